@@ -0,0 +1,58 @@
+"""
+백테스트 파라미터 스윕 - 자동 실행
+포트폴리오 크기, 리밸런싱 주기(7일 vs 14일), 편입 최소 점수,
+TechnicalAnalyzerV3 임계값 조합을 한 번에 비교
+
+결과: sweep_results_YYYYMMDD_HHMMSS.csv (샤프 비율 내림차순)
+"""
+
+from datetime import datetime, timedelta
+import sys
+sys.path.insert(0, '.')
+
+from quant_trading.backtest import MAJOR_US_TICKERS
+from quant_trading.param_sweep import run_sweep
+from quant_trading.price_store import PriceStore
+from quant_trading.market_archive import archive_path
+
+print("=" * 60)
+print("         백테스트 파라미터 스윕")
+print("=" * 60)
+print()
+
+# 설정
+end_date = datetime.now()
+start_date = end_date - timedelta(days=365)  # 1년
+major_tickers = MAJOR_US_TICKERS
+
+# 탐색 범위 (top_n / rebalance_days / min_score 외에는 TechnicalAnalyzerV3.THRESHOLDS 키)
+# 리밸런싱 주기 비교는 회전율 차이가 반영되도록 거래 비용 포함
+grid = {
+    'top_n': [5, 10, 15, 20],
+    'rebalance_days': [7, 14],              # daily_update_with_telegram 리밸런싱 주기 후보
+    'min_score': [None, 30, 40],
+    'momentum_6m_strong': [0.20, 0.30, 0.40],
+    'rsi_oversold': [25, 30, 35],
+}
+
+print(f"분석 종목: {len(major_tickers)}개")
+print(f"기간: {start_date.strftime('%Y-%m-%d')} ~ {end_date.strftime('%Y-%m-%d')}")
+print()
+
+# 전체 기간 가격 데이터 1회 로드 (워커 프로세스는 아카이브를 memmap으로 공유)
+price_store = PriceStore.load(major_tickers, start_date, end_date,
+                              archive=archive_path('backtest_sweep'))
+print(f"가격 데이터 로드: {len(price_store)}/{len(major_tickers)}개 종목")
+print()
+
+filename = f"sweep_results_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
+results = run_sweep(price_store, start_date, end_date, grid, tickers=major_tickers, output=filename,
+                    commission=0.0005, slippage=0.0005)
+
+print()
+print("=" * 60)
+print("         상위 10개 조합 (샤프 비율 기준)")
+print("=" * 60)
+print()
+print(results.head(10).to_string(index=False, float_format=lambda x: f"{x:.3f}"))
+print()
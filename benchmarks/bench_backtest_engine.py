@@ -0,0 +1,117 @@
+"""
+백테스트 엔진 벤치마크 - 기존 스크립트 루프 vs quant_trading.backtest
+
+- 50종목 × 1년 (주 1회 리밸런싱, 약 52회) 기준, 기술적 분석 점수만 사용
+- 기존: 리밸런싱마다 종목별 as_of + TechnicalAnalyzerV3, 보유 종목별 price_on
+- 엔진 (종목별 채점): 같은 채점 + (리밸런싱 × 종목) 수익률 행렬
+- 엔진 (패널 채점): 리밸런싱마다 종가 패널 구간으로 전 종목 한 번에 채점
+- 결과 동일성 검증 (선정 종목 / 구간 수익률) + 속도 비교
+
+실행:
+    python benchmarks/bench_backtest_engine.py
+"""
+
+import sys
+import time
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, '.')
+
+from quant_trading.backtest import Backtest, technical_panel_scorer, technical_scorer
+from quant_trading.price_store import PriceStore
+from quant_trading.technical_analyzer_v3 import TechnicalAnalyzerV3
+
+
+N_TICKERS = 50
+N_DAYS = 760
+TOP_N = 10
+REBALANCE_DAYS = 7
+START = datetime(2024, 1, 2)
+END = datetime(2024, 12, 31)
+
+
+def make_store(n_tickers, n_days, seed=0):
+    """종목별 OHLCV 저장소 (일부 종목은 중간 상장)"""
+    rng = np.random.default_rng(seed)
+    index = pd.bdate_range(end=END, periods=n_days)
+    frames = {}
+    for i in range(n_tickers):
+        close = 100 * np.exp(np.cumsum(rng.normal(0.0003, 0.02, n_days)))
+        df = pd.DataFrame({
+            'Open': close, 'High': close * 1.01, 'Low': close * 0.99, 'Close': close,
+            'Volume': rng.integers(1_000_000, 50_000_000, n_days).astype('float64'),
+        }, index=index)
+        frames[f'T{i:02d}'] = df.iloc[n_days // 2:] if i % 10 == 0 else df
+    return PriceStore(frames)
+
+
+def legacy_backtest(store, tickers):
+    """기존 backtest_quick.py 루프"""
+    dates = []
+    current_date = START
+    while current_date <= END:
+        dates.append(current_date)
+        current_date += timedelta(days=REBALANCE_DAYS)
+
+    history = []
+    for i, date in enumerate(dates[:-1]):
+        results = []
+        for ticker in tickers:
+            df = store.as_of(ticker, date, lookback_days=730)
+            if df.empty or len(df) < 180:
+                continue
+            score = TechnicalAnalyzerV3(df).calculate_total_score()['total_score']
+            results.append({'ticker': ticker, 'total_score': score, 'close_price': df['Close'].iloc[-1]})
+        results.sort(key=lambda x: x['total_score'], reverse=True)
+        top = results[:TOP_N]
+
+        total_return = 0
+        for stock in top:
+            sell_price = store.price_on(stock['ticker'], dates[i + 1])
+            if sell_price is not None:
+                total_return += (sell_price - stock['close_price']) / stock['close_price'] / len(top)
+        history.append(([s['ticker'] for s in top], total_return))
+    return history
+
+
+def engine_backtest(store, tickers, panel_scorer=None):
+    backtest = Backtest(store, technical_scorer, tickers, top_n=TOP_N, rebalance_days=REBALANCE_DAYS,
+                        panel_scorer=panel_scorer)
+    backtest.run(START, END, on_rebalance=None)
+    return [(p['top_stocks'], p['return']) for p in backtest.portfolio_history]
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def main():
+    store = make_store(N_TICKERS, N_DAYS)
+    tickers = store.tickers
+    print(f"백테스트 엔진 벤치마크: {N_TICKERS}종목, {START:%Y-%m-%d} ~ {END:%Y-%m-%d}, "
+          f"{REBALANCE_DAYS}일 리밸런싱\n")
+
+    legacy, legacy_time = timed(legacy_backtest, store, tickers)
+    engine, engine_time = timed(engine_backtest, store, tickers)
+    panel, panel_time = timed(engine_backtest, store, tickers, technical_panel_scorer)
+
+    # 결과 동일성 (선정 종목 동일, 수익률은 합산 순서 차이만 허용)
+    for result in (engine, panel):
+        assert len(result) == len(legacy)
+        for (top, ret), (expected_top, expected_ret) in zip(result, legacy):
+            assert top == expected_top
+            assert abs(ret - expected_ret) < 1e-12
+
+    print(f"  기존 스크립트 루프:       {legacy_time:8.2f} s")
+    print(f"  엔진 (종목별 채점):       {engine_time:8.2f} s  ({legacy_time / engine_time:.1f}x)")
+    print(f"  엔진 (패널 채점):         {panel_time:8.2f} s  ({legacy_time / panel_time:.1f}x)")
+    print(f"  리밸런싱 {len(legacy)}회, 결과 동일: OK")
+
+
+if __name__ == '__main__':
+    main()
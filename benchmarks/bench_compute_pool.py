@@ -0,0 +1,95 @@
+"""
+계산 단계 벤치마크 - 스레드 풀(GIL) vs 프로세스 풀 + 공유 아카이브
+
+- S&P 500 규모 (500종목 × 2년 일봉), 리포트와 같은 계산
+  (TechnicalAnalyzerV3 + PriceRecommender)
+- 결과 동일성 검증 + 속도 비교 (네트워크 시간 제외)
+
+실행:
+    python benchmarks/bench_compute_pool.py
+"""
+
+import os
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, '.')
+
+from quant_trading.compute_pool import run_compute_stage
+from quant_trading.price_recommender import PriceRecommender
+from quant_trading.price_store import PriceStore
+from quant_trading.technical_analyzer_v3 import TechnicalAnalyzerV3
+
+
+N_TICKERS = 500
+N_DAYS = 504
+THREADS = 10
+
+
+def compute(df, latest_price):
+    """generate_daily_report_v2.compute_price_scores와 같은 계산"""
+    return {
+        'technical': TechnicalAnalyzerV3(df).calculate_total_score(),
+        'price_rec': PriceRecommender(df, latest_price).get_recommendation(strategy='moderate'),
+    }
+
+
+def make_store(n_tickers, n_days, seed=0):
+    rng = np.random.default_rng(seed)
+    index = pd.bdate_range(end='2024-12-31', periods=n_days)
+    frames = {}
+    for i in range(n_tickers):
+        close = 100 * np.exp(np.cumsum(rng.normal(0, 0.02, n_days)))
+        frames[f'T{i:03d}'] = pd.DataFrame({
+            'Open': close * (1 + rng.normal(0, 0.005, n_days)),
+            'High': close * (1 + np.abs(rng.normal(0, 0.01, n_days))),
+            'Low': close * (1 - np.abs(rng.normal(0, 0.01, n_days))),
+            'Close': close,
+            'Volume': rng.integers(1_000_000, 50_000_000, n_days).astype('float64'),
+        }, index=index)
+    return PriceStore(frames)
+
+
+def run_threads(store, tasks):
+    """기존 구현: 10개 스레드에서 종목별 계산"""
+    def analyze(ticker):
+        return ticker, compute(store.history(ticker), *tasks[ticker])
+
+    with ThreadPoolExecutor(max_workers=THREADS) as executor:
+        return dict(executor.map(analyze, tasks))
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def main():
+    cpus = os.cpu_count()
+    print(f"계산 단계 벤치마크: {N_TICKERS}종목 × {N_DAYS}일, CPU {cpus}개\n")
+
+    store = make_store(N_TICKERS, N_DAYS)
+    tasks = {ticker: (float(store.history(ticker)['Close'].iloc[-1]),) for ticker in store.tickers}
+
+    with tempfile.TemporaryDirectory() as tmp:
+        shared = PriceStore.from_archive(store.save_archive(os.path.join(tmp, 'archive')))
+
+        expected, thread_time = timed(run_threads, store, tasks)
+        result, process_time = timed(lambda: dict(run_compute_stage(compute, shared, tasks)))
+        assert result == expected
+        del shared
+
+    print(f"  스레드 풀 ({THREADS}개):      {thread_time:8.2f} s")
+    print(f"  프로세스 풀 ({cpus}개):       {process_time:8.2f} s")
+    print(f"  속도 향상:              {thread_time / process_time:8.1f}x")
+    print("  결과 동일: OK")
+
+
+if __name__ == '__main__':
+    main()
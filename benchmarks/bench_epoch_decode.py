@@ -0,0 +1,123 @@
+"""
+epoch 응답 디코딩 벤치마크 - 기존 fromtimestamp 루프 vs 배열 변환
+
+- Yahoo Chart API: 30년치 일봉 / 5년치 시간봉 응답
+- CoinGecko market_chart: 10년치 일봉 / 5년치 시간봉 응답
+- 결과 동일성 검증 + 속도 비교
+
+실행:
+    python benchmarks/bench_epoch_decode.py
+"""
+
+import json
+import sys
+import time
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, 'src')
+
+from FinanceDataReader.yahoo.data import _parse_yahoo_chart
+from FinanceDataReader.crypto.data import _parse_crypto_data
+
+
+REPEAT = 5
+
+
+def parse_yahoo_chart_old(text):
+    """기존 구현 (타임스탬프마다 datetime.fromtimestamp)"""
+    chart = json.loads(text)['chart']['result'][0]
+    quote = chart['indicators']['quote'][0]
+    df_data = {
+        'Date': [datetime.fromtimestamp(ts) for ts in chart['timestamp']],
+        'Open': quote['open'],
+        'High': quote['high'],
+        'Low': quote['low'],
+        'Close': quote['close'],
+        'Volume': quote['volume'],
+    }
+    if 'adjclose' in chart['indicators']:
+        df_data['Adj Close'] = chart['indicators']['adjclose'][0]['adjclose']
+    df = pd.DataFrame(df_data)
+    return df.set_index('Date').dropna().sort_index()
+
+
+def parse_crypto_old(text):
+    """기존 구현 (행마다 dict 생성)"""
+    data = json.loads(text)
+    volumes = data.get('total_volumes', [])
+    price_data = []
+    for i, (timestamp, price) in enumerate(data['prices']):
+        price_data.append({
+            'Date': datetime.fromtimestamp(timestamp / 1000),
+            'Close': price,
+            'Volume': volumes[i][1] if i < len(volumes) else 0,
+        })
+    return pd.DataFrame(price_data).set_index('Date').sort_index()
+
+
+def make_yahoo_payload(n, step, seed=0):
+    """Chart API 형식 응답 (결측 봉 포함)"""
+    rng = np.random.default_rng(seed)
+    timestamps = (946906200 + np.arange(n) * step).tolist()
+    close = (100 * np.exp(np.cumsum(rng.normal(0, 0.01, n)))).round(4).tolist()
+    volume = rng.integers(1_000, 10_000_000, n).tolist()
+    close[5] = None
+    quote = {
+        'open': close, 'high': close, 'low': close, 'close': close, 'volume': volume,
+    }
+    return json.dumps({'chart': {'result': [{
+        'timestamp': timestamps,
+        'indicators': {'quote': [quote], 'adjclose': [{'adjclose': close}]},
+    }]}})
+
+
+def make_crypto_payload(n, step_ms, seed=0):
+    """market_chart/range 형식 응답"""
+    rng = np.random.default_rng(seed)
+    timestamps = (1388534400000 + np.arange(n) * step_ms).tolist()
+    price = (500 * np.exp(np.cumsum(rng.normal(0, 0.02, n)))).tolist()
+    volume = rng.uniform(1e6, 1e10, n).tolist()
+    return json.dumps({
+        'prices': [list(pair) for pair in zip(timestamps, price)],
+        'total_volumes': [list(pair) for pair in zip(timestamps, volume)],
+    })
+
+
+def compare(title, old_func, new_func, text):
+    start = time.perf_counter()
+    for _ in range(REPEAT):
+        old_df = old_func(text)
+    old_time = (time.perf_counter() - start) / REPEAT
+
+    start = time.perf_counter()
+    for _ in range(REPEAT):
+        new_df = new_func(text)
+    new_time = (time.perf_counter() - start) / REPEAT
+
+    pd.testing.assert_frame_equal(new_df, old_df)
+
+    print(f"[{title}] ({len(old_df):,}행)")
+    print(f"  기존 루프:  {old_time * 1000:8.1f} ms")
+    print(f"  배열 변환:  {new_time * 1000:8.1f} ms")
+    print(f"  속도 향상:  {old_time / new_time:8.1f}x")
+    print("  결과 동일:  OK\n")
+
+
+def main():
+    print(f"epoch 디코딩 벤치마크 ({REPEAT}회 평균)\n")
+
+    compare('Yahoo 일봉 30년', parse_yahoo_chart_old, _parse_yahoo_chart,
+            make_yahoo_payload(252 * 30, 86400 * 365 // 252))
+    compare('Yahoo 시간봉 5년', parse_yahoo_chart_old, _parse_yahoo_chart,
+            make_yahoo_payload(24 * 365 * 5, 3600))
+    compare('CoinGecko 일봉 10년', parse_crypto_old, lambda t: _parse_crypto_data(t, 'BTC'),
+            make_crypto_payload(365 * 10, 86_400_000))
+    compare('CoinGecko 시간봉 5년', parse_crypto_old, lambda t: _parse_crypto_data(t, 'BTC'),
+            make_crypto_payload(24 * 365 * 5, 3_600_000))
+
+
+if __name__ == '__main__':
+    main()
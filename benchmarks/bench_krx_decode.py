@@ -0,0 +1,144 @@
+"""
+KRX JSON 디코딩 벤치마크 - 기존 dict 리스트 DataFrame + 문자열 치환 vs 컬럼 단위 디코딩
+
+- 30년치 일봉 (약 7,500봉) / 전체 시장 종목 목록 (약 2,800종목) 응답 기준
+- 결과 동일성 검증 (숫자 컬럼) + 속도 / 최대 메모리 비교
+
+실행:
+    python benchmarks/bench_krx_decode.py
+"""
+
+import json
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, 'src')
+
+from FinanceDataReader.krx.data import _parse_krx_data
+from FinanceDataReader.krx.decode import decode_records
+from FinanceDataReader.krx.listing import KRX_LISTING_FIELDS
+
+
+N_BARS = 7500
+N_LISTINGS = 2800
+REPEAT = 10
+
+PRICE_COLUMN_MAP = {
+    'TRD_DD': 'Date', 'TDD_CLSPRC': 'Close', 'TDD_OPNPRC': 'Open', 'TDD_HGPRC': 'High',
+    'TDD_LWPRC': 'Low', 'ACC_TRDVOL': 'Volume', 'ACC_TRDVAL': 'Amount', 'FLUC_RT': 'Change',
+    'CMPPREVDD_PRC': 'ChgAmount',
+}
+
+
+def parse_prices_old(text):
+    """기존 구현 (dict 리스트 → DataFrame → 컬럼별 astype(str).str.replace)"""
+    df = pd.DataFrame(json.loads(text)['OutBlock_1'])
+    df = df.rename(columns=PRICE_COLUMN_MAP)
+    df['Date'] = pd.to_datetime(df['Date'], format='%Y/%m/%d', errors='coerce')
+    df = df.set_index('Date')
+    for col in ['Open', 'High', 'Low', 'Close', 'Volume', 'Amount', 'Change']:
+        if col in df.columns:
+            df[col] = df[col].astype(str).str.replace(',', '').astype(float)
+    ohlcv = ['Open', 'High', 'Low', 'Close', 'Volume']
+    return df[ohlcv + [c for c in df.columns if c not in ohlcv]].sort_index()
+
+
+def parse_listing_old(text):
+    """기존 구현 + 숫자 컬럼 변환 (문자열 치환)"""
+    column_map = {key: name for key, (name, _) in KRX_LISTING_FIELDS.items()}
+    df = pd.DataFrame(json.loads(text)['OutBlock_1']).rename(columns=column_map)
+    df = df[list(column_map.values())]
+    for col in ['Close', 'Shares', 'MarketCap']:
+        df[col] = df[col].astype(str).str.replace(',', '').astype(float)
+    return df
+
+
+def parse_listing_new(text):
+    """get_krx_stock_listing의 디코딩 단계"""
+    df = decode_records(json.loads(text)['OutBlock_1'], KRX_LISTING_FIELDS, keep_other=False)
+    return df[[name for name, _ in KRX_LISTING_FIELDS.values()]]
+
+
+def make_price_payload(n_bars, seed=0):
+    """MDCSTAT01701 (개별종목 시세 추이) 형식 응답"""
+    rng = np.random.default_rng(seed)
+    dates = pd.bdate_range(end='2024-12-31', periods=n_bars)[::-1]
+    close = np.round(50000 * np.exp(np.cumsum(rng.normal(0, 0.02, n_bars))), -1).astype(int)
+    volume = rng.integers(100_000, 30_000_000, n_bars)
+    records = [
+        {
+            'TRD_DD': f'{d:%Y/%m/%d}', 'TDD_CLSPRC': f'{c:,}', 'FLUC_TP_CD': '1',
+            'CMPPREVDD_PRC': f'{c // 100:,}', 'FLUC_RT': f'{rng.normal(0, 2):.2f}',
+            'TDD_OPNPRC': f'{c - 100:,}', 'TDD_HGPRC': f'{c + 200:,}', 'TDD_LWPRC': f'{c - 300:,}',
+            'ACC_TRDVOL': f'{v:,}', 'ACC_TRDVAL': f'{v * c:,}',
+            'MKTCAP': f'{c * 5_969_782_550:,}', 'LIST_SHRS': '5,969,782,550',
+        }
+        for d, c, v in zip(dates, close.tolist(), volume.tolist())
+    ]
+    return json.dumps({'OutBlock_1': records, 'CURRENT_DATETIME': '2024.12.31 PM 04:00:00'})
+
+
+def make_listing_payload(n_listings, seed=0):
+    """MDCSTAT01901 (전종목 기본정보) 형식 응답"""
+    rng = np.random.default_rng(seed)
+    price = rng.integers(1_000, 1_000_000, n_listings).tolist()
+    shares = rng.integers(1_000_000, 6_000_000_000, n_listings).tolist()
+    records = [
+        {
+            'ISU_CD': f'KR7{i:06d}003', 'ISU_SRT_CD': f'{i:06d}', 'ISU_NM': f'종목{i}보통주',
+            'ISU_ABBRV': f'종목{i}', 'ISU_ENG_NM': f'Stock {i}', 'LIST_DD': '2000/01/04',
+            'MKT_TP_NM': 'KOSPI', 'SECUGRP_NM': '주권', 'SECT_TP_NM': '', 'KIND_STKCERT_TP_NM': '보통주',
+            'PARVAL': '100', 'LIST_SHRS': f'{s:,}', 'MKT_NM': 'KOSPI', 'TDD_CLSPRC': f'{p:,}',
+            'MKTCAP': f'{p * s:,}',
+        }
+        for i, (p, s) in enumerate(zip(price, shares))
+    ]
+    return json.dumps({'OutBlock_1': records}, ensure_ascii=False)
+
+
+def measure(func, text):
+    """(결과, 평균 소요시간, 최대 메모리) 반환"""
+    start = time.perf_counter()
+    for _ in range(REPEAT):
+        result = func(text)
+    elapsed = (time.perf_counter() - start) / REPEAT
+
+    tracemalloc.start()
+    func(text)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+
+def report(title, old, new):
+    (_, old_time, old_peak), (_, new_time, new_peak) = old, new
+    print(f"[{title}]")
+    print(f"  기존:      {old_time * 1000:8.1f} ms  {old_peak / 1e6:7.1f} MB")
+    print(f"  컬럼 단위: {new_time * 1000:8.1f} ms  {new_peak / 1e6:7.1f} MB")
+    print(f"  속도 향상: {old_time / new_time:8.1f}x")
+    print("  결과 동일: OK\n")
+
+
+def main():
+    print(f"KRX 디코딩 벤치마크 ({REPEAT}회 평균)\n")
+
+    text = make_price_payload(N_BARS)
+    old = measure(parse_prices_old, text)
+    new = measure(lambda t: _parse_krx_data(t, '005930'), text)
+    # Volume/Amount는 int64로 바뀌었으므로 값 기준 비교
+    pd.testing.assert_frame_equal(new[0], old[0].astype(new[0].dtypes.to_dict()))
+    report(f"일봉 {N_BARS}봉", old, new)
+
+    text = make_listing_payload(N_LISTINGS)
+    old = measure(parse_listing_old, text)
+    new = measure(parse_listing_new, text)
+    pd.testing.assert_frame_equal(new[0], old[0].astype(new[0].dtypes.to_dict()))
+    report(f"종목 목록 {N_LISTINGS}종목", old, new)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,118 @@
+"""
+가격 아카이브 벤치마크 - 종목별 DataFrame 생성 vs memmap 아카이브 열기
+
+- S&P 500 2년치 (500종목 × 약 504거래일) 패널 기준
+- 기존: 일괄 다운로드 결과(wide frame)를 종목별로 나눠 PriceStore 구성 (네트워크 시간 제외)
+- 피클: wide frame을 디스크에 저장해 두고 다시 읽어 PriceStore 구성
+- 아카이브: MarketArchive 열기 + Close 패널 (복사 없음) / 전 종목 history 꺼내기
+- 결과 동일성 검증 + 속도 비교
+
+실행:
+    python benchmarks/bench_market_archive.py
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, '.')
+
+from quant_trading.market_archive import MarketArchive
+from quant_trading.price_store import PriceStore, split_wide_frame
+
+
+N_TICKERS = 500
+N_DAYS = 504
+REPEAT = 5
+
+
+def make_wide_frame(n_tickers, n_days, seed=0):
+    """yf.download(group_by='ticker') 형식 결과 (일부 종목은 중간 상장)"""
+    rng = np.random.default_rng(seed)
+    index = pd.bdate_range(end='2024-12-31', periods=n_days)
+    frames = {}
+    for i in range(n_tickers):
+        close = 100 * np.exp(np.cumsum(rng.normal(0, 0.02, n_days)))
+        df = pd.DataFrame({
+            'Open': close * (1 + rng.normal(0, 0.005, n_days)),
+            'High': close * 1.01,
+            'Low': close * 0.99,
+            'Close': close,
+            'Volume': rng.integers(1_000_000, 50_000_000, n_days).astype('float64'),
+        }, index=index)
+        if i % 50 == 0:
+            df.iloc[:n_days // 3] = np.nan
+        frames[f'T{i:03d}'] = df
+    return pd.concat(frames, axis=1)
+
+
+def build_store(wide, tickers):
+    """기존 구현: wide frame → 종목별 PriceStore"""
+    return PriceStore(split_wide_frame(wide, tickers))
+
+
+def load_pickle(path, tickers):
+    return build_store(pd.read_pickle(path), tickers)
+
+
+def open_panel(path):
+    archive = MarketArchive(path)
+    return archive, archive.panel('Close')
+
+
+def open_store_all(path, tickers):
+    store = PriceStore.from_archive(path)
+    for ticker in tickers:
+        store.history(ticker)
+    return store
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    for _ in range(REPEAT):
+        result = func(*args)
+    return result, (time.perf_counter() - start) / REPEAT
+
+
+def main():
+    print(f"가격 아카이브 벤치마크: {N_TICKERS}종목 × {N_DAYS}일, {REPEAT}회 평균\n")
+
+    wide = make_wide_frame(N_TICKERS, N_DAYS)
+    tickers = list(dict.fromkeys(wide.columns.get_level_values(0)))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        pickle_path = os.path.join(tmp, 'wide.pkl')
+        archive_dir = os.path.join(tmp, 'archive')
+        wide.to_pickle(pickle_path)
+
+        store, build_time = timed(build_store, wide, tickers)
+        _, pickle_time = timed(load_pickle, pickle_path, tickers)
+        _, write_time = timed(store.save_archive, archive_dir)
+        (archive, close), open_time = timed(open_panel, archive_dir)
+        lazy, lazy_time = timed(open_store_all, archive_dir, tickers)
+
+        # 결과 동일성 (패널 = 종목별 Close, 전 종목 history 동일)
+        expected = pd.DataFrame({t: store.history(t)['Close'] for t in tickers})
+        np.testing.assert_array_equal(close.values, expected.reindex(close.index).values)
+        assert np.shares_memory(close.values, archive.field('Close'))
+        for ticker in tickers:
+            pd.testing.assert_frame_equal(lazy.history(ticker), store.history(ticker), check_freq=False)
+
+        size = sum(os.path.getsize(os.path.join(root, name))
+                   for root, _, names in os.walk(archive_dir) for name in names)
+        del archive, close, lazy
+
+    print(f"  wide frame → PriceStore (기존):  {build_time * 1000:8.1f} ms")
+    print(f"  피클 로드 → PriceStore:          {pickle_time * 1000:8.1f} ms")
+    print(f"  아카이브 저장 ({size / 1e6:.1f} MB):        {write_time * 1000:8.1f} ms")
+    print(f"  아카이브 열기 + Close 패널:      {open_time * 1000:8.1f} ms  ({build_time / open_time:.0f}x)")
+    print(f"  아카이브 → 전 종목 history:      {lazy_time * 1000:8.1f} ms  ({build_time / lazy_time:.1f}x)")
+    print("  결과 동일: OK")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,114 @@
+"""
+네이버 차트 응답 파싱 벤치마크 - 기존 BeautifulSoup 구현 vs 정규식 + 열 단위 변환
+
+- 20년치 일봉 (약 5,000봉) 응답 기준
+- 결과 동일성 검증 (잘못된 행이 섞인 응답 포함) + 속도 비교
+
+실행:
+    python benchmarks/bench_naver_parse.py
+"""
+
+import sys
+import time
+import warnings
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+from bs4 import BeautifulSoup
+
+sys.path.insert(0, 'src')
+
+from FinanceDataReader.naver.data import _parse_naver_data
+
+
+N_BARS = 5000
+REPEAT = 5
+
+
+def parse_naver_bs4(text, start, end):
+    """기존 구현 (BeautifulSoup + 행 단위 strptime + dict 리스트)"""
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')  # XMLParsedAsHTMLWarning
+        soup = BeautifulSoup(text, 'lxml')
+    items = soup.find_all('item')
+
+    if not items:
+        return pd.DataFrame()
+
+    data_list = []
+    for item in items:
+        try:
+            data = item.get('data', '').split('|')
+
+            if len(data) >= 6:
+                data_list.append({
+                    'Date': datetime.strptime(data[0], '%Y%m%d'),
+                    'Open': float(data[1]),
+                    'High': float(data[2]),
+                    'Low': float(data[3]),
+                    'Close': float(data[4]),
+                    'Volume': int(data[5])
+                })
+        except (ValueError, IndexError):
+            continue
+
+    if not data_list:
+        return pd.DataFrame()
+
+    df = pd.DataFrame(data_list)
+    df = df.set_index('Date')
+    df = df.sort_index()
+    return df[(df.index >= start) & (df.index <= end)]
+
+
+def make_payload(n_bars, seed=0, broken=False):
+    """fchart sise.nhn 형식 응답 생성"""
+    rng = np.random.default_rng(seed)
+    dates = pd.bdate_range(end='2024-12-31', periods=n_bars)
+    close = np.round(50000 * np.exp(np.cumsum(rng.normal(0, 0.02, n_bars))), -1)
+    volume = rng.integers(100_000, 30_000_000, n_bars)
+
+    rows = [
+        f'<item data="{d:%Y%m%d}|{c - 100:.0f}|{c + 200:.0f}|{c - 300:.0f}|{c:.0f}|{v}" />'
+        for d, c, v in zip(dates, close, volume)
+    ]
+    if broken:
+        rows[10] = '<item data="20000101|1|2|3" />'
+        rows[20] = '<item data="2000010X|1|2|3|4|5" />'
+        rows[30] = '<item data="20000103|1|2|3|4|1.5" />'
+
+    return (
+        '<?xml version="1.0" encoding="EUC-KR" ?>\n<protocol>\n'
+        '<chartdata symbol="005930" name="삼성전자" count="%d" timeframe="day" precision="0" origintime="19900103">\n'
+        % n_bars + '\n'.join(rows) + '\n</chartdata>\n</protocol>'
+    )
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    for _ in range(REPEAT):
+        result = func(*args)
+    return result, (time.perf_counter() - start) / REPEAT
+
+
+def main():
+    print(f"네이버 차트 파싱 벤치마크: {N_BARS}봉, {REPEAT}회 평균\n")
+    start, end = datetime(1990, 1, 1), datetime(2024, 12, 31)
+
+    for broken in (False, True):
+        payload = make_payload(N_BARS, broken=broken)
+        old_df, old_time = timed(parse_naver_bs4, payload, start, end)
+        new_df, new_time = timed(_parse_naver_data, payload, '005930', start, end)
+
+        pd.testing.assert_frame_equal(new_df, old_df)
+
+        print(f"[{'잘못된 행 포함' if broken else '정상 응답'}] ({len(payload) / 1e6:.2f} MB)")
+        print(f"  BeautifulSoup: {old_time * 1000:10.1f} ms")
+        print(f"  정규식 + 배열: {new_time * 1000:10.1f} ms")
+        print(f"  속도 향상:     {old_time / new_time:10.1f}x")
+        print("  결과 동일:     OK\n")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,138 @@
+"""
+OBV 벤치마크 - 기존 루프 구현 vs 배열 구현
+
+- 500종목 × 504봉 (2년치 일봉) 기준
+- 결과 동일성 검증 + 속도 비교
+- 새 봉 이어붙이기 (append_obv) vs 전체 재계산 비교
+
+실행:
+    python benchmarks/bench_obv.py
+"""
+
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, '.')
+
+from quant_trading.indicators import calculate_obv, append_obv, obv_from_arrays
+
+
+N_TICKERS = 500
+N_BARS = 504
+N_APPEND = 1
+
+
+def calculate_obv_loop(df):
+    """기존 구현 (행 단위 파이썬 루프)"""
+    obv = [0]
+
+    for i in range(1, len(df)):
+        if df['Close'].iloc[i] > df['Close'].iloc[i-1]:
+            obv.append(obv[-1] + df['Volume'].iloc[i])
+        elif df['Close'].iloc[i] < df['Close'].iloc[i-1]:
+            obv.append(obv[-1] - df['Volume'].iloc[i])
+        else:
+            obv.append(obv[-1])
+
+    df['OBV'] = obv
+
+    return df
+
+
+def make_frames(n_tickers, n_bars, seed=0):
+    """랜덤 OHLCV 생성 (보합 봉 포함)"""
+    rng = np.random.default_rng(seed)
+    index = pd.bdate_range('2024-01-01', periods=n_bars)
+    frames = []
+    for _ in range(n_tickers):
+        close = np.round(100 * np.exp(np.cumsum(rng.normal(0, 0.02, n_bars))), 1)
+        volume = rng.integers(100_000, 10_000_000, n_bars)
+        frames.append(pd.DataFrame({'Close': close, 'Volume': volume}, index=index))
+    return frames
+
+
+def timed(func, frames):
+    """모든 종목에 func 적용 후 (결과, 소요시간) 반환"""
+    start = time.perf_counter()
+    results = [func(df.copy()) for df in frames]
+    return results, time.perf_counter() - start
+
+
+def main():
+    print(f"OBV 벤치마크: {N_TICKERS}종목 × {N_BARS}봉\n")
+    frames = make_frames(N_TICKERS, N_BARS + N_APPEND)
+    history = [df.iloc[:N_BARS] for df in frames]
+
+    loop_results, loop_time = timed(calculate_obv_loop, history)
+    vec_results, vec_time = timed(calculate_obv, history)
+
+    for loop_df, vec_df in zip(loop_results, vec_results):
+        np.testing.assert_array_equal(loop_df['OBV'].to_numpy(), vec_df['OBV'].to_numpy())
+
+    print("[전체 계산]")
+    print(f"  루프 구현:  {loop_time * 1000:10.1f} ms")
+    print(f"  배열 구현:  {vec_time * 1000:10.1f} ms")
+    print(f"  속도 향상:  {loop_time / vec_time:10.1f}x")
+    print("  결과 동일:  OK\n")
+
+    # 새 봉 이어붙이기 (시간별 갱신 시나리오)
+    # 상태 = 종목별 (마지막 OBV, 마지막 종가) -> 새 봉만 계산
+    closes = [df['Close'].to_numpy() for df in frames]
+    volumes = [df['Volume'].to_numpy() for df in frames]
+    state = [(df['OBV'].iloc[-1], df['Close'].iloc[-1]) for df in vec_results]
+
+    start = time.perf_counter()
+    full_obv = [obv_from_arrays(c, v) for c, v in zip(closes, volumes)]
+    full_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    new_obv = [
+        obv_from_arrays(c[N_BARS:], v[N_BARS:], initial_obv=last_obv, prev_close=last_close)
+        for c, v, (last_obv, last_close) in zip(closes, volumes, state)
+    ]
+    append_time = time.perf_counter() - start
+
+    for inc, full in zip(new_obv, full_obv):
+        np.testing.assert_array_equal(inc, full[N_BARS:])
+
+    # DataFrame 단위 이어붙이기도 결과 확인
+    for old, new, full in zip(vec_results[:10], frames[:10], full_obv[:10]):
+        merged = append_obv(old, new.iloc[N_BARS:])
+        np.testing.assert_array_equal(merged['OBV'].to_numpy(), full)
+
+    print(f"[{N_APPEND}봉 이어붙이기 - 배열 상태 기준]")
+    print(f"  전체 재계산: {full_time * 1000:10.2f} ms")
+    print(f"  이어붙이기:  {append_time * 1000:10.2f} ms")
+    print("  결과 동일:  OK\n")
+
+    # 패널 (봉 × 종목) 한 번에 계산
+    close_panel = np.column_stack([c[:N_BARS] for c in closes])
+    volume_panel = np.column_stack([v[:N_BARS] for v in volumes])
+
+    start = time.perf_counter()
+    panel_obv = obv_from_arrays(close_panel, volume_panel)
+    panel_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    panel_new = obv_from_arrays(
+        np.column_stack([c[N_BARS:] for c in closes]),
+        np.column_stack([v[N_BARS:] for v in volumes]),
+        initial_obv=panel_obv[-1],
+        prev_close=close_panel[-1],
+    )
+    panel_append_time = time.perf_counter() - start
+
+    np.testing.assert_array_equal(panel_obv, np.column_stack([f[:N_BARS] for f in full_obv]))
+    np.testing.assert_array_equal(panel_new, np.column_stack([f[N_BARS:] for f in full_obv]))
+
+    print(f"[패널 {N_BARS}봉 × {N_TICKERS}종목]")
+    print(f"  전체 계산:   {panel_time * 1000:10.2f} ms")
+    print(f"  이어붙이기:  {panel_append_time * 1000:10.2f} ms")
+    print("  결과 동일:  OK")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,95 @@
+"""
+파라미터 스윕 벤치마크 - 조합마다 백테스트 vs 점수 캐시 스윕
+
+- 60종목 × 1년, 조합 48개 (top_n 4 × 리밸런싱 2 × 최소 점수 2 × 모멘텀 임계값 3)
+- 기존: 조합마다 Backtest.run (패널 채점 포함, 스크립트를 여러 번 돌리는 것과 같음)
+- 스윕 (현재 프로세스): 채점 조건 × 리밸런싱 날짜마다 1회 채점 + 조합별 시뮬레이션
+- 스윕 (프로세스): 같은 작업을 워커 프로세스에서 실행 (아카이브 memmap 공유)
+- 결과 동일성 검증 + 속도 비교
+
+실행:
+    python benchmarks/bench_param_sweep.py
+"""
+
+import os
+import sys
+import time
+from datetime import datetime
+from functools import partial
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, '.')
+
+from quant_trading.backtest import Backtest, technical_panel_scorer
+from quant_trading.param_sweep import METRIC_COLUMNS, parameter_grid, run_sweep
+from quant_trading.price_store import PriceStore
+
+
+N_TICKERS = 60
+N_DAYS = 760
+START = datetime(2024, 1, 2)
+END = datetime(2024, 12, 31)
+GRID = {
+    'top_n': [5, 10, 15, 20],
+    'rebalance_days': [7, 14],
+    'min_score': [None, 30],
+    'momentum_6m_strong': [0.2, 0.3, 0.4],
+}
+
+
+def make_store(n_tickers, n_days, seed=0):
+    rng = np.random.default_rng(seed)
+    index = pd.bdate_range(end=END, periods=n_days)
+    frames = {}
+    for i in range(n_tickers):
+        close = 100 * np.exp(np.cumsum(rng.normal(0.0003, 0.02, n_days)))
+        frames[f'T{i:02d}'] = pd.DataFrame({
+            'Open': close, 'High': close * 1.01, 'Low': close * 0.99, 'Close': close,
+            'Volume': rng.integers(1_000_000, 50_000_000, n_days).astype('float64'),
+        }, index=index)
+    return PriceStore(frames)
+
+
+def naive_sweep(store):
+    """조합마다 처음부터 백테스트"""
+    rows = []
+    for params in parameter_grid(GRID):
+        scorer = partial(technical_panel_scorer, momentum_6m_strong=params['momentum_6m_strong'])
+        backtest = Backtest(store, tickers=store.tickers, top_n=params['top_n'],
+                            rebalance_days=params['rebalance_days'], min_score=params['min_score'],
+                            panel_scorer=scorer)
+        metrics = backtest.run(START, END, on_rebalance=None)
+        rows.append({**params, **{column: metrics[column] for column in METRIC_COLUMNS}})
+    return pd.DataFrame(rows)
+
+
+def timed(func, *args, **kwargs):
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def main():
+    store = make_store(N_TICKERS, N_DAYS)
+    n_combos = len(parameter_grid(GRID))
+    print(f"파라미터 스윕 벤치마크: {N_TICKERS}종목, 조합 {n_combos}개, CPU {os.cpu_count()}개\n")
+
+    naive, naive_time = timed(naive_sweep, store)
+    inline, inline_time = timed(run_sweep, store, START, END, GRID, processes=False, sort_by=None)
+    pooled, pooled_time = timed(run_sweep, store, START, END, GRID, sort_by=None)
+
+    # 결과 동일성 (같은 조합 순서)
+    pd.testing.assert_frame_equal(inline, naive, check_dtype=False)
+    pd.testing.assert_frame_equal(pooled, inline)
+
+    print()
+    print(f"  조합마다 백테스트 (기존):   {naive_time:8.2f} s")
+    print(f"  스윕 (현재 프로세스):       {inline_time:8.2f} s  ({naive_time / inline_time:.1f}x)")
+    print(f"  스윕 (프로세스 {os.cpu_count()}개):        {pooled_time:8.2f} s  ({naive_time / pooled_time:.1f}x)")
+    print("  결과 동일: OK")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,105 @@
+"""
+섹터 분산 종목 선정 벤치마크 - 날짜별 Python 루프 vs 벡터화 grouped rank
+
+- 500 리밸런싱 날짜 × 100종목, 11개 섹터, 상위 10개 (섹터 한도: portfolio.SECTOR_LIMITS)
+- 기존: 날짜마다 후보 dict 정렬 + 섹터 개수를 세며 순회 (backtest_improved 방식, 같은 한도)
+- 선택기 (날짜별): SectorCappedSelector를 Backtest처럼 날짜마다 호출
+- 선택기 (한 번에): (날짜 × 종목) 점수 행렬로 select_many 한 번
+- 결과 동일성 검증 + 속도 비교
+
+실행:
+    python benchmarks/bench_sector_selection.py
+"""
+
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, '.')
+
+from quant_trading.portfolio import SECTOR_LIMITS, SectorCappedSelector, sector_caps
+
+
+N_DATES = 500
+N_TICKERS = 100
+TOP_N = 10
+SECTORS = list(SECTOR_LIMITS) + ['Utilities', 'Industrials', 'Real Estate', 'Communication Services', None]
+
+
+def make_inputs(seed=0):
+    rng = np.random.default_rng(seed)
+    tickers = [f'T{i:03d}' for i in range(N_TICKERS)]
+    sectors = dict(zip(tickers, rng.choice(np.array(SECTORS, dtype=object), N_TICKERS)))
+    scores = np.round(rng.normal(50, 15, (N_DATES, N_TICKERS)))    # 동점 포함
+    scores[rng.random(scores.shape) < 0.05] = np.nan                # 데이터 부족 종목
+    return pd.DataFrame(scores, index=pd.bdate_range('2020-01-01', periods=N_DATES), columns=tickers), sectors
+
+
+def legacy_select(score_frame, sectors):
+    """날짜마다 후보 정렬 + 섹터 한도 순회"""
+    caps = dict(zip(SECTORS, sector_caps([s or 'Unknown' for s in SECTORS], TOP_N)))
+    picks = []
+    for date, row in score_frame.iterrows():
+        candidates = [{'ticker': t, 'total_score': s, 'sector': sectors[t]} for t, s in row.items() if not np.isnan(s)]
+        candidates.sort(key=lambda x: x['total_score'], reverse=True)
+        portfolio, counts = [], {}
+        for stock in candidates:
+            if len(portfolio) >= TOP_N:
+                break
+            if counts.get(stock['sector'], 0) >= caps[stock['sector']]:
+                continue
+            portfolio.append(stock['ticker'])
+            counts[stock['sector']] = counts.get(stock['sector'], 0) + 1
+        picks.append(portfolio)
+    return picks
+
+
+def selector_per_date(score_frame, selector):
+    picks = []
+    for date, row in score_frame.iterrows():
+        candidates = [{'ticker': t, 'total_score': s} for t, s in row.items() if not np.isnan(s)]
+        candidates.sort(key=lambda x: x['total_score'], reverse=True)
+        picks.append([stock['ticker'] for stock in selector(candidates, TOP_N)])
+    return picks
+
+
+def selector_batch(score_frame, selector):
+    selected = selector.select_many(score_frame, TOP_N)
+    picks = []
+    for (_, row), (_, mask) in zip(score_frame.iterrows(), selected.iterrows()):
+        picks.append(row[mask.values].sort_values(ascending=False, kind='stable').index.tolist())
+    return picks, selected
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def main():
+    score_frame, sectors = make_inputs()
+    selector = SectorCappedSelector(sectors)
+    print(f"섹터 분산 선정 벤치마크: {N_DATES}일 × {N_TICKERS}종목, 상위 {TOP_N}개\n")
+
+    legacy, legacy_time = timed(legacy_select, score_frame, sectors)
+    per_date, per_date_time = timed(selector_per_date, score_frame, selector)
+    start = time.perf_counter()
+    selected = selector.select_many(score_frame, TOP_N)
+    batch_time = time.perf_counter() - start
+    batch, _ = selector_batch(score_frame, selector)
+
+    assert per_date == legacy
+    assert batch == legacy
+    assert (selected.sum(axis=1) <= TOP_N).all()
+
+    print(f"  날짜별 Python 루프 (기존):   {legacy_time * 1000:8.1f} ms")
+    print(f"  선택기 (날짜별 호출):        {per_date_time * 1000:8.1f} ms  (후보 dict 생성/정렬 포함)")
+    print(f"  선택기 (select_many 한 번):  {batch_time * 1000:8.1f} ms  ({legacy_time / batch_time:.1f}x)")
+    print("  결과 동일: OK")
+
+
+if __name__ == '__main__':
+    main()
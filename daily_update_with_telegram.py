@@ -9,11 +9,11 @@ import yfinance as yf
 import pandas as pd
 from datetime import datetime, timedelta
 import sys
-import time
 sys.path.insert(0, '.')
 
 from quant_trading.technical_analyzer_v3 import TechnicalAnalyzerV3
 from quant_trading.news_sentiment_analyzer import NewsSentimentAnalyzer
+from quant_trading.rate_limiter import YAHOO_HOST, get_rate_limiter
 from telegram_notifier import TelegramNotifier
 from market_monitor import MarketMonitor
 
@@ -36,7 +36,7 @@ def analyze_stock(ticker, date=None):
     try:
         stock = yf.Ticker(ticker)
         start_fetch = date - timedelta(days=730)
-        df = stock.history(start=start_fetch, end=date)
+        df = get_rate_limiter(YAHOO_HOST).call(stock.history, start=start_fetch, end=date)
 
         if df.empty or len(df) < 180:
             return None
@@ -54,7 +54,6 @@ def analyze_stock(ticker, date=None):
             news_result = news_analyzer.calculate_news_score()
             news_score = news_result['total_score']
             news_count = news_result['news_count']
-            time.sleep(0.5)  # API 제한 대응
         except:
             pass
 
@@ -200,7 +199,7 @@ def main():
             # 간단한 성과 계산 (SPY 대비)
             try:
                 spy = yf.Ticker('SPY')
-                spy_df = spy.history(period='1mo')
+                spy_df = get_rate_limiter(YAHOO_HOST).call(spy.history, period='1mo')
                 if spy_df.empty or len(spy_df) < 2:
                     spy_return = 0
                 else:
@@ -11,15 +11,33 @@ sys.path.insert(0, '.')
 
 from quant_trading.technical_analyzer_v2 import TechnicalAnalyzerV2
 from quant_trading.technical_analyzer_v3 import TechnicalAnalyzerV3
+from quant_trading.price_store import PriceStore
+from quant_trading.market_archive import archive_path
 
 
-def analyze_korean_stock(ticker, period='2y'):
+def load_korean_prices(tickers, period='2y'):
+    """
+    여러 종목 가격을 묶음 다운로드 (1시간 이내 같은 요청의 가격 아카이브가 있으면 재사용)
+
+    Args:
+        tickers: 종목 코드 리스트 (.KS/.KQ 포함)
+        period: 분석 기간
+
+    Returns:
+        PriceStore
+    """
+    return PriceStore.download(tickers, period=period, archive=archive_path('korea_demo'),
+                               max_age_hours=1.0)
+
+
+def analyze_korean_stock(ticker, period='2y', price_store=None):
     """
     한국 종목 분석 (V2 vs V3 비교)
 
     Args:
         ticker: 종목 코드 (예: '005930.KS', '000660.KS')
         period: 분석 기간
+        price_store: 미리 받은 가격 저장소 (없거나 종목이 빠져 있으면 개별 다운로드)
 
     Returns:
         dict: 분석 결과
@@ -34,7 +52,10 @@ def analyze_korean_stock(ticker, period='2y'):
 
         # 데이터 다운로드
         stock = yf.Ticker(ticker_symbol)
-        df = stock.history(period=period)
+        if price_store is not None and ticker_symbol in price_store:
+            df = price_store.history(ticker_symbol)
+        else:
+            df = stock.history(period=period)
 
         if df.empty or len(df) < 180:
             print(f"[SKIP] {ticker}: 데이터 부족")
@@ -182,10 +203,12 @@ def demo_korean_major_stocks():
 
     print(f"분석 종목: {len(korean_stocks)}개\n")
 
+    price_store = load_korean_prices(list(korean_stocks))
+
     results = []
     for idx, (ticker, name_kr) in enumerate(korean_stocks.items(), 1):
         print(f"[{idx}/{len(korean_stocks)}] {ticker} ({name_kr})... ", end='', flush=True)
-        result = analyze_korean_stock(ticker)
+        result = analyze_korean_stock(ticker, price_store=price_store)
         if result:
             results.append(result)
             print(f"V2: {result['V2_Total']:3.0f} | V3: {result['V3_Total']:3.0f}")
@@ -288,12 +311,13 @@ def demo_sector_analysis():
     }
 
     all_results = []
+    price_store = load_korean_prices([ticker for tickers in sectors.values() for ticker in tickers])
 
     for sector_name, tickers in sectors.items():
         print(f"\n[{sector_name} 섹터]")
         for ticker in tickers:
             print(f"  {ticker}... ", end='', flush=True)
-            result = analyze_korean_stock(ticker)
+            result = analyze_korean_stock(ticker, price_store=price_store)
             if result:
                 all_results.append(result)
                 print(f"V3: {result['V3_Total']:3.0f} ({result['V3_Signal'][:30]}...)")
@@ -15,9 +15,8 @@
 import yfinance as yf
 import pandas as pd
 from datetime import datetime, timezone, timedelta
+import os
 import sys
-import time
-import concurrent.futures
 sys.path.insert(0, '.')
 
 # 한국 시간대 (UTC+9)
@@ -52,9 +51,42 @@ from quant_trading.price_recommender import PriceRecommender
 from quant_trading.valuation_analyzer import ValuationAnalyzer
 from quant_trading.automation_analyzer import AutomationAnalyzer
 from quant_trading.policy_analyzer import PolicyAnalyzer
+from quant_trading.ticker_info_cache import TickerInfoCache
+from quant_trading.price_store import PriceStore
+from quant_trading.market_archive import archive_path
+from quant_trading.indicator_state import DEFAULT_STATE_DIR, IndicatorStateStore, refresh_indicator_states
+from quant_trading.compute_pool import run_pipeline
+from quant_trading.report_cache import FragmentCache, write_static_asset
+from quant_trading.portfolio import sector_rankings
+from quant_trading.rate_limiter import YAHOO_HOST, get_rate_limiter
 
+# 실행당 종목 정보 캐시 (종목별 .info 요청 1회)
+INFO_CACHE = TickerInfoCache()
 
-def analyze_stock_for_report(ticker):
+
+def compute_price_scores(df, latest_price=None):
+    """
+    가격 데이터만 쓰는 CPU 계산 (계산 단계 프로세스 풀에서 실행)
+
+    Args:
+        df: OHLCV
+        latest_price: 가격 추천 기준가 (None이면 마지막 종가)
+
+    Returns:
+        {'technical': TechnicalAnalyzerV3 결과, 'price_rec': 가격 추천} (데이터 부족 시 None)
+    """
+    if df.empty or len(df) < 180:
+        return None
+
+    # 가격 추천은 최신 가격 기준
+    latest_price = latest_price or df['Close'].iloc[-1]
+    return {
+        'technical': TechnicalAnalyzerV3(df).calculate_total_score(),
+        'price_rec': PriceRecommender(df, latest_price).get_recommendation(strategy='moderate'),
+    }
+
+
+def analyze_stock_for_report(ticker, info_cache=None, df=None, price_scores=None):
     """
     리포트용 종목 분석 - 김기현 투자 철학 반영
 
@@ -63,38 +95,50 @@ def analyze_stock_for_report(ticker):
     - 기술적 분석: 25점 (65점 -> 25점으로 스케일)
     - 자동화/AI 수혜: 20점 (AI인프라, 자동화/로봇)
     - 정책 수혜: 20점 (25점 -> 20점으로 스케일)
+
+    Args:
+        ticker: 종목 코드
+        info_cache: 공유 종목 정보 캐시 (None이면 모듈 INFO_CACHE 사용)
+        df: 미리 받아둔 OHLCV (None이면 개별 다운로드)
+        price_scores: 계산 단계에서 미리 구한 compute_price_scores 결과 (None이면 여기서 계산)
     """
+    if info_cache is None:
+        info_cache = INFO_CACHE
+
     try:
-        stock = yf.Ticker(ticker)
-        df = stock.history(period='2y')
+        if df is None:
+            df = get_rate_limiter(YAHOO_HOST).call(yf.Ticker(ticker).history, period='2y')
 
         if df.empty or len(df) < 180:
             return None
 
+        info = info_cache.get(ticker)
+
+        if price_scores is None:
+            price_scores = compute_price_scores(df, info.get('regularMarketPrice'))
+
         # 1. 기술적 분석 (25점 만점으로 스케일)
-        tech_v3 = TechnicalAnalyzerV3(df)
-        result_v3 = tech_v3.calculate_total_score()
+        result_v3 = price_scores['technical']
         tech_score_scaled = (result_v3['total_score'] / 65) * 25  # 65점 -> 25점
 
         # 2. 밥값 점수 (35점 만점)
-        valuation = ValuationAnalyzer(ticker)
+        valuation = ValuationAnalyzer(ticker, info_cache=info_cache)
         valuation_result = valuation.calculate_total_score()
         valuation_score = valuation_result['total_score']
 
         # 3. 자동화/AI 수혜 점수 (20점 만점)
-        automation = AutomationAnalyzer(ticker)
+        automation = AutomationAnalyzer(ticker, info_cache=info_cache)
         automation_result = automation.calculate_total_score()
         automation_score = automation_result['total_score']
 
         # 4. 정책 수혜 점수 (20점 만점)
-        policy = PolicyAnalyzer(ticker)
+        policy = PolicyAnalyzer(ticker, info_cache=info_cache)
         policy_result = policy.calculate_total_score()
         policy_score = policy_result['total_score']  # 이미 20점 만점
 
         # 총점 계산 (100점 만점)
         total_score = valuation_score + tech_score_scaled + automation_score + policy_score
 
-        info = stock.info
         name = info.get('longName', ticker)
         sector = info.get('sector', 'N/A')
         current_price = df['Close'].iloc[-1]
@@ -109,10 +153,7 @@ def analyze_stock_for_report(ticker):
         postmarket_price = info.get('postMarketPrice')
         postmarket_change = info.get('postMarketChangePercent')
 
-        # 가격 추천은 최신 가격 기준
-        latest_price = regular_market_price or current_price
-        price_rec = PriceRecommender(df, latest_price)
-        price_recommendation = price_rec.get_recommendation(strategy='moderate')
+        price_recommendation = price_scores['price_rec']
 
         return {
             'ticker': ticker,
@@ -190,16 +231,41 @@ def get_market_session():
         return 'regular'  # 기본값
 
 
+# 카드 템플릿 자리표시자 (순위/TOP 5 여부는 전체 결과가 모인 뒤에 정해짐)
+CARD_CLASS_SLOT = '<!--card-class-->'
+TOP5_LABEL_SLOT = '<!--top5-label-->'
+RANK_SLOT = '<!--rank-->'
+BADGE_CLASS_SLOT = '<!--badge-class-->'
+
+
+def fill_stock_card(template, stock, idx, is_top5=False):
+    """카드 템플릿에 순위/TOP 5 표시 채우기"""
+    badge_class = 'top5' if is_top5 else 'high' if stock['total_score'] >= 60 else 'medium' if stock['total_score'] >= 50 else ''
+    top5_badge = f'<span class="top5-label">TOP {idx}</span>' if is_top5 else ''
+
+    return (template
+            .replace(CARD_CLASS_SLOT, 'top5-card' if is_top5 else '')
+            .replace(TOP5_LABEL_SLOT, top5_badge)
+            .replace(RANK_SLOT, str(idx))
+            .replace(BADGE_CLASS_SLOT, badge_class))
+
+
 def generate_stock_card_html(stock, idx, is_top5=False, market_session='regular'):
     """개별 종목 카드 HTML 생성"""
+    return fill_stock_card(render_stock_card_template(stock, market_session), stock, idx, is_top5)
+
+
+def render_stock_card_template(stock, market_session='regular'):
+    """
+    순위와 무관한 종목 카드 HTML (분석 결과가 나오는 대로 미리 렌더링)
+
+    순위, TOP 5 표시, 점수 배지 색은 fill_stock_card에서 채웁니다.
+    """
     pr = stock['price_rec']
 
-    badge_class = 'top5' if is_top5 else 'high' if stock['total_score'] >= 60 else 'medium' if stock['total_score'] >= 50 else ''
     change_class = 'positive' if stock['change_pct'] >= 0 else 'negative'
     change_sign = '+' if stock['change_pct'] >= 0 else ''
 
-    top5_badge = f'<span class="top5-label">TOP {idx}</span>' if is_top5 else ''
-
     # 시장 세션별 가격 표시
     if market_session == 'premarket':
         # 프리마켓: 전날 종가 + 프리마켓 가격
@@ -243,16 +309,16 @@ def generate_stock_card_html(stock, idx, is_top5=False, market_session='regular'
         '''
 
     return f"""
-    <div class="stock-card {'top5-card' if is_top5 else ''}">
+    <div class="stock-card {CARD_CLASS_SLOT}">
         <div class="stock-header">
             <div class="stock-title">
-                {top5_badge}
-                <span class="rank-badge">#{idx}</span>
+                {TOP5_LABEL_SLOT}
+                <span class="rank-badge">#{RANK_SLOT}</span>
                 <h2>{stock['name']}</h2>
                 <div class="ticker">{stock['ticker']}</div>
                 <div class="sector">{stock['sector']}</div>
             </div>
-            <div class="score-badge {badge_class}">
+            <div class="score-badge {BADGE_CLASS_SLOT}">
                 {stock['total_score']:.0f}점
             </div>
         </div>
@@ -361,46 +427,14 @@ def generate_stock_card_html(stock, idx, is_top5=False, market_session='regular'
     """
 
 
-def generate_html_report(stocks_data, title="Daily Stock Recommendations"):
-    """HTML 리포트 생성"""
-
-    kst_now = datetime.now(KST)
-    current_date = kst_now.strftime('%Y년 %m월 %d일')
-    current_time = kst_now.strftime('%H:%M:%S')
-
-    # 현재 시장 세션 확인
-    market_session = get_market_session()
-
-    stocks_data = sorted(stocks_data, key=lambda x: x['total_score'], reverse=True)
-
-    # 섹터별 그룹화
-    sectors = {}
-    for stock in stocks_data:
-        sector = stock['sector']
-        if sector not in sectors:
-            sectors[sector] = []
-        sectors[sector].append(stock)
-
-    # TOP 5와 나머지 분리
-    top5_stocks = stocks_data[:5]
-    other_stocks = stocks_data[5:]
-
-    html = f"""
-<!DOCTYPE html>
-<html lang="ko">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{title} - {current_date}</title>
-    <link href="https://fonts.googleapis.com/css2?family=Noto+Sans+KR:wght@400;500;700&display=swap" rel="stylesheet">
-    <style>
-        * {{
+# 리포트 공용 스타일/스크립트 (asset_dir을 주면 정적 파일로 분리, 매 실행 HTML에서 제외)
+REPORT_CSS = """        * {
             margin: 0;
             padding: 0;
             box-sizing: border-box;
-        }}
+        }
 
-        body {{
+        body {
             font-family: 'Noto Sans KR', -apple-system, sans-serif;
             background: linear-gradient(180deg, #87CEEB 0%, #98D8C8 30%, #F7DC6F 70%, #FADBD8 100%);
             background-attachment: fixed;
@@ -409,40 +443,40 @@ def generate_html_report(stocks_data, title="Daily Stock Recommendations"):
             color: #5D4E37;
             position: relative;
             overflow-x: hidden;
-        }}
+        }
 
         /* 구름 애니메이션 */
-        .cloud {{
+        .cloud {
             position: fixed;
             background: white;
             border-radius: 50px;
             opacity: 0.8;
             animation: float 25s infinite linear;
             z-index: 0;
-        }}
-        .cloud::before, .cloud::after {{
+        }
+        .cloud::before, .cloud::after {
             content: '';
             position: absolute;
             background: white;
             border-radius: 50%;
-        }}
-        .cloud-1 {{ width: 100px; height: 40px; top: 10%; left: -100px; animation-delay: 0s; }}
-        .cloud-1::before {{ width: 50px; height: 50px; top: -25px; left: 15px; }}
-        .cloud-1::after {{ width: 35px; height: 35px; top: -15px; left: 55px; }}
-        .cloud-2 {{ width: 120px; height: 45px; top: 25%; left: -120px; animation-delay: -8s; }}
-        .cloud-2::before {{ width: 55px; height: 55px; top: -30px; left: 20px; }}
-        .cloud-2::after {{ width: 40px; height: 40px; top: -18px; left: 65px; }}
-        .cloud-3 {{ width: 80px; height: 35px; top: 40%; left: -80px; animation-delay: -16s; }}
-        .cloud-3::before {{ width: 40px; height: 40px; top: -20px; left: 10px; }}
-        .cloud-3::after {{ width: 30px; height: 30px; top: -12px; left: 40px; }}
-
-        @keyframes float {{
-            0% {{ transform: translateX(0); }}
-            100% {{ transform: translateX(calc(100vw + 200px)); }}
-        }}
+        }
+        .cloud-1 { width: 100px; height: 40px; top: 10%; left: -100px; animation-delay: 0s; }
+        .cloud-1::before { width: 50px; height: 50px; top: -25px; left: 15px; }
+        .cloud-1::after { width: 35px; height: 35px; top: -15px; left: 55px; }
+        .cloud-2 { width: 120px; height: 45px; top: 25%; left: -120px; animation-delay: -8s; }
+        .cloud-2::before { width: 55px; height: 55px; top: -30px; left: 20px; }
+        .cloud-2::after { width: 40px; height: 40px; top: -18px; left: 65px; }
+        .cloud-3 { width: 80px; height: 35px; top: 40%; left: -80px; animation-delay: -16s; }
+        .cloud-3::before { width: 40px; height: 40px; top: -20px; left: 10px; }
+        .cloud-3::after { width: 30px; height: 30px; top: -12px; left: 40px; }
+
+        @keyframes float {
+            0% { transform: translateX(0); }
+            100% { transform: translateX(calc(100vw + 200px)); }
+        }
 
         /* 반짝이 효과 */
-        .sparkle {{
+        .sparkle {
             position: fixed;
             width: 10px;
             height: 10px;
@@ -450,20 +484,20 @@ def generate_html_report(stocks_data, title="Daily Stock Recommendations"):
             clip-path: polygon(50% 0%, 61% 35%, 98% 35%, 68% 57%, 79% 91%, 50% 70%, 21% 91%, 32% 57%, 2% 35%, 39% 35%);
             animation: sparkle 2s infinite;
             z-index: 1;
-        }}
-        @keyframes sparkle {{
-            0%, 100% {{ opacity: 0; transform: scale(0); }}
-            50% {{ opacity: 1; transform: scale(1); }}
-        }}
+        }
+        @keyframes sparkle {
+            0%, 100% { opacity: 0; transform: scale(0); }
+            50% { opacity: 1; transform: scale(1); }
+        }
 
-        .container {{
+        .container {
             max-width: 1400px;
             margin: 0 auto;
             position: relative;
             z-index: 10;
-        }}
+        }
 
-        .header {{
+        .header {
             background: white;
             border-radius: 30px;
             padding: 35px;
@@ -471,36 +505,36 @@ def generate_html_report(stocks_data, title="Daily Stock Recommendations"):
             box-shadow: 0 8px 0 #5BA3E0, 0 12px 20px rgba(0,0,0,0.15);
             border: 4px solid #5D4E37;
             text-align: center;
-        }}
+        }
 
-        .header h1 {{
+        .header h1 {
             color: #5D4E37;
             font-size: 2.2em;
             margin-bottom: 8px;
             text-shadow: 2px 2px 0 #B8E4FF;
-        }}
+        }
 
-        .header .subtitle {{
+        .header .subtitle {
             color: #7B6B4F;
             font-size: 1em;
-        }}
+        }
 
-        .header .date {{
+        .header .date {
             color: #5BA3E0;
             font-weight: 600;
             margin-top: 10px;
             font-size: 1.1em;
-        }}
+        }
 
-        .tabs {{
+        .tabs {
             display: flex;
             gap: 10px;
             margin-bottom: 25px;
             flex-wrap: wrap;
             justify-content: center;
-        }}
+        }
 
-        .tab {{
+        .tab {
             background: white;
             border: 3px solid #5D4E37;
             padding: 12px 25px;
@@ -510,58 +544,58 @@ def generate_html_report(stocks_data, title="Daily Stock Recommendations"):
             font-weight: 500;
             color: #5D4E37;
             box-shadow: 0 4px 0 #C4A35A;
-        }}
+        }
 
-        .tab:hover {{
+        .tab:hover {
             transform: translateY(-2px);
             box-shadow: 0 6px 0 #C4A35A;
-        }}
+        }
 
-        .tab.active {{
+        .tab.active {
             background: #5BA3E0;
             border-color: #5D4E37;
             color: white;
             box-shadow: 0 4px 0 #3B83BD;
-        }}
+        }
 
-        .tab-content {{
+        .tab-content {
             display: none;
-        }}
+        }
 
-        .tab-content.active {{
+        .tab-content.active {
             display: block;
-        }}
+        }
 
-        .summary {{
+        .summary {
             display: grid;
             grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
             gap: 15px;
             margin-bottom: 25px;
-        }}
+        }
 
-        .summary-card {{
+        .summary-card {
             background: linear-gradient(180deg, #FFF8DC 0%, #FAEBD7 100%);
             border-radius: 20px;
             padding: 20px;
             border: 3px solid #5D4E37;
             box-shadow: 0 4px 0 #C4A35A;
             text-align: center;
-        }}
+        }
 
-        .summary-card .label {{
+        .summary-card .label {
             color: #7B6B4F;
             font-size: 0.85em;
             margin-bottom: 8px;
-        }}
+        }
 
-        .summary-card .value {{
+        .summary-card .value {
             color: #FF6B35;
             font-size: 1.8em;
             font-weight: bold;
             text-shadow: 1px 1px 0 #5D4E37;
-        }}
+        }
 
-        .section-title {{
+        .section-title {
             font-size: 1.6em;
             color: #5D4E37;
             margin: 30px 0 20px 0;
@@ -573,9 +607,9 @@ def generate_html_report(stocks_data, title="Daily Stock Recommendations"):
             border-radius: 20px;
             border: 3px solid #5D4E37;
             box-shadow: 0 4px 0 #C4A35A;
-        }}
+        }
 
-        .stock-card {{
+        .stock-card {
             background: linear-gradient(180deg, #FFFFFF 0%, #F5F5DC 100%);
             border-radius: 20px;
             padding: 25px;
@@ -583,24 +617,24 @@ def generate_html_report(stocks_data, title="Daily Stock Recommendations"):
             border: 3px solid #5D4E37;
             box-shadow: 0 5px 0 #5BA3E0, 0 8px 15px rgba(0,0,0,0.1);
             transition: all 0.3s ease;
-        }}
+        }
 
-        .stock-card:hover {{
+        .stock-card:hover {
             transform: translateY(-5px);
             box-shadow: 0 10px 0 #5BA3E0, 0 15px 25px rgba(0,0,0,0.15);
-        }}
+        }
 
-        .top5-card {{
+        .top5-card {
             border: 4px solid #F5B041;
             background: linear-gradient(180deg, #FFFACD 0%, #FFF8DC 100%);
             box-shadow: 0 6px 0 #E8A838, 0 10px 20px rgba(0,0,0,0.15);
-        }}
+        }
 
-        .top5-card:hover {{
+        .top5-card:hover {
             box-shadow: 0 12px 0 #E8A838, 0 18px 30px rgba(0,0,0,0.15);
-        }}
+        }
 
-        .top5-label {{
+        .top5-label {
             display: inline-block;
             background: linear-gradient(135deg, #F5B041 0%, #E8A838 100%);
             color: white;
@@ -610,40 +644,40 @@ def generate_html_report(stocks_data, title="Daily Stock Recommendations"):
             font-size: 0.9em;
             margin-right: 10px;
             border: 2px solid #5D4E37;
-        }}
+        }
 
-        .stock-header {{
+        .stock-header {
             display: flex;
             justify-content: space-between;
             align-items: center;
             margin-bottom: 20px;
             padding-bottom: 15px;
             border-bottom: 3px dashed #C4A35A;
-        }}
+        }
 
-        .stock-title {{
+        .stock-title {
             flex: 1;
-        }}
+        }
 
-        .stock-title h2 {{
+        .stock-title h2 {
             color: #5D4E37;
             font-size: 1.5em;
             margin-bottom: 5px;
-        }}
+        }
 
-        .stock-title .ticker {{
+        .stock-title .ticker {
             color: #5BA3E0;
             font-size: 1em;
             font-weight: 600;
-        }}
+        }
 
-        .stock-title .sector {{
+        .stock-title .sector {
             color: #7B6B4F;
             font-size: 0.85em;
             margin-top: 5px;
-        }}
+        }
 
-        .score-badge {{
+        .score-badge {
             background: #5BA3E0;
             color: white;
             padding: 12px 25px;
@@ -654,261 +688,261 @@ def generate_html_report(stocks_data, title="Daily Stock Recommendations"):
             min-width: 90px;
             border: 3px solid #5D4E37;
             box-shadow: 0 3px 0 #3B83BD;
-        }}
+        }
 
-        .score-badge.top5 {{
+        .score-badge.top5 {
             background: linear-gradient(135deg, #F5B041 0%, #E8A838 100%);
             font-size: 1.5em;
             box-shadow: 0 4px 0 #C4842F;
-        }}
+        }
 
-        .score-badge.high {{
+        .score-badge.high {
             background: #4CAF50;
             box-shadow: 0 3px 0 #388E3C;
-        }}
+        }
 
-        .score-badge.medium {{
+        .score-badge.medium {
             background: #5BA3E0;
-        }}
+        }
 
-        .current-price {{
+        .current-price {
             margin-bottom: 20px;
-        }}
+        }
 
-        .price-row {{
+        .price-row {
             display: flex;
             align-items: baseline;
             gap: 12px;
             margin-bottom: 8px;
-        }}
+        }
 
-        .price-row.premarket {{
+        .price-row.premarket {
             opacity: 0.9;
             border-left: 3px solid #5BA3E0;
             padding-left: 8px;
-        }}
+        }
 
-        .price-row.regular {{
+        .price-row.regular {
             opacity: 1;
             border-left: 3px solid #4CAF50;
             padding-left: 8px;
             font-weight: 600;
-        }}
+        }
 
-        .price-row.afterhours {{
+        .price-row.afterhours {
             opacity: 0.9;
             border-left: 3px solid #F5B041;
             padding-left: 8px;
-        }}
+        }
 
-        .price-label {{
+        .price-label {
             font-size: 0.9em;
             color: #7B6B4F;
             min-width: 90px;
-        }}
+        }
 
-        .current-price .price {{
+        .current-price .price {
             font-size: 1.5em;
             font-weight: bold;
             color: #5D4E37;
-        }}
+        }
 
-        .current-price .change {{
+        .current-price .change {
             font-size: 1.0em;
             font-weight: 600;
             padding: 4px 12px;
             border-radius: 12px;
             border: 2px solid;
-        }}
+        }
 
-        .current-price .change.positive {{
+        .current-price .change.positive {
             background: #E8F5E9;
             color: #2E7D32;
             border-color: #4CAF50;
-        }}
+        }
 
-        .current-price .change.negative {{
+        .current-price .change.negative {
             background: #FFEBEE;
             color: #C62828;
             border-color: #E53935;
-        }}
+        }
 
-        .metrics {{
+        .metrics {
             display: grid;
             grid-template-columns: repeat(auto-fit, minmax(100px, 1fr));
             gap: 12px;
             margin-bottom: 20px;
-        }}
+        }
 
-        .metric {{
+        .metric {
             background: linear-gradient(180deg, #FFF8DC 0%, #FAEBD7 100%);
             padding: 12px;
             border-radius: 15px;
             text-align: center;
             border: 2px solid #C4A35A;
-        }}
+        }
 
-        .metric .label {{
+        .metric .label {
             color: #7B6B4F;
             font-size: 0.75em;
             margin-bottom: 6px;
-        }}
+        }
 
-        .metric .value {{
+        .metric .value {
             color: #5D4E37;
             font-size: 1.2em;
             font-weight: bold;
-        }}
+        }
 
-        .metric.highlight {{
+        .metric.highlight {
             background: linear-gradient(135deg, #4CAF50, #45A049);
             color: white;
             border-color: #388E3C;
-        }}
+        }
 
         .metric.highlight .label,
-        .metric.highlight .value {{
+        .metric.highlight .value {
             color: white;
-        }}
+        }
 
         /* 밥값/자동화 상세 섹션 */
-        .verdict-section {{
+        .verdict-section {
             background: linear-gradient(180deg, #E8F4FD 0%, #D6EAF8 100%);
             border-radius: 15px;
             padding: 12px 15px;
             margin-bottom: 15px;
             border: 2px solid #5BA3E0;
-        }}
+        }
 
-        .verdict-item {{
+        .verdict-item {
             display: flex;
             align-items: center;
             gap: 8px;
             margin-bottom: 6px;
             font-size: 0.9em;
-        }}
+        }
 
-        .verdict-item:last-child {{
+        .verdict-item:last-child {
             margin-bottom: 0;
-        }}
+        }
 
-        .verdict-label {{
+        .verdict-label {
             font-weight: 600;
             color: #5D4E37;
             min-width: 80px;
-        }}
+        }
 
-        .verdict-value {{
+        .verdict-value {
             color: #5D4E37;
             font-weight: 500;
-        }}
+        }
 
-        .verdict-desc {{
+        .verdict-desc {
             color: #7B6B4F;
             font-size: 0.9em;
-        }}
+        }
 
-        .verdict-item.profitable .verdict-value {{
+        .verdict-item.profitable .verdict-value {
             color: #4CAF50;
-        }}
+        }
 
-        .verdict-item.unprofitable .verdict-value {{
+        .verdict-item.unprofitable .verdict-value {
             color: #E53935;
-        }}
+        }
 
-        .price-section {{
+        .price-section {
             display: grid;
             grid-template-columns: repeat(auto-fit, minmax(280px, 1fr));
             gap: 15px;
             margin-top: 20px;
-        }}
+        }
 
-        .price-box {{
+        .price-box {
             background: linear-gradient(180deg, #FFF8DC 0%, #FAEBD7 100%);
             border-radius: 15px;
             padding: 18px;
             border: 3px solid #5D4E37;
-        }}
+        }
 
-        .price-box.buy {{
+        .price-box.buy {
             border-color: #5BA3E0;
             background: linear-gradient(180deg, #E8F4FD 0%, #D6EAF8 100%);
-        }}
+        }
 
-        .price-box.sell {{
+        .price-box.sell {
             border-color: #9B59B6;
             background: linear-gradient(180deg, #F5EEF8 0%, #E8DAEF 100%);
-        }}
+        }
 
-        .price-box.stop {{
+        .price-box.stop {
             border-color: #E53935;
             background: linear-gradient(180deg, #FFEBEE 0%, #FFCDD2 100%);
-        }}
+        }
 
-        .price-box h3 {{
+        .price-box h3 {
             color: #5D4E37;
             margin-bottom: 12px;
             font-size: 1em;
-        }}
+        }
 
-        .price-item {{
+        .price-item {
             display: flex;
             justify-content: space-between;
             padding: 8px 0;
             border-bottom: 2px dashed rgba(93, 78, 55, 0.2);
-        }}
+        }
 
-        .price-item:last-child {{
+        .price-item:last-child {
             border-bottom: none;
-        }}
+        }
 
-        .price-item .label {{
+        .price-item .label {
             color: #7B6B4F;
             font-weight: 500;
             font-size: 0.9em;
-        }}
+        }
 
-        .price-item .value {{
+        .price-item .value {
             color: #5D4E37;
             font-weight: bold;
-        }}
+        }
 
-        .signal {{
+        .signal {
             background: linear-gradient(180deg, #E8F4FD 0%, #D6EAF8 100%);
             padding: 12px;
             border-radius: 12px;
             margin-top: 15px;
             border: 2px solid #5BA3E0;
-        }}
+        }
 
-        .signal .label {{
+        .signal .label {
             color: #7B6B4F;
             font-size: 0.85em;
             margin-bottom: 6px;
-        }}
+        }
 
-        .signal .value {{
+        .signal .value {
             color: #5D4E37;
             font-weight: 500;
             line-height: 1.5;
-        }}
+        }
 
-        .risk-reward {{
+        .risk-reward {
             background: linear-gradient(180deg, #FFEBEE 0%, #FFCDD2 100%);
             border: 3px solid #E53935;
             border-radius: 15px;
             padding: 12px;
             margin-top: 15px;
             text-align: center;
-        }}
+        }
 
-        .risk-reward .ratio {{
+        .risk-reward .ratio {
             font-size: 1.3em;
             font-weight: bold;
             color: #C62828;
-        }}
+        }
 
-        .show-more-btn {{
+        .show-more-btn {
             display: block;
             width: 100%;
             max-width: 400px;
@@ -924,22 +958,22 @@ def generate_html_report(stocks_data, title="Daily Stock Recommendations"):
             transition: all 0.2s;
             font-family: 'Noto Sans KR', sans-serif;
             box-shadow: 0 4px 0 #C4A35A;
-        }}
+        }
 
-        .show-more-btn:hover {{
+        .show-more-btn:hover {
             transform: translateY(2px);
             box-shadow: 0 2px 0 #C4A35A;
-        }}
+        }
 
-        #other-stocks {{
+        #other-stocks {
             display: none;
-        }}
+        }
 
-        #other-stocks.show {{
+        #other-stocks.show {
             display: block;
-        }}
+        }
 
-        .footer {{
+        .footer {
             background: rgba(255,255,255,0.9);
             border-radius: 20px;
             padding: 20px;
@@ -948,9 +982,9 @@ def generate_html_report(stocks_data, title="Daily Stock Recommendations"):
             margin-top: 30px;
             font-size: 0.9em;
             border: 3px solid #C4A35A;
-        }}
+        }
 
-        .rank-badge {{
+        .rank-badge {
             display: inline-block;
             background: linear-gradient(180deg, #FFF8DC 0%, #FAEBD7 100%);
             color: #5D4E37;
@@ -960,26 +994,26 @@ def generate_html_report(stocks_data, title="Daily Stock Recommendations"):
             margin-right: 8px;
             font-size: 0.9em;
             border: 2px solid #C4A35A;
-        }}
+        }
 
         /* 점수 항목 클릭 기능 */
-        .metric.clickable {{
+        .metric.clickable {
             cursor: pointer;
             transition: all 0.2s ease;
             position: relative;
-        }}
+        }
 
-        .metric.clickable:hover {{
+        .metric.clickable:hover {
             transform: scale(1.05);
             box-shadow: 0 4px 10px rgba(91, 163, 224, 0.3);
-        }}
+        }
 
-        .metric.clickable:active {{
+        .metric.clickable:active {
             transform: scale(0.98);
-        }}
+        }
 
         /* 점수 기준 팝업 */
-        .score-tooltip {{
+        .score-tooltip {
             display: none;
             position: fixed;
             top: 50%;
@@ -995,13 +1029,13 @@ def generate_html_report(stocks_data, title="Daily Stock Recommendations"):
             border: 4px solid #5D4E37;
             max-height: 80vh;
             overflow-y: auto;
-        }}
+        }
 
-        .score-tooltip.show {{
+        .score-tooltip.show {
             display: block;
-        }}
+        }
 
-        .score-tooltip-overlay {{
+        .score-tooltip-overlay {
             display: none;
             position: fixed;
             top: 0;
@@ -1010,43 +1044,43 @@ def generate_html_report(stocks_data, title="Daily Stock Recommendations"):
             bottom: 0;
             background: rgba(0,0,0,0.6);
             z-index: 9999;
-        }}
+        }
 
-        .score-tooltip-overlay.show {{
+        .score-tooltip-overlay.show {
             display: block;
-        }}
+        }
 
-        .score-tooltip h3 {{
+        .score-tooltip h3 {
             color: #5D4E37;
             margin-bottom: 15px;
             font-size: 1.3em;
             border-bottom: 3px solid #5BA3E0;
             padding-bottom: 10px;
-        }}
+        }
 
-        .score-tooltip .criteria-list {{
+        .score-tooltip .criteria-list {
             list-style: none;
             padding: 0;
             margin: 0;
-        }}
+        }
 
-        .score-tooltip .criteria-list li {{
+        .score-tooltip .criteria-list li {
             padding: 8px 0;
             border-bottom: 2px dashed #C4A35A;
             font-size: 0.95em;
             color: #5D4E37;
-        }}
+        }
 
-        .score-tooltip .criteria-list li:last-child {{
+        .score-tooltip .criteria-list li:last-child {
             border-bottom: none;
-        }}
+        }
 
-        .score-tooltip .criteria-list .score-value {{
+        .score-tooltip .criteria-list .score-value {
             font-weight: 700;
             color: #5BA3E0;
-        }}
+        }
 
-        .score-tooltip .close-btn {{
+        .score-tooltip .close-btn {
             position: absolute;
             top: 15px;
             right: 15px;
@@ -1061,165 +1095,55 @@ def generate_html_report(stocks_data, title="Daily Stock Recommendations"):
             display: flex;
             align-items: center;
             justify-content: center;
-        }}
+        }
 
-        .score-tooltip .close-btn:hover {{
+        .score-tooltip .close-btn:hover {
             background: #C62828;
-        }}
+        }
 
         /* 뉴스 섹션 스타일 */
-        .news-section {{
+        .news-section {
             margin-top: 20px;
             padding: 15px;
             background: linear-gradient(135deg, #f7fafc, #edf2f7);
             border-radius: 10px;
             border-left: 4px solid #667eea;
-        }}
+        }
 
-        .news-title {{
+        .news-title {
             font-weight: 700;
             color: #2d3748;
             margin-bottom: 12px;
             font-size: 1em;
-        }}
+        }
 
-        .news-list {{
+        .news-list {
             list-style: none;
             padding: 0;
             margin: 0;
-        }}
+        }
 
-        .news-list li {{
+        .news-list li {
             padding: 8px 0;
             border-bottom: 1px solid #e2e8f0;
             color: #4a5568;
             font-size: 0.9em;
             line-height: 1.5;
-        }}
+        }
 
-        .news-list li:last-child {{
+        .news-list li:last-child {
             border-bottom: none;
-        }}
+        }
 
-        .news-list li:before {{
+        .news-list li:before {
             content: "•";
             color: #667eea;
             margin-right: 8px;
             font-weight: bold;
-        }}
-    </style>
-</head>
-<body>
-    <!-- 구름들 -->
-    <div class="cloud cloud-1"></div>
-    <div class="cloud cloud-2"></div>
-    <div class="cloud cloud-3"></div>
-
-    <!-- 반짝이들 -->
-    <div class="sparkle" style="top: 15%; left: 10%;"></div>
-    <div class="sparkle" style="top: 25%; right: 15%; animation-delay: 0.5s;"></div>
-    <div class="sparkle" style="top: 45%; left: 8%; animation-delay: 1s;"></div>
-    <div class="sparkle" style="top: 65%; right: 12%; animation-delay: 1.5s;"></div>
-
-    <div class="container">
-        <div class="header">
-            <div style="font-size: 3em; margin-bottom: 10px;">🚀</div>
-            <h1>NASDAQ 100 Recommendations</h1>
-            <div class="subtitle">검증된 퀀트 전략 기반 매수/매도 가격 추천</div>
-            <div class="date">{current_date} {current_time} 업데이트</div>
-        </div>
-
-        <div class="summary">
-            <div class="summary-card">
-                <div class="label">분석 종목 수</div>
-                <div class="value">{len(stocks_data)}개</div>
-            </div>
-            <div class="summary-card">
-                <div class="label">평균 점수</div>
-                <div class="value">{sum(s['total_score'] for s in stocks_data) / len(stocks_data):.1f}</div>
-            </div>
-            <div class="summary-card">
-                <div class="label">추천 종목 (60점 이상)</div>
-                <div class="value">{sum(1 for s in stocks_data if s['total_score'] >= 60)}개</div>
-            </div>
-            <div class="summary-card">
-                <div class="label">최고 점수</div>
-                <div class="value">{max(s['total_score'] for s in stocks_data):.0f}점</div>
-            </div>
-        </div>
-
-        <div class="tabs">
-            <div class="tab active" onclick="showTab('all')">전체</div>
-"""
-
-    # 섹터 탭 생성
-    for sector in sorted(sectors.keys()):
-        if sector != 'N/A':
-            html += f'            <div class="tab" onclick="showTab(\'{sector}\')">{sector} ({len(sectors[sector])})</div>\n'
-
-    html += """
-        </div>
-
-        <div id="tab-all" class="tab-content active">
-            <h2 class="section-title">🏆 TOP 5 추천 종목</h2>
-"""
-
-    # TOP 5 종목 카드
-    for idx, stock in enumerate(top5_stocks, 1):
-        html += generate_stock_card_html(stock, idx, is_top5=True, market_session=market_session)
-
-    html += f"""
-            <button class="show-more-btn" onclick="toggleOtherStocks()">
-                <span id="show-more-text">▼ 나머지 {len(other_stocks)}개 종목 보기</span>
-            </button>
-
-            <div id="other-stocks">
-                <h2 class="section-title">📋 기타 종목</h2>
-"""
-
-    # 나머지 종목 카드
-    for idx, stock in enumerate(other_stocks, 6):
-        html += generate_stock_card_html(stock, idx, is_top5=False, market_session=market_session)
-
-    html += """
-            </div>
-        </div>
+        }
 """
 
-    # 섹터별 탭 컨텐츠
-    for sector, sector_stocks in sorted(sectors.items()):
-        if sector != 'N/A':
-            html += f'        <div id="tab-{sector}" class="tab-content">\n'
-            html += f'            <h2 class="section-title">{sector} 섹터 ({len(sector_stocks)}개)</h2>\n'
-
-            # 섹터 내에서도 점수순 정렬
-            sector_stocks_sorted = sorted(sector_stocks, key=lambda x: x['total_score'], reverse=True)
-            for idx, stock in enumerate(sector_stocks_sorted, 1):
-                html += generate_stock_card_html(stock, idx, is_top5=False, market_session=market_session)
-
-            html += '        </div>\n'
-
-    html += """
-        <div class="footer">
-            <p><strong>※ 면책 조항</strong></p>
-            <p>본 리포트는 투자 참고 자료이며, 투자 판단 및 결과에 대한 책임은 투자자 본인에게 있습니다.</p>
-            <p>손절가는 반드시 지켜서 리스크를 관리하시기 바랍니다.</p>
-            <p style="margin-top: 15px; color: #a0aec0;">
-                Powered by 검증된 퀀트 전략 (Jegadeesh & Titman 1993, De Bondt & Thaler 1985, Hurst et al. 2013)
-            </p>
-        </div>
-    </div>
-
-    <!-- 점수 기준 팝업 -->
-    <div class="score-tooltip-overlay" id="scoreOverlay" onclick="hideScoreCriteria()"></div>
-    <div class="score-tooltip" id="scoreTooltip">
-        <button class="close-btn" onclick="hideScoreCriteria()">&times;</button>
-        <h3 id="scoreTooltipTitle"></h3>
-        <ul class="criteria-list" id="scoreTooltipContent"></ul>
-    </div>
-
-    <script>
-        // 점수 기준 데이터
+REPORT_JS = """        // 점수 기준 데이터
         const scoreCriteria = {
             valuation: {
                 title: '밥값 점수 (35점 만점)',
@@ -1384,17 +1308,189 @@ def generate_html_report(stocks_data, title="Daily Stock Recommendations"):
             var otherStocks = document.getElementById('other-stocks');
             var showMoreText = document.getElementById('show-more-text');
 
+            // 처음 문구(나머지 종목 수 포함)를 기억해 두고 접을 때 복원
+            if (!showMoreText.dataset.label) {
+                showMoreText.dataset.label = showMoreText.textContent;
+            }
+
             if (otherStocks.classList.contains('show')) {
                 otherStocks.classList.remove('show');
-                showMoreText.textContent = '▼ 나머지 """ + str(len(other_stocks)) + """개 종목 보기';
+                showMoreText.textContent = showMoreText.dataset.label;
             } else {
                 otherStocks.classList.add('show');
                 showMoreText.textContent = '▲ 접기';
             }
         }
 
-    </script>
-</body>
+"""
+
+
+def generate_html_report(stocks_data, title="Daily Stock Recommendations",
+                         card_templates=None, market_session=None, asset_dir=None):
+    """
+    HTML 리포트 생성
+
+    Args:
+        stocks_data: 종목 분석 결과 리스트
+        title: 리포트 제목
+        card_templates: {종목: render_stock_card_template 결과} (분석 중 미리 렌더링한 카드)
+        market_session: 시장 세션 (None이면 현재 시각 기준)
+        asset_dir: 공용 CSS/JS 저장 디렉토리 (HTML 기준 상대 경로, None이면 HTML에 포함)
+    """
+
+    kst_now = datetime.now(KST)
+    current_date = kst_now.strftime('%Y년 %m월 %d일')
+    current_time = kst_now.strftime('%H:%M:%S')
+
+    # 현재 시장 세션 확인
+    if market_session is None:
+        market_session = get_market_session()
+    card_templates = card_templates or {}
+
+    if asset_dir:
+        css_href = write_static_asset(asset_dir, 'daily_report', REPORT_CSS, 'css')
+        js_src = write_static_asset(asset_dir, 'daily_report', REPORT_JS, 'js')
+        style_html = f'    <link rel="stylesheet" href="{css_href}">\n'
+        script_html = f'    <script src="{js_src}"></script>\n'
+    else:
+        style_html = f"    <style>\n{REPORT_CSS}    </style>\n"
+        script_html = f"    <script>\n{REPORT_JS}    </script>\n"
+
+    def card_html(stock, idx, is_top5=False):
+        template = card_templates.get(stock['ticker'])
+        if template is None:
+            template = render_stock_card_template(stock, market_session)
+        return fill_stock_card(template, stock, idx, is_top5)
+
+    stocks_data = sorted(stocks_data, key=lambda x: x['total_score'], reverse=True)
+
+    # 섹터별 그룹화 (섹터 이름순, 섹터 내 점수순)
+    rankings = sector_rankings([s['sector'] for s in stocks_data], [s['total_score'] for s in stocks_data])
+    sectors = {sector: [stocks_data[i] for i in positions] for sector, positions in rankings.items()}
+
+    # TOP 5와 나머지 분리
+    top5_stocks = stocks_data[:5]
+    other_stocks = stocks_data[5:]
+
+    html = f"""
+<!DOCTYPE html>
+<html lang="ko">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>{title} - {current_date}</title>
+    <link href="https://fonts.googleapis.com/css2?family=Noto+Sans+KR:wght@400;500;700&display=swap" rel="stylesheet">
+{style_html}</head>
+<body>
+    <!-- 구름들 -->
+    <div class="cloud cloud-1"></div>
+    <div class="cloud cloud-2"></div>
+    <div class="cloud cloud-3"></div>
+
+    <!-- 반짝이들 -->
+    <div class="sparkle" style="top: 15%; left: 10%;"></div>
+    <div class="sparkle" style="top: 25%; right: 15%; animation-delay: 0.5s;"></div>
+    <div class="sparkle" style="top: 45%; left: 8%; animation-delay: 1s;"></div>
+    <div class="sparkle" style="top: 65%; right: 12%; animation-delay: 1.5s;"></div>
+
+    <div class="container">
+        <div class="header">
+            <div style="font-size: 3em; margin-bottom: 10px;">🚀</div>
+            <h1>NASDAQ 100 Recommendations</h1>
+            <div class="subtitle">검증된 퀀트 전략 기반 매수/매도 가격 추천</div>
+            <div class="date">{current_date} {current_time} 업데이트</div>
+        </div>
+
+        <div class="summary">
+            <div class="summary-card">
+                <div class="label">분석 종목 수</div>
+                <div class="value">{len(stocks_data)}개</div>
+            </div>
+            <div class="summary-card">
+                <div class="label">평균 점수</div>
+                <div class="value">{sum(s['total_score'] for s in stocks_data) / len(stocks_data):.1f}</div>
+            </div>
+            <div class="summary-card">
+                <div class="label">추천 종목 (60점 이상)</div>
+                <div class="value">{sum(1 for s in stocks_data if s['total_score'] >= 60)}개</div>
+            </div>
+            <div class="summary-card">
+                <div class="label">최고 점수</div>
+                <div class="value">{max(s['total_score'] for s in stocks_data):.0f}점</div>
+            </div>
+        </div>
+
+        <div class="tabs">
+            <div class="tab active" onclick="showTab('all')">전체</div>
+"""
+
+    # 섹터 탭 생성
+    for sector in sectors:
+        if sector != 'N/A':
+            html += f'            <div class="tab" onclick="showTab(\'{sector}\')">{sector} ({len(sectors[sector])})</div>\n'
+
+    html += """
+        </div>
+
+        <div id="tab-all" class="tab-content active">
+            <h2 class="section-title">🏆 TOP 5 추천 종목</h2>
+"""
+
+    # TOP 5 종목 카드
+    for idx, stock in enumerate(top5_stocks, 1):
+        html += card_html(stock, idx, is_top5=True)
+
+    html += f"""
+            <button class="show-more-btn" onclick="toggleOtherStocks()">
+                <span id="show-more-text">▼ 나머지 {len(other_stocks)}개 종목 보기</span>
+            </button>
+
+            <div id="other-stocks">
+                <h2 class="section-title">📋 기타 종목</h2>
+"""
+
+    # 나머지 종목 카드
+    for idx, stock in enumerate(other_stocks, 6):
+        html += card_html(stock, idx)
+
+    html += """
+            </div>
+        </div>
+"""
+
+    # 섹터별 탭 컨텐츠
+    for sector, sector_stocks in sectors.items():
+        if sector != 'N/A':
+            html += f'        <div id="tab-{sector}" class="tab-content">\n'
+            html += f'            <h2 class="section-title">{sector} 섹터 ({len(sector_stocks)}개)</h2>\n'
+
+            for idx, stock in enumerate(sector_stocks, 1):
+                html += card_html(stock, idx)
+
+            html += '        </div>\n'
+
+    html += """
+        <div class="footer">
+            <p><strong>※ 면책 조항</strong></p>
+            <p>본 리포트는 투자 참고 자료이며, 투자 판단 및 결과에 대한 책임은 투자자 본인에게 있습니다.</p>
+            <p>손절가는 반드시 지켜서 리스크를 관리하시기 바랍니다.</p>
+            <p style="margin-top: 15px; color: #a0aec0;">
+                Powered by 검증된 퀀트 전략 (Jegadeesh & Titman 1993, De Bondt & Thaler 1985, Hurst et al. 2013)
+            </p>
+        </div>
+    </div>
+
+    <!-- 점수 기준 팝업 -->
+    <div class="score-tooltip-overlay" id="scoreOverlay" onclick="hideScoreCriteria()"></div>
+    <div class="score-tooltip" id="scoreTooltip">
+        <button class="close-btn" onclick="hideScoreCriteria()">&times;</button>
+        <h3 id="scoreTooltipTitle"></h3>
+        <ul class="criteria-list" id="scoreTooltipContent"></ul>
+    </div>
+
+"""
+    html += script_html
+    html += """</body>
 </html>
 """
 
@@ -1440,68 +1536,62 @@ def main(index_type='nasdaq100'):
 
     print(f"분석 대상: {len(tickers)}개 종목\n")
 
-    # 병렬 처리 설정 (Rate Limiting 고려 + 성능 최적화)
-    MAX_WORKERS = 10  # 동시 처리 스레드 수 (안정성 확보)
-    BATCH_SIZE = 25   # 배치당 종목 수
-    BATCH_DELAY = 2.0 # 배치 간 대기 시간 (초) - Rate Limit 회피
+    # 병렬 처리 설정
+    MAX_WORKERS = 10  # I/O 단계 스레드 수 (종목 정보 요청 + 누락 종목 개별 다운로드)
+    COMPUTE_WORKERS = None  # 계산 단계 프로세스 수 (None이면 CPU 코어 수)
+    DOWNLOAD_CHUNK = 100  # 가격 일괄 다운로드 묶음 크기
+    MAX_RETRIES = 2  # 요청 실패 종목 재시도 횟수 (1초, 2초 백오프)
+    ASSET_DIR = 'assets'  # 공용 CSS/JS 정적 파일 (리포트 HTML과 같은 위치 기준)
 
     stocks_data = []
+    card_templates = {}
+    # 종목 카드 캐시 (이전 실행과 점수/가격이 같은 종목은 다시 렌더링하지 않음)
+    card_cache = FragmentCache(os.path.join('cache', 'report_cards', f'{index_type}.json'))
     failed_count = 0
     total = len(tickers)
+    market_session = get_market_session()
 
-    print(f"병렬 처리: {MAX_WORKERS}개 스레드, 배치당 {BATCH_SIZE}개 종목\n")
-
-    # 배치로 나누기
-    batches = [tickers[i:i + BATCH_SIZE] for i in range(0, len(tickers), BATCH_SIZE)]
+    # 1. 가격 데이터 일괄 다운로드 (종목별 history 요청 대신 묶음 요청)
+    #    매 실행 새로 받고, 아카이브는 계산 워커 공유용 (지수별로 분리해 동시 실행 시 충돌 방지)
+    print(f"가격 데이터 일괄 다운로드 중... ({DOWNLOAD_CHUNK}개 종목 단위)")
+    price_store = PriceStore.download(tickers, period='2y', chunk_size=DOWNLOAD_CHUNK,
+                                      archive=archive_path(f'daily_report_{index_type}'))
+    print(f"가격 데이터 {len(price_store)}/{total}개 종목 로드 완료\n")
+
+    def fetch(ticker):
+        # I/O 단계: 종목 정보 + 일괄 다운로드에서 빠진 종목의 개별 가격 (예외 시 재시도)
+        if ticker not in price_store:
+            df = get_rate_limiter(YAHOO_HOST).call(yf.Ticker(ticker).history, period='2y')
+            if not df.empty:
+                price_store.add(ticker, df)
+        return (INFO_CACHE.get(ticker).get('regularMarketPrice'),)
+
+    # 2. 요청(스레드) → 계산(프로세스) → 점수 합산/카드 렌더링 스트리밍
+    #    느린 종목이 다른 종목을 막지 않고, 실패한 요청은 백오프 후 동시에 재시도
+    print(f"요청 {MAX_WORKERS}개 스레드 → 계산 {COMPUTE_WORKERS or os.cpu_count()}개 프로세스\n")
 
     processed = 0
-    for batch_idx, batch in enumerate(batches):
-        # 병렬 처리
-        with concurrent.futures.ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
-            futures = {executor.submit(analyze_stock_for_report, ticker): ticker for ticker in batch}
-
-            for future in concurrent.futures.as_completed(futures):
-                ticker = futures[future]
-                try:
-                    result = future.result(timeout=30)
-                    if result:
-                        stocks_data.append(result)
-                    else:
-                        failed_count += 1
-                except Exception as e:
-                    print(f"[ERROR] {ticker}: {e}")
-                    failed_count += 1
-
-        processed += len(batch)
-        print(f"[배치 {batch_idx + 1}/{len(batches)}] {processed}/{total} 완료 (성공: {len(stocks_data)}, 실패: {failed_count})")
-
-        # 배치 간 대기 (마지막 배치 제외)
-        if batch_idx < len(batches) - 1:
-            time.sleep(BATCH_DELAY)
-
-    # 실패한 종목 재시도 (Rate Limit 해제 후)
-    if failed_count > 20:
-        print(f"\n[재시도] {failed_count}개 실패 종목 중 일부 재시도 중...")
-        time.sleep(5)  # Rate Limit 해제 대기
-
-        # 성공한 티커 목록
-        success_tickers = {s['ticker'] for s in stocks_data}
-        failed_tickers = [t for t in tickers if t not in success_tickers]
-
-        # 최대 50개까지만 재시도
-        retry_tickers = failed_tickers[:50]
-
-        for ticker in retry_tickers:
-            try:
-                result = analyze_stock_for_report(ticker)
-                if result:
-                    stocks_data.append(result)
-                    failed_count -= 1
-                time.sleep(0.2)  # 재시도는 더 느리게
-            except:
-                pass
-
-        print(f"[재시도 완료] 최종 성공: {len(stocks_data)}, 실패: {failed_count}")
+    for ticker, price_scores in run_pipeline(tickers, fetch, compute_price_scores, price_store,
+                                             fetch_workers=MAX_WORKERS, max_workers=COMPUTE_WORKERS,
+                                             retries=MAX_RETRIES):
+        result = None
+        if price_scores is not None:
+            result = analyze_stock_for_report(ticker, df=price_store.history(ticker),
+                                              price_scores=price_scores)
+        if result:
+            stocks_data.append(result)
+            if result['total_score'] >= 50:
+                card_templates[ticker] = card_cache.render(result, render_stock_card_template, market_session)
+        else:
+            failed_count += 1
+
+        processed += 1
+        if processed % 25 == 0 or processed == total:
+            print(f"[진행] {processed}/{total} 완료 (성공: {len(stocks_data)}, 실패: {failed_count})")
+
+    # 3. 종목별 지표 상태 갱신 (저장된 상태에 이번에 새로 받은 봉만 반영, 진행 중인 봉은 미리보기)
+    indicator_values = refresh_indicator_states(price_store, tickers, IndicatorStateStore(DEFAULT_STATE_DIR))
+    print(f"[지표 상태] {len(indicator_values)}개 종목 갱신")
 
     if stocks_data:
         print(f"\n총 {len(stocks_data)}개 종목 분석 완료!")
@@ -1514,7 +1604,12 @@ def main(index_type='nasdaq100'):
             print(f"[제외] {filtered_out}개 종목 제외 (50점 미만)")
         print(f"[추천 대상] {len(stocks_data)}개 종목")
 
-        html_content = generate_html_report(stocks_data, title=report_title)
+        html_content = generate_html_report(stocks_data, title=report_title,
+                                            card_templates=card_templates,
+                                            market_session=market_session,
+                                            asset_dir=ASSET_DIR)
+        card_cache.save()
+        print(f"[카드 캐시] 재사용 {card_cache.hits}개, 새로 렌더링 {card_cache.misses}개")
 
         # 파일명에 지수 타입 포함
         index_prefix = 'nasdaq100' if index_type == 'nasdaq100' else 'sp500'
@@ -1526,7 +1621,6 @@ def main(index_type='nasdaq100'):
         print(f"파일 위치: {filename}")
 
         import webbrowser
-        import os
         webbrowser.open('file://' + os.path.abspath(filename))
 
     else:
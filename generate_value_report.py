@@ -13,9 +13,8 @@
 import yfinance as yf
 import pandas as pd
 from datetime import datetime, timezone, timedelta
+import os
 import sys
-import time
-import concurrent.futures
 sys.path.insert(0, '.')
 
 # 한국 시간대 (UTC+9)
@@ -38,6 +37,14 @@ from quant_trading.technical_analyzer_v3 import TechnicalAnalyzerV3
 from quant_trading.price_recommender import PriceRecommender
 from quant_trading.valuation_analyzer import ValuationAnalyzer
 from quant_trading.policy_analyzer import PolicyAnalyzer
+from quant_trading.ticker_info_cache import TickerInfoCache
+from quant_trading.price_store import PriceStore
+from quant_trading.market_archive import archive_path
+from quant_trading.compute_pool import run_pipeline
+from quant_trading.rate_limiter import YAHOO_HOST, get_rate_limiter
+
+# 실행당 종목 정보 캐시 (종목별 .info 요청 1회)
+INFO_CACHE = TickerInfoCache()
 
 
 def calculate_stability_score(df, info):
@@ -106,14 +113,14 @@ def calculate_stability_score(df, info):
     }
 
 
-def calculate_enhanced_valuation(ticker, info):
+def calculate_enhanced_valuation(ticker, info, info_cache=None):
     """
     강화된 밥값 점수 (45점 만점)
     - 기존 밸류에이션 (35점)
     - 배당 (10점 추가)
     """
     # 기존 밸류에이션 점수
-    valuation = ValuationAnalyzer(ticker)
+    valuation = ValuationAnalyzer(ticker, info_cache=info_cache)
     base_result = valuation.calculate_total_score()
     base_score = base_result['total_score']  # 35점 만점
 
@@ -162,7 +169,30 @@ def calculate_enhanced_valuation(ticker, info):
     }
 
 
-def analyze_value_stock(ticker):
+def compute_price_scores(df, latest_price=None, beta=None):
+    """
+    가격 데이터만 쓰는 CPU 계산 (계산 단계 프로세스 풀에서 실행)
+
+    Args:
+        df: OHLCV
+        latest_price: 가격 추천 기준가 (None이면 마지막 종가)
+        beta: 종목 베타 (안정성 점수용)
+
+    Returns:
+        {'technical', 'stability', 'price_rec'} (데이터 부족 시 None)
+    """
+    if df.empty or len(df) < 180:
+        return None
+
+    latest_price = latest_price or df['Close'].iloc[-1]
+    return {
+        'technical': TechnicalAnalyzerV3(df).calculate_total_score(),
+        'stability': calculate_stability_score(df, {'beta': beta}),
+        'price_rec': PriceRecommender(df, latest_price).get_recommendation(strategy='conservative'),
+    }
+
+
+def analyze_value_stock(ticker, info_cache=None, df=None, price_scores=None):
     """
     가치주 분석
 
@@ -171,32 +201,43 @@ def analyze_value_stock(ticker):
     - 기술적 분석: 25점
     - 정책 수혜: 15점
     - 안정성: 15점
+
+    Args:
+        ticker: 종목 코드
+        info_cache: 공유 종목 정보 캐시 (None이면 모듈 INFO_CACHE 사용)
+        df: 미리 받아둔 OHLCV (None이면 개별 다운로드)
+        price_scores: 계산 단계에서 미리 구한 compute_price_scores 결과 (None이면 여기서 계산)
     """
+    if info_cache is None:
+        info_cache = INFO_CACHE
+
     try:
-        stock = yf.Ticker(ticker)
-        df = stock.history(period='2y')
+        if df is None:
+            df = get_rate_limiter(YAHOO_HOST).call(yf.Ticker(ticker).history, period='2y')
 
         if df.empty or len(df) < 180:
             return None
 
-        info = stock.info
+        info = info_cache.get(ticker)
+
+        if price_scores is None:
+            price_scores = compute_price_scores(df, info.get('regularMarketPrice'), info.get('beta'))
 
         # 1. 기술적 분석 (25점 만점으로 스케일)
-        tech_v3 = TechnicalAnalyzerV3(df)
-        result_v3 = tech_v3.calculate_total_score()
+        result_v3 = price_scores['technical']
         tech_score = (result_v3['total_score'] / 65) * 25
 
         # 2. 강화된 밥값 점수 (45점 만점)
-        valuation_result = calculate_enhanced_valuation(ticker, info)
+        valuation_result = calculate_enhanced_valuation(ticker, info, info_cache=info_cache)
         valuation_score = valuation_result['total_score']
 
         # 3. 정책 수혜 점수 (15점 만점으로 스케일)
-        policy = PolicyAnalyzer(ticker)
+        policy = PolicyAnalyzer(ticker, info_cache=info_cache)
         policy_result = policy.calculate_total_score()
         policy_score = (policy_result['total_score'] / 20) * 15
 
         # 4. 안정성 점수 (15점 만점)
-        stability_result = calculate_stability_score(df, info)
+        stability_result = price_scores['stability']
         stability_score = stability_result['score']
 
         # 총점 계산 (100점 만점)
@@ -208,10 +249,9 @@ def analyze_value_stock(ticker):
         previous_close = df['Close'].iloc[-2]
         change_pct = ((current_price - previous_close) / previous_close) * 100
 
-        # 가격 추천
+        # 가격 추천 (계산 단계에서 최신 가격 기준으로 계산)
         regular_market_price = info.get('regularMarketPrice') or current_price
-        price_rec = PriceRecommender(df, regular_market_price)
-        price_recommendation = price_rec.get_recommendation(strategy='conservative')
+        price_recommendation = price_scores['price_rec']
 
         return {
             'ticker': ticker,
@@ -1113,40 +1153,46 @@ def main():
 
     print(f"분석 대상: {len(tickers)}개 종목\n")
 
-    MAX_WORKERS = 10
-    BATCH_SIZE = 25
-    BATCH_DELAY = 2.0
+    MAX_WORKERS = 10  # I/O 단계 스레드 수
+    COMPUTE_WORKERS = None  # 계산 단계 프로세스 수 (None이면 CPU 코어 수)
+    DOWNLOAD_CHUNK = 100
 
     stocks_data = []
-    failed_count = 0
     total = len(tickers)
 
-    print(f"병렬 처리: {MAX_WORKERS}개 스레드\n")
+    # 가격 데이터 일괄 다운로드 (매 실행 새로 받고, 아카이브는 계산 워커 공유용)
+    print(f"가격 데이터 일괄 다운로드 중... ({DOWNLOAD_CHUNK}개 종목 단위)")
+    price_store = PriceStore.download(tickers, period='2y', chunk_size=DOWNLOAD_CHUNK,
+                                      archive=archive_path('value_report'))
+    print(f"가격 데이터 {len(price_store)}/{total}개 종목 로드 완료\n")
 
-    batches = [tickers[i:i + BATCH_SIZE] for i in range(0, len(tickers), BATCH_SIZE)]
+    def fetch(ticker):
+        # I/O 단계: 종목 정보 + 일괄 다운로드에서 빠진 종목의 개별 가격 (예외 시 재시도)
+        if ticker not in price_store:
+            df = get_rate_limiter(YAHOO_HOST).call(yf.Ticker(ticker).history, period='2y')
+            if not df.empty:
+                price_store.add(ticker, df)
+        info = INFO_CACHE.get(ticker)
+        return info.get('regularMarketPrice'), info.get('beta')
+
+    # 요청(스레드) → 계산(프로세스, 가격은 아카이브 memmap으로 공유) → 점수 합산 스트리밍
+    print(f"요청 {MAX_WORKERS}개 스레드 → 계산 {COMPUTE_WORKERS or os.cpu_count()}개 프로세스\n")
 
     processed = 0
-    for batch_idx, batch in enumerate(batches):
-        with concurrent.futures.ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
-            futures = {executor.submit(analyze_value_stock, ticker): ticker for ticker in batch}
-
-            for future in concurrent.futures.as_completed(futures):
-                ticker = futures[future]
-                try:
-                    result = future.result(timeout=30)
-                    if result:
-                        stocks_data.append(result)
-                    else:
-                        failed_count += 1
-                except Exception as e:
-                    print(f"[ERROR] {ticker}: {e}")
-                    failed_count += 1
-
-        processed += len(batch)
-        print(f"[배치 {batch_idx + 1}/{len(batches)}] {processed}/{total} (성공: {len(stocks_data)}, 실패: {failed_count})")
-
-        if batch_idx < len(batches) - 1:
-            time.sleep(BATCH_DELAY)
+    failed_count = 0
+    for ticker, price_scores in run_pipeline(tickers, fetch, compute_price_scores, price_store,
+                                             fetch_workers=MAX_WORKERS, max_workers=COMPUTE_WORKERS):
+        result = None
+        if price_scores is not None:
+            result = analyze_value_stock(ticker, df=price_store.history(ticker), price_scores=price_scores)
+        if result:
+            stocks_data.append(result)
+        else:
+            failed_count += 1
+
+        processed += 1
+        if processed % 25 == 0 or processed == total:
+            print(f"[진행] {processed}/{total} (성공: {len(stocks_data)}, 실패: {failed_count})")
 
     if stocks_data:
         print(f"\n총 {len(stocks_data)}개 종목 분석 완료!")
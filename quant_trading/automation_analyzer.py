@@ -9,7 +9,9 @@
 """
 
 import yfinance as yf
-from typing import Dict
+from typing import Dict, Optional
+
+from .ticker_info_cache import TickerInfoCache
 
 
 class AutomationAnalyzer:
@@ -99,16 +101,20 @@ class AutomationAnalyzer:
         'ASML': {'bonus': 1, 'ref': 'EUV 장비 독점, 고도 자동화'},
     }
 
-    def __init__(self, ticker: str):
+    def __init__(self, ticker: str, info_cache: Optional[TickerInfoCache] = None):
         self.ticker = ticker.upper()
         self.stock = yf.Ticker(ticker)
+        self.info_cache = info_cache
         self.info = {}
         self._fetch_data()
 
     def _fetch_data(self):
         """기업 정보 가져오기"""
         try:
-            self.info = self.stock.info
+            if self.info_cache is not None:
+                self.info = self.info_cache.get(self.ticker)
+            else:
+                self.info = self.stock.info
         except Exception as e:
             print(f"[WARNING] {self.ticker} 정보 로드 실패: {e}")
             self.info = {}
@@ -0,0 +1,526 @@
+"""
+공용 백테스트 엔진 (Backtest Engine)
+- 채점 함수 + 종목 유니버스 + 리밸런싱 주기만 정하면 같은 루프로 백테스트
+- 가격은 미리 로드한 PriceStore에서만 읽음 (리밸런싱 중 가격 재요청 없음)
+- 보유 기간 수익률은 종가 패널에서 (리밸런싱 × 종목) 행렬로 한 번에 계산
+- 포트폴리오 수익률/회전율/거래 비용은 (리밸런싱 × 종목) 비중 행렬과 수익률 행렬의 연산
+- 가격만 쓰는 채점은 panel_scorer로 리밸런싱 날짜마다 전 종목을 한 번에 채점
+- 지표(총 수익률, 승률, MDD, 샤프 비율)와 CSV 형식은 기존 백테스트 스크립트와 동일
+- score_cache_dir를 주면 (종목, 리밸런싱 날짜)별 점수를 디스크에 저장해 다음 실행에서 재사용
+
+기존 backtest_*.py 스크립트는 리밸런싱 루프, 수익률 계산, MDD/샤프 계산을
+각각 복사해 쓰고 있었습니다. 새 전략은 채점 함수만 작성하면 됩니다.
+
+Examples:
+    >>> def score(ticker, df):
+    ...     return {'total_score': TechnicalAnalyzerV3(df).calculate_total_score()['total_score']}
+    >>> store = PriceStore.load(tickers, start_date, end_date)
+    >>> backtest = Backtest(store, score, tickers, top_n=10, rebalance_days=7)
+    >>> metrics = backtest.run(start_date, end_date)
+    >>> print_metrics(metrics, benchmark_return(start_date, end_date))
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+import yfinance as yf
+
+from .price_store import PriceStore, _to_day
+from .rate_limiter import YAHOO_HOST, get_rate_limiter
+from .score_cache import ScoreCache
+from .technical_analyzer_v3 import TechnicalAnalyzerV3, TechnicalAnalyzerV3Panel
+
+
+# 백테스트 기본 유니버스 (S&P500 시가총액 상위 100개)
+MAJOR_US_TICKERS = [
+    'AAPL', 'MSFT', 'GOOGL', 'AMZN', 'NVDA', 'META', 'TSLA', 'BRK-B',
+    'UNH', 'JNJ', 'V', 'XOM', 'WMT', 'JPM', 'MA', 'PG', 'CVX', 'HD',
+    'LLY', 'ABBV', 'MRK', 'KO', 'PEP', 'AVGO', 'COST', 'TMO', 'MCD',
+    'CSCO', 'ACN', 'ABT', 'DHR', 'ADBE', 'TXN', 'NKE', 'NEE', 'WFC',
+    'BAC', 'DIS', 'PM', 'COP', 'AMD', 'VZ', 'CMCSA', 'LIN', 'NFLX',
+    'INTC', 'RTX', 'BMY', 'UPS', 'T', 'QCOM', 'HON', 'LOW', 'SPGI',
+    'AMGN', 'UNP', 'INTU', 'BA', 'CAT', 'GE', 'DE', 'SBUX', 'GILD',
+    'AXP', 'BLK', 'MDT', 'PLD', 'AMT', 'TJX', 'SYK', 'SCHW', 'MMM',
+    'ADP', 'BKNG', 'MDLZ', 'C', 'CB', 'TMUS', 'CVS', 'ZTS', 'ADI',
+    'MO', 'ISRG', 'CI', 'SO', 'DUK', 'PNC', 'TGT', 'USB', 'BDX', 'EOG',
+    'REGN', 'NOC', 'MMC', 'SLB', 'HUM', 'ETN', 'CL', 'ITW', 'GD'
+]
+
+# 후보 dict에서 평균을 기록하지 않는 키
+_RESERVED_KEYS = {'ticker', 'date', 'total_score', 'close_price'}
+
+
+def technical_scorer(ticker: str, df: pd.DataFrame, **thresholds) -> Dict:
+    """기본 채점 함수 (TechnicalAnalyzerV3 총점, thresholds로 임계값 변경)"""
+    tech_score = TechnicalAnalyzerV3(df, thresholds).calculate_total_score()['total_score']
+    return {'total_score': tech_score, 'tech_score': tech_score}
+
+
+def technical_panel_scorer(close: pd.DataFrame, **thresholds) -> pd.DataFrame:
+    """technical_scorer의 패널 버전 (리밸런싱 날짜의 전 종목을 한 번에 채점)"""
+    scores = TechnicalAnalyzerV3Panel(close, thresholds).calculate_total_scores()
+    return pd.DataFrame({'total_score': scores['total_score'], 'tech_score': scores['total_score']})
+
+
+def top_n_selector(candidates: List[Dict], top_n: int) -> List[Dict]:
+    """기본 종목 선정 (점수순 상위 N개)"""
+    return candidates[:top_n]
+
+
+def rebalance_schedule(start_date: datetime, end_date: datetime, rebalance_days: int) -> List[datetime]:
+    """시작일부터 rebalance_days 간격의 리밸런싱 날짜 (종료일 포함)"""
+    dates = []
+    current_date = start_date
+    while current_date <= end_date:
+        dates.append(current_date)
+        current_date += timedelta(days=rebalance_days)
+    return dates
+
+
+def close_panel(price_store: PriceStore, tickers: List[str]) -> pd.DataFrame:
+    """종가 패널 (index: 날짜, columns: 종목, 거래 없는 날은 NaN)"""
+    closes = {ticker: price_store.history(ticker)['Close'] for ticker in tickers if ticker in price_store}
+    if not closes:
+        return pd.DataFrame()
+    return pd.concat(closes, axis=1, sort=True)
+
+
+def holding_period_returns(close: pd.DataFrame, dates: List[datetime]) -> pd.DataFrame:
+    """
+    리밸런싱 구간별 종목 수익률 (리밸런싱 × 종목 행렬)
+
+    매수가는 리밸런싱 날짜 전날까지의 마지막 종가(PriceStore.as_of 기준),
+    매도가는 다음 리밸런싱 날짜 당일 또는 그 이전 마지막 종가(PriceStore.price_on 기준)입니다.
+
+    Args:
+        close: 종가 패널 (close_panel 결과)
+        dates: 리밸런싱 날짜 (마지막 날짜는 매도만)
+
+    Returns:
+        DataFrame (index: 매수 리밸런싱 날짜, columns: 종목, 가격이 없으면 NaN)
+    """
+    index = pd.DatetimeIndex(dates[:-1])
+    if close.empty or len(dates) < 2:
+        return pd.DataFrame(index=index, columns=close.columns, dtype='float64')
+
+    # 종목별 마지막 거래일 가격 (거래 없는 날은 직전 종가)
+    values = close.ffill().to_numpy(dtype=np.float64)
+    days = close.index.values.astype('datetime64[ns]')
+    targets = np.array([_to_day(date) for date in dates])
+
+    entry_rows = np.searchsorted(days, targets[:-1], side='left') - 1
+    exit_rows = np.searchsorted(days, targets[1:], side='right') - 1
+
+    entry = np.where((entry_rows >= 0)[:, None], values[entry_rows], np.nan)
+    exit_ = np.where((exit_rows >= 0)[:, None], values[exit_rows], np.nan)
+
+    return pd.DataFrame((exit_ - entry) / entry, index=index, columns=close.columns)
+
+
+def portfolio_returns(weights, returns, commission: float = 0.0, slippage: float = 0.0,
+                      previous: Optional[np.ndarray] = None) -> Dict[str, np.ndarray]:
+    """
+    비중 행렬 × 수익률 행렬로 구간별 포트폴리오 수익률 계산 (거래 비용 포함)
+
+    리밸런싱 시점에 목표 비중으로 맞추고 다음 리밸런싱까지 보유합니다.
+    회전율은 직전 구간 보유 비중(가격 변동 반영 후)과 목표 비중의 차이 합계이며,
+    거래 비용 = 회전율 × (commission + slippage)를 구간 시작 자본에서 차감합니다.
+    한 행만 넘기고 previous로 직전 보유 비중을 이어 주면 리밸런싱마다 순차 계산할 수 있습니다.
+
+    Args:
+        weights: (구간 × 종목) 목표 비중
+        returns: 같은 모양의 보유 기간 수익률 (NaN은 0% 수익)
+        commission: 거래 금액 대비 수수료 비율 (예: 0.0005 = 0.05%)
+        slippage: 거래 금액 대비 슬리피지 비율
+        previous: 첫 구간 직전 보유 비중 (None이면 현금에서 시작)
+
+    Returns:
+        {'gross': 비용 전 수익률, 'turnover': 회전율, 'cost': 거래 비용 비율,
+         'net': 비용 차감 수익률, 'drift': 마지막 구간 종료 시점 보유 비중}
+    """
+    weights = np.atleast_2d(np.asarray(weights, dtype=np.float64))
+    returns = np.nan_to_num(np.atleast_2d(np.asarray(returns, dtype=np.float64)), nan=0.0)
+
+    gross = (weights * returns).sum(axis=1)
+
+    # 구간 종료 시점 비중 (종목별 가격 변동 반영)
+    grown = weights * (1 + returns)
+    growth = (1 + gross)[:, None]
+    drift = np.divide(grown, growth, out=np.zeros_like(grown), where=growth != 0)
+
+    held = np.vstack([np.zeros(weights.shape[1]) if previous is None else previous, drift[:-1]])
+    turnover = np.abs(weights - held).sum(axis=1)
+    cost = turnover * (commission + slippage)
+
+    return {
+        'gross': gross,
+        'turnover': turnover,
+        'cost': cost,
+        'net': gross - cost * (1 + gross),
+        'drift': drift[-1] if len(drift) else held[-1],
+    }
+
+
+def calculate_metrics(returns, initial_capital: float = 100000,
+                      days: Optional[int] = None, periods_per_year: float = 252) -> Optional[Dict]:
+    """
+    구간 수익률로 성과 지표 계산 (기존 백테스트 스크립트와 같은 정의)
+
+    Args:
+        returns: 리밸런싱 구간별 포트폴리오 수익률
+        initial_capital: 초기 자본금
+        days: 백테스트 기간 (일, 연평균 수익률 계산용, None이면 총 수익률과 동일)
+        periods_per_year: 샤프 비율 연율화 계수 (기존 스크립트는 252)
+
+    Returns:
+        지표 dict (수익률이 없으면 None)
+    """
+    returns = np.asarray(returns, dtype=np.float64)
+    if len(returns) == 0:
+        return None
+
+    # 자본 추이 (초기 자본부터 순서대로 곱함)
+    capital = np.cumprod(np.concatenate([[initial_capital], 1 + returns]))[1:]
+    total_return = (capital[-1] - initial_capital) / initial_capital
+
+    avg_return = float(np.mean(returns))
+    std_return = float(np.std(returns))
+    sharpe = (avg_return / std_return * np.sqrt(periods_per_year)) if std_return > 0 else 0
+
+    # 최대 낙폭 (첫 구간 이후 자본 기준)
+    peak = np.maximum.accumulate(capital)
+    max_dd = float(min(0.0, np.min((capital - peak) / peak)))
+
+    winning_trades = int(np.sum(returns > 0))
+
+    return {
+        'final_capital': float(capital[-1]),
+        'total_return': float(total_return),
+        'annual_return': float(total_return / (days / 365)) if days else float(total_return),
+        'win_rate': winning_trades / len(returns),
+        'winning_trades': winning_trades,
+        'n_periods': len(returns),
+        'sharpe_ratio': float(sharpe),
+        'max_drawdown': max_dd,
+        'avg_return': avg_return,
+        'std_return': std_return,
+    }
+
+
+def benchmark_return(start_date: datetime, end_date: datetime, ticker: str = 'SPY') -> Optional[float]:
+    """벤치마크(기본 SPY) 기간 수익률 (데이터가 없으면 None)"""
+    try:
+        data = get_rate_limiter(YAHOO_HOST).call(yf.Ticker(ticker).history, start=start_date, end=end_date)
+        return float((data['Close'].iloc[-1] - data['Close'].iloc[0]) / data['Close'].iloc[0])
+    except Exception as e:
+        print(f"[WARNING] 벤치마크({ticker}) 데이터 없음: {e}")
+        return None
+
+
+def print_metrics(metrics: Dict, benchmark: Optional[float] = None, benchmark_name: str = 'S&P500'):
+    """성과 지표 출력"""
+    print(f"최종 자본:         ${metrics['final_capital']:,.2f}")
+    print(f"총 수익률:         {metrics['total_return']*100:+.2f}%")
+    print(f"연평균 수익률:     {metrics['annual_return']*100:+.2f}%")
+    print(f"승률:             {metrics['win_rate']*100:.1f}% ({metrics['winning_trades']}/{metrics['n_periods']})")
+    print(f"최대 낙폭:         {metrics['max_drawdown']*100:.2f}%")
+    print(f"샤프 비율:         {metrics['sharpe_ratio']:.2f}")
+    print(f"평균 수익률:       {metrics['avg_return']*100:+.2f}%")
+    print(f"변동성:           {metrics['std_return']*100:.2f}%")
+    if 'avg_turnover' in metrics:
+        print(f"평균 회전율:       {metrics['avg_turnover']*100:.1f}%")
+        print(f"누적 거래 비용:    {metrics['total_cost']*100:.2f}%")
+
+    if benchmark is not None:
+        print()
+        print(f"{benchmark_name} 수익률:     {benchmark*100:+.2f}%")
+        print(f"초과 수익률:       {(metrics['total_return'] - benchmark)*100:+.2f}%")
+
+
+def _print_rebalance(i: int, total: int, record: Dict):
+    """리밸런싱 진행 출력 (기본)"""
+    print(f"[{i}/{total}] {record['date']:%Y-%m-%d} -> {', '.join(record['top_stocks'][:3])}... | "
+          f"{record['return']*100:+.2f}% | ${record['capital']:,.0f}")
+
+
+class Backtest:
+    """
+    리밸런싱 백테스트
+
+    리밸런싱 날짜마다 각 종목의 시점 기준 데이터(당일 제외)로 scorer를 호출하고,
+    selector로 고른 종목을 동일 비중으로 다음 리밸런싱 날짜까지 보유합니다.
+    panel_scorer를 주면 종목별 호출 대신 종가 패널 구간 하나로 전 종목을 채점합니다.
+    """
+
+    def __init__(self, price_store: PriceStore,
+                 scorer: Callable[[str, pd.DataFrame], Optional[Dict]] = technical_scorer,
+                 tickers: Optional[List[str]] = None, top_n: int = 10, rebalance_days: int = 7,
+                 initial_capital: float = 100000,
+                 selector: Callable[[List[Dict], int], List[Dict]] = top_n_selector,
+                 min_history: int = 180, lookback_days: int = 730, max_workers: int = 1,
+                 periods_per_year: float = 252,
+                 panel_scorer: Optional[Callable[[pd.DataFrame], pd.DataFrame]] = None,
+                 min_score: Optional[float] = None, score_cache: Optional[Dict] = None,
+                 close: Optional[pd.DataFrame] = None, score_cache_dir: Optional[str] = None,
+                 commission: float = 0.0, slippage: float = 0.0):
+        """
+        초기화
+
+        Args:
+            price_store: 미리 로드한 가격 저장소
+            scorer: (종목, 시점 기준 OHLCV) -> {'total_score': ..., 기타 점수} 또는 None
+            tickers: 종목 유니버스 (None이면 저장소 전체)
+            top_n: 포트폴리오 종목 수
+            rebalance_days: 리밸런싱 주기 (일)
+            initial_capital: 초기 자본금 (달러)
+            selector: (점수순 후보, top_n) -> 포트폴리오 (섹터 분산 등)
+            min_history: 채점에 필요한 최소 봉 수
+            lookback_days: 채점에 넘기는 과거 데이터 길이 (일)
+            max_workers: 채점 스레드 수 (뉴스/종목 정보 요청이 있는 scorer용, 1이면 순차)
+            periods_per_year: 샤프 비율 연율화 계수
+            panel_scorer: 종가 패널 구간 (날짜 × 종목) -> DataFrame (index: 종목,
+                          'total_score' 및 기타 점수 컬럼). 주면 scorer 대신 사용
+            min_score: 편입 최소 점수 (None이면 제한 없음)
+            score_cache: {리밸런싱 날짜: score_date 결과} (같은 채점 조건의 백테스트끼리 공유)
+            close: 미리 만든 종가 패널 (None이면 price_store에서 생성)
+            score_cache_dir: 점수 캐시 디렉토리 (ScoreCache, 예: DEFAULT_SCORE_CACHE_DIR).
+                             채점 함수 코드/파라미터가 같으면 이전 실행의 점수를 재사용
+                             (가격 데이터만 쓰는 채점 함수에만 사용)
+            commission: 거래 금액 대비 수수료 비율 (리밸런싱 회전율에 부과, 예: 0.0005)
+            slippage: 거래 금액 대비 슬리피지 비율
+        """
+        self.price_store = price_store
+        self.scorer = scorer
+        self.tickers = list(tickers) if tickers is not None else price_store.tickers
+        self.top_n = top_n
+        self.rebalance_days = rebalance_days
+        self.initial_capital = initial_capital
+        self.selector = selector
+        self.min_history = min_history
+        self.lookback_days = lookback_days
+        self.max_workers = max_workers
+        self.periods_per_year = periods_per_year
+        self.panel_scorer = panel_scorer
+        self.min_score = min_score
+        self.score_cache = score_cache
+        self.commission = commission
+        self.slippage = slippage
+        self.score_store = None
+        if score_cache_dir:
+            self.score_store = ScoreCache(score_cache_dir, panel_scorer or scorer, panel=panel_scorer is not None,
+                                          min_history=min_history, lookback_days=lookback_days)
+
+        self.weights = None
+
+        self._close = close
+        self._failed = set()
+        self.capital = initial_capital
+        self.portfolio_history = []
+
+    def _score_one(self, ticker: str, date: datetime) -> Optional[Dict]:
+        """한 종목 채점 (데이터 부족/실패 시 None)"""
+        df = self.price_store.as_of(ticker, date, lookback_days=self.lookback_days)
+        if df.empty or len(df) < self.min_history:
+            return None
+        try:
+            result = self.scorer(ticker, df)
+        except Exception as e:
+            print(f"[WARNING] {ticker} 분석 실패: {e}")
+            self._failed.add(ticker)
+            return None
+        if result is None:
+            return None
+        return {'ticker': ticker, 'date': date, **result, 'close_price': df['Close'].iloc[-1]}
+
+    def _window(self, date: datetime) -> pd.DataFrame:
+        """리밸런싱 날짜의 종가 패널 구간 (as_of와 같은 구간)"""
+        if self._close is None:
+            self._close = close_panel(self.price_store, self.tickers)
+        day = _to_day(date)
+        days = self._close.index.values.astype('datetime64[ns]')
+        begin = np.searchsorted(days, day - np.timedelta64(self.lookback_days, 'D'), side='left')
+        stop = np.searchsorted(days, day, side='left')
+        return self._close.iloc[begin:stop]
+
+    def _window_summary(self, date: datetime) -> Dict:
+        """{종목: (구간 봉 수, 구간 마지막 종가)} (점수 캐시 검증용, 데이터 없는 종목은 (0, NaN))"""
+        window = self._window(date)
+        bars = window.notna().sum()
+        last_close = window.ffill().iloc[-1] if len(window) else pd.Series(dtype='float64')
+        return {ticker: (int(bars.get(ticker, 0)), float(last_close.get(ticker, np.nan)))
+                for ticker in self.tickers}
+
+    def _score_panel(self, date: datetime, tickers: List[str]) -> List[Dict]:
+        """종가 패널 구간으로 전 종목 채점 (as_of와 같은 구간, 데이터 부족 종목 제외)"""
+        window = self._window(date)
+        window = window.loc[:, window.columns.isin(tickers)]
+
+        lengths = window.notna().sum()
+        window = window.loc[:, lengths[lengths >= self.min_history].index]
+        if window.empty:
+            return []
+
+        scores = self.panel_scorer(window)
+        last_close = window.ffill().iloc[-1]
+        return [{'ticker': ticker, 'date': date, **row, 'close_price': last_close[ticker]}
+                for ticker, row in zip(scores.index, scores.to_dict('records'))]
+
+    def score_date(self, date: datetime) -> List[Dict]:
+        """
+        리밸런싱 날짜의 전체 종목 채점
+
+        Returns:
+            점수 내림차순 후보 리스트 (같은 점수는 유니버스 순서)
+        """
+        if self.score_cache is not None and date in self.score_cache:
+            return self.score_cache[date]
+
+        # 디스크 캐시에 있는 종목은 채점 생략
+        tickers, candidates = self.tickers, []
+        if self.score_store is not None:
+            summary = self._window_summary(date)
+            candidates, tickers = self.score_store.lookup(date, summary)
+
+        if not tickers:
+            results = []
+        elif self.panel_scorer is not None:
+            results = self._score_panel(date, tickers)
+        elif self.max_workers > 1:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                results = list(executor.map(lambda ticker: self._score_one(ticker, date), tickers))
+        else:
+            results = [self._score_one(ticker, date) for ticker in tickers]
+        results = [result for result in results if result is not None]
+
+        if self.score_store is not None:
+            # 분석 실패(예외)는 일시적일 수 있으므로 캐시하지 않음
+            self.score_store.store(date, summary, [t for t in tickers if t not in self._failed], results)
+            self._failed.clear()
+            order = {ticker: i for i, ticker in enumerate(self.tickers)}
+            candidates = sorted(candidates + results, key=lambda x: order[x['ticker']])
+        else:
+            candidates = results
+        candidates.sort(key=lambda x: x['total_score'], reverse=True)
+
+        if self.score_cache is not None:
+            self.score_cache[date] = candidates
+        return candidates
+
+    def run(self, start_date: datetime, end_date: datetime,
+            on_rebalance: Optional[Callable[[int, int, Dict], None]] = _print_rebalance
+            ) -> Optional[Dict]:
+        """
+        백테스트 실행
+
+        Args:
+            start_date: 시작일
+            end_date: 종료일
+            on_rebalance: (순번, 전체 횟수, 기록) 진행 콜백 (None이면 출력 없음)
+
+        Returns:
+            calculate_metrics 결과 (리밸런싱 기록이 없으면 None)
+        """
+        dates = rebalance_schedule(start_date, end_date, self.rebalance_days)
+        if self._close is None:
+            self._close = close_panel(self.price_store, self.tickers)
+        returns = holding_period_returns(self._close, dates)
+
+        self.capital = self.initial_capital
+        self.portfolio_history = []
+        total = len(dates) - 1
+
+        # 비중 행렬 (리밸런싱 × 종목, 선정 종목 동일 비중)
+        columns = {ticker: j for j, ticker in enumerate(returns.columns)}
+        weights = np.zeros(returns.shape)
+        holdings = None
+        with_costs = bool(self.commission or self.slippage)
+
+        for i, date in enumerate(dates[:-1]):
+            candidates = self.score_date(date)
+            if self.min_score is not None:
+                candidates = [stock for stock in candidates if stock['total_score'] >= self.min_score]
+            portfolio = self.selector(candidates, self.top_n)
+
+            if not portfolio:
+                # 현금 보유 (기록 제외): 직전 보유 종목 전량 매도 비용은 직전 구간 기록에 반영
+                if holdings is not None and with_costs:
+                    self._charge_liquidation(float(holdings.sum()))
+                holdings = np.zeros(returns.shape[1])
+                if on_rebalance is not None:
+                    print(f"[{i+1}/{total}] {date:%Y-%m-%d} -> 종목 없음")
+                continue
+
+            # 동일 비중 (가격이 없는 종목은 0% 수익)
+            tickers = [stock['ticker'] for stock in portfolio]
+            for ticker in tickers:
+                if ticker in columns:
+                    weights[i, columns[ticker]] += 1 / len(portfolio)
+            period = portfolio_returns(weights[i], returns.values[i], self.commission, self.slippage,
+                                       previous=holdings)
+            holdings = period['drift']
+            period_return = float(period['net'][0])
+            self.capital = self.capital * (1 + period_return)
+
+            record = {
+                'date': date,
+                'capital': self.capital,
+                'return': period_return,
+                'top_stocks': tickers,
+                'top_scores': [stock['total_score'] for stock in portfolio],
+            }
+            if with_costs:
+                record.update(gross_return=float(period['gross'][0]), turnover=float(period['turnover'][0]),
+                              cost=float(period['cost'][0]))
+            # 채점 함수가 준 세부 점수는 포트폴리오 평균으로 기록 (예: avg_news_score)
+            for key, value in portfolio[0].items():
+                if key not in _RESERVED_KEYS and isinstance(value, (int, float, np.number)):
+                    record[f'avg_{key}'] = float(np.mean([stock[key] for stock in portfolio]))
+            self.portfolio_history.append(record)
+
+            if on_rebalance is not None:
+                on_rebalance(i + 1, total, record)
+
+        self.save_score_cache()
+        self.weights = pd.DataFrame(weights, index=returns.index, columns=returns.columns)
+        metrics = calculate_metrics([p['return'] for p in self.portfolio_history], self.initial_capital,
+                                    (end_date - start_date).days, self.periods_per_year)
+        if metrics is not None and with_costs:
+            metrics['avg_turnover'] = float(np.mean([p['turnover'] for p in self.portfolio_history]))
+            metrics['total_cost'] = float(np.sum([p['cost'] for p in self.portfolio_history]))
+        return metrics
+
+    def _charge_liquidation(self, sold: float):
+        """
+        현금 전환 시 전량 매도 비용을 자본과 직전 리밸런싱 기록에 반영
+
+        Args:
+            sold: 매도 비중 합계 (직전 구간 종료 시점 보유 비중 합계)
+        """
+        if sold <= 0 or not self.portfolio_history:
+            return
+        cost = sold * (self.commission + self.slippage)
+        record = self.portfolio_history[-1]
+        # 기록의 비용은 구간 시작 자본 대비 비율
+        record['cost'] += cost * (1 + record['return'])
+        record['turnover'] += sold
+        record['return'] = (1 + record['return']) * (1 - cost) - 1
+        self.capital *= 1 - cost
+        record['capital'] = self.capital
+
+    def save_score_cache(self):
+        """이번 실행에서 새로 채점한 결과를 디스크 캐시에 저장 (score_cache_dir가 없으면 무시)"""
+        if self.score_store is not None:
+            self.score_store.save()
+
+    def to_frame(self) -> pd.DataFrame:
+        """리밸런싱 기록 DataFrame"""
+        return pd.DataFrame(self.portfolio_history)
+
+    def save_csv(self, prefix: str = 'backtest_result') -> str:
+        """리밸런싱 기록 CSV 저장 (visualize_backtest.py 형식)"""
+        filename = f"{prefix}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
+        self.to_frame().to_csv(filename, index=False)
+        return filename
@@ -0,0 +1,213 @@
+"""
+CPU 계산 단계 프로세스 풀 (Process-pool Compute Stage)
+- 리포트 파이프라인을 I/O 단계(스레드: 가격/종목 정보 요청)와
+  계산 단계(프로세스: 지표, 점수, 가격 추천)로 분리
+- 가격 데이터는 MarketArchive(memmap)로 공유하므로 작업마다 DataFrame을
+  피클로 보내지 않고 종목 코드만 전달 (워커는 아카이브를 한 번만 열어 재사용)
+
+지표/점수 계산은 pandas 연산이 대부분이라 스레드 풀에서는 GIL 때문에 사실상
+한 코어만 사용합니다. 계산 단계를 프로세스 풀로 옮기면 코어 수만큼 확장됩니다.
+
+run_pipeline은 두 단계를 묶음/장벽 없이 이어 붙입니다. 요청이 끝난 종목은 바로
+계산 단계로 넘어가고, 실패한 요청은 다른 종목을 막지 않고 지수 백오프 후 재시도하며,
+결과는 완료되는 순서대로 호출자에게 전달됩니다.
+
+Examples:
+    >>> def compute(df, latest_price):           # 모듈 최상위 함수 (피클 가능)
+    ...     return TechnicalAnalyzerV3(df).calculate_total_score()
+    >>> tasks = {ticker: (prices.get(ticker),) for ticker in tickers}
+    >>> for ticker, result in run_compute_stage(compute, price_store, tasks):
+    ...     ...
+"""
+
+import heapq
+import os
+import shutil
+import tempfile
+import time
+from concurrent.futures import (
+    FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, as_completed, wait
+)
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import pandas as pd
+
+from .market_archive import MarketArchive
+from .price_store import PriceStore
+
+
+# 워커 프로세스별 가격 저장소 (initializer에서 아카이브를 열어 둠)
+_WORKER_STORE: Optional[PriceStore] = None
+
+
+def _init_worker(archive_dir: str):
+    """워커 시작 시 공유 아카이브 열기 (memmap, 데이터 복사 없음)"""
+    global _WORKER_STORE
+    _WORKER_STORE = PriceStore.from_archive(archive_dir)
+
+
+def _run_one(func: Callable, ticker: str, df: Optional[pd.DataFrame], args: Tuple,
+             store: Optional[PriceStore]) -> Any:
+    """종목 하나 계산 (실패 시 None, 다른 종목 계산은 계속)"""
+    try:
+        if df is None:
+            df = store.history(ticker)
+        return func(df, *args)
+    except Exception as e:
+        print(f"[ERROR] {ticker}: {e}")
+        return None
+
+
+def _run_chunk(func: Callable, items: List[Tuple[str, Optional[pd.DataFrame], Tuple]]
+               ) -> List[Tuple[str, Any]]:
+    """워커에서 종목 묶음 계산 (프로세스 간 왕복 횟수를 줄이기 위해 묶음 단위)"""
+    return [(ticker, _run_one(func, ticker, df, args, _WORKER_STORE)) for ticker, df, args in items]
+
+
+@contextmanager
+def _shared_archive(store: PriceStore, enabled: bool) -> Iterator[Optional[MarketArchive]]:
+    """워커가 열 아카이브 (연결된 아카이브가 없으면 임시 아카이브를 만들고 끝나면 삭제)"""
+    if not enabled or store.archive is not None:
+        yield store.archive if enabled else None
+        return
+
+    temp_dir = tempfile.mkdtemp(prefix='price_archive_')
+    try:
+        yield store.save_archive(temp_dir)
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def _compute_item(store: PriceStore, archive, ticker: str, args: Tuple):
+    """워커로 보낼 작업 (아카이브에 없는 종목은 DataFrame을 직접 전달)"""
+    return ticker, None if ticker in archive else store.history(ticker), args
+
+
+def run_compute_stage(func: Callable[..., Any], store: PriceStore,
+                      tasks: Dict[str, Tuple], max_workers: Optional[int] = None,
+                      chunk_size: Optional[int] = None, processes: bool = True
+                      ) -> Iterator[Tuple[str, Any]]:
+    """
+    가격 데이터 기반 CPU 계산을 프로세스 풀에서 실행
+
+    Args:
+        func: (df, *args) -> 결과 (모듈 최상위 함수여야 프로세스로 전달 가능)
+        store: 가격 저장소 (아카이브가 연결되어 있으면 그대로 공유, 없으면 임시 아카이브 생성)
+        tasks: {종목: func에 전달할 추가 인자 튜플}
+        max_workers: 프로세스 수 (기본: CPU 코어 수)
+        chunk_size: 작업 묶음 크기 (기본: 워커당 약 4묶음)
+        processes: False면 현재 프로세스에서 순서대로 계산 (디버깅/테스트용)
+
+    Yields:
+        (종목, 결과) - 완료되는 순서대로 (계산 실패 종목은 결과 None)
+    """
+    tickers = [ticker for ticker in tasks if ticker in store]
+    if not tickers:
+        return
+
+    max_workers = max_workers or os.cpu_count() or 1
+
+    with _shared_archive(store, processes and max_workers > 1) as archive:
+        if archive is None:
+            for ticker in tickers:
+                yield ticker, _run_one(func, ticker, None, tasks[ticker], store)
+            return
+
+        items = [_compute_item(store, archive, ticker, tasks[ticker]) for ticker in tickers]
+        chunk_size = chunk_size or max(1, len(items) // (max_workers * 4))
+        chunks = [items[i:i + chunk_size] for i in range(0, len(items), chunk_size)]
+
+        with ProcessPoolExecutor(max_workers=min(max_workers, len(chunks)),
+                                 initializer=_init_worker, initargs=(archive.path,)) as executor:
+            futures = [executor.submit(_run_chunk, func, chunk) for chunk in chunks]
+            for future in as_completed(futures):
+                yield from future.result()
+
+
+def run_pipeline(tickers: Iterable[str], fetch: Callable[[str], Optional[Tuple]],
+                 func: Callable[..., Any], store: PriceStore,
+                 fetch_workers: int = 10, max_workers: Optional[int] = None,
+                 retries: int = 2, backoff: float = 1.0, processes: bool = True
+                 ) -> Iterator[Tuple[str, Any]]:
+    """
+    요청(스레드) → 계산(프로세스) 스트리밍 파이프라인
+
+    Args:
+        tickers: 종목 리스트
+        fetch: 종목 → func 추가 인자 튜플 (I/O 단계, 스레드에서 실행).
+               가격이 store에 없으면 fetch가 store.add로 채워야 함.
+               예외 또는 None이면 실패로 보고 재시도
+        func: (df, *args) -> 결과 (계산 단계, 모듈 최상위 함수)
+        store: 가격 저장소
+        fetch_workers: I/O 스레드 수
+        max_workers: 계산 프로세스 수 (기본: CPU 코어 수)
+        retries: 요청 실패 시 재시도 횟수
+        backoff: 첫 재시도 대기 시간 (초, 재시도마다 2배)
+        processes: False면 계산을 현재 프로세스에서 실행
+
+    Yields:
+        (종목, 결과) - 완료되는 순서대로 (요청/계산 실패 종목은 결과 None)
+    """
+    tickers = list(dict.fromkeys(tickers))
+    max_workers = max_workers or os.cpu_count() or 1
+    use_processes = processes and max_workers > 1
+
+    with _shared_archive(store, use_processes) as archive, \
+            ThreadPoolExecutor(max_workers=fetch_workers) as io_pool:
+        cpu_pool = None
+        if archive is not None:
+            cpu_pool = ProcessPoolExecutor(max_workers=max_workers,
+                                           initializer=_init_worker, initargs=(archive.path,))
+        try:
+            pending = {}  # future → (단계, 종목, 시도 횟수)
+            retry_queue = []  # (재시도 시각, 종목, 시도 횟수)
+
+            for ticker in tickers:
+                pending[io_pool.submit(fetch, ticker)] = ('fetch', ticker, 0)
+
+            while pending or retry_queue:
+                now = time.monotonic()
+                while retry_queue and retry_queue[0][0] <= now:
+                    _, ticker, attempt = heapq.heappop(retry_queue)
+                    pending[io_pool.submit(fetch, ticker)] = ('fetch', ticker, attempt)
+
+                timeout = max(0.0, retry_queue[0][0] - now) if retry_queue else None
+                done, _ = wait(list(pending), timeout=timeout, return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    stage, ticker, attempt = pending.pop(future)
+
+                    if stage == 'compute':
+                        try:
+                            result = future.result()[0][1]
+                        except Exception as e:
+                            # 워커 프로세스 비정상 종료 등 (func 예외는 워커에서 처리)
+                            print(f"[ERROR] {ticker}: {e}")
+                            result = None
+                        yield ticker, result
+                        continue
+
+                    try:
+                        args, error = future.result(), None
+                    except Exception as e:
+                        args, error = None, e
+
+                    if args is None or ticker not in store:
+                        if attempt < retries:
+                            heapq.heappush(retry_queue,
+                                           (time.monotonic() + backoff * (2 ** attempt), ticker, attempt + 1))
+                        else:
+                            if error is not None:
+                                print(f"[ERROR] {ticker}: {error} (재시도 {retries}회 실패)")
+                            yield ticker, None
+                        continue
+
+                    if cpu_pool is None:
+                        yield ticker, _run_one(func, ticker, None, args, store)
+                    else:
+                        item = _compute_item(store, archive, ticker, args)
+                        pending[cpu_pool.submit(_run_chunk, func, [item])] = ('compute', ticker, attempt)
+        finally:
+            if cpu_pool is not None:
+                cpu_pool.shutdown(cancel_futures=True)
@@ -0,0 +1,596 @@
+"""
+증분 지표 상태 (Incremental Indicator State)
+- 시간별 리포트 갱신 시 2년치 지표를 처음부터 다시 계산하지 않도록
+  종목별 지표 상태(rolling 합계, EMA 값, 최소/최대 deque)를 저장
+- 새 봉 하나를 추가하면 SMA/EMA/RSI/MACD/BB/ATR/스토캐스틱/일목균형표/OBV를 O(1)로 갱신
+
+사용 예:
+    store = IndicatorStateStore(DEFAULT_STATE_DIR)
+    state = store.load(ticker) or IndicatorState.from_history(df)
+    latest = state.advance(df)   # 확정 봉은 반영, 진행 중인 마지막 봉은 미리보기
+    store.save(ticker, state)
+
+    # 시간별 리포트: 다운로드한 PriceStore 전체를 한 번에
+    latest = refresh_indicator_states(price_store, tickers, store)
+
+지표 정의는 indicators.py와 같습니다 (계산 결과는 부동소수점 오차 범위 내에서 동일).
+"""
+
+import json
+import math
+import os
+import threading
+from collections import deque
+from typing import Dict, Iterable, Optional
+
+import numpy as np
+import pandas as pd
+
+from .indicators import calculate_all_indicators, obv_from_arrays
+
+
+SMA_PERIODS = [5, 20, 60, 120]
+EMA_SPANS = [12, 26]
+STOCH_PARAMS = [(5, 3, 3), (10, 6, 6), (20, 12, 12)]
+ICHIMOKU_PERIODS = [9, 26, 52]
+ICHIMOKU_SHIFT = 26
+
+# 상태 파일 기본 위치
+DEFAULT_STATE_DIR = os.path.join('cache', 'indicator_state')
+
+# 상태로 갱신하는 지표 컬럼 (Ichimoku_Lagging은 미래 종가라 최신 봉에서는 항상 NaN)
+STATE_COLUMNS = (
+    [f'SMA_{p}' for p in SMA_PERIODS]
+    + [f'EMA_{s}' for s in EMA_SPANS]
+    + ['RSI', 'EMA_fast', 'EMA_slow', 'MACD', 'MACD_Signal', 'MACD_Hist',
+       'BB_Middle', 'BB_Std', 'BB_Upper', 'BB_Lower', 'ATR']
+    + [f'STOCH_{kd}_{k}_{d}_{s}' for k, d, s in STOCH_PARAMS for kd in ['K', 'D']]
+    + ['Ichimoku_Conversion', 'Ichimoku_Base', 'Ichimoku_SpanA', 'Ichimoku_SpanB', 'OBV']
+)
+
+
+class _RollingWindow:
+    """고정 길이 윈도우의 평균/표준편차 (합계를 이동하며 갱신)"""
+
+    def __init__(self, size: int):
+        self.size = size
+        self.values = deque(maxlen=size)
+        self.shift = None       # 상쇄 오차를 줄이기 위한 기준값
+        self.total = 0.0        # sum(x - shift)
+        self.total_sq = 0.0     # sum((x - shift)^2)
+        self.nan_count = 0
+
+    @classmethod
+    def from_values(cls, size: int, values) -> '_RollingWindow':
+        window = cls(size)
+        for value in list(values)[-size:]:
+            window.push(float(value))
+        return window
+
+    def _with(self, x: float):
+        """x를 추가했을 때의 (shift, total, total_sq, nan_count, length)"""
+        shift, total, total_sq, nan_count = self.shift, self.total, self.total_sq, self.nan_count
+
+        if len(self.values) == self.size:
+            outgoing = self.values[0]
+            if math.isnan(outgoing):
+                nan_count -= 1
+            else:
+                total -= outgoing - shift
+                total_sq -= (outgoing - shift) ** 2
+
+        if math.isnan(x):
+            nan_count += 1
+        else:
+            if shift is None:
+                shift = x
+            total += x - shift
+            total_sq += (x - shift) ** 2
+
+        return shift, total, total_sq, nan_count, min(len(self.values) + 1, self.size)
+
+    def mean_with(self, x: float) -> float:
+        shift, total, _, nan_count, length = self._with(x)
+        if length < self.size or nan_count:
+            return np.nan
+        return shift + total / self.size
+
+    def std_with(self, x: float) -> float:
+        _, total, total_sq, nan_count, length = self._with(x)
+        if length < self.size or nan_count or self.size < 2:
+            return np.nan
+        var = (total_sq - total * total / self.size) / (self.size - 1)
+        return math.sqrt(max(var, 0.0))
+
+    def push(self, x: float):
+        self.shift, self.total, self.total_sq, self.nan_count, _ = self._with(x)
+        self.values.append(x)
+
+    def to_dict(self) -> Dict:
+        return {'size': self.size, 'values': list(self.values)}
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> '_RollingWindow':
+        # 합계는 저장된 값으로 다시 계산 (누적 오차 초기화)
+        return cls.from_values(data['size'], data['values'])
+
+
+class _RollingExtreme:
+    """고정 길이 윈도우의 최대/최소 (단조 deque)"""
+
+    def __init__(self, size: int, mode: str):
+        self.size = size
+        self.mode = mode
+        self.entries = deque()  # (index, value), max면 값 내림차순 / min이면 오름차순
+        self.count = 0
+
+    @classmethod
+    def from_values(cls, size: int, mode: str, values, count: int) -> '_RollingExtreme':
+        values = list(values)[-size:]
+        extreme = cls(size, mode)
+        extreme.count = count - len(values)
+        for value in values:
+            extreme.push(float(value))
+        return extreme
+
+    def _better(self, a: float, b: float) -> bool:
+        return a >= b if self.mode == 'max' else a <= b
+
+    def value_with(self, x: float) -> float:
+        if self.count + 1 < self.size:
+            return np.nan
+
+        start = self.count + 1 - self.size
+        best = x
+        for index, value in self.entries:
+            if index < start:
+                continue
+            # 단조 deque에서 유효한 첫 원소가 나머지 윈도우의 극값
+            if self._better(value, best):
+                best = value
+            break
+        return best
+
+    def push(self, x: float):
+        while self.entries and self._better(x, self.entries[-1][1]):
+            self.entries.pop()
+        self.entries.append((self.count, x))
+        self.count += 1
+
+        start = self.count - self.size
+        while self.entries and self.entries[0][0] < start:
+            self.entries.popleft()
+
+    def to_dict(self) -> Dict:
+        return {'size': self.size, 'mode': self.mode, 'count': self.count,
+                'entries': [list(entry) for entry in self.entries]}
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> '_RollingExtreme':
+        extreme = cls(data['size'], data['mode'])
+        extreme.count = data['count']
+        extreme.entries = deque((int(i), float(v)) for i, v in data['entries'])
+        return extreme
+
+
+class _Ema:
+    """지수 이동평균 (pandas ewm(span, adjust=False)와 같은 점화식)"""
+
+    def __init__(self, span: int, value: Optional[float] = None):
+        self.span = span
+        self.alpha = 2.0 / (span + 1.0)
+        self.value = value
+
+    def value_with(self, x: float) -> float:
+        if self.value is None:
+            return x
+        old_wt = 1.0 - self.alpha
+        return (old_wt * self.value + self.alpha * x) / (old_wt + self.alpha)
+
+    def push(self, x: float):
+        self.value = self.value_with(x)
+
+    def to_dict(self) -> Dict:
+        return {'span': self.span, 'value': self.value}
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> '_Ema':
+        return cls(data['span'], data['value'])
+
+
+class _Lag:
+    """lag 봉 전 값 (shift(lag))"""
+
+    def __init__(self, lag: int, values=()):
+        self.lag = lag
+        self.values = deque(values, maxlen=lag)
+
+    def value_with(self, x: float) -> float:
+        return self.values[0] if len(self.values) == self.lag else np.nan
+
+    def push(self, x: float):
+        self.values.append(x)
+
+    def to_dict(self) -> Dict:
+        return {'lag': self.lag, 'values': list(self.values)}
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> '_Lag':
+        return cls(data['lag'], data['values'])
+
+
+def _ratio(numerator: float, denominator: float) -> float:
+    """0으로 나누기를 pandas와 같이 inf/NaN으로 처리"""
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return float(np.float64(numerator) / np.float64(denominator))
+
+
+class IndicatorState:
+    """
+    종목 하나의 지표 상태
+
+    update(bar)는 확정된 봉을 반영하고, peek(bar)는 상태를 바꾸지 않고
+    진행 중인 봉(장중 갱신)의 지표 값을 계산합니다. 둘 다 과거 길이와 무관하게 O(1)입니다.
+    """
+
+    def __init__(self):
+        self.sma = {p: _RollingWindow(p) for p in SMA_PERIODS}
+        self.ema = {s: _Ema(s) for s in EMA_SPANS}
+        self.macd_signal = _Ema(9)
+        self.rsi_gain = _RollingWindow(14)
+        self.rsi_loss = _RollingWindow(14)
+        self.atr = _RollingWindow(14)
+
+        periods = sorted({k for k, _, _ in STOCH_PARAMS} | set(ICHIMOKU_PERIODS))
+        self.highs = {p: _RollingExtreme(p, 'max') for p in periods}
+        self.lows = {p: _RollingExtreme(p, 'min') for p in periods}
+        self.stoch_k = {params: _RollingWindow(params[2]) for params in STOCH_PARAMS}
+        self.stoch_d = {params: _RollingWindow(params[1]) for params in STOCH_PARAMS}
+        self.span_a = _Lag(ICHIMOKU_SHIFT)
+        self.span_b = _Lag(ICHIMOKU_SHIFT)
+
+        self.obv = 0
+        self.prev_close = None
+        self.last_date = None
+        self.last_values = {}
+        self.n_bars = 0
+
+    @classmethod
+    def from_history(cls, df: pd.DataFrame) -> 'IndicatorState':
+        """
+        과거 OHLCV로 상태 생성 (전체 지표를 벡터 연산으로 한 번 계산한 뒤 꼬리만 보관)
+
+        Args:
+            df: OHLCV DataFrame (시간순)
+
+        Returns:
+            IndicatorState
+        """
+        state = cls()
+        if df.empty:
+            return state
+
+        full = calculate_all_indicators(df)
+        close = full['Close'].to_numpy(dtype=np.float64)
+        high = full['High'].to_numpy(dtype=np.float64)
+        low = full['Low'].to_numpy(dtype=np.float64)
+        n = len(full)
+
+        for p in SMA_PERIODS:
+            state.sma[p] = _RollingWindow.from_values(p, close)
+        for s in EMA_SPANS:
+            state.ema[s] = _Ema(s, float(full[f'EMA_{s}'].iloc[-1]))
+        state.macd_signal = _Ema(9, float(full['MACD_Signal'].iloc[-1]))
+
+        delta = np.diff(close, prepend=np.nan)
+        state.rsi_gain = _RollingWindow.from_values(14, np.where(delta > 0, delta, 0.0))
+        state.rsi_loss = _RollingWindow.from_values(14, -np.where(delta < 0, delta, 0.0))
+
+        prev_close = np.concatenate([[np.nan], close[:-1]])
+        true_range = np.nanmax(np.vstack([
+            high - low, np.abs(high - prev_close), np.abs(low - prev_close)
+        ]), axis=0)
+        state.atr = _RollingWindow.from_values(14, true_range)
+
+        for p in state.highs:
+            state.highs[p] = _RollingExtreme.from_values(p, 'max', high, n)
+            state.lows[p] = _RollingExtreme.from_values(p, 'min', low, n)
+
+        for k, d, s in STOCH_PARAMS:
+            low_min = full['Low'].rolling(window=k).min()
+            high_max = full['High'].rolling(window=k).max()
+            raw_k = 100 * (full['Close'] - low_min) / (high_max - low_min)
+            state.stoch_k[(k, d, s)] = _RollingWindow.from_values(s, raw_k.to_numpy())
+            state.stoch_d[(k, d, s)] = _RollingWindow.from_values(
+                d, full[f'STOCH_K_{k}_{d}_{s}'].to_numpy())
+
+        span_a_raw = (full['Ichimoku_Conversion'] + full['Ichimoku_Base']) / 2
+        span_b_raw = (full['High'].rolling(window=52).max() + full['Low'].rolling(window=52).min()) / 2
+        state.span_a = _Lag(ICHIMOKU_SHIFT, span_a_raw.to_numpy()[-ICHIMOKU_SHIFT:])
+        state.span_b = _Lag(ICHIMOKU_SHIFT, span_b_raw.to_numpy()[-ICHIMOKU_SHIFT:])
+
+        state.obv = obv_from_arrays(close, full['Volume'].to_numpy())[-1].item()
+        state.prev_close = float(close[-1])
+        state.last_date = pd.Timestamp(full.index[-1])
+        state.last_values = {col: float(full[col].iloc[-1]) for col in STATE_COLUMNS}
+        state.n_bars = n
+
+        return state
+
+    def _step(self, bar, commit: bool, date=None) -> Dict[str, float]:
+        """봉 하나의 지표 계산 (commit=True면 상태에 반영)"""
+        close = float(bar['Close'])
+        high = float(bar['High'])
+        low = float(bar['Low'])
+        volume = bar['Volume']
+        prev_close = self.prev_close
+
+        values = {}
+
+        # 이동평균 / 볼린저 밴드
+        for p in SMA_PERIODS:
+            values[f'SMA_{p}'] = self.sma[p].mean_with(close)
+        values['BB_Middle'] = values['SMA_20']
+        values['BB_Std'] = self.sma[20].std_with(close)
+        values['BB_Upper'] = values['BB_Middle'] + (values['BB_Std'] * 2)
+        values['BB_Lower'] = values['BB_Middle'] - (values['BB_Std'] * 2)
+
+        # EMA / MACD
+        for s in EMA_SPANS:
+            values[f'EMA_{s}'] = self.ema[s].value_with(close)
+        values['EMA_fast'] = values['EMA_12']
+        values['EMA_slow'] = values['EMA_26']
+        macd = values['EMA_fast'] - values['EMA_slow']
+        values['MACD'] = macd
+        values['MACD_Signal'] = self.macd_signal.value_with(macd)
+        values['MACD_Hist'] = macd - values['MACD_Signal']
+
+        # RSI
+        delta = close - prev_close if prev_close is not None else np.nan
+        gain = delta if delta > 0 else 0.0
+        loss = -delta if delta < 0 else 0.0
+        rs = _ratio(self.rsi_gain.mean_with(gain), self.rsi_loss.mean_with(loss))
+        values['RSI'] = 100 - (100 / (1 + rs))
+
+        # ATR
+        if prev_close is None:
+            true_range = high - low
+        else:
+            true_range = max(high - low, abs(high - prev_close), abs(low - prev_close))
+        values['ATR'] = self.atr.mean_with(true_range)
+
+        # 스토캐스틱
+        highs = {p: self.highs[p].value_with(high) for p in self.highs}
+        lows = {p: self.lows[p].value_with(low) for p in self.lows}
+        raw_ks = {}
+        for k, d, s in STOCH_PARAMS:
+            raw_k = 100 * _ratio(close - lows[k], highs[k] - lows[k])
+            smooth_k = self.stoch_k[(k, d, s)].mean_with(raw_k)
+            raw_ks[(k, d, s)] = (raw_k, smooth_k)
+            values[f'STOCH_K_{k}_{d}_{s}'] = smooth_k
+            values[f'STOCH_D_{k}_{d}_{s}'] = self.stoch_d[(k, d, s)].mean_with(smooth_k)
+
+        # 일목균형표
+        values['Ichimoku_Conversion'] = (highs[9] + lows[9]) / 2
+        values['Ichimoku_Base'] = (highs[26] + lows[26]) / 2
+        span_a_raw = (values['Ichimoku_Conversion'] + values['Ichimoku_Base']) / 2
+        span_b_raw = (highs[52] + lows[52]) / 2
+        values['Ichimoku_SpanA'] = self.span_a.value_with(span_a_raw)
+        values['Ichimoku_SpanB'] = self.span_b.value_with(span_b_raw)
+
+        # OBV
+        if prev_close is not None and close > prev_close:
+            obv = self.obv + volume
+        elif prev_close is not None and close < prev_close:
+            obv = self.obv - volume
+        else:
+            obv = self.obv
+        values['OBV'] = obv
+
+        if commit:
+            for p in SMA_PERIODS:
+                self.sma[p].push(close)
+            for s in EMA_SPANS:
+                self.ema[s].push(close)
+            self.macd_signal.push(macd)
+            self.rsi_gain.push(gain)
+            self.rsi_loss.push(loss)
+            self.atr.push(true_range)
+            for p in self.highs:
+                self.highs[p].push(high)
+                self.lows[p].push(low)
+            for params, (raw_k, smooth_k) in raw_ks.items():
+                self.stoch_k[params].push(raw_k)
+                self.stoch_d[params].push(smooth_k)
+            self.span_a.push(span_a_raw)
+            self.span_b.push(span_b_raw)
+
+            self.obv = obv
+            self.prev_close = close
+            if date is None:
+                date = getattr(bar, 'name', None)
+            if date is not None:
+                self.last_date = pd.Timestamp(date)
+            self.last_values = values
+            self.n_bars += 1
+
+        return values
+
+    def matches(self, df: pd.DataFrame) -> bool:
+        """
+        마지막 확정 봉이 df에 같은 종가로 남아 있는지 (수정 주가/데이터 교체 감지)
+
+        Args:
+            df: 최근 OHLCV DataFrame
+
+        Returns:
+            True면 advance(df)로 이어서 갱신 가능
+        """
+        if self.last_date is None or self.prev_close is None:
+            return False
+        try:
+            close = df['Close'].loc[self.last_date]
+        except (KeyError, TypeError):
+            return False
+        if isinstance(close, pd.Series):
+            close = close.iloc[-1]
+        return bool(np.isclose(float(close), self.prev_close, rtol=1e-9))
+
+    def update(self, bar, date=None) -> Dict[str, float]:
+        """
+        확정된 봉 추가
+
+        Args:
+            bar: Open/High/Low/Close/Volume을 가진 Series 또는 dict
+            date: 봉 날짜 (None이면 Series의 name 사용)
+
+        Returns:
+            {지표 컬럼: 값}
+        """
+        return self._step(bar, commit=True, date=date)
+
+    def peek(self, bar) -> Dict[str, float]:
+        """진행 중인 봉의 지표 값 (상태는 변경하지 않음)"""
+        return self._step(bar, commit=False)
+
+    def advance(self, df: pd.DataFrame) -> Dict[str, float]:
+        """
+        새로 받은 데이터로 상태 갱신 (시간별 리포트용)
+
+        last_date 이후의 봉 중 마지막 봉을 제외한 봉은 확정 봉으로 반영하고,
+        마지막 봉은 장중 진행 중인 봉으로 보고 미리보기 값만 계산합니다.
+
+        Args:
+            df: 최근 OHLCV DataFrame (예: period='5d')
+
+        Returns:
+            마지막 봉 기준 {지표 컬럼: 값}
+        """
+        if self.last_date is not None:
+            df = df[df.index > self.last_date]
+        if df.empty:
+            return self.last_values
+
+        # 행 단위 Series 생성 비용을 피하기 위해 dict로 순회
+        bars = df.to_dict('records')
+        for date, bar in zip(df.index[:-1], bars[:-1]):
+            self.update(bar, date=date)
+        return self.peek(bars[-1])
+
+    def to_dict(self) -> Dict:
+        """JSON 직렬화 가능한 dict로 변환"""
+        return {
+            'sma': {str(p): w.to_dict() for p, w in self.sma.items()},
+            'ema': {str(s): e.to_dict() for s, e in self.ema.items()},
+            'macd_signal': self.macd_signal.to_dict(),
+            'rsi_gain': self.rsi_gain.to_dict(),
+            'rsi_loss': self.rsi_loss.to_dict(),
+            'atr': self.atr.to_dict(),
+            'highs': {str(p): e.to_dict() for p, e in self.highs.items()},
+            'lows': {str(p): e.to_dict() for p, e in self.lows.items()},
+            'stoch_k': {'_'.join(map(str, k)): w.to_dict() for k, w in self.stoch_k.items()},
+            'stoch_d': {'_'.join(map(str, k)): w.to_dict() for k, w in self.stoch_d.items()},
+            'span_a': self.span_a.to_dict(),
+            'span_b': self.span_b.to_dict(),
+            'obv': self.obv,
+            'prev_close': self.prev_close,
+            'last_date': self.last_date.isoformat() if self.last_date is not None else None,
+            'last_values': self.last_values,
+            'n_bars': self.n_bars,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'IndicatorState':
+        """to_dict() 결과에서 상태 복원"""
+        def stoch_key(key):
+            return tuple(int(part) for part in key.split('_'))
+
+        state = cls()
+        state.sma = {int(p): _RollingWindow.from_dict(w) for p, w in data['sma'].items()}
+        state.ema = {int(s): _Ema.from_dict(e) for s, e in data['ema'].items()}
+        state.macd_signal = _Ema.from_dict(data['macd_signal'])
+        state.rsi_gain = _RollingWindow.from_dict(data['rsi_gain'])
+        state.rsi_loss = _RollingWindow.from_dict(data['rsi_loss'])
+        state.atr = _RollingWindow.from_dict(data['atr'])
+        state.highs = {int(p): _RollingExtreme.from_dict(e) for p, e in data['highs'].items()}
+        state.lows = {int(p): _RollingExtreme.from_dict(e) for p, e in data['lows'].items()}
+        state.stoch_k = {stoch_key(k): _RollingWindow.from_dict(w) for k, w in data['stoch_k'].items()}
+        state.stoch_d = {stoch_key(k): _RollingWindow.from_dict(w) for k, w in data['stoch_d'].items()}
+        state.span_a = _Lag.from_dict(data['span_a'])
+        state.span_b = _Lag.from_dict(data['span_b'])
+        state.obv = data['obv']
+        state.prev_close = data['prev_close']
+        state.last_date = pd.Timestamp(data['last_date']) if data['last_date'] else None
+        state.last_values = data['last_values']
+        state.n_bars = data['n_bars']
+        return state
+
+
+class IndicatorStateStore:
+    """종목별 IndicatorState 디스크 저장소 (JSON 파일)"""
+
+    def __init__(self, cache_dir: str):
+        """
+        초기화
+
+        Args:
+            cache_dir: 상태 파일 디렉토리
+        """
+        self.cache_dir = cache_dir
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    def _path(self, ticker: str) -> str:
+        return os.path.join(self.cache_dir, f"{ticker.upper()}.json")
+
+    def load(self, ticker: str) -> Optional[IndicatorState]:
+        """저장된 상태 로드 (없거나 손상되면 None)"""
+        try:
+            with open(self._path(ticker), 'r', encoding='utf-8') as f:
+                return IndicatorState.from_dict(json.load(f))
+        except (OSError, ValueError, KeyError) as e:
+            if not isinstance(e, FileNotFoundError):
+                print(f"[WARNING] {ticker} 지표 상태 로드 실패: {e}")
+            return None
+
+    def save(self, ticker: str, state: IndicatorState):
+        """상태 저장 (원자적 교체)"""
+        path = self._path(ticker)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(state.to_dict(), f)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"[WARNING] {ticker} 지표 상태 저장 실패: {e}")
+
+
+def refresh_indicator_states(price_store, tickers: Iterable[str],
+                             state_store: IndicatorStateStore) -> Dict[str, Dict[str, float]]:
+    """
+    저장된 지표 상태에 새로 추가된 봉만 반영하고 다시 저장 (시간별 리포트용)
+
+    상태가 없거나 가격 이력과 맞지 않으면 마지막 봉 전까지의 이력으로 다시 만듭니다.
+    마지막 봉은 장중 진행 중인 봉으로 보고 미리보기 값만 계산합니다.
+
+    Args:
+        price_store: PriceStore (history(ticker)로 OHLCV 조회)
+        tickers: 종목 리스트 (price_store에 없는 종목은 건너뜀)
+        state_store: IndicatorStateStore
+
+    Returns:
+        {종목: 마지막 봉 기준 {지표 컬럼: 값}}
+    """
+    latest = {}
+    for ticker in tickers:
+        if ticker not in price_store:
+            continue
+        df = price_store.history(ticker)
+        if df.empty:
+            continue
+
+        state = state_store.load(ticker)
+        if state is None or not state.matches(df):
+            state = IndicatorState.from_history(df.iloc[:-1])
+        latest[ticker] = state.advance(df)
+        state_store.save(ticker, state)
+    return latest
@@ -7,6 +7,127 @@ import pandas as pd
 import numpy as np
 
 
+class _IndicatorCache:
+    """지표 간 공유되는 중간 계산 결과 (rolling/ewm) 캐시"""
+
+    def __init__(self, df):
+        self.df = df
+        self._values = {}
+
+    def rolling(self, column, window, how):
+        """df[column].rolling(window).<how>() (같은 인자는 한 번만 계산)"""
+        key = ('rolling', column, window, how)
+        if key not in self._values:
+            self._values[key] = getattr(self.df[column].rolling(window=window), how)()
+        return self._values[key]
+
+    def ewm(self, column, span):
+        """df[column].ewm(span, adjust=False).mean() (같은 인자는 한 번만 계산)"""
+        key = ('ewm', column, span)
+        if key not in self._values:
+            self._values[key] = self.df[column].ewm(span=span, adjust=False).mean()
+        return self._values[key]
+
+
+# 지표 공식: 인자를 받아 compute(df, cache) -> Series를 반환
+# calculate_* 함수와 INDICATOR_REGISTRY가 같은 공식을 사용합니다.
+
+def _apply(df, formulas):
+    """[(컬럼명, 공식)] 순서대로 df에 컬럼 추가 (앞 컬럼을 뒤 공식이 참조할 수 있음)"""
+    cache = _IndicatorCache(df)
+    for name, func in formulas:
+        df[name] = func(df, cache)
+    return df
+
+
+def _sma(period):
+    return lambda df, cache: cache.rolling('Close', period, 'mean')
+
+
+def _rolling_std(period):
+    return lambda df, cache: cache.rolling('Close', period, 'std')
+
+
+def _ema(span):
+    return lambda df, cache: cache.ewm('Close', span)
+
+
+def _rsi(period):
+    def compute(df, cache):
+        delta = df['Close'].diff()
+        gain = (delta.where(delta > 0, 0)).rolling(window=period).mean()
+        loss = (-delta.where(delta < 0, 0)).rolling(window=period).mean()
+        rs = gain / loss
+        return 100 - (100 / (1 + rs))
+    return compute
+
+
+def _macd(df, cache):
+    return df['EMA_fast'] - df['EMA_slow']
+
+
+def _macd_signal(signal):
+    return lambda df, cache: df['MACD'].ewm(span=signal, adjust=False).mean()
+
+
+def _macd_hist(df, cache):
+    return df['MACD'] - df['MACD_Signal']
+
+
+def _bb_upper(std):
+    return lambda df, cache: df['BB_Middle'] + (df['BB_Std'] * std)
+
+
+def _bb_lower(std):
+    return lambda df, cache: df['BB_Middle'] - (df['BB_Std'] * std)
+
+
+def _atr(period):
+    def compute(df, cache):
+        high_low = df['High'] - df['Low']
+        high_close = np.abs(df['High'] - df['Close'].shift())
+        low_close = np.abs(df['Low'] - df['Close'].shift())
+        ranges = pd.concat([high_low, high_close, low_close], axis=1)
+        true_range = np.max(ranges, axis=1)
+        return true_range.rolling(window=period).mean()
+    return compute
+
+
+def _stoch_k(k_period, smooth_k):
+    def compute(df, cache):
+        low_min = cache.rolling('Low', k_period, 'min')
+        high_max = cache.rolling('High', k_period, 'max')
+        stoch_k = 100 * (df['Close'] - low_min) / (high_max - low_min)
+        return stoch_k.rolling(window=smooth_k).mean()
+    return compute
+
+
+def _stoch_d(k_name, d_period):
+    return lambda df, cache: df[k_name].rolling(window=d_period).mean()
+
+
+def _midpoint(period):
+    def compute(df, cache):
+        return (cache.rolling('High', period, 'max') + cache.rolling('Low', period, 'min')) / 2
+    return compute
+
+
+def _ichimoku_span_a(df, cache):
+    return ((df['Ichimoku_Conversion'] + df['Ichimoku_Base']) / 2).shift(26)
+
+
+def _ichimoku_span_b(df, cache):
+    return _midpoint(52)(df, cache).shift(26)
+
+
+def _ichimoku_lagging(df, cache):
+    return df['Close'].shift(-26)
+
+
+def _obv(df, cache):
+    return obv_from_arrays(df['Close'].to_numpy(), df['Volume'].to_numpy())
+
+
 def calculate_sma(df, periods=[5, 20, 60, 120]):
     """
     단순 이동평균선 (Simple Moving Average)
@@ -18,9 +139,7 @@ def calculate_sma(df, periods=[5, 20, 60, 120]):
     Returns:
         DataFrame with SMA columns added
     """
-    for period in periods:
-        df[f'SMA_{period}'] = df['Close'].rolling(window=period).mean()
-    return df
+    return _apply(df, [(f'SMA_{period}', _sma(period)) for period in periods])
 
 
 def calculate_ema(df, periods=[12, 26]):
@@ -34,9 +153,7 @@ def calculate_ema(df, periods=[12, 26]):
     Returns:
         DataFrame with EMA columns added
     """
-    for period in periods:
-        df[f'EMA_{period}'] = df['Close'].ewm(span=period, adjust=False).mean()
-    return df
+    return _apply(df, [(f'EMA_{period}', _ema(period)) for period in periods])
 
 
 def calculate_rsi(df, period=14):
@@ -50,14 +167,7 @@ def calculate_rsi(df, period=14):
     Returns:
         DataFrame with RSI column added
     """
-    delta = df['Close'].diff()
-    gain = (delta.where(delta > 0, 0)).rolling(window=period).mean()
-    loss = (-delta.where(delta < 0, 0)).rolling(window=period).mean()
-
-    rs = gain / loss
-    df['RSI'] = 100 - (100 / (1 + rs))
-
-    return df
+    return _apply(df, [('RSI', _rsi(period))])
 
 
 def calculate_macd(df, fast=12, slow=26, signal=9):
@@ -73,14 +183,13 @@ def calculate_macd(df, fast=12, slow=26, signal=9):
     Returns:
         DataFrame with MACD columns added
     """
-    df['EMA_fast'] = df['Close'].ewm(span=fast, adjust=False).mean()
-    df['EMA_slow'] = df['Close'].ewm(span=slow, adjust=False).mean()
-
-    df['MACD'] = df['EMA_fast'] - df['EMA_slow']
-    df['MACD_Signal'] = df['MACD'].ewm(span=signal, adjust=False).mean()
-    df['MACD_Hist'] = df['MACD'] - df['MACD_Signal']
-
-    return df
+    return _apply(df, [
+        ('EMA_fast', _ema(fast)),
+        ('EMA_slow', _ema(slow)),
+        ('MACD', _macd),
+        ('MACD_Signal', _macd_signal(signal)),
+        ('MACD_Hist', _macd_hist),
+    ])
 
 
 def calculate_bollinger_bands(df, period=20, std=2):
@@ -95,13 +204,12 @@ def calculate_bollinger_bands(df, period=20, std=2):
     Returns:
         DataFrame with BB columns added
     """
-    df['BB_Middle'] = df['Close'].rolling(window=period).mean()
-    df['BB_Std'] = df['Close'].rolling(window=period).std()
-
-    df['BB_Upper'] = df['BB_Middle'] + (df['BB_Std'] * std)
-    df['BB_Lower'] = df['BB_Middle'] - (df['BB_Std'] * std)
-
-    return df
+    return _apply(df, [
+        ('BB_Middle', _sma(period)),
+        ('BB_Std', _rolling_std(period)),
+        ('BB_Upper', _bb_upper(std)),
+        ('BB_Lower', _bb_lower(std)),
+    ])
 
 
 def calculate_stochastic(df, k_period=14, d_period=3, smooth_k=3):
@@ -117,20 +225,11 @@ def calculate_stochastic(df, k_period=14, d_period=3, smooth_k=3):
     Returns:
         DataFrame with Stochastic columns added
     """
-    # 최고가/최저가
-    low_min = df['Low'].rolling(window=k_period).min()
-    high_max = df['High'].rolling(window=k_period).max()
-
-    # %K 계산
-    stoch_k = 100 * (df['Close'] - low_min) / (high_max - low_min)
-
-    # %K 스무딩
-    df[f'STOCH_K_{k_period}_{d_period}_{smooth_k}'] = stoch_k.rolling(window=smooth_k).mean()
-
-    # %D 계산 (시그널선)
-    df[f'STOCH_D_{k_period}_{d_period}_{smooth_k}'] = df[f'STOCH_K_{k_period}_{d_period}_{smooth_k}'].rolling(window=d_period).mean()
-
-    return df
+    k_name = f'STOCH_K_{k_period}_{d_period}_{smooth_k}'
+    return _apply(df, [
+        (k_name, _stoch_k(k_period, smooth_k)),
+        (f'STOCH_D_{k_period}_{d_period}_{smooth_k}', _stoch_d(k_name, d_period)),
+    ])
 
 
 def calculate_ichimoku(df):
@@ -140,28 +239,13 @@ def calculate_ichimoku(df):
     Returns:
         DataFrame with Ichimoku columns added
     """
-    # 전환선 (Conversion Line): (9일 최고가 + 9일 최저가) / 2
-    high_9 = df['High'].rolling(window=9).max()
-    low_9 = df['Low'].rolling(window=9).min()
-    df['Ichimoku_Conversion'] = (high_9 + low_9) / 2
-
-    # 기준선 (Base Line): (26일 최고가 + 26일 최저가) / 2
-    high_26 = df['High'].rolling(window=26).max()
-    low_26 = df['Low'].rolling(window=26).min()
-    df['Ichimoku_Base'] = (high_26 + low_26) / 2
-
-    # 선행스팬 A (Leading Span A): (전환선 + 기준선) / 2
-    df['Ichimoku_SpanA'] = ((df['Ichimoku_Conversion'] + df['Ichimoku_Base']) / 2).shift(26)
-
-    # 선행스팬 B (Leading Span B): (52일 최고가 + 52일 최저가) / 2
-    high_52 = df['High'].rolling(window=52).max()
-    low_52 = df['Low'].rolling(window=52).min()
-    df['Ichimoku_SpanB'] = ((high_52 + low_52) / 2).shift(26)
-
-    # 후행스팬 (Lagging Span): 현재 종가를 26일 뒤로
-    df['Ichimoku_Lagging'] = df['Close'].shift(-26)
-
-    return df
+    return _apply(df, [
+        ('Ichimoku_Conversion', _midpoint(9)),        # 전환선: (9일 최고가 + 9일 최저가) / 2
+        ('Ichimoku_Base', _midpoint(26)),             # 기준선: (26일 최고가 + 26일 최저가) / 2
+        ('Ichimoku_SpanA', _ichimoku_span_a),         # 선행스팬 A: (전환선 + 기준선) / 2, 26일 앞으로
+        ('Ichimoku_SpanB', _ichimoku_span_b),         # 선행스팬 B: 52일 중간값, 26일 앞으로
+        ('Ichimoku_Lagging', _ichimoku_lagging),      # 후행스팬: 현재 종가를 26일 뒤로
+    ])
 
 
 def calculate_atr(df, period=14):
@@ -175,16 +259,38 @@ def calculate_atr(df, period=14):
     Returns:
         DataFrame with ATR column added
     """
-    high_low = df['High'] - df['Low']
-    high_close = np.abs(df['High'] - df['Close'].shift())
-    low_close = np.abs(df['Low'] - df['Close'].shift())
+    return _apply(df, [('ATR', _atr(period))])
 
-    ranges = pd.concat([high_low, high_close, low_close], axis=1)
-    true_range = np.max(ranges, axis=1)
 
-    df['ATR'] = true_range.rolling(window=period).mean()
+def obv_from_arrays(close, volume, initial_obv=0, prev_close=None):
+    """
+    OBV 배열 계산 (종가 변화 부호 × 거래량의 누적합)
 
-    return df
+    1차원(봉) 또는 2차원(봉 × 종목) 배열을 받아 축 0 방향으로 누적합니다.
+
+    Args:
+        close: 종가 배열
+        volume: 거래량 배열
+        initial_obv: 시작 OBV 값 (이어붙이기 시 직전 OBV, 2차원이면 종목별 배열)
+        prev_close: 직전 종가 (None이면 첫 봉은 변화 없음으로 처리)
+
+    Returns:
+        OBV numpy 배열 (close와 같은 shape)
+    """
+    close = np.asarray(close, dtype=np.float64)
+    volume = np.asarray(volume)
+
+    if prev_close is None:
+        first = close[:1]
+    else:
+        first = np.asarray(prev_close, dtype=np.float64)[np.newaxis]
+    prev = np.concatenate([first, close[:-1]])
+
+    # 상승 +1, 하락 -1, 보합(또는 NaN) 0
+    direction = (close > prev).astype(np.int8) - (close < prev).astype(np.int8)
+    flow = np.where(direction != 0, direction * volume, 0)
+
+    return initial_obv + np.cumsum(flow, axis=0)
 
 
 def calculate_obv(df):
@@ -194,57 +300,146 @@ def calculate_obv(df):
     Returns:
         DataFrame with OBV column added
     """
-    obv = [0]
+    return _apply(df, [('OBV', _obv)])
+
+
+def append_obv(df, new_bars):
+    """
+    OBV가 계산된 DataFrame에 새 봉을 이어붙이고 새 봉의 OBV만 계산
 
-    for i in range(1, len(df)):
-        if df['Close'].iloc[i] > df['Close'].iloc[i-1]:
-            obv.append(obv[-1] + df['Volume'].iloc[i])
-        elif df['Close'].iloc[i] < df['Close'].iloc[i-1]:
-            obv.append(obv[-1] - df['Volume'].iloc[i])
-        else:
-            obv.append(obv[-1])
+    Args:
+        df: OBV 컬럼이 있는 OHLCV DataFrame
+        new_bars: 추가할 OHLCV DataFrame
 
-    df['OBV'] = obv
+    Returns:
+        OBV가 채워진 합쳐진 DataFrame
+    """
+    new_bars = new_bars.copy()
+    if df.empty:
+        return calculate_obv(new_bars)
+
+    new_bars['OBV'] = obv_from_arrays(
+        new_bars['Close'].to_numpy(),
+        new_bars['Volume'].to_numpy(),
+        initial_obv=df['OBV'].iloc[-1],
+        prev_close=df['Close'].iloc[-1],
+    )
+
+    return pd.concat([df, new_bars])
+
+
+# 지표 레지스트리: 컬럼명 -> (의존 컬럼, 계산 함수(df, cache))
+# 등록 순서 = 계산 순서 (의존 컬럼은 항상 먼저 등록)
+INDICATOR_REGISTRY = {}
+
+
+def _register(name, func, requires=()):
+    for dependency in requires:
+        if dependency not in INDICATOR_REGISTRY:
+            raise ValueError(f"{name}의 의존 지표 {dependency}가 먼저 등록되어야 합니다")
+    INDICATOR_REGISTRY[name] = (tuple(requires), func)
+
+
+# 이동평균 (SMA_20은 BB_Middle과 공유)
+for _period in [5, 20, 60, 120]:
+    _register(f'SMA_{_period}', _sma(_period))
+for _span in [12, 26]:
+    _register(f'EMA_{_span}', _ema(_span))
+
+# 모멘텀 지표 (MACD의 EMA는 EMA_12/EMA_26과 공유)
+_register('RSI', _rsi(14))
+_register('EMA_fast', _ema(12))
+_register('EMA_slow', _ema(26))
+_register('MACD', _macd, requires=['EMA_fast', 'EMA_slow'])
+_register('MACD_Signal', _macd_signal(9), requires=['MACD'])
+_register('MACD_Hist', _macd_hist, requires=['MACD', 'MACD_Signal'])
+
+# 변동성 지표
+_register('BB_Middle', _sma(20))
+_register('BB_Std', _rolling_std(20))
+_register('BB_Upper', _bb_upper(2), requires=['BB_Middle', 'BB_Std'])
+_register('BB_Lower', _bb_lower(2), requires=['BB_Middle', 'BB_Std'])
+_register('ATR', _atr(14))
+
+# 스토캐스틱 (단기, 중기, 장기)
+for _k, _d, _smooth in [(5, 3, 3), (10, 6, 6), (20, 12, 12)]:
+    _k_name = f'STOCH_K_{_k}_{_d}_{_smooth}'
+    _register(_k_name, _stoch_k(_k, _smooth))
+    _register(f'STOCH_D_{_k}_{_d}_{_smooth}', _stoch_d(_k_name, _d), requires=[_k_name])
+
+# 일목균형표
+_register('Ichimoku_Conversion', _midpoint(9))
+_register('Ichimoku_Base', _midpoint(26))
+_register('Ichimoku_SpanA', _ichimoku_span_a, requires=['Ichimoku_Conversion', 'Ichimoku_Base'])
+_register('Ichimoku_SpanB', _ichimoku_span_b)
+_register('Ichimoku_Lagging', _ichimoku_lagging)
+
+# 거래량 지표
+_register('OBV', _obv)
+
+
+def resolve_indicators(columns):
+    """
+    요청 컬럼과 그 의존 컬럼 전체 집합 반환
 
-    return df
+    Args:
+        columns: 지표 컬럼명 리스트
 
+    Returns:
+        계산해야 할 컬럼 집합
 
-def calculate_all_indicators(df):
+    Raises:
+        ValueError: 등록되지 않은 지표
     """
-    모든 기술적 지표 한번에 계산
+    needed = set()
+    stack = list(columns)
+    while stack:
+        name = stack.pop()
+        if name in needed:
+            continue
+        if name not in INDICATOR_REGISTRY:
+            raise ValueError(f"알 수 없는 지표: {name}")
+        needed.add(name)
+        stack.extend(INDICATOR_REGISTRY[name][0])
+    return needed
+
+
+def calculate_indicators(df, columns=None, copy=True):
+    """
+    필요한 지표만 계산 (의존 지표 포함, 중간 계산 공유)
 
     Args:
         df: OHLCV DataFrame
+        columns: 계산할 지표 컬럼명 리스트 (None이면 전체)
+        copy: True면 원본을 복사해서 계산
 
     Returns:
-        모든 지표가 추가된 DataFrame
+        지표가 추가된 DataFrame
     """
-    df = df.copy()
+    if copy:
+        df = df.copy()
 
-    # 이동평균
-    df = calculate_sma(df, periods=[5, 20, 60, 120])
-    df = calculate_ema(df, periods=[12, 26])
+    needed = set(INDICATOR_REGISTRY) if columns is None else resolve_indicators(columns)
+    cache = _IndicatorCache(df)
 
-    # 모멘텀 지표
-    df = calculate_rsi(df, period=14)
-    df = calculate_macd(df)
+    for name, (requires, func) in INDICATOR_REGISTRY.items():
+        if name in needed:
+            df[name] = func(df, cache)
 
-    # 변동성 지표
-    df = calculate_bollinger_bands(df, period=20, std=2)
-    df = calculate_atr(df, period=14)
+    return df
 
-    # 스토캐스틱 (단기, 중기, 장기)
-    df = calculate_stochastic(df, k_period=5, d_period=3, smooth_k=3)  # 단기
-    df = calculate_stochastic(df, k_period=10, d_period=6, smooth_k=6)  # 중기
-    df = calculate_stochastic(df, k_period=20, d_period=12, smooth_k=12)  # 장기
 
-    # 일목균형표
-    df = calculate_ichimoku(df)
+def calculate_all_indicators(df):
+    """
+    모든 기술적 지표 한번에 계산
 
-    # 거래량 지표
-    df = calculate_obv(df)
+    Args:
+        df: OHLCV DataFrame
 
-    return df
+    Returns:
+        모든 지표가 추가된 DataFrame
+    """
+    return calculate_indicators(df)
 
 
 def get_indicator_names():
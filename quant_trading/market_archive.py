@@ -0,0 +1,274 @@
+"""
+공유 시장 데이터 아카이브 (Memory-mapped Market Archive)
+- 필드별 (날짜 × 종목) float64/float32 배열을 원시 바이너리 파일로 저장
+- numpy.memmap으로 열기 때문에 여러 프로세스가 OS 페이지 캐시 한 벌을 공유
+- 열기 = 메타데이터(JSON) 읽기 + mmap 뿐이라 S&P 500 2년치 패널도 즉시 열림
+
+리포트/백테스트 스크립트는 매번 가격을 새 DataFrame으로 받아 왔습니다.
+PriceStore.download(..., archive=경로) / PriceStore.load(..., archive=경로)를 쓰면
+받은 데이터를 아카이브로 저장하고, 같은 요청이 다시 오면 다운로드 없이 재사용합니다.
+
+디렉토리 구조:
+    <path>/CURRENT              현재 세대 디렉토리 이름 (os.replace로 원자적 교체)
+    <path>/<세대>/meta.json     종목, 날짜 수, 필드별 dtype, 생성 시각, 요청 정보
+    <path>/<세대>/dates.bin     int64 (datetime64[ns], 시각 없는 날짜)
+    <path>/<세대>/<필드>.bin    (날짜 × 종목) C-order 배열, 거래 없는 칸은 NaN
+
+새 데이터는 항상 새 세대 디렉토리에 쓰고 CURRENT만 바꾸므로,
+이미 아카이브를 열어 둔 프로세스는 쓰기 도중에도 이전 세대를 그대로 읽습니다.
+"""
+
+import json
+import os
+import shutil
+import time
+import uuid
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+import pandas as pd
+
+
+OHLCV_COLUMNS = ['Open', 'High', 'Low', 'Close', 'Volume']
+
+# 아카이브 기본 위치 (환경변수 PRICE_ARCHIVE_DIR로 변경 가능)
+DEFAULT_ARCHIVE_DIR = os.environ.get('PRICE_ARCHIVE_DIR', os.path.join('cache', 'price_archive'))
+
+ARCHIVE_VERSION = 1
+
+_CURRENT_FILE = 'CURRENT'
+_META_FILE = 'meta.json'
+_DATES_FILE = 'dates.bin'
+
+
+def archive_path(name: str) -> str:
+    """스크립트별 아카이브 경로 (예: archive_path('daily_report'))"""
+    return os.path.join(DEFAULT_ARCHIVE_DIR, name)
+
+
+def _field_file(field: str) -> str:
+    return f"{field}.bin"
+
+
+def _read_current(path: str) -> Optional[str]:
+    """현재 세대 디렉토리 경로 (아카이브가 없으면 None)"""
+    try:
+        with open(os.path.join(path, _CURRENT_FILE), 'r', encoding='utf-8') as f:
+            generation = f.read().strip()
+    except OSError:
+        return None
+    return os.path.join(path, generation) if generation else None
+
+
+def _remove_old_generations(path: str, keep: str):
+    """이전 세대 정리 (Windows에서 다른 프로세스가 열어 둔 파일은 남겨 둠)"""
+    for name in os.listdir(path):
+        full = os.path.join(path, name)
+        if name != keep and os.path.isdir(full):
+            shutil.rmtree(full, ignore_errors=True)
+
+
+class MarketArchive:
+    """
+    읽기 전용 시장 데이터 아카이브
+
+    field()/panel()은 memmap을 그대로 반환하므로 데이터를 복사하지 않습니다.
+    frame(symbol)은 한 종목의 OHLCV만 꺼내 거래일 행으로 된 DataFrame을 만듭니다.
+    """
+
+    def __init__(self, path: str):
+        """
+        아카이브 열기
+
+        Args:
+            path: 아카이브 디렉토리
+
+        Raises:
+            FileNotFoundError: 아카이브가 없을 때
+            ValueError: 메타데이터가 손상되었거나 버전이 다를 때
+        """
+        generation_dir = _read_current(path)
+        if generation_dir is None:
+            raise FileNotFoundError(f"Market archive not found: {path}")
+
+        with open(os.path.join(generation_dir, _META_FILE), 'r', encoding='utf-8') as f:
+            meta = json.load(f)
+
+        if meta.get('version') != ARCHIVE_VERSION:
+            raise ValueError(f"Unsupported market archive version: {meta.get('version')}")
+
+        self.path = path
+        self.meta = meta
+        self.symbols: List[str] = list(meta['symbols'])
+        self.shape = tuple(meta['shape'])
+        self.created_at = datetime.fromisoformat(meta['created_at'])
+
+        n_dates = self.shape[0]
+        dates = np.memmap(os.path.join(generation_dir, _DATES_FILE), dtype=np.int64,
+                          mode='r', shape=(n_dates,))
+        # 저장 당시 인덱스 단위로 복원 (pandas 버전에 따라 ns/us)
+        self.dates = pd.DatetimeIndex(dates.view('datetime64[ns]')).as_unit(meta.get('date_unit', 'ns'))
+
+        self._columns = {symbol: i for i, symbol in enumerate(self.symbols)}
+        self._fields = {
+            field: np.memmap(os.path.join(generation_dir, _field_file(field)),
+                             dtype=np.dtype(dtype), mode='r', shape=self.shape)
+            for field, dtype in meta['fields'].items()
+        }
+
+    @classmethod
+    def open(cls, path: Optional[str]) -> Optional['MarketArchive']:
+        """
+        아카이브 열기 (없거나 손상되었으면 None)
+
+        Args:
+            path: 아카이브 디렉토리 (None이면 None 반환)
+        """
+        if not path:
+            return None
+        try:
+            return cls(path)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            print(f"[WARNING] 가격 아카이브를 열 수 없습니다 ({path}): {e}")
+            return None
+
+    @classmethod
+    def write(cls, path: str, frames: Dict[str, pd.DataFrame],
+              fields: Iterable[str] = OHLCV_COLUMNS, dtype: str = 'float64',
+              requested: Optional[Iterable[str]] = None,
+              params: Optional[Dict] = None) -> Optional['MarketArchive']:
+        """
+        종목별 DataFrame을 (날짜 × 종목) 패널로 맞춰 아카이브로 저장
+
+        Args:
+            path: 아카이브 디렉토리 (기존 아카이브는 새 세대로 교체)
+            frames: {종목: OHLCV DataFrame} (시각 없는 날짜 인덱스)
+            fields: 저장할 필드
+            dtype: 가격 필드 dtype ('float64' 또는 메모리를 절반으로 줄이는 'float32',
+                   Volume은 항상 float64)
+            requested: 요청한 종목 전체 (다운로드 실패 종목 포함, 재사용 판단용)
+            params: 요청 정보 (기간 등, 재사용 판단용)
+
+        Returns:
+            새로 저장한 MarketArchive (저장할 데이터가 없으면 None)
+        """
+        frames = {symbol: df for symbol, df in frames.items() if df is not None and not df.empty}
+        if not frames:
+            print(f"[WARNING] 가격 아카이브에 저장할 데이터가 없습니다 ({path})")
+            return None
+
+        symbols = list(frames)
+        fields = list(fields)
+        dates = pd.DatetimeIndex(
+            np.unique(np.concatenate([df.index.values.astype('datetime64[ns]') for df in frames.values()]))
+        )
+        shape = (len(dates), len(symbols))
+        dtypes = {field: 'float64' if field == 'Volume' else np.dtype(dtype).name for field in fields}
+
+        generation = f"{datetime.now():%Y%m%d%H%M%S}-{uuid.uuid4().hex[:8]}"
+        generation_dir = os.path.join(path, generation)
+        os.makedirs(generation_dir)
+
+        dates.values.astype('datetime64[ns]').view(np.int64).tofile(os.path.join(generation_dir, _DATES_FILE))
+
+        # 종목별 행 위치 (전체 날짜 기준)
+        rows = [dates.get_indexer(df.index) for df in frames.values()]
+
+        for field in fields:
+            panel = np.memmap(os.path.join(generation_dir, _field_file(field)),
+                              dtype=dtypes[field], mode='w+', shape=shape)
+            panel[:] = np.nan
+            for col, (df, row) in enumerate(zip(frames.values(), rows)):
+                if field in df.columns:
+                    panel[row, col] = df[field].to_numpy(dtype='float64')
+            panel.flush()
+            del panel
+
+        meta = {
+            'version': ARCHIVE_VERSION,
+            'created_at': datetime.now().isoformat(timespec='seconds'),
+            'shape': list(shape),
+            'date_unit': pd.DatetimeIndex(next(iter(frames.values())).index).unit,
+            'symbols': symbols,
+            'fields': dtypes,
+            'requested': list(dict.fromkeys(requested)) if requested is not None else symbols,
+            'params': params or {},
+        }
+        with open(os.path.join(generation_dir, _META_FILE), 'w', encoding='utf-8') as f:
+            json.dump(meta, f, ensure_ascii=False)
+
+        # 세대 교체 (CURRENT 파일을 원자적으로 바꿈)
+        current_tmp = os.path.join(path, f"{_CURRENT_FILE}.{generation}.tmp")
+        with open(current_tmp, 'w', encoding='utf-8') as f:
+            f.write(generation)
+        os.replace(current_tmp, os.path.join(path, _CURRENT_FILE))
+
+        _remove_old_generations(path, generation)
+        return cls(path)
+
+    @property
+    def fields(self) -> List[str]:
+        """저장된 필드 리스트"""
+        return list(self._fields)
+
+    @property
+    def requested(self) -> List[str]:
+        """저장 당시 요청한 종목 리스트"""
+        return list(self.meta.get('requested', self.symbols))
+
+    @property
+    def params(self) -> Dict:
+        """저장 당시 요청 정보"""
+        return dict(self.meta.get('params', {}))
+
+    def __contains__(self, symbol: str) -> bool:
+        return symbol in self._columns
+
+    def __len__(self) -> int:
+        return len(self.symbols)
+
+    def age_hours(self) -> float:
+        """생성 후 경과 시간 (시간)"""
+        return (time.time() - self.created_at.timestamp()) / 3600
+
+    def covers(self, symbols: Iterable[str], params: Optional[Dict] = None,
+               max_age_hours: Optional[float] = None) -> bool:
+        """
+        같은 요청을 이 아카이브로 대신할 수 있는지 여부
+
+        Args:
+            symbols: 필요한 종목
+            params: 요청 정보 (저장 당시와 같아야 함, None이면 비교 안 함)
+            max_age_hours: 허용 경과 시간 (None이면 무제한)
+        """
+        if params is not None and self.params != params:
+            return False
+        if max_age_hours is not None and self.age_hours() > max_age_hours:
+            return False
+        return set(symbols) <= set(self.requested)
+
+    def field(self, name: str) -> np.ndarray:
+        """필드 패널 (날짜 × 종목) 읽기 전용 memmap"""
+        return self._fields[name]
+
+    def panel(self, name: str = 'Close') -> pd.DataFrame:
+        """필드 패널 DataFrame (memmap을 복사 없이 감쌈, 인덱스는 날짜, 컬럼은 종목)"""
+        return pd.DataFrame(self._fields[name], index=self.dates, columns=self.symbols, copy=False)
+
+    def frame(self, symbol: str) -> pd.DataFrame:
+        """
+        한 종목의 OHLCV (거래 기록이 없는 날 제외, float32 아카이브도 float64로 반환)
+
+        Returns:
+            OHLCV DataFrame (없는 종목이면 빈 DataFrame)
+        """
+        if symbol not in self._columns:
+            return pd.DataFrame(columns=self.fields)
+
+        col = self._columns[symbol]
+        values = np.column_stack([panel[:, col] for panel in self._fields.values()]).astype(np.float64, copy=False)
+        traded = ~np.isnan(values).all(axis=1)
+        return pd.DataFrame(values[traded], index=self.dates[traded], columns=self.fields)
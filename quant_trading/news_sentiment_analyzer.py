@@ -6,9 +6,10 @@ StockNews 방식을 미국 주식에 적용
 import yfinance as yf
 from datetime import datetime, timedelta
 from textblob import TextBlob
-import requests
 from bs4 import BeautifulSoup
-import time
+
+from .rate_limiter import YAHOO_HOST, get_rate_limiter
+from FinanceDataReader.utils.http import get_request  # noqa: E402  (rate_limiter가 src/를 경로에 추가)
 
 
 class NewsSentimentAnalyzer:
@@ -27,7 +28,7 @@ class NewsSentimentAnalyzer:
         """Yahoo Finance에서 뉴스 가져오기"""
         try:
             stock = yf.Ticker(self.ticker)
-            news = stock.news
+            news = get_rate_limiter(YAHOO_HOST).call(lambda: stock.news)
 
             if not news:
                 return []
@@ -147,7 +148,8 @@ class AdvancedNewsSentimentAnalyzer:
         """FMP API로 뉴스 가져오기"""
         try:
             url = f"{self.base_url}/stock_news?tickers={self.ticker}&limit=50&apikey={self.api_key}"
-            response = requests.get(url, timeout=10)
+            # 호스트별 속도 제한 + 429 응답 시 속도를 낮춰 재시도
+            response = get_request(url, timeout=10)
 
             if response.status_code == 200:
                 news_data = response.json()
@@ -243,6 +245,4 @@ if __name__ == '__main__':
                 sentiment_emoji = "+" if news['sentiment'] > 0 else "-" if news['sentiment'] < 0 else "o"
                 print(f"  [{sentiment_emoji}] {news['title'][:60]}...")
 
-        time.sleep(1)  # API 제한 방지
-
     print("\n" + "=" * 60)
@@ -0,0 +1,223 @@
+"""
+백테스트 파라미터 스윕 (Parameter Sweep)
+- 그리드 / 랜덤 탐색으로 수백 개 파라미터 조합을 워커 프로세스에서 병렬 평가
+- 가격은 MarketArchive(memmap)로 공유하므로 워커마다 데이터를 복사하지 않음
+- 스윕 파라미터 중 점수에 영향이 없는 것(top_n, rebalance_days, min_score, 거래 비용)은
+  리밸런싱 날짜별 점수를 한 번만 계산해 모든 조합이 재사용
+- 결과는 조합별 성과 지표 표 (DataFrame, CSV 저장)
+
+두 단계로 실행합니다:
+1. 채점: 채점 파라미터 조합(예: 모멘텀 임계값) × 리밸런싱 날짜 합집합마다 1회 채점
+2. 시뮬레이션: 파라미터 조합마다 캐시된 점수로 Backtest.run (채점 없이 선정 + 수익률만)
+
+Examples:
+    >>> grid = {'top_n': [5, 10, 20], 'rebalance_days': [7, 14],
+    ...         'min_score': [0, 30], 'momentum_6m_strong': [0.2, 0.3]}
+    >>> results = run_sweep(price_store, start_date, end_date, grid)
+    >>> results.head()   # sharpe_ratio 내림차순
+"""
+
+import itertools
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime
+from functools import partial
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from . import compute_pool
+from .backtest import (
+    Backtest, close_panel, rebalance_schedule, technical_panel_scorer, technical_scorer
+)
+from .price_store import PriceStore
+
+
+# Backtest 생성자로 전달하는 파라미터 (나머지는 채점 함수 인자)
+BACKTEST_PARAMS = ('top_n', 'rebalance_days', 'min_score', 'commission', 'slippage')
+
+METRIC_COLUMNS = ['total_return', 'annual_return', 'sharpe_ratio', 'max_drawdown', 'win_rate',
+                  'avg_return', 'std_return', 'final_capital', 'n_periods']
+
+# 워커 프로세스별 스윕 상태 (initializer에서 설정)
+_WORKER_SWEEP: Optional['_SweepContext'] = None
+
+
+def parameter_grid(grid: Dict[str, Iterable], n_random: Optional[int] = None,
+                   seed: int = 0) -> List[Dict]:
+    """
+    파라미터 조합 생성
+
+    Args:
+        grid: {파라미터: 후보 값 리스트}
+        n_random: 랜덤 탐색 조합 수 (None이면 전체 그리드)
+        seed: 랜덤 시드
+
+    Returns:
+        파라미터 dict 리스트
+    """
+    names = list(grid)
+    combos = [dict(zip(names, values)) for values in itertools.product(*(list(grid[name]) for name in names))]
+    if n_random is not None and n_random < len(combos):
+        picks = np.random.default_rng(seed).choice(len(combos), size=n_random, replace=False)
+        combos = [combos[i] for i in sorted(picks)]
+    return combos
+
+
+def _split_params(params: Dict) -> Tuple[Dict, Tuple]:
+    """(Backtest 파라미터, 채점 파라미터 키) 분리"""
+    backtest_params = {key: value for key, value in params.items() if key in BACKTEST_PARAMS}
+    score_key = tuple(sorted((key, value) for key, value in params.items() if key not in BACKTEST_PARAMS))
+    return backtest_params, score_key
+
+
+class _SweepContext:
+    """채점/시뮬레이션 공통 상태 (워커마다 한 번 생성, 종가 패널도 한 번만 구성)"""
+
+    def __init__(self, store: PriceStore, tickers: List[str], start_date: datetime,
+                 end_date: datetime, scorer: Callable, panel_scorer: Optional[Callable],
+                 options: Dict, score_caches: Optional[Dict] = None):
+        self.store = store
+        self.tickers = tickers
+        self.start_date = start_date
+        self.end_date = end_date
+        self.scorer = scorer
+        self.panel_scorer = panel_scorer
+        self.options = options
+        self.score_caches = score_caches or {}
+        self.close = close_panel(store, tickers)
+
+    def backtest(self, score_key: Tuple, **kwargs) -> Backtest:
+        score_params = dict(score_key)
+        return Backtest(self.store, partial(self.scorer, **score_params), self.tickers,
+                        panel_scorer=partial(self.panel_scorer, **score_params) if self.panel_scorer else None,
+                        score_cache=self.score_caches.setdefault(score_key, {}),
+                        close=self.close, **self.options, **kwargs)
+
+    def score(self, score_key: Tuple, dates: List[datetime]) -> List[Tuple[Tuple, datetime, List[Dict]]]:
+        """1단계: 리밸런싱 날짜별 채점"""
+        backtest = self.backtest(score_key)
+        results = [(score_key, date, backtest.score_date(date)) for date in dates]
+        backtest.save_score_cache()
+        return results
+
+    def simulate(self, combos: List[Tuple[int, Dict]]) -> List[Tuple[int, Optional[Dict]]]:
+        """2단계: 캐시된 점수로 조합별 백테스트"""
+        results = []
+        for i, params in combos:
+            backtest_params, score_key = _split_params(params)
+            backtest = self.backtest(score_key, **backtest_params)
+            results.append((i, backtest.run(self.start_date, self.end_date, on_rebalance=None)))
+        return results
+
+
+def _init_sweep_worker(archive_dir: str, *args):
+    """워커 시작 시 공유 아카이브를 열고 스윕 상태 생성"""
+    global _WORKER_SWEEP
+    compute_pool._init_worker(archive_dir)
+    _WORKER_SWEEP = _SweepContext(compute_pool._WORKER_STORE, *args)
+
+
+def _score_chunk(score_key: Tuple, dates: List[datetime]):
+    return _WORKER_SWEEP.score(score_key, dates)
+
+
+def _simulate_chunk(combos: List[Tuple[int, Dict]]):
+    return _WORKER_SWEEP.simulate(combos)
+
+
+def _chunks(items: List, n_chunks: int) -> List[List]:
+    size = max(1, -(-len(items) // n_chunks))
+    return [items[i:i + size] for i in range(0, len(items), size)]
+
+
+def run_sweep(price_store: PriceStore, start_date: datetime, end_date: datetime,
+              grid: Dict[str, Iterable], n_random: Optional[int] = None, seed: int = 0,
+              tickers: Optional[List[str]] = None, scorer: Callable = technical_scorer,
+              panel_scorer: Optional[Callable] = technical_panel_scorer,
+              max_workers: Optional[int] = None, processes: bool = True,
+              sort_by: str = 'sharpe_ratio', output: Optional[str] = None,
+              **options) -> pd.DataFrame:
+    """
+    파라미터 스윕 실행
+
+    Args:
+        price_store: 가격 저장소 (아카이브가 연결되어 있으면 그대로 공유, 없으면 임시 아카이브 생성)
+        start_date: 백테스트 시작일
+        end_date: 백테스트 종료일
+        grid: {파라미터: 후보 값}. BACKTEST_PARAMS(top_n, rebalance_days, min_score,
+              commission, slippage)는 Backtest로,
+              나머지(예: TechnicalAnalyzerV3.THRESHOLDS 키)는 채점 함수 인자로 전달
+        n_random: 랜덤 탐색 조합 수 (None이면 전체 그리드)
+        seed: 랜덤 시드
+        tickers: 종목 유니버스 (None이면 저장소 전체)
+        scorer: 종목별 채점 함수 (panel_scorer가 None일 때 사용, 모듈 최상위 함수)
+        panel_scorer: 패널 채점 함수 (모듈 최상위 함수)
+        max_workers: 프로세스 수 (기본: CPU 코어 수)
+        processes: False면 현재 프로세스에서 실행 (디버깅/테스트용)
+        sort_by: 결과 정렬 지표 (내림차순)
+        output: 결과 CSV 경로 (None이면 저장 안 함)
+        **options: Backtest 추가 인자 (initial_capital, min_history, lookback_days, selector,
+                   score_cache_dir 등. score_cache_dir를 주면 워커마다 채점 결과를 디스크 캐시에 추가)
+
+    Returns:
+        DataFrame (조합별 파라미터 + METRIC_COLUMNS)
+    """
+    tickers = list(tickers) if tickers is not None else price_store.tickers
+    # 고정값으로 준 BACKTEST_PARAMS(예: commission)도 조합 파라미터로 취급
+    fixed = {key: options.pop(key) for key in BACKTEST_PARAMS if key in options}
+    combos = [{**fixed, **params} for params in parameter_grid(grid, n_random, seed)]
+    max_workers = max_workers or os.cpu_count() or 1
+    use_processes = processes and max_workers > 1
+
+    # 1단계 작업: 채점 조건별 리밸런싱 날짜 합집합 (조합끼리 겹치는 날짜는 한 번만 채점)
+    score_dates = {}
+    for params in combos:
+        backtest_params, score_key = _split_params(params)
+        days = backtest_params.get('rebalance_days', 7)
+        score_dates.setdefault(score_key, set()).update(rebalance_schedule(start_date, end_date, days)[:-1])
+
+    args = (tickers, start_date, end_date, scorer, panel_scorer, options)
+    n_scores = sum(len(dates) for dates in score_dates.values())
+    print(f"[스윕] 조합 {len(combos)}개, 채점 {n_scores}회 (채점 조건 {len(score_dates)}개)")
+
+    with compute_pool._shared_archive(price_store, use_processes) as archive:
+        if archive is None:
+            context = _SweepContext(price_store, *args)
+            for score_key, dates in score_dates.items():
+                context.score(score_key, sorted(dates))
+            results = dict(context.simulate(list(enumerate(combos))))
+        else:
+            score_caches = {}
+            with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_sweep_worker,
+                                     initargs=(archive.path, *args)) as executor:
+                futures = [executor.submit(_score_chunk, score_key, chunk)
+                           for score_key, dates in score_dates.items()
+                           for chunk in _chunks(sorted(dates), max_workers * 2)]
+                for future in as_completed(futures):
+                    for score_key, date, candidates in future.result():
+                        score_caches.setdefault(score_key, {})[date] = candidates
+
+            # 2단계: 캐시된 점수를 워커에 한 번씩만 전달
+            results = {}
+            with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_sweep_worker,
+                                     initargs=(archive.path, *args, score_caches)) as executor:
+                futures = [executor.submit(_simulate_chunk, chunk)
+                           for chunk in _chunks(list(enumerate(combos)), max_workers * 4)]
+                for future in as_completed(futures):
+                    results.update(future.result())
+
+    rows = []
+    for i, params in enumerate(combos):
+        metrics = results.get(i) or {}
+        rows.append({**params, **{column: metrics.get(column, np.nan) for column in METRIC_COLUMNS}})
+
+    table = pd.DataFrame(rows)
+    if sort_by in table.columns:
+        table = table.sort_values(sort_by, ascending=False, kind='stable').reset_index(drop=True)
+
+    if output:
+        table.to_csv(output, index=False)
+        print(f"[스윕] 결과 저장: {output}")
+    return table
@@ -0,0 +1,225 @@
+"""
+포트폴리오 구성 (Portfolio Construction)
+- 섹터별 편입 한도가 있는 상위 N개 종목 선정 (sector-capped top-N)
+- 섹터는 종목 유니버스 기준 정수 코드 배열로 한 번만 변환
+- 섹터 내 순위(grouped rank)를 행별 정렬 한 번 + 섹터 누적 개수로 계산하므로
+  (날짜 × 종목) 점수 행렬을 넣으면 수백 개 리밸런싱 날짜를 한 번에 선정
+
+섹터 한도는 포트폴리오 크기 대비 비율입니다 (예: Technology 0.30 × 10종목 = 최대 3종목).
+점수 내림차순(같은 점수는 종목 순서)으로 보면서 한도가 찬 섹터는 건너뛰는 것과 같습니다.
+
+Examples:
+    >>> selector = SectorCappedSelector(sectors)           # {종목: 섹터}
+    >>> Backtest(price_store, score_stock, tickers, selector=selector)
+    >>> codes, names = encode_sectors([sectors[t] for t in tickers])
+    >>> caps = sector_caps(names, top_n=10)
+    >>> selected = sector_capped_top_n(score_matrix, codes, caps, top_n=10)   # (날짜 × 종목) bool
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+# 섹터별 최대 비중 (backtest_improved 섹터 분산 규칙)
+SECTOR_LIMITS = {
+    'Financials': 0.25,
+    'Technology': 0.30,
+    'Healthcare': 0.25,
+    'Consumer Cyclical': 0.20,
+    'Consumer Defensive': 0.20,
+    'Energy': 0.20,
+}
+DEFAULT_SECTOR_LIMIT = 0.20
+
+UNKNOWN_SECTOR = 'Unknown'
+
+
+def encode_sectors(sectors: Iterable[Optional[str]]) -> Tuple[np.ndarray, List[str]]:
+    """
+    섹터 이름 -> 정수 코드 (등장 순서, 없는 섹터는 UNKNOWN_SECTOR)
+
+    Returns:
+        (코드 배열, 코드별 섹터 이름)
+    """
+    codes, names = pd.factorize(pd.Series([sector or UNKNOWN_SECTOR for sector in sectors], dtype=object))
+    return codes.astype(np.int64), list(names)
+
+
+def sector_caps(names: Sequence[str], top_n: int, limits: Optional[Dict[str, float]] = None,
+                default_limit: float = DEFAULT_SECTOR_LIMIT) -> np.ndarray:
+    """
+    섹터 코드별 최대 편입 종목 수 (비율 × top_n 내림, 최소 1종목)
+
+    Args:
+        names: 코드별 섹터 이름 (encode_sectors 결과)
+        top_n: 포트폴리오 종목 수
+        limits: {섹터: 최대 비중} (None이면 SECTOR_LIMITS)
+        default_limit: limits에 없는 섹터의 최대 비중
+    """
+    limits = SECTOR_LIMITS if limits is None else limits
+    ratios = np.array([limits.get(name, default_limit) for name in names], dtype=np.float64)
+    # 0.3 × 10 = 2.9999... 같은 부동소수점 오차 보정 후 내림
+    return np.maximum(1, np.floor(ratios * top_n + 1e-9)).astype(np.int64)
+
+
+def _sorted_group_ranks(scores: np.ndarray, codes: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    행별 점수 내림차순 정렬 + 정렬 순서 기준 섹터 내 순위
+
+    Returns:
+        (정렬 순서, 정렬된 섹터 코드, 정렬된 섹터 내 순위) - 모두 scores와 같은 모양
+    """
+    # 같은 점수는 열 순서, NaN은 맨 뒤 (stable 정렬)
+    order = np.argsort(-scores, axis=1, kind='stable')
+    sorted_codes = codes[order]
+
+    # 섹터 원-핫 누적합 = 그 섹터에서 몇 번째 종목인지
+    onehot = sorted_codes[..., None] == np.arange(codes.max(initial=-1) + 1)
+    counts = np.cumsum(onehot, axis=1, dtype=np.int64)
+    ranks = np.take_along_axis(counts, sorted_codes[..., None], axis=2)[..., 0] - 1
+    return order, sorted_codes, ranks
+
+
+def grouped_rank(scores: np.ndarray, codes: np.ndarray) -> np.ndarray:
+    """
+    행(날짜)별 섹터 내 점수 순위 (0부터, 같은 점수는 열 순서, NaN은 맨 뒤)
+
+    Args:
+        scores: (날짜 × 종목) 점수 행렬 (1차원이면 한 날짜)
+        codes: 종목별 섹터 코드
+
+    Returns:
+        scores와 같은 모양(2차원)의 int64 순위
+    """
+    scores = np.atleast_2d(np.asarray(scores, dtype=np.float64))
+    order, _, sorted_ranks = _sorted_group_ranks(scores, np.asarray(codes, dtype=np.int64))
+    ranks = np.empty_like(sorted_ranks)
+    np.put_along_axis(ranks, order, sorted_ranks, axis=1)
+    return ranks
+
+
+def sector_capped_top_n(scores: np.ndarray, codes: np.ndarray, caps: np.ndarray, top_n: int) -> np.ndarray:
+    """
+    섹터 한도를 지키는 상위 N개 선정
+
+    섹터 내 순위가 한도 미만인 종목 중 점수 상위 top_n개를 고릅니다.
+    NaN 점수(채점 안 된 종목)는 선정하지 않습니다.
+
+    Args:
+        scores: (날짜 × 종목) 점수 행렬 (1차원이면 한 날짜)
+        codes: 종목별 섹터 코드
+        caps: 섹터 코드별 최대 종목 수 (sector_caps 결과)
+        top_n: 날짜별 선정 종목 수
+
+    Returns:
+        scores와 같은 모양(2차원)의 bool 선정 행렬
+    """
+    scores = np.atleast_2d(np.asarray(scores, dtype=np.float64))
+    order, sorted_codes, sorted_ranks = _sorted_group_ranks(scores, np.asarray(codes, dtype=np.int64))
+
+    # 정렬 순서로 보면서 한도 안의 종목을 앞에서부터 top_n개
+    sorted_scores = np.take_along_axis(scores, order, axis=1)
+    eligible = ~np.isnan(sorted_scores) & (sorted_ranks < np.asarray(caps)[sorted_codes])
+    taken = eligible & (np.cumsum(eligible, axis=1) <= top_n)
+
+    selected = np.zeros(scores.shape, dtype=bool)
+    np.put_along_axis(selected, order, taken, axis=1)
+    return selected
+
+
+def sector_rankings(sectors: Sequence[Optional[str]], scores: Sequence[float]) -> Dict[str, List[int]]:
+    """
+    섹터별 점수순 위치 리스트 (리포트 섹터 탭용, 같은 점수는 입력 순서)
+
+    Returns:
+        {섹터: scores 내 위치 리스트 (점수 내림차순)} (섹터는 이름순)
+    """
+    codes, names = encode_sectors(sectors)
+    if not names:
+        return {}
+    ranks = grouped_rank(np.asarray(scores, dtype=np.float64), codes)[0]
+    groups = {}
+    for code, name in sorted(enumerate(names), key=lambda item: item[1]):
+        positions = np.flatnonzero(codes == code)
+        groups[name] = positions[np.argsort(ranks[positions])].tolist()
+    return groups
+
+
+class SectorCappedSelector:
+    """
+    Backtest selector (점수순 후보, top_n) -> 섹터 한도를 지킨 포트폴리오
+
+    종목별 섹터 코드와 top_n별 섹터 한도는 한 번만 계산합니다.
+    Backtest는 날짜마다 호출하고, 여러 날짜 점수 행렬은 select_many로 한 번에 선정합니다.
+    """
+
+    def __init__(self, sectors: Dict[str, str], limits: Optional[Dict[str, float]] = None,
+                 default_limit: float = DEFAULT_SECTOR_LIMIT):
+        """
+        초기화
+
+        Args:
+            sectors: {종목: 섹터} (없는 종목은 UNKNOWN_SECTOR)
+            limits: {섹터: 최대 비중} (None이면 SECTOR_LIMITS)
+            default_limit: limits에 없는 섹터의 최대 비중
+        """
+        self.limits = SECTOR_LIMITS if limits is None else limits
+        self.default_limit = default_limit
+
+        codes, self.names = encode_sectors(list(sectors.values()) + [UNKNOWN_SECTOR])
+        self.codes = dict(zip(sectors, codes[:-1].tolist()))
+        self._unknown = int(codes[-1])
+        self._caps = {}
+
+    @classmethod
+    def from_info_cache(cls, tickers: Iterable[str], info_cache, max_workers: int = 10,
+                        **kwargs) -> 'SectorCappedSelector':
+        """TickerInfoCache의 'sector'로 생성 (종목 정보는 스레드로 미리 가져옴)"""
+        tickers = list(tickers)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            sectors = list(executor.map(lambda ticker: info_cache.get(ticker).get('sector'), tickers))
+        return cls(dict(zip(tickers, sectors)), **kwargs)
+
+    def caps(self, top_n: int) -> np.ndarray:
+        """섹터 코드별 최대 종목 수 (top_n별 캐시)"""
+        caps = self._caps.get(top_n)
+        if caps is None:
+            caps = self._caps[top_n] = sector_caps(self.names, top_n, self.limits, self.default_limit)
+        return caps
+
+    def select_many(self, scores: pd.DataFrame, top_n: int) -> pd.DataFrame:
+        """
+        여러 날짜 한 번에 선정
+
+        Args:
+            scores: (날짜 × 종목) 점수 DataFrame (채점 안 된 칸은 NaN)
+            top_n: 날짜별 선정 종목 수
+
+        Returns:
+            같은 모양의 bool DataFrame
+        """
+        codes = np.array([self.codes.get(ticker, self._unknown) for ticker in scores.columns], dtype=np.int64)
+        selected = sector_capped_top_n(scores.to_numpy(dtype=np.float64), codes, self.caps(top_n), top_n)
+        return pd.DataFrame(selected, index=scores.index, columns=scores.columns)
+
+    def __call__(self, candidates: List[Dict], top_n: int) -> List[Dict]:
+        """
+        한 날짜 선정 (select_many와 같은 규칙)
+
+        후보를 점수순으로 (안정) 정렬한 뒤 top_n개가 찰 때까지만 순회합니다.
+        (백테스트처럼 이미 점수순인 입력이면 정렬 비용은 작고, 다른 호출자는 순서를 보장하지 않음)
+        """
+        caps = self.caps(top_n)
+        counts = np.zeros(len(caps), dtype=np.int64)
+        portfolio = []
+        for stock in sorted(candidates, key=lambda x: x['total_score'], reverse=True):
+            if len(portfolio) >= top_n:
+                break
+            code = self.codes.get(stock['ticker'], self._unknown)
+            if counts[code] < caps[code] and not np.isnan(stock['total_score']):
+                counts[code] += 1
+                portfolio.append(stock)
+        return portfolio
@@ -9,9 +9,10 @@ References:
 """
 
 import pandas as pd
-import numpy as np
 from typing import Dict, Tuple
 
+from .indicators import calculate_indicators
+
 
 class PriceRecommender:
     """
@@ -19,6 +20,9 @@ class PriceRecommender:
     매수가, 매도가, 손절가 계산
     """
 
+    # 가격 계산에 사용하는 지표 (이 컬럼과 의존 지표만 계산)
+    REQUIRED_INDICATORS = ['SMA_20', 'SMA_60', 'BB_Middle', 'BB_Upper', 'BB_Lower', 'ATR']
+
     def __init__(self, df: pd.DataFrame, current_price: float):
         """
         초기화
@@ -32,23 +36,8 @@ class PriceRecommender:
         self._calculate_indicators()
 
     def _calculate_indicators(self):
-        """필요한 기술적 지표 계산"""
-        # 이동평균선
-        self.df['SMA_20'] = self.df['Close'].rolling(window=20).mean()
-        self.df['SMA_60'] = self.df['Close'].rolling(window=60).mean()
-
-        # 볼린저 밴드
-        self.df['BB_Middle'] = self.df['Close'].rolling(window=20).mean()
-        bb_std = self.df['Close'].rolling(window=20).std()
-        self.df['BB_Upper'] = self.df['BB_Middle'] + (bb_std * 2)
-        self.df['BB_Lower'] = self.df['BB_Middle'] - (bb_std * 2)
-
-        # ATR (Average True Range) - 변동성 측정
-        high_low = self.df['High'] - self.df['Low']
-        high_close = np.abs(self.df['High'] - self.df['Close'].shift())
-        low_close = np.abs(self.df['Low'] - self.df['Close'].shift())
-        true_range = pd.concat([high_low, high_close, low_close], axis=1).max(axis=1)
-        self.df['ATR'] = true_range.rolling(window=14).mean()
+        """필요한 기술적 지표 계산 (이동평균, 볼린저 밴드, ATR)"""
+        self.df = calculate_indicators(self.df, self.REQUIRED_INDICATORS, copy=False)
 
     def calculate_support_resistance(self, lookback: int = 60) -> Tuple[float, float]:
         """
@@ -0,0 +1,359 @@
+"""
+백테스트용 시점 기준 가격 저장소 (Point-in-Time Price Store)
+- 종목별 전체 기간 OHLCV를 한 번만 다운로드
+- 리밸런싱 날짜마다 as_of(date)로 과거 구간만 잘라서 제공 (복사 없음)
+
+기존 백테스트는 (종목 × 리밸런싱 날짜)마다 2년치 데이터를 다시 받았기 때문에
+100종목 × 26회 = 2,600회 요청이 발생했습니다.
+PriceStore를 쓰면 종목당 1회 요청으로 끝나고 이후 계산은 CPU만 사용합니다.
+
+리포트 생성기는 PriceStore.download()로 여러 종목을 묶음 단위로 받아
+종목별 history 요청과 배치 간 대기(sleep)를 없앱니다.
+
+archive 경로를 주면 받은 데이터를 MarketArchive(memmap)로 저장하고,
+같은 요청은 다운로드 없이 아카이브를 열어 종목별로 필요할 때만 꺼냅니다.
+download()는 기본적으로 항상 새로 받고, 아카이브는 워커 프로세스 공유용으로만 씁니다.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Callable, Dict, Iterable, List, Optional
+
+import numpy as np
+import pandas as pd
+import yfinance as yf
+
+from .market_archive import OHLCV_COLUMNS, MarketArchive
+from .rate_limiter import YAHOO_HOST, get_rate_limiter
+
+
+def _fetch_history_from_yfinance(ticker: str, start: datetime, end: datetime) -> pd.DataFrame:
+    """yfinance에서 일봉 데이터 가져오기 (기본 loader, Yahoo 속도 제한 적용)"""
+    return get_rate_limiter(YAHOO_HOST).call(yf.Ticker(ticker).history, start=start, end=end)
+
+
+def _download_from_yfinance(tickers: List[str], **kwargs) -> pd.DataFrame:
+    """yfinance 일괄 다운로드 (기본 downloader, 종목 × 필드 MultiIndex 컬럼)"""
+    return get_rate_limiter(YAHOO_HOST).call(
+        yf.download, tickers, group_by='ticker', auto_adjust=True, actions=False,
+        progress=False, multi_level_index=True, **kwargs)
+
+
+def split_wide_frame(wide: pd.DataFrame, tickers: Iterable[str]) -> Dict[str, pd.DataFrame]:
+    """
+    일괄 다운로드 결과(종목 × 필드 컬럼)를 종목별 OHLCV로 분리
+
+    Args:
+        wide: yf.download(group_by='ticker') 결과
+        tickers: 요청한 종목 리스트
+
+    Returns:
+        {종목: OHLCV DataFrame} (데이터가 없는 종목은 제외)
+    """
+    frames = {}
+    if wide is None or wide.empty:
+        return frames
+
+    if not isinstance(wide.columns, pd.MultiIndex):
+        # 단일 종목 요청 시 필드만 있는 컬럼
+        tickers = list(tickers)
+        if len(tickers) == 1:
+            wide = pd.concat({tickers[0]: wide}, axis=1)
+        else:
+            return frames
+
+    available = set(wide.columns.get_level_values(0))
+    for ticker in tickers:
+        if ticker not in available:
+            continue
+        df = wide[ticker]
+        columns = [col for col in OHLCV_COLUMNS if col in df.columns]
+        # 해당 종목이 거래되지 않은 날(다른 종목 기준으로 생긴 행) 제거
+        df = df[columns].dropna(how='all')
+        if not df.empty:
+            frames[ticker] = df
+
+    return frames
+
+
+def _to_naive_dates(index: pd.Index) -> pd.DatetimeIndex:
+    """시간대/시각 정보를 제거한 날짜 인덱스로 변환"""
+    index = pd.DatetimeIndex(index)
+    if index.tz is not None:
+        index = index.tz_localize(None)
+    return index.normalize()
+
+
+def _to_day(date) -> np.datetime64:
+    """날짜를 시각 없는 datetime64[ns]로 변환 (검색용)"""
+    ts = pd.Timestamp(date)
+    if ts.tz is not None:
+        ts = ts.tz_localize(None)
+    return np.datetime64(ts.normalize(), 'ns')
+
+
+def _open_reusable_archive(path: Optional[str], tickers: List[str], params: Dict,
+                           max_age_hours: Optional[float]) -> Optional[MarketArchive]:
+    """같은 요청으로 저장된 아카이브가 있으면 열기 (없거나 오래되었거나 max_age_hours=0이면 None)"""
+    if max_age_hours == 0:
+        return None
+    archive = MarketArchive.open(path)
+    if archive is not None and archive.covers(tickers, params, max_age_hours):
+        return archive
+    return None
+
+
+class PriceStore:
+    """
+    종목별 OHLCV를 열 단위(float64 단일 블록)로 보관하는 저장소
+
+    as_of(ticker, date)는 date 이전(당일 제외) 봉만 잘라서 반환합니다.
+    yfinance history(end=date)와 같은 의미이며, 반환값은 원본의 슬라이스이므로
+    데이터를 복사하지 않습니다 (수정이 필요하면 호출자가 copy()).
+    """
+
+    def __init__(self, frames: Optional[Dict[str, pd.DataFrame]] = None):
+        """
+        초기화
+
+        Args:
+            frames: {종목: OHLCV DataFrame} (None이면 빈 저장소)
+        """
+        self._frames = {}
+        self._dates = {}
+        self._archive = None
+
+        for ticker, df in (frames or {}).items():
+            self.add(ticker, df)
+
+    @classmethod
+    def from_archive(cls, archive) -> 'PriceStore':
+        """
+        MarketArchive를 감싼 저장소 (종목 데이터는 처음 조회할 때 꺼냄)
+
+        Args:
+            archive: MarketArchive 또는 아카이브 경로
+
+        Returns:
+            PriceStore (아카이브를 열 수 없으면 빈 저장소)
+        """
+        store = cls()
+        store._archive = archive if isinstance(archive, MarketArchive) else MarketArchive.open(archive)
+        return store
+
+    @classmethod
+    def load(cls, tickers: Iterable[str], start: datetime, end: datetime,
+             lookback_days: int = 730, max_workers: int = 10,
+             loader: Optional[Callable[[str, datetime, datetime], pd.DataFrame]] = None,
+             archive: Optional[str] = None, max_age_hours: Optional[float] = None
+             ) -> 'PriceStore':
+        """
+        전체 백테스트 구간 + 분석용 과거 구간을 종목당 1회씩 다운로드
+
+        Args:
+            tickers: 종목 리스트
+            start: 백테스트 시작일
+            end: 백테스트 종료일
+            lookback_days: 첫 리밸런싱에 필요한 과거 데이터 길이 (일)
+            max_workers: 동시 다운로드 스레드 수
+            loader: (ticker, start, end) -> DataFrame (기본: yfinance)
+            archive: 가격 아카이브 경로 (같은 기간 요청이면 재사용, 아니면 새로 저장)
+            max_age_hours: 아카이브 재사용 허용 시간 (None이면 무제한)
+
+        Returns:
+            PriceStore
+        """
+        loader = loader or _fetch_history_from_yfinance
+        fetch_start = start - timedelta(days=lookback_days)
+        # 마지막 리밸런싱 날짜의 종가까지 포함
+        fetch_end = end + timedelta(days=1)
+
+        tickers = list(dict.fromkeys(tickers))
+        params = {'start': f"{fetch_start:%Y-%m-%d}", 'end': f"{fetch_end:%Y-%m-%d}"}
+
+        cached = _open_reusable_archive(archive, tickers, params, max_age_hours)
+        if cached is not None:
+            return cls.from_archive(cached)
+
+        store = cls()
+
+        def fetch(ticker):
+            try:
+                return ticker, loader(ticker, fetch_start, fetch_end)
+            except Exception as e:
+                print(f"  ⚠️  {ticker} 가격 데이터 로드 실패: {e}")
+                return ticker, None
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for ticker, df in executor.map(fetch, tickers):
+                if df is not None and not df.empty:
+                    store.add(ticker, df)
+
+        if archive:
+            # 저장한 아카이브를 연결해 두면 다른 프로세스에 경로만 넘겨 공유 가능
+            store._archive = store.save_archive(archive, requested=tickers, params=params)
+        return store
+
+    @classmethod
+    def download(cls, tickers: Iterable[str], period: str = '2y', chunk_size: int = 100,
+                 downloader: Optional[Callable[..., pd.DataFrame]] = None,
+                 archive: Optional[str] = None, max_age_hours: Optional[float] = 0,
+                 **kwargs) -> 'PriceStore':
+        """
+        여러 종목을 묶음 단위로 일괄 다운로드 (리포트용)
+
+        종목마다 yf.Ticker(...).history()를 호출하는 대신 chunk_size개씩
+        yf.download로 받아 하나의 wide frame을 종목별로 나눠 저장합니다.
+
+        Args:
+            tickers: 종목 리스트
+            period: 조회 기간 (기본: 2y)
+            chunk_size: 한 번에 다운로드할 종목 수
+            downloader: (tickers, period=..., **kwargs) -> wide DataFrame (기본: yf.download)
+            archive: 가격 아카이브 경로 (워커 프로세스 공유용, max_age_hours 이내의 같은 요청이면 재사용)
+            max_age_hours: 아카이브 재사용 허용 시간 (기본 0 = 항상 다운로드, None이면 무제한)
+            **kwargs: downloader에 전달할 추가 인자 (start, end 등)
+
+        Returns:
+            PriceStore (다운로드 실패 종목은 포함되지 않음)
+        """
+        downloader = downloader or _download_from_yfinance
+        tickers = list(dict.fromkeys(tickers))
+        params = {'period': period, **{key: str(value) for key, value in kwargs.items()}}
+
+        cached = _open_reusable_archive(archive, tickers, params, max_age_hours)
+        if cached is not None:
+            return cls.from_archive(cached)
+
+        store = cls()
+
+        for i in range(0, len(tickers), chunk_size):
+            chunk = tickers[i:i + chunk_size]
+            try:
+                wide = downloader(chunk, period=period, **kwargs)
+            except Exception as e:
+                print(f"[WARNING] 가격 일괄 다운로드 실패 ({chunk[0]} 외 {len(chunk) - 1}개): {e}")
+                continue
+
+            for ticker, df in split_wide_frame(wide, chunk).items():
+                store.add(ticker, df)
+
+        if archive:
+            # 저장한 아카이브를 연결해 두면 다른 프로세스에 경로만 넘겨 공유 가능
+            store._archive = store.save_archive(archive, requested=tickers, params=params)
+        return store
+
+    def save_archive(self, path: str, dtype: str = 'float64',
+                     requested: Optional[Iterable[str]] = None,
+                     params: Optional[Dict] = None) -> Optional[MarketArchive]:
+        """
+        저장소 전체를 MarketArchive로 저장 (다른 프로세스/다음 실행에서 memmap으로 공유)
+
+        Args:
+            path: 아카이브 디렉토리
+            dtype: 가격 필드 dtype ('float64' 또는 'float32')
+            requested: 요청한 종목 전체 (기본: 저장된 종목)
+            params: 요청 정보
+
+        Returns:
+            MarketArchive (저장 실패 시 None)
+        """
+        try:
+            return MarketArchive.write(path, {ticker: self.history(ticker) for ticker in self.tickers},
+                                       dtype=dtype, requested=requested, params=params)
+        except OSError as e:
+            print(f"[WARNING] 가격 아카이브 저장 실패 ({path}): {e}")
+            return None
+
+    def add(self, ticker: str, df: pd.DataFrame):
+        """종목 데이터 추가 (OHLCV 컬럼만 float64로 보관)"""
+        columns = [col for col in OHLCV_COLUMNS if col in df.columns]
+        frame = df[columns].astype('float64')
+        frame.index = _to_naive_dates(frame.index)
+        frame = frame[~frame.index.duplicated(keep='last')].sort_index()
+
+        self._frames[ticker] = frame
+        self._dates[ticker] = frame.index.values.astype('datetime64[ns]')
+
+    def _ensure(self, ticker: str) -> bool:
+        """종목 데이터 준비 (아카이브에만 있으면 이때 꺼내서 추가)"""
+        if ticker in self._frames:
+            return True
+        if self._archive is not None and ticker in self._archive:
+            # 아카이브 데이터는 이미 float64 / 정렬된 날짜이므로 add()의 정리 과정 생략
+            frame = self._archive.frame(ticker)
+            self._frames[ticker] = frame
+            self._dates[ticker] = frame.index.values.astype('datetime64[ns]')
+            return True
+        return False
+
+    @property
+    def archive(self) -> Optional[MarketArchive]:
+        """연결된 MarketArchive (없으면 None)"""
+        return self._archive
+
+    @property
+    def tickers(self) -> List[str]:
+        """저장된 종목 리스트"""
+        if self._archive is None:
+            return list(self._frames)
+        return list(dict.fromkeys(self._archive.symbols + list(self._frames)))
+
+    def __contains__(self, ticker: str) -> bool:
+        return ticker in self._frames or (self._archive is not None and ticker in self._archive)
+
+    def __len__(self) -> int:
+        return len(self.tickers)
+
+    def history(self, ticker: str) -> pd.DataFrame:
+        """종목 전체 데이터"""
+        if not self._ensure(ticker):
+            return pd.DataFrame(columns=OHLCV_COLUMNS)
+        return self._frames[ticker]
+
+    def as_of(self, ticker: str, date, lookback_days: Optional[int] = 730) -> pd.DataFrame:
+        """
+        시점 기준 데이터 (date 당일 제외, 미래 데이터 누수 없음)
+
+        Args:
+            ticker: 종목 코드
+            date: 기준일
+            lookback_days: 과거 조회 기간 (None이면 처음부터)
+
+        Returns:
+            OHLCV DataFrame 슬라이스 (없으면 빈 DataFrame)
+        """
+        if not self._ensure(ticker):
+            return pd.DataFrame(columns=OHLCV_COLUMNS)
+
+        dates = self._dates[ticker]
+        day = _to_day(date)
+        stop = int(np.searchsorted(dates, day, side='left'))
+
+        if lookback_days is None:
+            begin = 0
+        else:
+            begin = int(np.searchsorted(dates, day - np.timedelta64(lookback_days, 'D'), side='left'))
+
+        return self._frames[ticker].iloc[begin:stop]
+
+    def price_on(self, ticker: str, date, field: str = 'Close') -> Optional[float]:
+        """
+        date 당일(포함) 또는 그 이전 마지막 거래일 가격
+
+        Args:
+            ticker: 종목 코드
+            date: 기준일
+            field: 가격 컬럼 (기본: Close)
+
+        Returns:
+            가격 (데이터 없으면 None)
+        """
+        if not self._ensure(ticker):
+            return None
+
+        dates = self._dates[ticker]
+        pos = int(np.searchsorted(dates, _to_day(date), side='right')) - 1
+        if pos < 0:
+            return None
+        return float(self._frames[ticker][field].iat[pos])
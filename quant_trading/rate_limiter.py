@@ -0,0 +1,40 @@
+"""
+적응형 요청 속도 제한기 (Adaptive Rate Limiter)
+- 호스트별 토큰 버킷 (스레드 안전, 프로세스 전체 공유)
+- 429 (Too Many Requests) 응답 시 속도를 줄이고 Retry-After 동안 대기
+- 연속 성공 시 속도를 조금씩 올려 실제 한도 근처에서 동작 (AIMD)
+
+스크립트마다 넣어두던 고정 time.sleep() 대신 사용합니다.
+
+사용 예:
+    limiter = get_rate_limiter(YAHOO_HOST)
+    df = limiter.call(yf.Ticker(ticker).history, period='2y')
+
+구현은 FinanceDataReader/utils/rate_limit.py 하나만 사용합니다.
+(리포트 스크립트 실행 환경에는 FinanceDataReader가 설치되지 않으므로 저장소의 src/를 경로에 추가)
+여기서는 Yahoo Finance 호스트의 기본 속도만 정합니다.
+"""
+
+import os
+import sys
+
+_SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src')
+if os.path.isdir(_SRC_DIR) and _SRC_DIR not in sys.path:
+    sys.path.insert(0, _SRC_DIR)
+
+from FinanceDataReader.utils.rate_limit import (  # noqa: E402,F401
+    AdaptiveRateLimiter,
+    get_host,
+    get_rate_limiter,
+    get_retry_after,
+    is_rate_limit_error,
+    set_host_defaults,
+)
+
+
+# yfinance가 사용하는 Yahoo Finance API 호스트
+YAHOO_HOST = 'query2.finance.yahoo.com'
+
+# Yahoo 호스트 기본 속도 (초당 요청 수, 비공식 API라 보수적으로 시작)
+YAHOO_LIMITS = {'rate': 2.0, 'burst': 5.0, 'max_rate': 20.0}
+set_host_defaults(YAHOO_HOST, **YAHOO_LIMITS)
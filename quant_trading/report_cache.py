@@ -0,0 +1,143 @@
+"""
+리포트 HTML 조각 캐시 (Report Fragment Cache)
+- 종목 카드 HTML을 종목 데이터 해시로 캐시 (점수/가격이 바뀐 종목만 다시 렌더링)
+- 실행 간 재사용을 위해 디스크(JSON)에 저장, 이번 실행에 쓰지 않은 조각은 정리
+- 공용 CSS/JS는 내용 해시가 붙은 정적 파일로 한 번만 저장 (HTML은 링크만 포함)
+
+매시간 리포트를 다시 만들 때 대부분의 카드는 이전 실행과 같습니다.
+카드 렌더러 소스도 키에 포함하므로 템플릿을 수정하면 캐시가 자동으로 무효화됩니다.
+"""
+
+import hashlib
+import inspect
+import json
+import os
+import threading
+from typing import Any, Callable, Dict, Optional
+
+
+def _digest(text: str) -> str:
+    return hashlib.sha1(text.encode('utf-8')).hexdigest()
+
+
+def data_hash(data: Any) -> str:
+    """딕셔너리 등 JSON으로 표현 가능한 데이터의 해시 (키 순서 무관)"""
+    return _digest(json.dumps(data, sort_keys=True, ensure_ascii=False, default=str))
+
+
+class FragmentCache:
+    """
+    HTML 조각 캐시
+
+    render(data, renderer, *args)는 (데이터, 렌더러 소스, 추가 인자)가 같으면
+    이전에 렌더링한 HTML을 그대로 반환합니다.
+    """
+
+    def __init__(self, cache_path: Optional[str] = None):
+        """
+        초기화
+
+        Args:
+            cache_path: 디스크 캐시 파일 경로 (None이면 메모리 캐시만 사용)
+        """
+        self.cache_path = cache_path
+        self.hits = 0
+        self.misses = 0
+
+        self._fragments = {}
+        self._used = set()
+        self._lock = threading.Lock()
+        self._renderer_keys = {}
+
+        if cache_path:
+            try:
+                with open(cache_path, 'r', encoding='utf-8') as f:
+                    self._fragments = json.load(f)
+            except (OSError, ValueError):
+                self._fragments = {}
+
+    def _renderer_key(self, renderer: Callable) -> str:
+        """렌더러 소스 해시 (템플릿이 바뀌면 캐시 무효화)"""
+        key = self._renderer_keys.get(renderer)
+        if key is None:
+            try:
+                source = inspect.getsource(renderer)
+            except (OSError, TypeError):
+                source = renderer.__qualname__
+            key = _digest(source)
+            self._renderer_keys[renderer] = key
+        return key
+
+    def render(self, data: Dict, renderer: Callable[..., str], *args) -> str:
+        """
+        캐시된 조각 반환 (없으면 renderer(data, *args)로 렌더링 후 저장)
+
+        Args:
+            data: 조각에 들어가는 데이터 (해시 키)
+            renderer: HTML 렌더링 함수
+            *args: renderer 추가 인자 (키에 포함)
+
+        Returns:
+            HTML 조각
+        """
+        key = data_hash([self._renderer_key(renderer), data, list(args)])
+
+        with self._lock:
+            self._used.add(key)
+            html = self._fragments.get(key)
+            if html is not None:
+                self.hits += 1
+                return html
+
+        html = renderer(data, *args)
+        with self._lock:
+            self._fragments[key] = html
+            self.misses += 1
+        return html
+
+    def save(self):
+        """이번 실행에 사용한 조각만 디스크에 저장 (원자적 교체)"""
+        if not self.cache_path:
+            return
+
+        with self._lock:
+            fragments = {key: html for key, html in self._fragments.items() if key in self._used}
+
+        directory = os.path.dirname(self.cache_path)
+        tmp_path = f"{self.cache_path}.{os.getpid()}.tmp"
+        try:
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(fragments, f, ensure_ascii=False)
+            os.replace(tmp_path, self.cache_path)
+        except OSError as e:
+            print(f"[WARNING] 리포트 조각 캐시 저장 실패: {e}")
+
+
+def write_static_asset(directory: str, name: str, content: str, extension: str) -> str:
+    """
+    내용 해시가 붙은 정적 파일 저장 (같은 내용이면 다시 쓰지 않음)
+
+    파일명에 해시가 들어가므로 브라우저/CDN이 오래 캐시해도 내용이 바뀌면 새 파일을 받습니다.
+
+    Args:
+        directory: 저장 디렉토리 (HTML 파일 기준 상대 경로, 예: 'assets')
+        name: 파일 이름 (예: 'daily_report')
+        content: 파일 내용
+        extension: 확장자 (예: 'css', 'js')
+
+    Returns:
+        HTML에서 쓸 링크 경로 (예: 'assets/daily_report.1a2b3c4d5e.css')
+    """
+    filename = f"{name}.{_digest(content)[:10]}.{extension}"
+    path = os.path.join(directory, filename)
+
+    if not os.path.exists(path):
+        os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(content)
+        os.replace(tmp_path, path)
+
+    return f"{directory.replace(os.sep, '/').rstrip('/')}/{filename}"
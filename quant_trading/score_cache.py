@@ -0,0 +1,345 @@
+"""
+백테스트 점수 캐시 (Walk-forward Score Cache)
+- (종목, 기준일, 채점 함수 버전)별 채점 결과를 디스크에 저장해 실행 간 재사용
+- 채점 함수 버전 = 채점 함수 소스 + 참조하는 quant_trading 모듈 소스 + 파라미터의 해시
+  (TechnicalAnalyzerV3 등 채점 코드를 수정하면 자동으로 새 캐시를 사용)
+- 기준일 시점의 마지막 종가와 봉 수를 함께 저장해 가격 데이터가 바뀐 행은 다시 채점
+- 가격 데이터만으로 계산하는 채점 함수 전용 (종목 정보/뉴스/테마 등 실행 시점의 외부 데이터를
+  쓰는 채점 함수는 키가 바뀌지 않아 예전 값이나 일시적인 실패 결과를 계속 재사용하므로 사용 불가)
+- 파일은 열 단위 배열(.npz) 조각으로 추가만 하므로 여러 프로세스가 동시에 저장해도 안전
+
+백테스트는 리밸런싱 날짜마다 전 종목을 TechnicalAnalyzerV3로 다시 채점했습니다.
+top_n이나 섹터 제한 규칙만 바꿔 다시 실행하면 채점은 캐시에서 읽고
+포트폴리오 시뮬레이션만 계산합니다.
+
+디렉토리 구조:
+    <cache_dir>/<채점 함수 버전>/<시각>-<pid>-<id>.npz   조각 (행: 종목 × 기준일)
+
+조각 컬럼:
+    ticker, date(일 단위 int64), bars(구간 봉 수), close(기준일 전 마지막 종가), scored,
+    columns/kinds(점수 키와 타입), value_<i>/present_<i>(점수 키별 값과 존재 여부)
+"""
+
+import glob
+import inspect
+import os
+import threading
+import uuid
+from datetime import datetime
+from functools import partial
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from .price_store import _to_day
+from .report_cache import _digest, data_hash
+
+
+# 점수 캐시 기본 위치 (환경변수 SCORE_CACHE_DIR로 변경 가능)
+DEFAULT_SCORE_CACHE_DIR = os.environ.get('SCORE_CACHE_DIR', os.path.join('cache', 'score_cache'))
+
+SCORE_CACHE_VERSION = 1
+
+# 조각이 이보다 많아지면 저장 시 하나로 합침
+MAX_SHARDS = 8
+
+# 후보 dict에서 캐시 행으로 따로 저장하는 키
+_ROW_KEYS = {'ticker', 'date', 'close_price'}
+
+_PACKAGE = __name__.rsplit('.', 1)[0]
+_module_digests = {}
+
+
+def _source(obj) -> str:
+    try:
+        return inspect.getsource(obj)
+    except (OSError, TypeError):
+        return getattr(obj, '__qualname__', repr(obj))
+
+
+def _code_names(code) -> set:
+    """코드 객체(중첩 함수/람다 포함)가 참조하는 전역 이름"""
+    names = set(code.co_names)
+    for const in code.co_consts:
+        if inspect.iscode(const):
+            names |= _code_names(const)
+    return names
+
+
+def _package_module(value):
+    """quant_trading 패키지 안에서 정의된 객체의 모듈 (아니면 None)"""
+    module = value if inspect.ismodule(value) else inspect.getmodule(type(value) if not (
+        inspect.isclass(value) or inspect.isroutine(value)) else value)
+    if module is not None and module.__name__.split('.')[0] == _PACKAGE:
+        return module
+    return None
+
+
+def _module_digest(module) -> str:
+    """모듈과 그 모듈이 참조하는 quant_trading 모듈들의 소스 해시"""
+    digest = _module_digests.get(module.__name__)
+    if digest is None:
+        seen, stack, sources = set(), [module], []
+        while stack:
+            current = stack.pop()
+            if current.__name__ in seen:
+                continue
+            seen.add(current.__name__)
+            sources.append((current.__name__, _source(current)))
+            stack.extend(m for m in map(_package_module, vars(current).values()) if m is not None)
+        digest = data_hash(sorted(sources))
+        _module_digests[module.__name__] = digest
+    return digest
+
+
+def scorer_key(scorer: Callable, **params) -> str:
+    """
+    채점 함수 버전 키
+
+    functools.partial 인자, 함수(메서드면 클래스) 소스, 함수가 참조하는
+    quant_trading 모듈 소스, params(예: lookback_days)를 모두 해시합니다.
+
+    Returns:
+        16자리 16진수 키
+    """
+    parts = [SCORE_CACHE_VERSION, params]
+    while isinstance(scorer, partial):
+        parts.append([list(map(repr, scorer.args)), sorted((k, repr(v)) for k, v in scorer.keywords.items())])
+        scorer = scorer.func
+
+    owner = getattr(scorer, '__self__', None)
+    func = getattr(scorer, '__func__', scorer)
+    if owner is not None and not inspect.ismodule(owner):
+        # 메서드: 클래스 전체 소스와 모든 메서드가 참조하는 이름
+        cls = owner if inspect.isclass(owner) else type(owner)
+        parts.append(_source(cls))
+        names = set()
+        for member in vars(cls).values():
+            member = getattr(member, '__func__', member)
+            if inspect.isfunction(member):
+                names |= _code_names(member.__code__)
+    else:
+        parts.append(_source(func))
+        names = _code_names(func.__code__) if hasattr(func, '__code__') else set()
+
+    namespace = getattr(func, '__globals__', {})
+    modules = {m.__name__: m for m in (_package_module(namespace[name]) for name in names if name in namespace)
+               if m is not None}
+    parts.append([_module_digest(modules[name]) for name in sorted(modules)])
+    return _digest(repr(parts))[:16]
+
+
+def _day_number(date) -> int:
+    return int(_to_day(date).astype('datetime64[D]').astype(np.int64))
+
+
+def _value_kind(value) -> Optional[str]:
+    """캐시 가능한 값 타입 ('b', 'i', 'f', 'U', 아니면 None)"""
+    if isinstance(value, (bool, np.bool_)):
+        return 'b'
+    if isinstance(value, (int, np.integer)):
+        return 'i'
+    if isinstance(value, (float, np.floating)):
+        return 'f'
+    if isinstance(value, str):
+        return 'U'
+    return None
+
+
+def _column_kind(kinds: set) -> Optional[str]:
+    if len(kinds) == 1:
+        return next(iter(kinds))
+    if kinds <= {'b', 'i'}:
+        return 'i'
+    if kinds <= {'b', 'i', 'f'}:
+        return 'f'
+    return None
+
+
+_CONVERT = {'b': bool, 'i': int, 'f': float, 'U': str}
+_EMPTY = {'b': False, 'i': 0, 'f': np.nan, 'U': ''}
+
+
+class ScoreCache:
+    """
+    (종목, 기준일) 채점 결과 캐시 (채점 함수 버전 하나당 하나)
+
+    lookup()은 기준일의 종가/봉 수가 저장 당시와 같은 종목만 캐시 결과를 주고,
+    나머지 종목은 다시 채점하도록 돌려줍니다. store()로 채점 결과를 추가하고
+    save()로 새 행만 조각 파일로 저장합니다.
+    """
+
+    def __init__(self, cache_dir: Optional[str], scorer: Callable, **params):
+        """
+        초기화 (디스크 읽기와 키 계산은 첫 lookup 때)
+
+        Args:
+            cache_dir: 캐시 디렉토리 (None이면 메모리 캐시만 사용)
+            scorer: 채점 함수 (버전 키 계산용)
+            **params: 채점 결과에 영향을 주는 추가 파라미터 (lookback_days, min_history 등)
+        """
+        self.cache_dir = cache_dir
+        self.scorer = scorer
+        self.params = params
+        self.hits = 0
+        self.misses = 0
+
+        self._key = None
+        self._rows = None       # {(종목, 일): (봉 수, 종가, 점수 dict 또는 None)}
+        self._new = {}
+        self._shards = []
+        self._lock = threading.Lock()
+
+    @property
+    def key(self) -> str:
+        """채점 함수 버전 키"""
+        if self._key is None:
+            self._key = scorer_key(self.scorer, **self.params)
+        return self._key
+
+    @property
+    def path(self) -> Optional[str]:
+        """조각 파일 디렉토리"""
+        return os.path.join(self.cache_dir, self.key) if self.cache_dir else None
+
+    def _load(self):
+        if self._rows is not None:
+            return
+        self._rows = {}
+        if not self.path:
+            return
+
+        # 오래된 조각부터 읽어 같은 행은 나중 조각 값을 사용
+        for shard in sorted(glob.glob(os.path.join(self.path, '*.npz'))):
+            try:
+                with np.load(shard, allow_pickle=False) as data:
+                    self._rows.update(self._read_shard(data))
+                self._shards.append(shard)
+            except FileNotFoundError:
+                continue    # 다른 프로세스가 합치면서 지운 조각
+            except (OSError, ValueError, KeyError) as e:
+                print(f"[WARNING] 점수 캐시 조각을 읽을 수 없습니다 ({shard}): {e}")
+
+    @staticmethod
+    def _read_shard(data) -> Dict:
+        columns = [(name, kind, data[f'value_{i}'], data[f'present_{i}'])
+                   for i, (name, kind) in enumerate(zip(data['columns'].tolist(), data['kinds'].tolist()))]
+        rows = {}
+        for row, (ticker, day, bars, close, scored) in enumerate(zip(
+                data['ticker'].tolist(), data['date'].tolist(), data['bars'].tolist(),
+                data['close'], data['scored'].tolist())):
+            scores = None
+            if scored:
+                scores = {name: _CONVERT[kind](values[row])
+                          for name, kind, values, present in columns if present[row]}
+            rows[(ticker, day)] = (bars, close, scores)
+        return rows
+
+    def lookup(self, date: datetime, summary: Dict[str, Tuple[int, float]]) -> Tuple[List[Dict], List[str]]:
+        """
+        기준일 캐시 조회
+
+        Args:
+            date: 리밸런싱 날짜 (후보 dict의 'date')
+            summary: {종목: (기준일 전 봉 수, 기준일 전 마지막 종가)} (조회할 종목 순서)
+
+        Returns:
+            (캐시된 후보 리스트, 다시 채점할 종목 리스트)
+        """
+        day = _day_number(date)
+        candidates, missing = [], []
+        with self._lock:
+            self._load()
+            for ticker, (bars, close) in summary.items():
+                row = self._rows.get((ticker, day))
+                if row is None or row[0] != bars or not (row[1] == close or (np.isnan(row[1]) and np.isnan(close))):
+                    missing.append(ticker)
+                    continue
+                if row[2] is not None:
+                    candidates.append({'ticker': ticker, 'date': date, **row[2], 'close_price': row[1]})
+            self.hits += len(summary) - len(missing)
+            self.misses += len(missing)
+        return candidates, missing
+
+    def store(self, date: datetime, summary: Dict[str, Tuple[int, float]],
+              tickers: Iterable[str], candidates: List[Dict]):
+        """
+        채점 결과 추가 (tickers 중 candidates에 없는 종목은 '채점 결과 없음'으로 저장)
+
+        문자열/숫자가 아닌 값이 있는 후보는 캐시하지 않습니다.
+        """
+        day = _day_number(date)
+        by_ticker = {candidate['ticker']: candidate for candidate in candidates}
+        with self._lock:
+            self._load()
+            for ticker in tickers:
+                bars, close = summary[ticker]
+                candidate = by_ticker.get(ticker)
+                scores = None
+                if candidate is not None:
+                    scores = {key: value for key, value in candidate.items() if key not in _ROW_KEYS}
+                    if any(_value_kind(value) is None for value in scores.values()):
+                        continue
+                row = (int(bars), float(close), scores)
+                self._rows[(ticker, day)] = row
+                self._new[(ticker, day)] = row
+
+    def _shard_arrays(self, rows: Dict) -> Dict[str, np.ndarray]:
+        """행 dict -> 조각 배열 (타입이 섞인 점수 키가 있는 행은 제외)"""
+        kinds = {}
+        for _, _, scores in rows.values():
+            for name, value in (scores or {}).items():
+                kinds.setdefault(name, set()).add(_value_kind(value))
+        columns = {name: _column_kind(kind_set) for name, kind_set in kinds.items()}
+        mixed = {name for name, kind in columns.items() if kind is None}
+        if mixed:
+            rows = {key: row for key, row in rows.items() if not mixed & set(row[2] or ())}
+            columns = {name: kind for name, kind in columns.items() if kind is not None}
+
+        keys = list(rows)
+        arrays = {
+            'ticker': np.array([ticker for ticker, _ in keys], dtype=str),
+            'date': np.array([day for _, day in keys], dtype=np.int64),
+            'bars': np.array([rows[key][0] for key in keys], dtype=np.int32),
+            'close': np.array([rows[key][1] for key in keys], dtype=np.float64),
+            'scored': np.array([rows[key][2] is not None for key in keys], dtype=bool),
+            'columns': np.array(list(columns), dtype=str),
+            'kinds': np.array(list(columns.values()), dtype=str),
+        }
+        for i, (name, kind) in enumerate(columns.items()):
+            values = [(rows[key][2] or {}).get(name, _EMPTY[kind]) for key in keys]
+            arrays[f'value_{i}'] = np.array(values, dtype={'b': bool, 'i': np.int64, 'f': np.float64, 'U': str}[kind])
+            arrays[f'present_{i}'] = np.array([name in (rows[key][2] or {}) for key in keys], dtype=bool)
+        return arrays
+
+    def _write_shard(self, rows: Dict) -> str:
+        os.makedirs(self.path, exist_ok=True)
+        name = f"{datetime.now():%Y%m%d%H%M%S%f}-{os.getpid()}-{uuid.uuid4().hex[:8]}.npz"
+        shard = os.path.join(self.path, name)
+        tmp_path = f"{shard}.tmp"
+        with open(tmp_path, 'wb') as f:
+            np.savez(f, **self._shard_arrays(rows))
+        os.replace(tmp_path, shard)
+        return shard
+
+    def save(self):
+        """새 행을 조각 파일로 저장 (조각이 많으면 읽은 조각과 합쳐 하나로 교체)"""
+        if not self.cache_dir:
+            return
+        with self._lock:
+            if not self._new:
+                return
+            try:
+                if len(self._shards) + 1 > MAX_SHARDS:
+                    shard = self._write_shard(self._rows)
+                    for old in self._shards:
+                        try:
+                            os.remove(old)
+                        except OSError:
+                            pass
+                    self._shards = [shard]
+                else:
+                    self._shards.append(self._write_shard(self._new))
+                self._new = {}
+            except OSError as e:
+                print(f"[WARNING] 점수 캐시 저장 실패: {e}")
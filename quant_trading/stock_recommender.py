@@ -7,9 +7,9 @@ import pandas as pd
 import yfinance as yf
 from datetime import datetime, timedelta
 from typing import List, Dict
-import time
 
 from .technical_analyzer_v2 import TechnicalAnalyzerV2
+from .rate_limiter import YAHOO_HOST, get_rate_limiter
 from .theme_analyzer import ThemeAnalyzer
 
 
@@ -42,7 +42,7 @@ class StockScorer:
         """
         try:
             stock = yf.Ticker(self.ticker)
-            self.df = stock.history(period=self.period)
+            self.df = get_rate_limiter(YAHOO_HOST).call(stock.history, period=self.period)
 
             if self.df.empty or len(self.df) < 120:
                 print(f"[SKIP] {self.ticker}: 데이터 부족 (행 수: {len(self.df)})")
@@ -202,9 +202,6 @@ class StockRecommender:
                 else:
                     print("실패")
 
-                # API 호출 제한 방지
-                time.sleep(0.5)
-
             except Exception as e:
                 print(f"오류: {e}")
                 continue
@@ -6,7 +6,7 @@
 import pandas as pd
 import numpy as np
 from typing import Dict, Tuple
-from .indicators import calculate_all_indicators
+from .indicators import calculate_indicators
 
 
 class TechnicalAnalyzerV2:
@@ -15,6 +15,14 @@ class TechnicalAnalyzerV2:
     총 75점 만점
     """
 
+    # 채점에 사용하는 지표 (이 컬럼과 의존 지표만 계산)
+    REQUIRED_INDICATORS = [
+        'SMA_5', 'SMA_20', 'SMA_60', 'SMA_120',
+        'RSI', 'BB_Upper', 'BB_Lower',
+        'STOCH_K_5_3_3', 'STOCH_D_5_3_3', 'STOCH_K_10_6_6', 'STOCH_K_20_12_12',
+        'Ichimoku_Conversion', 'Ichimoku_Base', 'Ichimoku_SpanA', 'Ichimoku_SpanB',
+    ]
+
     def __init__(self, df: pd.DataFrame):
         """
         초기화 함수
@@ -25,12 +33,12 @@ class TechnicalAnalyzerV2:
         self.df = df.copy()
         self.signals = []  # 발생한 시그널 목록
 
-        # 모든 기술적 지표 계산
+        # 필요한 기술적 지표만 계산
         self._calculate_indicators()
 
     def _calculate_indicators(self):
-        """모든 필요한 기술적 지표를 계산"""
-        self.df = calculate_all_indicators(self.df)
+        """REQUIRED_INDICATORS에 선언된 지표만 계산"""
+        self.df = calculate_indicators(self.df, self.REQUIRED_INDICATORS, copy=False)
 
     def calculate_moving_average_score(self) -> Tuple[int, str]:
         """
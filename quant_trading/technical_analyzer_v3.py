@@ -11,8 +11,9 @@ References:
 
 import pandas as pd
 import numpy as np
-from typing import Dict, Tuple
-from .indicators import calculate_all_indicators
+from pandas.api.indexers import BaseIndexer
+from typing import Dict, Optional, Tuple
+from .indicators import calculate_indicators
 
 
 class TechnicalAnalyzerV3:
@@ -26,23 +27,38 @@ class TechnicalAnalyzerV3:
     3. Trend Following (15점) - 이동평균 기반 추세
     """
 
-    def __init__(self, df: pd.DataFrame):
+    # 채점에 사용하는 지표 (이 컬럼과 의존 지표만 계산)
+    REQUIRED_INDICATORS = ['SMA_5', 'SMA_20', 'SMA_60', 'RSI', 'BB_Middle', 'BB_Upper', 'BB_Lower']
+
+    # 채점 임계값 (생성자 thresholds로 일부만 바꿀 수 있음, 파라미터 스윕용)
+    THRESHOLDS = {
+        'momentum_6m_strong': 0.30,   # 6개월 수익률 (상위 30% 기준)
+        'momentum_6m_medium': 0.15,   # 6개월 수익률 (상위 50% 기준)
+        'momentum_12m_strong': 0.50,  # 12개월 수익률 (최근 1개월 제외)
+        'momentum_12m_medium': 0.25,
+        'rsi_oversold': 30,           # RSI 과매도 기준
+        'bb_near': 1.05,              # BB 하단 근접 (하단 × 1.05 이하)
+    }
+
+    def __init__(self, df: pd.DataFrame, thresholds: Optional[Dict] = None):
         """
         초기화 함수
 
         Args:
             df: OHLCV 데이터 DataFrame (컬럼: Open, High, Low, Close, Volume)
+            thresholds: THRESHOLDS 중 바꿀 임계값 (None이면 기본값)
         """
         self.df = df.copy()
         self.signals = []
+        self.thresholds = {**self.THRESHOLDS, **(thresholds or {})}
 
-        # 모든 기술적 지표 계산
+        # 필요한 기술적 지표만 계산
         self._calculate_indicators()
         self._calculate_returns()
 
     def _calculate_indicators(self):
-        """모든 필요한 기술적 지표를 계산"""
-        self.df = calculate_all_indicators(self.df)
+        """REQUIRED_INDICATORS에 선언된 지표만 계산"""
+        self.df = calculate_indicators(self.df, self.REQUIRED_INDICATORS, copy=False)
 
     def _calculate_returns(self):
         """수익률 계산 (Momentum 전략용)"""
@@ -80,14 +96,15 @@ class TechnicalAnalyzerV3:
                 return 0, "데이터 부족"
 
         recent = self.df.iloc[-1]
+        th = self.thresholds
 
         # 1. 6개월 모멘텀 (15점)
         if pd.notna(recent.get('Return_6M')):
             ret_6m = recent['Return_6M']
-            if ret_6m > 0.30:  # 30% 이상 상승 (상위 30% 기준)
+            if ret_6m > th['momentum_6m_strong']:  # 30% 이상 상승 (상위 30% 기준)
                 score += 15
                 signal = "강력 모멘텀(6M)"
-            elif ret_6m > 0.15:  # 15% 이상 상승 (상위 50% 기준)
+            elif ret_6m > th['momentum_6m_medium']:  # 15% 이상 상승 (상위 50% 기준)
                 score += 10
                 signal = "중간 모멘텀(6M)"
             elif ret_6m > 0:  # 양수 수익률
@@ -97,13 +114,13 @@ class TechnicalAnalyzerV3:
         # 2. 12개월 모멘텀 (15점) - 최근 1개월 제외
         if pd.notna(recent.get('Return_12M')) and pd.notna(recent.get('Return_1M')):
             ret_12m_adjusted = recent['Return_12M'] - recent['Return_1M']
-            if ret_12m_adjusted > 0.50:  # 50% 이상
+            if ret_12m_adjusted > th['momentum_12m_strong']:  # 50% 이상
                 score += 15
                 if signal:
                     signal += " + 강력 모멘텀(12M)"
                 else:
                     signal = "강력 모멘텀(12M)"
-            elif ret_12m_adjusted > 0.25:  # 25% 이상
+            elif ret_12m_adjusted > th['momentum_12m_medium']:  # 25% 이상
                 score += 10
                 if signal:
                     signal += " + 중간 모멘텀(12M)"
@@ -145,6 +162,7 @@ class TechnicalAnalyzerV3:
 
         recent = self.df.iloc[-1]
         prev = self.df.iloc[-2]
+        oversold = self.thresholds['rsi_oversold']
 
         # 1. RSI 기반 평균회귀 (10점)
         if pd.notna(recent.get('RSI')):
@@ -152,11 +170,11 @@ class TechnicalAnalyzerV3:
             prev_rsi = prev.get('RSI', np.nan)
 
             # 과매도 구간 탈출 (RSI 30 이하에서 반등)
-            if pd.notna(prev_rsi) and prev_rsi <= 30 and rsi > 30:
+            if pd.notna(prev_rsi) and prev_rsi <= oversold and rsi > oversold:
                 score += 10
                 signal = "RSI 과매도 반등"
             # 과매도 구간 진입
-            elif rsi <= 30:
+            elif rsi <= oversold:
                 score += 5
                 signal = "RSI 과매도 구간"
 
@@ -176,7 +194,7 @@ class TechnicalAnalyzerV3:
                 else:
                     signal = "BB 하단 반등"
             # 하단 밴드 근처 (5% 이내)
-            elif close <= bb_lower * 1.05:
+            elif close <= bb_lower * self.thresholds['bb_near']:
                 score += 5
                 if signal:
                     signal += " + BB 하단 근접"
@@ -314,6 +332,245 @@ class TechnicalAnalyzerV3:
         }
 
 
+class _ColumnWindowIndexer(BaseIndexer):
+    """
+    종목 열을 이어붙인 1차원 배열용 고정 윈도우 (열 경계를 넘지 않음)
+
+    rolling(window)을 종목마다 호출하면 열 수만큼 파이썬 오버헤드가 생기므로,
+    (종목 × 날짜) 순서로 펼친 배열에서 한 번에 계산합니다.
+    각 열 첫 행에서 윈도우가 새로 시작되므로 종목별 rolling과 결과가 같습니다.
+    """
+
+    def get_window_bounds(self, num_values=0, min_periods=None, center=None,
+                          closed=None, step=None):
+        end = np.arange(1, num_values + 1, dtype=np.int64)
+        row = np.arange(num_values, dtype=np.int64) % self.n_rows
+        start = end - np.minimum(row + 1, self.window_size)
+        return start, end
+
+
+def _join_signals(left: np.ndarray, right: np.ndarray) -> np.ndarray:
+    """시그널 문자열 배열 결합 ("A" + "B" -> "A + B", 빈 문자열은 생략)"""
+    joined = np.where(left == "", right, left + " + " + right)
+    return np.where(right == "", left, joined)
+
+
+class TechnicalAnalyzerV3Panel:
+    """
+    TechnicalAnalyzerV3의 패널(날짜 × 종목) 버전
+
+    종목별로 DataFrame을 복사하고 지표를 다시 계산하는 대신,
+    종가 행렬 하나에서 모든 종목의 지표를 열 단위로 한 번에 계산하고
+    마지막 두 행만 NumPy 배열 연산으로 채점합니다.
+    임계값과 시그널 문자열은 TechnicalAnalyzerV3와 동일합니다.
+
+    V3 총점은 종가만 사용하므로(변동성 점수는 총점 제외) 종가 패널만 필요합니다.
+    종목마다 상장일이 달라 생기는 NaN은 종목별 데이터 길이로 처리합니다.
+    """
+
+    def __init__(self, close: pd.DataFrame, thresholds: Optional[Dict] = None):
+        """
+        초기화
+
+        Args:
+            close: 종가 패널 (index: 날짜, columns: 종목)
+            thresholds: TechnicalAnalyzerV3.THRESHOLDS 중 바꿀 임계값 (None이면 기본값)
+        """
+        self.tickers = list(close.columns)
+        self.thresholds = {**TechnicalAnalyzerV3.THRESHOLDS, **(thresholds or {})}
+
+        values = close.to_numpy(dtype=np.float64)
+        valid = ~np.isnan(values)
+
+        # 종목별 유효 데이터를 아래쪽으로 정렬 (각 열의 마지막 행 = 해당 종목의 최신 봉)
+        order = np.argsort(valid, axis=0, kind='stable')
+        self.close = pd.DataFrame(np.take_along_axis(values, order, axis=0), columns=self.tickers)
+        self.lengths = valid.sum(axis=0)
+
+        self._calculate_indicators()
+
+    @classmethod
+    def from_frames(cls, frames: Dict[str, pd.DataFrame]) -> 'TechnicalAnalyzerV3Panel':
+        """
+        종목별 OHLCV DataFrame에서 패널 생성
+
+        Args:
+            frames: {종목: OHLCV DataFrame}
+
+        Returns:
+            TechnicalAnalyzerV3Panel
+        """
+        close = pd.concat({ticker: df['Close'] for ticker, df in frames.items()}, axis=1, sort=True)
+        return cls(close)
+
+    def _rolling(self, values: np.ndarray, window: int):
+        """(날짜 × 종목) 배열을 열 단위로 펼쳐 rolling 객체 생성"""
+        n_rows = values.shape[0]
+        indexer = _ColumnWindowIndexer(window_size=window, n_rows=n_rows)
+        return pd.Series(values.T.ravel()).rolling(indexer, min_periods=window)
+
+    def _tail(self, series: pd.Series) -> np.ndarray:
+        """펼친 결과를 (날짜 × 종목)으로 되돌린 뒤 마지막 두 행 반환"""
+        n_rows = len(self.close)
+        return series.to_numpy().reshape(-1, n_rows).T[-2:]
+
+    def _calculate_indicators(self):
+        """채점에 필요한 지표의 마지막 두 행 계산 (shape: 2 × 종목)"""
+        values = self.close.to_numpy()
+
+        # 이동평균 / 볼린저 밴드 (SMA_20 = BB_Middle)
+        self.sma_5 = self._tail(self._rolling(values, 5).mean())
+        self.sma_20 = self._tail(self._rolling(values, 20).mean())
+        self.sma_60 = self._tail(self._rolling(values, 60).mean())
+        bb_std = self._tail(self._rolling(values, 20).std())
+        self.bb_lower = self.sma_20 - (bb_std * 2)
+        self.bb_upper = self.sma_20 + (bb_std * 2)
+
+        # RSI
+        delta = np.full_like(values, np.nan)
+        delta[1:] = values[1:] - values[:-1]
+        gain = self._tail(self._rolling(np.where(delta > 0, delta, 0.0), 14).mean())
+        loss = self._tail(self._rolling(-np.where(delta < 0, delta, 0.0), 14).mean())
+
+        self.last_close = values[-2:]
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            rs = gain / loss
+            self.rsi = 100 - (100 / (1 + rs))
+
+            # 수익률 (1M/6M/12M)
+            last = values[-1]
+            self.return_1m = self._pct_change(values, last, 21)
+            self.return_6m = self._pct_change(values, last, 126)
+            self.return_12m = self._pct_change(values, last, 252)
+
+    @staticmethod
+    def _pct_change(values: np.ndarray, last: np.ndarray, periods: int) -> np.ndarray:
+        """마지막 행의 periods 기간 수익률"""
+        if len(values) <= periods:
+            return np.full(values.shape[1], np.nan)
+        return last / values[-1 - periods] - 1
+
+    def calculate_momentum_score(self) -> Tuple[np.ndarray, np.ndarray]:
+        """모멘텀 점수 (30점 만점) - TechnicalAnalyzerV3.calculate_momentum_score 참고"""
+        th = self.thresholds
+
+        ret_6m = self.return_6m
+        levels_6m = [ret_6m > th['momentum_6m_strong'], ret_6m > th['momentum_6m_medium'], ret_6m > 0]
+        score_6m = np.select(levels_6m, [15, 10, 5], 0)
+        signal_6m = np.select(
+            levels_6m, ["강력 모멘텀(6M)", "중간 모멘텀(6M)", "약한 모멘텀(6M)"], "").astype(object)
+
+        ret_12m = self.return_12m - self.return_1m
+        levels_12m = [ret_12m > th['momentum_12m_strong'], ret_12m > th['momentum_12m_medium'], ret_12m > 0]
+        score_12m = np.select(levels_12m, [15, 10, 5], 0)
+        signal_12m = np.select(
+            levels_12m, ["강력 모멘텀(12M)", "중간 모멘텀(12M)", "약한 모멘텀(12M)"], "").astype(object)
+
+        score = score_6m + score_12m
+        signal = _join_signals(signal_6m, signal_12m)
+        signal = np.where(signal == "", "모멘텀 없음", signal)
+
+        short = self.lengths < 126
+        return np.where(short, 0, score), np.where(short, "데이터 부족", signal)
+
+    def calculate_mean_reversion_score(self) -> Tuple[np.ndarray, np.ndarray]:
+        """평균 회귀 점수 (20점 만점) - TechnicalAnalyzerV3.calculate_mean_reversion_score 참고"""
+        prev_rsi, rsi = self.rsi
+        oversold = self.thresholds['rsi_oversold']
+        rsi_rebound = (prev_rsi <= oversold) & (rsi > oversold)
+        rsi_oversold = ~rsi_rebound & (rsi <= oversold)
+        score_rsi = np.select([rsi_rebound, rsi_oversold], [10, 5], 0)
+        signal_rsi = np.select(
+            [rsi_rebound, rsi_oversold], ["RSI 과매도 반등", "RSI 과매도 구간"], "").astype(object)
+
+        prev_close, close = self.last_close
+        bb_lower = self.bb_lower[-1]
+        has_bb = ~np.isnan(bb_lower) & ~np.isnan(self.bb_upper[-1]) & ~np.isnan(close)
+        bb_rebound = has_bb & (prev_close <= bb_lower) & (close > bb_lower)
+        bb_near = has_bb & ~bb_rebound & (close <= bb_lower * self.thresholds['bb_near'])
+        score_bb = np.select([bb_rebound, bb_near], [10, 5], 0)
+        signal_bb = np.select(
+            [bb_rebound, bb_near], ["BB 하단 반등", "BB 하단 근접"], "").astype(object)
+
+        score = score_rsi + score_bb
+        signal = _join_signals(signal_rsi, signal_bb)
+        signal = np.where(signal == "", "평균회귀 없음", signal)
+
+        short = self.lengths < 20
+        return np.where(short, 0, score), np.where(short, "데이터 부족", signal)
+
+    def calculate_trend_following_score(self) -> Tuple[np.ndarray, np.ndarray]:
+        """추세 추종 점수 (15점 만점) - TechnicalAnalyzerV3.calculate_trend_following_score 참고"""
+        prev_20, sma_20 = self.sma_20
+        prev_60, sma_60 = self.sma_60
+        sma_5 = self.sma_5[-1]
+
+        # NaN 비교는 항상 False이므로 notna 조건이 자동으로 반영됨
+        golden_cross = (prev_20 <= prev_60) & (sma_20 > sma_60)
+        aligned = (sma_5 > sma_20) & (sma_20 > sma_60)
+
+        score = np.where(golden_cross, 10, 0) + np.where(aligned, 5, 0)
+        signal = _join_signals(
+            np.where(golden_cross, "골든크로스", "").astype(object),
+            np.where(aligned, "정배열", "").astype(object))
+        signal = np.where(signal == "", "추세 없음", signal)
+
+        short = self.lengths < 60
+        return np.where(short, 0, score), np.where(short, "데이터 부족", signal)
+
+    def calculate_total_scores(self) -> pd.DataFrame:
+        """
+        전체 종목 점수 및 시그널 계산
+
+        Returns:
+            DataFrame (index: 종목, columns: TechnicalAnalyzerV3.calculate_total_score 키)
+        """
+        momentum_score, momentum_signal = self.calculate_momentum_score()
+        mean_rev_score, mean_rev_signal = self.calculate_mean_reversion_score()
+        trend_score, trend_signal = self.calculate_trend_following_score()
+
+        total = momentum_score + mean_rev_score + trend_score
+
+        # 시그널 결합 ("~ 없음"은 제외)
+        combined = _join_signals(
+            np.where(momentum_signal == "모멘텀 없음", "", momentum_signal).astype(object),
+            np.where(mean_rev_signal == "평균회귀 없음", "", mean_rev_signal).astype(object))
+        combined = _join_signals(
+            combined, np.where(trend_signal == "추세 없음", "", trend_signal).astype(object))
+        combined = np.where(combined == "", "시그널 없음", combined)
+
+        return pd.DataFrame({
+            'total_score': total,
+            'momentum_score': momentum_score,
+            'mean_reversion_score': mean_rev_score,
+            'trend_score': trend_score,
+            'volatility_score': 0,
+            'signals': combined,
+            'momentum_signal': momentum_signal,
+            'mean_reversion_signal': mean_rev_signal,
+            'trend_signal': trend_signal,
+            'volatility_signal': '',
+        }, index=pd.Index(self.tickers, name='ticker'))
+
+    def get_result(self, ticker: str, scores: Optional[pd.DataFrame] = None) -> Dict:
+        """
+        한 종목의 결과를 TechnicalAnalyzerV3.calculate_total_score()와 같은 dict로 반환
+
+        Args:
+            ticker: 종목 코드
+            scores: calculate_total_scores() 결과 (None이면 새로 계산)
+        """
+        if scores is None:
+            scores = self.calculate_total_scores()
+        row = scores.loc[ticker]
+        result = row.to_dict()
+        for key in ['total_score', 'momentum_score', 'mean_reversion_score',
+                    'trend_score', 'volatility_score']:
+            result[key] = int(result[key])
+        return result
+
+
 def compare_analyzers(df: pd.DataFrame) -> pd.DataFrame:
     """
     V2와 V3 분석기 비교
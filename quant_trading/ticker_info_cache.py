@@ -0,0 +1,145 @@
+"""
+종목 메타데이터 캐시 (Ticker Info Cache)
+- yfinance `.info` 요청을 실행(run)당 종목별 1회로 제한
+- 메모리 캐시 + 선택적 디스크 TTL 저장소
+
+리포트 한 번 실행 시 analyze_stock_for_report, ValuationAnalyzer,
+AutomationAnalyzer, PolicyAnalyzer가 같은 캐시를 공유하면
+종목당 4회였던 메타데이터 요청이 1회로 줄어듭니다.
+"""
+
+import json
+import os
+import threading
+import time
+from typing import Callable, Dict, Optional
+
+import yfinance as yf
+
+from .rate_limiter import YAHOO_HOST, get_rate_limiter
+
+
+def _fetch_info_from_yfinance(ticker: str) -> Dict:
+    """yfinance에서 종목 정보 가져오기 (기본 fetcher, Yahoo 속도 제한 적용)"""
+    return get_rate_limiter(YAHOO_HOST).call(lambda: yf.Ticker(ticker).info)
+
+
+class TickerInfoCache:
+    """
+    스레드 안전한 종목 정보 캐시
+
+    같은 종목을 여러 스레드가 동시에 요청해도 실제 요청은 한 번만 발생합니다.
+    실패한 요청은 캐시하지 않으므로 재시도 시 다시 요청합니다.
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None, ttl: float = 24 * 3600,
+                 fetcher: Optional[Callable[[str], Dict]] = None):
+        """
+        초기화
+
+        Args:
+            cache_dir: 디스크 캐시 디렉토리 (None이면 메모리 캐시만 사용)
+            ttl: 디스크 캐시 유효 시간 (초)
+            fetcher: 종목 정보 조회 함수 (기본: yfinance `.info`)
+        """
+        self.cache_dir = cache_dir
+        self.ttl = ttl
+        self.fetcher = fetcher or _fetch_info_from_yfinance
+        self.request_count = 0
+
+        self._memory = {}
+        self._lock = threading.Lock()
+        self._key_locks = {}
+
+        if self.cache_dir:
+            os.makedirs(self.cache_dir, exist_ok=True)
+
+    def _key_lock(self, ticker: str) -> threading.Lock:
+        """종목별 잠금 객체 반환"""
+        with self._lock:
+            lock = self._key_locks.get(ticker)
+            if lock is None:
+                lock = threading.Lock()
+                self._key_locks[ticker] = lock
+            return lock
+
+    def _disk_path(self, ticker: str) -> str:
+        """디스크 캐시 파일 경로"""
+        return os.path.join(self.cache_dir, f"{ticker}.json")
+
+    def _load_from_disk(self, ticker: str) -> Optional[Dict]:
+        """TTL 이내의 디스크 캐시 로드"""
+        if not self.cache_dir:
+            return None
+
+        path = self._disk_path(ticker)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if time.time() - entry.get('fetched_at', 0) > self.ttl:
+            return None
+        return entry.get('info')
+
+    def _save_to_disk(self, ticker: str, info: Dict):
+        """디스크 캐시 저장 (원자적 교체)"""
+        if not self.cache_dir:
+            return
+
+        path = self._disk_path(ticker)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({'fetched_at': time.time(), 'info': info}, f, default=str)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"[WARNING] {ticker} 정보 캐시 저장 실패: {e}")
+
+    def get(self, ticker: str) -> Dict:
+        """
+        종목 정보 조회 (캐시 우선)
+
+        Args:
+            ticker: 종목 코드
+
+        Returns:
+            yfinance `.info` 딕셔너리
+
+        Raises:
+            fetcher가 발생시킨 예외 (실패는 캐시하지 않음)
+        """
+        ticker = ticker.upper()
+
+        info = self._memory.get(ticker)
+        if info is not None:
+            return info
+
+        with self._key_lock(ticker):
+            # 잠금 대기 중 다른 스레드가 채웠을 수 있음
+            info = self._memory.get(ticker)
+            if info is not None:
+                return info
+
+            info = self._load_from_disk(ticker)
+            if info is None:
+                with self._lock:
+                    self.request_count += 1
+                info = self.fetcher(ticker) or {}
+                self._save_to_disk(ticker, info)
+
+            self._memory[ticker] = info
+            return info
+
+    def clear(self):
+        """메모리 캐시 비우기 (디스크 캐시는 유지)"""
+        with self._lock:
+            self._memory.clear()
+            self._key_locks.clear()
+
+    def __contains__(self, ticker: str) -> bool:
+        return ticker.upper() in self._memory
+
+    def __len__(self) -> int:
+        return len(self._memory)
@@ -11,22 +11,28 @@
 """
 
 import yfinance as yf
-from typing import Dict
+from typing import Dict, Optional
+
+from .ticker_info_cache import TickerInfoCache
 
 
 class ValuationAnalyzer:
     """밥값(가치) 분석기 - 실체 있는 기업인가?"""
 
-    def __init__(self, ticker: str):
+    def __init__(self, ticker: str, info_cache: Optional[TickerInfoCache] = None):
         self.ticker = ticker
         self.stock = yf.Ticker(ticker)
+        self.info_cache = info_cache
         self.info = {}
         self._fetch_data()
 
     def _fetch_data(self):
         """재무 데이터 가져오기"""
         try:
-            self.info = self.stock.info
+            if self.info_cache is not None:
+                self.info = self.info_cache.get(self.ticker)
+            else:
+                self.info = self.stock.info
         except Exception as e:
             print(f"[WARNING] {self.ticker} 재무 데이터 실패: {e}")
             self.info = {}
@@ -9,6 +9,12 @@ Examples:
     >>> # 주가 데이터 조회
     >>> df = fdr.DataReader('005930', '2020-01-01', '2020-12-31')  # 삼성전자
     >>> df = fdr.DataReader('AAPL', '2020')  # Apple
+    >>> panel = fdr.DataReader(['005930', '000660'], '2020')  # 여러 종목
+    >>> panel = asyncio.run(fdr.DataReaderAsync(tickers, '2020'))  # asyncio (대량 종목)
+    >>>
+    >>> # 로컬 캐시 (이후 같은 조회는 디스크 + 최근 구간만)
+    >>> fdr.enable_cache()
+    >>> df = fdr.DataReader('005930', '2015')
     >>>
     >>> # 종목 목록 조회
     >>> df_krx = fdr.StockListing('KRX')
@@ -22,12 +28,19 @@ __version__ = '0.1.0'
 __author__ = 'FinanceDataReader Implementation'
 __license__ = 'MIT'
 
-from .data import DataReader, StockListing
+from .data import DataReader, DataReaderMany, DataReaderAsync, DataReaderError, StockListing
 from .snap import SnapDataReader
+from .cache import OHLCVCache, enable_cache, disable_cache
 
 __all__ = [
     'DataReader',
+    'DataReaderMany',
+    'DataReaderAsync',
+    'DataReaderError',
     'StockListing',
     'SnapDataReader',
+    'OHLCVCache',
+    'enable_cache',
+    'disable_cache',
     '__version__',
 ]
@@ -0,0 +1,424 @@
+"""로컬 OHLCV 캐시 모듈
+
+- (데이터 소스, 심볼)별 일봉을 로컬 디스크에 저장 (Parquet, 엔진이 없으면 pickle)
+- 요청 기간 중 캐시가 덮지 못하는 구간만 원본에서 받아 병합
+- 아직 확정되지 않은 최근 봉(오늘)은 refresh_ttl이 지나면 다시 받음
+
+Examples:
+    >>> import FinanceDataReader as fdr
+    >>> fdr.enable_cache()                      # ~/.cache/FinanceDataReader
+    >>> df = fdr.DataReader('005930', '2015')   # 첫 호출: 전체 다운로드
+    >>> df = fdr.DataReader('005930', '2015')   # 이후: 디스크 + 최근 구간만 조회
+"""
+
+import asyncio
+import importlib.util
+import json
+import os
+import re
+import threading
+import time
+import weakref
+from datetime import datetime, timedelta
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple, Union
+
+import pandas as pd
+
+from .utils.report import collect_warnings
+
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'FinanceDataReader')
+
+# 이 기간보다 최근 봉은 아직 확정되지 않은 것으로 보고 커버 범위에 넣지 않음
+_UNSETTLED_DAYS = 1
+
+
+def _parquet_available() -> bool:
+    """Parquet 엔진(pyarrow 또는 fastparquet) 설치 여부"""
+    return any(importlib.util.find_spec(name) is not None for name in ('pyarrow', 'fastparquet'))
+
+
+def _to_day(date) -> pd.Timestamp:
+    """시간대/시각을 제거한 날짜"""
+    ts = pd.Timestamp(date)
+    if ts.tz is not None:
+        ts = ts.tz_localize(None)
+    return ts.normalize()
+
+
+def _naive_index(df: pd.DataFrame) -> pd.DatetimeIndex:
+    """비교용 시간대 없는 인덱스"""
+    index = pd.DatetimeIndex(df.index)
+    return index.tz_localize(None) if index.tz is not None else index
+
+
+def _merge_frames(frames: List[pd.DataFrame]) -> pd.DataFrame:
+    """여러 구간 병합 (중복 날짜는 나중 값, 날짜순)"""
+    merged = pd.concat(frames) if len(frames) > 1 else frames[0]
+    return merged[~merged.index.duplicated(keep='last')].sort_index()
+
+
+class OHLCVCache:
+    """
+    (데이터 소스, 심볼)별 일봉 디스크 캐시
+
+    캐시는 연속된 하나의 날짜 구간을 "확인 완료"로 기록합니다. 요청이 이 구간을
+    벗어나면 앞/뒤로 모자란 구간만 조회하므로 커버 범위는 항상 연속입니다.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[str] = None,
+        fmt: Optional[str] = None,
+        refresh_ttl: float = 3600,
+        now: Callable[[], datetime] = datetime.now
+    ):
+        """
+        초기화
+
+        Args:
+            cache_dir: 캐시 디렉토리 (None이면 FDR_CACHE_DIR 환경변수 또는 ~/.cache/FinanceDataReader)
+            fmt: 저장 형식 ('parquet', 'pickle', None이면 Parquet 엔진 유무로 자동 선택)
+            refresh_ttl: 최근(미확정) 구간 재조회 간격 (초)
+            now: 현재 시각 함수 (테스트용)
+        """
+        if fmt is None:
+            fmt = 'parquet' if _parquet_available() else 'pickle'
+        if fmt not in ('parquet', 'pickle'):
+            raise ValueError(f"Unknown cache format: {fmt}")
+
+        self.cache_dir = cache_dir or os.environ.get('FDR_CACHE_DIR') or DEFAULT_CACHE_DIR
+        self.fmt = fmt
+        self.refresh_ttl = refresh_ttl
+        self.fetch_count = 0
+
+        self._now = now
+        self._lock = threading.Lock()
+        self._key_locks = {}
+        self._async_key_locks = weakref.WeakKeyDictionary()
+
+    def _key_lock(self, key: Tuple[str, str]) -> threading.Lock:
+        with self._lock:
+            lock = self._key_locks.get(key)
+            if lock is None:
+                lock = threading.Lock()
+                self._key_locks[key] = lock
+            return lock
+
+    def _async_key_lock(self, key: Tuple[str, str]) -> asyncio.Lock:
+        # 이벤트 루프마다 새로 만들어야 하므로 루프별로 보관
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            locks = self._async_key_locks.get(loop)
+            if locks is None:
+                locks = weakref.WeakValueDictionary()
+                self._async_key_locks[loop] = locks
+            lock = locks.get(key)
+            if lock is None:
+                lock = asyncio.Lock()
+                locks[key] = lock
+            return lock
+
+    def _paths(self, source: str, symbol: str) -> Tuple[str, str]:
+        """(데이터 파일, 메타 파일) 경로"""
+        safe_symbol = re.sub(r'[^0-9A-Za-z._-]', '_', symbol)
+        base = os.path.join(self.cache_dir, source.upper(), safe_symbol)
+        ext = '.parquet' if self.fmt == 'parquet' else '.pkl'
+        return base + ext, base + '.json'
+
+    def _load(self, source: str, symbol: str) -> Tuple[Optional[pd.DataFrame], Optional[Dict]]:
+        data_path, meta_path = self._paths(source, symbol)
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+            if self.fmt == 'parquet':
+                df = pd.read_parquet(data_path)
+            else:
+                df = pd.read_pickle(data_path)
+        except (OSError, ValueError, KeyError):
+            return None, None
+        except Exception as e:
+            print(f"Warning: cache read failed for {source}:{symbol} ({e})")
+            return None, None
+        return df, meta
+
+    def _save(self, source: str, symbol: str, df: pd.DataFrame, meta: Dict):
+        """데이터 → 메타 순서로 원자적 교체"""
+        data_path, meta_path = self._paths(source, symbol)
+        os.makedirs(os.path.dirname(data_path), exist_ok=True)
+        suffix = f".{threading.get_ident()}.tmp"
+
+        try:
+            if self.fmt == 'parquet':
+                df.to_parquet(data_path + suffix)
+            else:
+                df.to_pickle(data_path + suffix)
+            os.replace(data_path + suffix, data_path)
+
+            with open(meta_path + suffix, 'w', encoding='utf-8') as f:
+                json.dump(meta, f)
+            os.replace(meta_path + suffix, meta_path)
+        except Exception as e:
+            print(f"Warning: cache write failed for {source}:{symbol} ({e})")
+
+    def missing_ranges(
+        self,
+        meta: Optional[Dict],
+        start: pd.Timestamp,
+        end: pd.Timestamp
+    ) -> List[Tuple[pd.Timestamp, pd.Timestamp]]:
+        """
+        요청 구간 중 원본에서 받아야 할 구간 목록
+
+        Args:
+            meta: 캐시 메타 정보 (None이면 캐시 없음)
+            start: 시작일
+            end: 종료일 (포함)
+
+        Returns:
+            [(시작일, 종료일), ...]
+        """
+        if meta is None:
+            return [(start, end)]
+
+        one_day = timedelta(days=1)
+        covered_start = pd.Timestamp(meta['start'])
+        covered_end = pd.Timestamp(meta['end'])
+        ranges = []
+
+        if start < covered_start:
+            ranges.append((start, covered_start - one_day))
+
+        if end > covered_end:
+            # 최근 구간은 TTL 이내에 같은 범위를 이미 받았으면 생략
+            tail_fresh = (
+                meta.get('tail_end') is not None
+                and end <= pd.Timestamp(meta['tail_end'])
+                and time.time() - meta.get('fetched_at', 0) < self.refresh_ttl
+            )
+            if not tail_fresh:
+                ranges.append((covered_end + one_day, end))
+
+        return ranges
+
+    def read(
+        self,
+        source: str,
+        symbol: str,
+        start: datetime,
+        end: datetime,
+        fetcher: Callable[[datetime, datetime], pd.DataFrame]
+    ) -> pd.DataFrame:
+        """
+        캐시 우선 조회 (모자란 구간만 fetcher로 받아 병합 후 저장)
+
+        Args:
+            source: 데이터 소스 ('KRX', 'NAVER', 'YAHOO', ...)
+            symbol: 심볼
+            start: 시작일
+            end: 종료일
+            fetcher: (start, end) -> DataFrame 원본 조회 함수
+
+        Returns:
+            요청 구간 DataFrame
+        """
+        source = source.upper()
+        start_day, end_day = _to_day(start), _to_day(end)
+
+        with self._key_lock((source, symbol)):
+            df, meta = self._load(source, symbol)
+            ranges = self.missing_ranges(meta, start_day, end_day)
+
+            if ranges:
+                results, error = [], None
+                for range_start, range_end in ranges:
+                    self.fetch_count += 1
+                    fetched = None
+                    with collect_warnings() as warnings:
+                        try:
+                            fetched = fetcher(range_start.to_pydatetime(), range_end.to_pydatetime())
+                        except Exception as e:
+                            # 성공한 구간은 저장한 뒤 예외 전달
+                            error = error or e
+                    results.append((fetched, not self._fetch_failed(fetched, warnings)))
+                df, meta = self._fill(source, symbol, df, meta, ranges, results, start_day, end_day)
+                if error is not None:
+                    raise error
+
+        return self._slice(df, start_day, end_day)
+
+    async def read_async(
+        self,
+        source: str,
+        symbol: str,
+        start: datetime,
+        end: datetime,
+        fetcher: Callable[[datetime, datetime], Awaitable[pd.DataFrame]]
+    ) -> pd.DataFrame:
+        """
+        캐시 우선 조회 (asyncio 버전, fetcher는 코루틴 함수)
+
+        디스크 읽기/쓰기는 작으므로 이벤트 루프에서 바로 수행하고,
+        같은 (소스, 심볼)의 동시 조회는 asyncio.Lock으로 직렬화합니다.
+        """
+        source = source.upper()
+        start_day, end_day = _to_day(start), _to_day(end)
+
+        async with self._async_key_lock((source, symbol)):
+            df, meta = self._load(source, symbol)
+            ranges = self.missing_ranges(meta, start_day, end_day)
+
+            if ranges:
+                results, error = [], None
+                for range_start, range_end in ranges:
+                    self.fetch_count += 1
+                    fetched = None
+                    with collect_warnings() as warnings:
+                        try:
+                            fetched = await fetcher(range_start.to_pydatetime(), range_end.to_pydatetime())
+                        except Exception as e:
+                            # 성공한 구간은 저장한 뒤 예외 전달
+                            error = error or e
+                    results.append((fetched, not self._fetch_failed(fetched, warnings)))
+                df, meta = self._fill(source, symbol, df, meta, ranges, results, start_day, end_day)
+                if error is not None:
+                    raise error
+
+        return self._slice(df, start_day, end_day)
+
+    @staticmethod
+    def _slice(df: Optional[pd.DataFrame], start_day: pd.Timestamp, end_day: pd.Timestamp) -> pd.DataFrame:
+        """요청 구간만 잘라서 반환"""
+        if df is None or df.empty:
+            return pd.DataFrame() if df is None else df
+
+        index = _naive_index(df)
+        return df[(index >= start_day) & (index < end_day + timedelta(days=1))]
+
+    def _fill(self, source, symbol, df, meta, ranges, results, start_day, end_day):
+        """
+        받아온 구간 병합 및 메타 갱신
+
+        results는 구간별 (DataFrame 또는 None, 확인 완료 여부)입니다.
+        확인 완료된 구간만 디스크에 저장하고 커버 범위를 늘립니다 (빈 결과도 "데이터 없음"으로 확인).
+        실패한 구간(예외 또는 리더 경고)의 일부 결과는 이번 반환값에만 포함합니다.
+        모자란 구간은 기존 커버 범위의 앞/뒤에 맞닿아 있으므로 일부만 성공해도 커버 범위는 연속입니다.
+
+        Returns:
+            (반환할 DataFrame, 메타)
+        """
+        saved = [df] if df is not None and not df.empty else []
+        partial = []
+        succeeded = []
+
+        for fetch_range, (fetched, complete) in zip(ranges, results):
+            if complete:
+                succeeded.append(fetch_range)
+            if fetched is not None and not fetched.empty:
+                (saved if complete else partial).append(fetched)
+
+        if succeeded:
+            merged = _merge_frames(saved) if saved else (df if df is not None else pd.DataFrame())
+
+            settled_end = _to_day(self._now()) - timedelta(days=_UNSETTLED_DAYS)
+            meta = dict(meta or {})
+
+            covered_start = pd.Timestamp(meta['start']) if 'start' in meta else None
+            covered_end = pd.Timestamp(meta['end']) if 'end' in meta else None
+            for range_start, range_end in succeeded:
+                range_end = min(range_end, settled_end)
+                covered_start = range_start if covered_start is None else min(covered_start, range_start)
+                covered_end = range_end if covered_end is None else max(covered_end, range_end)
+            meta['start'] = covered_start.isoformat()
+            meta['end'] = covered_end.isoformat()
+
+            if succeeded[-1][1] == end_day:
+                meta['tail_end'] = end_day.isoformat()
+                meta['fetched_at'] = time.time()
+
+            self._save(source, symbol, merged, meta)
+            df = merged
+
+        if partial:
+            df = _merge_frames(([df] if df is not None and not df.empty else []) + partial)
+        return df, meta
+
+    @staticmethod
+    def _fetch_failed(fetched, warnings: List[str]) -> bool:
+        """
+        조회 실패 여부
+
+        리더는 네트워크 오류 시 report_warning 후 빈(또는 일부) DataFrame을 반환하므로
+        경고가 있었던 구간은 "데이터 없음"으로 기록하지 않습니다.
+        """
+        return fetched is None or bool(warnings)
+
+    def clear(self, source: Optional[str] = None, symbol: Optional[str] = None):
+        """
+        캐시 삭제
+
+        Args:
+            source: 데이터 소스 (None이면 전체)
+            symbol: 심볼 (None이면 소스 전체)
+        """
+        import shutil
+
+        if source is None:
+            shutil.rmtree(self.cache_dir, ignore_errors=True)
+        elif symbol is None:
+            shutil.rmtree(os.path.join(self.cache_dir, source.upper()), ignore_errors=True)
+        else:
+            for path in self._paths(source, symbol):
+                if os.path.exists(path):
+                    os.remove(path)
+
+
+_DEFAULT_CACHE: Optional[OHLCVCache] = None
+
+
+def enable_cache(cache_dir: Optional[str] = None, **kwargs) -> OHLCVCache:
+    """
+    DataReader 기본 캐시 활성화
+
+    Args:
+        cache_dir: 캐시 디렉토리
+        **kwargs: OHLCVCache 설정
+
+    Returns:
+        활성화된 OHLCVCache
+    """
+    global _DEFAULT_CACHE
+    _DEFAULT_CACHE = OHLCVCache(cache_dir, **kwargs)
+    return _DEFAULT_CACHE
+
+
+def disable_cache():
+    """DataReader 기본 캐시 비활성화"""
+    global _DEFAULT_CACHE
+    _DEFAULT_CACHE = None
+
+
+def resolve_cache(cache: Union[None, bool, str, OHLCVCache]) -> Optional[OHLCVCache]:
+    """
+    DataReader cache 인자를 OHLCVCache로 변환
+
+    - None: 기본 캐시 (enable_cache() 또는 FDR_CACHE_DIR 환경변수로 활성화)
+    - False: 캐시 사용 안 함
+    - True: 기본 디렉토리 캐시
+    - str: 해당 디렉토리 캐시
+    """
+    global _DEFAULT_CACHE
+
+    if cache is None:
+        if _DEFAULT_CACHE is None and os.environ.get('FDR_CACHE_DIR'):
+            _DEFAULT_CACHE = OHLCVCache()
+        return _DEFAULT_CACHE
+    if cache is False:
+        return None
+    if cache is True:
+        if _DEFAULT_CACHE is None:
+            _DEFAULT_CACHE = OHLCVCache()
+        return _DEFAULT_CACHE
+    if isinstance(cache, str):
+        return OHLCVCache(cache)
+    return cache
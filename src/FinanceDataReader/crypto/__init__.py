@@ -1,5 +1,5 @@
 """암호화폐 데이터 소스"""
 
-from .data import get_crypto_data, parse_crypto_symbol
+from .data import get_crypto_data, get_crypto_data_async, parse_crypto_symbol
 
-__all__ = ['get_crypto_data', 'parse_crypto_symbol']
+__all__ = ['get_crypto_data', 'get_crypto_data_async', 'parse_crypto_symbol']
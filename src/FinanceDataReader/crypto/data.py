@@ -1,9 +1,10 @@
 """암호화폐 데이터 조회"""
 
+import numpy as np
 import pandas as pd
 from datetime import datetime
 from typing import Optional
-from ..utils import get_request, create_session
+from ..utils import get_request, get_request_async, report_warning, epoch_to_datetime
 
 
 # CoinGecko API (무료, API 키 불필요)
@@ -26,6 +27,47 @@ COIN_ID_MAP = {
 }
 
 
+def _coingecko_params(start: datetime, end: datetime, currency: str) -> dict:
+    """CoinGecko market_chart/range 요청 파라미터"""
+    # Unix timestamp 변환
+    return {
+        'vs_currency': currency.lower(),
+        'from': int(start.timestamp()),
+        'to': int(end.timestamp())
+    }
+
+
+def _parse_crypto_data(text: str, symbol: str) -> pd.DataFrame:
+    """CoinGecko 응답(JSON) → 가격 DataFrame (동기/비동기 공용)"""
+    import json
+    data = json.loads(text)
+
+    if 'prices' not in data:
+        report_warning(f"No data found for {symbol}")
+        return pd.DataFrame()
+
+    # 가격 데이터 파싱 ([[timestamp(ms), 값], ...] → N × 2 배열)
+    prices = np.array(data['prices'], dtype=np.float64).reshape(-1, 2)
+    volumes = np.array(data.get('total_volumes') or [], dtype=np.float64).reshape(-1, 2)
+
+    if len(prices) == 0:
+        report_warning(f"No data found for {symbol}")
+        return pd.DataFrame()
+
+    # 거래량은 가격과 같은 순번끼리 맞추고 모자라면 0
+    volume = np.zeros(len(prices))
+    n_volumes = min(len(prices), len(volumes))
+    volume[:n_volumes] = volumes[:n_volumes, 1]
+
+    df = pd.DataFrame(
+        {'Close': prices[:, 1], 'Volume': volume},
+        index=epoch_to_datetime(prices[:, 0], unit='ms').rename('Date')
+    )
+    df = df.sort_index()
+
+    return df
+
+
 def get_crypto_data(
     symbol: str,
     start: datetime,
@@ -52,63 +94,68 @@ def get_crypto_data(
     coin_id = COIN_ID_MAP.get(symbol.upper(), symbol.lower())
 
     try:
-        # Unix timestamp 변환
-        from_timestamp = int(start.timestamp())
-        to_timestamp = int(end.timestamp())
-
         # CoinGecko API 호출
         url = COINGECKO_API_URL.format(coin_id=coin_id)
-        params = {
-            'vs_currency': currency.lower(),
-            'from': from_timestamp,
-            'to': to_timestamp
-        }
 
-        session = create_session()
-        response = get_request(url, params=params, session=session)
+        response = get_request(url, params=_coingecko_params(start, end, currency))
 
-        import json
-        data = json.loads(response.text)
+        return _parse_crypto_data(response.text, symbol)
 
-        if 'prices' not in data:
-            print(f"No data found for {symbol}")
+    except Exception as e:
+        report_warning(f"Warning: CoinGecko API failed for {symbol} ({e})")
+
+        # 대체: Yahoo Finance 사용
+        try:
+            from ..yahoo import get_yahoo_data
+
+            # 심볼 변환 (BTC -> BTC-USD)
+            yahoo_symbol = f"{symbol.upper()}-{currency.upper()}"
+            return get_yahoo_data(yahoo_symbol, start, end)
+
+        except Exception as e2:
+            report_warning(f"Warning: Yahoo Finance also failed ({e2})")
             return pd.DataFrame()
 
-        # 가격 데이터 파싱
-        prices = data['prices']
-        volumes = data.get('total_volumes', [])
 
-        price_data = []
-        for i, (timestamp, price) in enumerate(prices):
-            date = datetime.fromtimestamp(timestamp / 1000)  # milliseconds to seconds
+async def get_crypto_data_async(
+    symbol: str,
+    start: datetime,
+    end: datetime,
+    currency: str = 'usd'
+) -> pd.DataFrame:
+    """
+    암호화폐 가격 데이터 조회 (asyncio 버전, 결과는 get_crypto_data와 동일)
 
-            volume = volumes[i][1] if i < len(volumes) else 0
+    Args:
+        symbol: 암호화폐 심볼 (예: 'BTC', 'ETH')
+        start: 시작일
+        end: 종료일
+        currency: 통화 ('usd', 'krw', 'eur' 등)
 
-            price_data.append({
-                'Date': date,
-                'Close': price,
-                'Volume': volume
-            })
+    Returns:
+        암호화폐 가격 데이터 DataFrame
+    """
+    coin_id = COIN_ID_MAP.get(symbol.upper(), symbol.lower())
+
+    try:
+        url = COINGECKO_API_URL.format(coin_id=coin_id)
 
-        df = pd.DataFrame(price_data)
-        df = df.set_index('Date')
-        df = df.sort_index()
+        response = await get_request_async(url, params=_coingecko_params(start, end, currency))
 
-        return df
+        return _parse_crypto_data(response.text, symbol)
 
     except Exception as e:
-        print(f"Warning: CoinGecko API failed for {symbol} ({e})")
+        report_warning(f"Warning: CoinGecko API failed for {symbol} ({e})")
 
         # 대체: Yahoo Finance 사용
         try:
-            from ..yahoo import get_yahoo_data
+            from ..yahoo import get_yahoo_data_async
 
-            # 심볼 변환 (BTC -> BTC-USD)
             yahoo_symbol = f"{symbol.upper()}-{currency.upper()}"
-            return get_yahoo_data(yahoo_symbol, start, end)
+            return await get_yahoo_data_async(yahoo_symbol, start, end)
 
         except Exception as e2:
-            print(f"Warning: Yahoo Finance also failed ({e2})")
+            report_warning(f"Warning: Yahoo Finance also failed ({e2})")
             return pd.DataFrame()
 
 
@@ -1,28 +1,51 @@
 """메인 데이터 리더 함수"""
 
+import asyncio
 import pandas as pd
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Optional, Union
+from typing import Dict, Iterable, List, Optional, Union
 
-from .utils import get_default_dates, parse_date
-from .krx import get_krx_data, get_krx_stock_listing
-from .naver import get_naver_data
-from .yahoo import get_yahoo_data, normalize_yahoo_symbol
-from .crypto import get_crypto_data, parse_crypto_symbol
-from .fred import get_fred_data
+from .utils import get_default_dates, parse_date, collect_warnings, async_session
+from .krx import get_krx_data, get_krx_data_async, get_krx_stock_listing
+from .naver import get_naver_data, get_naver_data_async
+from .yahoo import get_yahoo_data, get_yahoo_data_async, normalize_yahoo_symbol
+from .crypto import get_crypto_data, get_crypto_data_async, parse_crypto_symbol
+from .fred import get_fred_data, get_fred_data_async
+from .cache import OHLCVCache, resolve_cache
+
+
+class DataReaderError(Exception):
+    """여러 종목 조회 중 실패한 종목이 있을 때 발생 (errors='raise')"""
+
+    def __init__(self, errors: Dict[str, str], results: Dict[str, pd.DataFrame]):
+        self.errors = errors
+        self.results = results
+        failed = ', '.join(f"{symbol} ({message})" for symbol, message in errors.items())
+        super().__init__(f"Failed to read {len(errors)} symbol(s): {failed}")
+
+
+class SymbolFrames(dict):
+    """종목별 DataFrame dict (실패 종목과 사유는 errors에 보관)"""
+
+    def __init__(self, frames: Dict[str, pd.DataFrame], errors: Dict[str, str]):
+        super().__init__(frames)
+        self.errors = errors
 
 
 def DataReader(
-    symbol: str,
+    symbol: Union[str, List[str]],
     start: Optional[Union[str, datetime]] = None,
     end: Optional[Union[str, datetime]] = None,
-    data_source: Optional[str] = None
-) -> pd.DataFrame:
+    data_source: Optional[str] = None,
+    cache: Union[None, bool, str, OHLCVCache] = None
+) -> Union[pd.DataFrame, SymbolFrames]:
     """
     금융 데이터 조회 (통합 인터페이스)
 
     Args:
-        symbol: 종목 코드 또는 티커
+        symbol: 종목 코드 또는 티커 (리스트면 DataReaderMany로 여러 종목 조회)
             - 한국 주식: '005930', '000660' (6자리)
             - 미국 주식: 'AAPL', 'TSLA'
             - 지수: 'KS11'(KOSPI), 'KQ11'(KOSDAQ), 'DJI', 'IXIC'
@@ -35,10 +58,16 @@ def DataReader(
         end: 종료일 (YYYY, YYYY-MM-DD, datetime)
         data_source: 데이터 소스 ('KRX', 'NAVER', 'YAHOO', 'FRED', 'CRYPTO')
             None이면 자동 선택
+        cache: 로컬 OHLCV 캐시
+            None이면 기본 캐시 (enable_cache() 또는 FDR_CACHE_DIR 환경변수로 활성화)
+            False면 캐시 미사용, True면 기본 디렉토리, str이면 해당 디렉토리
 
     Returns:
-        주가/지수 데이터 DataFrame
-        Columns: Open, High, Low, Close, Volume (데이터 소스별로 다를 수 있음)
+        symbol이 문자열이면 주가/지수 데이터 DataFrame
+            Columns: Open, High, Low, Close, Volume (데이터 소스별로 다를 수 있음)
+        리스트면 DataReaderMany(output='panel') 결과
+            날짜 × (종목, 필드) MultiIndex 컬럼 DataFrame, 실패 종목과 사유는 panel.attrs['errors']
+            (종목별 SymbolFrames가 필요하면 DataReaderMany(..., output='dict'))
 
     Examples:
         >>> import FinanceDataReader as fdr
@@ -46,7 +75,29 @@ def DataReader(
         >>> df = fdr.DataReader('AAPL', '2020')  # Apple
         >>> df = fdr.DataReader('BTC/USD', '2020-01-01')  # 비트코인
         >>> df = fdr.DataReader('FRED:GDP', '2010', '2020')  # GDP 데이터
+        >>> df = fdr.DataReader('005930', '2015', cache=True)  # 로컬 캐시 사용
+        >>> panel = fdr.DataReader(['005930', '000660'], '2020')  # 여러 종목 (MultiIndex 컬럼)
     """
+    if not isinstance(symbol, str):
+        return DataReaderMany(symbol, start, end, data_source=data_source, cache=cache)
+
+    data_source, symbol, start_dt, end_dt = _resolve_request(symbol, start, end, data_source)
+
+    cache = resolve_cache(cache)
+    if cache is None:
+        return _fetch_data(data_source, symbol, start_dt, end_dt)
+
+    return cache.read(
+        data_source,
+        symbol,
+        start_dt,
+        end_dt,
+        lambda fetch_start, fetch_end: _fetch_data(data_source, symbol, fetch_start, fetch_end)
+    )
+
+
+def _resolve_request(symbol: str, start, end, data_source: Optional[str]):
+    """(데이터 소스, 심볼, 시작일, 종료일) 결정"""
     # 날짜 처리
     if isinstance(start, str):
         start_dt, end_dt = get_default_dates(start, end)
@@ -67,9 +118,11 @@ def DataReader(
     if data_source is None:
         data_source = _detect_data_source(symbol)
 
-    # 데이터 소스별 라우팅
-    data_source = data_source.upper()
+    return data_source.upper(), symbol, start_dt, end_dt
 
+
+def _fetch_data(data_source: str, symbol: str, start_dt: datetime, end_dt: datetime) -> pd.DataFrame:
+    """데이터 소스에서 직접 조회"""
     if data_source == 'KRX':
         return get_krx_data(symbol, start_dt, end_dt)
 
@@ -90,6 +143,216 @@ def DataReader(
         raise ValueError(f"Unknown data source: {data_source}")
 
 
+async def _fetch_data_async(data_source: str, symbol: str, start_dt: datetime, end_dt: datetime) -> pd.DataFrame:
+    """데이터 소스에서 직접 조회 (asyncio 버전)"""
+    if data_source == 'KRX':
+        return await get_krx_data_async(symbol, start_dt, end_dt)
+
+    elif data_source == 'NAVER':
+        return await get_naver_data_async(symbol, start_dt, end_dt)
+
+    elif data_source == 'YAHOO':
+        return await get_yahoo_data_async(symbol, start_dt, end_dt)
+
+    elif data_source == 'FRED':
+        return await get_fred_data_async(symbol, start_dt, end_dt)
+
+    elif data_source == 'CRYPTO':
+        coin_symbol, currency = parse_crypto_symbol(symbol)
+        return await get_crypto_data_async(coin_symbol, start_dt, end_dt, currency.lower())
+
+    else:
+        raise ValueError(f"Unknown data source: {data_source}")
+
+
+def DataReaderMany(
+    symbols: Iterable[str],
+    start: Optional[Union[str, datetime]] = None,
+    end: Optional[Union[str, datetime]] = None,
+    data_source: Optional[str] = None,
+    cache=None,
+    output: str = 'panel',
+    max_workers: int = 8,
+    errors: str = 'warn'
+) -> Union[pd.DataFrame, SymbolFrames]:
+    """
+    여러 종목 동시 조회
+
+    종목별 DataReader 호출을 스레드 풀에서 동시에 실행합니다.
+    HTTP 연결은 호스트별 공유 세션 풀을, 요청 속도는 호스트별 제한기를 공유합니다.
+
+    Args:
+        symbols: 종목 코드 리스트 (소스 접두사 혼용 가능, 예: ['005930', 'YAHOO:AAPL'])
+        start: 시작일
+        end: 종료일
+        data_source: 데이터 소스 (None이면 종목별 자동 선택)
+        cache: 로컬 OHLCV 캐시 (DataReader와 동일)
+        output: 'panel' (컬럼 = (종목, 필드) MultiIndex) 또는 'dict' (종목별 DataFrame)
+        max_workers: 동시 조회 종목 수
+        errors: 실패 종목 처리
+            - 'warn': 실패 종목과 사유 출력 (기본)
+            - 'raise': DataReaderError 발생 (성공한 결과는 예외의 results에 포함)
+            - 'ignore': 출력 없음
+
+    Returns:
+        output='panel': 날짜 × (종목, 필드) DataFrame, 실패 사유는 panel.attrs['errors']
+        output='dict': SymbolFrames ({종목: DataFrame}, 실패 사유는 .errors)
+
+    Examples:
+        >>> import FinanceDataReader as fdr
+        >>> panel = fdr.DataReaderMany(['005930', '000660'], '2020')
+        >>> closes = panel.xs('Close', axis=1, level=1)
+        >>> frames = fdr.DataReaderMany(['AAPL', 'MSFT'], '2020', output='dict')
+        >>> frames.errors
+        {}
+    """
+    if output not in ('panel', 'dict'):
+        raise ValueError(f"Unknown output: {output}")
+    if errors not in ('warn', 'raise', 'ignore'):
+        raise ValueError(f"Unknown errors option: {errors}")
+
+    symbols = list(dict.fromkeys(symbols))
+
+    def read(symbol):
+        # 리더가 출력하는 경고를 종목별로 수집 (빈 결과의 실패 사유)
+        with collect_warnings() as messages:
+            try:
+                df = DataReader(symbol, start, end, data_source=data_source, cache=cache)
+            except Exception as e:
+                return symbol, None, str(e)
+
+        if df is None or df.empty:
+            return symbol, None, '; '.join(messages) or 'No data returned'
+        return symbol, df, None
+
+    frames: Dict[str, pd.DataFrame] = {}
+    failures: Dict[str, str] = {}
+
+    # 작업마다 context를 복사해 경고 수집이 서로 섞이지 않도록 함
+    contexts = [contextvars.copy_context() for _ in symbols]
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(symbols) or 1))) as executor:
+        for symbol, df, error in executor.map(lambda ctx, sym: ctx.run(read, sym), contexts, symbols):
+            if error is None:
+                frames[symbol] = df
+            else:
+                failures[symbol] = error
+
+    return _build_output(frames, failures, output, errors)
+
+
+def _build_output(
+    frames: Dict[str, pd.DataFrame],
+    failures: Dict[str, str],
+    output: str,
+    errors: str
+) -> Union[pd.DataFrame, SymbolFrames]:
+    """종목별 결과를 panel 또는 SymbolFrames로 변환 (실패 처리 포함)"""
+    if failures:
+        if errors == 'raise':
+            raise DataReaderError(failures, frames)
+        if errors == 'warn':
+            for symbol, message in failures.items():
+                print(f"Warning: {symbol} failed ({message})")
+
+    if output == 'dict':
+        return SymbolFrames(frames, failures)
+
+    if frames:
+        panel = pd.concat(frames, axis=1, sort=True)
+    else:
+        panel = pd.DataFrame(columns=pd.MultiIndex.from_tuples([], names=[None, None]))
+    panel.attrs['errors'] = failures
+    return panel
+
+
+async def DataReaderAsync(
+    symbol: Union[str, Iterable[str]],
+    start: Optional[Union[str, datetime]] = None,
+    end: Optional[Union[str, datetime]] = None,
+    data_source: Optional[str] = None,
+    cache: Union[None, bool, str, OHLCVCache] = None,
+    output: str = 'panel',
+    max_concurrency: int = 50,
+    errors: str = 'warn'
+) -> Union[pd.DataFrame, SymbolFrames]:
+    """
+    금융 데이터 조회 (asyncio 버전)
+
+    종목별 요청을 하나의 이벤트 루프에서 다중화합니다. 동시에 진행하는 종목 수는
+    max_concurrency로 제한하고, 요청 속도는 동기 경로와 같은 호스트별 제한기를 공유합니다.
+    aiohttp가 설치되어 있지 않으면 요청을 스레드에서 실행합니다 (결과는 동일).
+
+    Args:
+        symbol: 종목 코드 또는 종목 코드 리스트 (DataReader와 동일한 형식)
+        start: 시작일
+        end: 종료일
+        data_source: 데이터 소스 (None이면 종목별 자동 선택)
+        cache: 로컬 OHLCV 캐시 (DataReader와 동일)
+        output: 리스트 조회 시 'panel' 또는 'dict' (DataReaderMany와 동일)
+        max_concurrency: 동시 조회 종목 수 (연결 풀 크기도 이 값으로 제한)
+        errors: 리스트 조회 시 실패 종목 처리 ('warn', 'raise', 'ignore')
+
+    Returns:
+        symbol이 문자열이면 DataFrame, 리스트면 DataReaderMany와 같은 형식
+
+    Examples:
+        >>> import asyncio
+        >>> import FinanceDataReader as fdr
+        >>> df = asyncio.run(fdr.DataReaderAsync('005930', '2020'))
+        >>> panel = asyncio.run(fdr.DataReaderAsync(tickers, '2020', max_concurrency=100))
+    """
+    if output not in ('panel', 'dict'):
+        raise ValueError(f"Unknown output: {output}")
+    if errors not in ('warn', 'raise', 'ignore'):
+        raise ValueError(f"Unknown errors option: {errors}")
+
+    cache = resolve_cache(cache)
+
+    async def read(sym):
+        source, sym_code, start_dt, end_dt = _resolve_request(sym, start, end, data_source)
+        if cache is None:
+            return await _fetch_data_async(source, sym_code, start_dt, end_dt)
+        return await cache.read_async(
+            source,
+            sym_code,
+            start_dt,
+            end_dt,
+            lambda fetch_start, fetch_end: _fetch_data_async(source, sym_code, fetch_start, fetch_end)
+        )
+
+    async with async_session(limit=max(1, max_concurrency)):
+        if isinstance(symbol, str):
+            return await read(symbol)
+
+        symbols = list(dict.fromkeys(symbol))
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+        async def read_one(sym):
+            # 태스크마다 context가 복사되므로 경고 수집이 종목별로 분리됨
+            async with semaphore:
+                with collect_warnings() as messages:
+                    try:
+                        df = await read(sym)
+                    except Exception as e:
+                        return sym, None, str(e)
+
+            if df is None or df.empty:
+                return sym, None, '; '.join(messages) or 'No data returned'
+            return sym, df, None
+
+        results = await asyncio.gather(*(read_one(sym) for sym in symbols))
+
+    frames: Dict[str, pd.DataFrame] = {}
+    failures: Dict[str, str] = {}
+    for sym, df, error in results:
+        if error is None:
+            frames[sym] = df
+        else:
+            failures[sym] = error
+
+    return _build_output(frames, failures, output, errors)
+
+
 def StockListing(market: str = 'KRX') -> pd.DataFrame:
     """
     거래소 종목 목록 조회
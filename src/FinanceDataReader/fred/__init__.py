@@ -1,5 +1,5 @@
 """FRED 경제 데이터 소스"""
 
-from .data import get_fred_data
+from .data import get_fred_data, get_fred_data_async
 
-__all__ = ['get_fred_data']
+__all__ = ['get_fred_data', 'get_fred_data_async']
@@ -3,13 +3,54 @@
 import pandas as pd
 from datetime import datetime
 from typing import Optional
-from ..utils import get_request, create_session
+from ..utils import get_request, get_request_async, report_warning
 
 
 # FRED API (API 키 필요)
 FRED_API_URL = "https://api.stlouisfed.org/fred/series/observations"
 
 
+def _fred_params(series_id: str, start: datetime, end: datetime, api_key: str) -> dict:
+    """FRED observations API 요청 파라미터"""
+    return {
+        'series_id': series_id,
+        'observation_start': start.strftime('%Y-%m-%d'),
+        'observation_end': end.strftime('%Y-%m-%d'),
+        'api_key': api_key,
+        'file_type': 'json'
+    }
+
+
+def _parse_fred_data(text: str, series_id: str) -> pd.DataFrame:
+    """FRED 응답(JSON) → 경제 지표 DataFrame (동기/비동기 공용)"""
+    import json
+    data = json.loads(text)
+
+    if 'observations' not in data:
+        return pd.DataFrame()
+
+    # DataFrame 변환
+    df = pd.DataFrame(data['observations'])
+
+    # Date 컬럼 처리
+    df['date'] = pd.to_datetime(df['date'])
+    df = df.set_index('date')
+
+    # Value 컬럼 변환
+    df['value'] = pd.to_numeric(df['value'], errors='coerce')
+
+    # 컬럼명 정규화
+    df = df.rename(columns={'value': series_id})
+
+    # 필요한 컬럼만 선택
+    df = df[[series_id]]
+
+    # NaN 제거
+    df = df.dropna()
+
+    return df
+
+
 def get_fred_data(
     series_id: str,
     start: datetime,
@@ -33,50 +74,48 @@ def get_fred_data(
         FRED API 키는 https://fred.stlouisfed.org/docs/api/api_key.html 에서 발급
     """
     if not api_key:
-        print("Warning: FRED API key not provided. Using sample data.")
+        report_warning("Warning: FRED API key not provided. Using sample data.")
         return _get_sample_fred_data(series_id, start, end)
 
     try:
-        params = {
-            'series_id': series_id,
-            'observation_start': start.strftime('%Y-%m-%d'),
-            'observation_end': end.strftime('%Y-%m-%d'),
-            'api_key': api_key,
-            'file_type': 'json'
-        }
+        response = get_request(FRED_API_URL, params=_fred_params(series_id, start, end, api_key))
 
-        session = create_session()
-        response = get_request(FRED_API_URL, params=params, session=session)
+        return _parse_fred_data(response.text, series_id)
 
-        import json
-        data = json.loads(response.text)
-
-        if 'observations' not in data:
-            return pd.DataFrame()
-
-        # DataFrame 변환
-        df = pd.DataFrame(data['observations'])
+    except Exception as e:
+        report_warning(f"Warning: FRED API failed for {series_id} ({e})")
+        return _get_sample_fred_data(series_id, start, end)
 
-        # Date 컬럼 처리
-        df['date'] = pd.to_datetime(df['date'])
-        df = df.set_index('date')
 
-        # Value 컬럼 변환
-        df['value'] = pd.to_numeric(df['value'], errors='coerce')
+async def get_fred_data_async(
+    series_id: str,
+    start: datetime,
+    end: datetime,
+    api_key: Optional[str] = None
+) -> pd.DataFrame:
+    """
+    FRED에서 경제 지표 데이터 조회 (asyncio 버전, 결과는 get_fred_data와 동일)
 
-        # 컬럼명 정규화
-        df = df.rename(columns={'value': series_id})
+    Args:
+        series_id: FRED 시리즈 ID (예: 'GDP', 'UNRATE', 'DGS10')
+        start: 시작일
+        end: 종료일
+        api_key: FRED API 키 (없으면 제한된 접근)
 
-        # 필요한 컬럼만 선택
-        df = df[[series_id]]
+    Returns:
+        경제 데이터 DataFrame
+    """
+    if not api_key:
+        report_warning("Warning: FRED API key not provided. Using sample data.")
+        return _get_sample_fred_data(series_id, start, end)
 
-        # NaN 제거
-        df = df.dropna()
+    try:
+        response = await get_request_async(FRED_API_URL, params=_fred_params(series_id, start, end, api_key))
 
-        return df
+        return _parse_fred_data(response.text, series_id)
 
     except Exception as e:
-        print(f"Warning: FRED API failed for {series_id} ({e})")
+        report_warning(f"Warning: FRED API failed for {series_id} ({e})")
         return _get_sample_fred_data(series_id, start, end)
 
 
@@ -6,7 +6,12 @@ from .listing import (
     get_kosdaq_listing,
     get_konex_listing,
 )
-from .data import get_krx_data, fetch_krx_stock_data
+from .data import (
+    get_krx_data,
+    fetch_krx_stock_data,
+    get_krx_data_async,
+    fetch_krx_stock_data_async,
+)
 
 __all__ = [
     'get_krx_stock_listing',
@@ -15,4 +20,6 @@ __all__ = [
     'get_konex_listing',
     'get_krx_data',
     'fetch_krx_stock_data',
+    'get_krx_data_async',
+    'fetch_krx_stock_data_async',
 ]
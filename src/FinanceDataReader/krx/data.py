@@ -1,16 +1,114 @@
 """KRX 주가 데이터 조회"""
 
+import asyncio
 import pandas as pd
 import json
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Optional
-from ..utils import get_request, post_request, create_session, date_to_str_krx, get_date_chunks
+from ..utils import (
+    get_request,
+    post_request,
+    get_request_async,
+    post_request_async,
+    date_to_str_krx,
+    get_date_chunks,
+    report_warning,
+    set_host_defaults,
+)
+from .decode import DATE, FLOAT, INT, decode_records, find_records
 
 
 # KRX API 엔드포인트
 KRX_STOCK_URL = "http://data.krx.co.kr/comm/bldAttendant/getJsonData.cmd"
 KRX_OTP_URL = "http://data.krx.co.kr/comm/fileDn/GenerateOTP/generate.cmd"
 
+# KRX 호스트 요청 속도 (청크 병렬 조회가 순차 조회보다 느려지지 않도록 기본값보다 높게 시작,
+# 429 응답 시 자동 감속)
+KRX_RATE_LIMITS = {'rate': 10.0, 'burst': 10.0, 'max_rate': 50.0}
+set_host_defaults(KRX_STOCK_URL, **KRX_RATE_LIMITS)
+
+
+# 데이터 요청 헤더
+KRX_HEADERS = {
+    'Referer': 'http://data.krx.co.kr/contents/MDC/MDI/mdiLoader',
+    'User-Agent': 'Mozilla/5.0'
+}
+
+
+def _krx_otp_params(stock_code: str, start_date: str, end_date: str) -> dict:
+    """OTP 발급 요청 파라미터"""
+    return {
+        'locale': 'ko_KR',
+        'isuCd': stock_code,
+        'strtDd': start_date,
+        'endDd': end_date,
+        'share': '1',
+        'money': '1',
+        'csvxls_isNo': 'false',
+        'name': 'fileDown',
+        'url': 'dbms/MDC/STAT/standard/MDCSTAT01701'
+    }
+
+
+def _krx_data_form(otp: str, stock_code: str, start_date: str, end_date: str) -> dict:
+    """OTP로 데이터를 요청하는 form 데이터"""
+    return {
+        'code': otp,
+        'isuCd': stock_code,
+        'strtDd': start_date,
+        'endDd': end_date,
+        'share': '1',
+        'money': '1',
+        'csvxls_isNo': 'false'
+    }
+
+
+# KRX 필드 → (컬럼명, 형식)
+KRX_PRICE_FIELDS = {
+    'TRD_DD': ('Date', DATE),
+    'TDD_CLSPRC': ('Close', FLOAT),
+    'TDD_OPNPRC': ('Open', FLOAT),
+    'TDD_HGPRC': ('High', FLOAT),
+    'TDD_LWPRC': ('Low', FLOAT),
+    'ACC_TRDVOL': ('Volume', INT),
+    'ACC_TRDVAL': ('Amount', INT),
+    'FLUC_RT': ('Change', FLOAT),
+    'CMPPREVDD_PRC': ('ChgAmount', FLOAT),
+}
+
+
+def _parse_krx_data(text: str, stock_code: str) -> pd.DataFrame:
+    """KRX 응답(JSON) → 주가 DataFrame (동기/비동기 공용)"""
+    # JSON 파싱
+    records = find_records(json.loads(text))
+
+    if records is None:
+        raise ValueError(f"No data found in response for {stock_code}")
+
+    # 숫자 필드는 쉼표 제거 후 바로 float64/int64 배열로 변환
+    df = decode_records(records, KRX_PRICE_FIELDS)
+
+    if df.empty:
+        return pd.DataFrame()
+
+    # Date 컬럼 처리
+    if 'Date' in df.columns:
+        df = df.set_index('Date')
+
+    # OHLCV 순서로 정렬
+    ohlcv_cols = ['Open', 'High', 'Low', 'Close', 'Volume']
+    available_cols = [col for col in ohlcv_cols if col in df.columns]
+    other_cols = [col for col in df.columns if col not in ohlcv_cols]
+
+    df = df[available_cols + other_cols]
+
+    # 날짜순 정렬
+    df = df.sort_index()
+
+    return df
+
 
 def get_krx_price_otp(
     stock_code: str,
@@ -28,20 +126,7 @@ def get_krx_price_otp(
     Returns:
         OTP 문자열
     """
-    params = {
-        'locale': 'ko_KR',
-        'isuCd': stock_code,
-        'strtDd': start_date,
-        'endDd': end_date,
-        'share': '1',
-        'money': '1',
-        'csvxls_isNo': 'false',
-        'name': 'fileDown',
-        'url': 'dbms/MDC/STAT/standard/MDCSTAT01701'
-    }
-
-    session = create_session()
-    response = get_request(KRX_OTP_URL, params=params, session=session)
+    response = get_request(KRX_OTP_URL, params=_krx_otp_params(stock_code, start_date, end_date))
 
     return response.text
 
@@ -75,121 +160,62 @@ def fetch_krx_stock_data(
         otp = get_krx_price_otp(stock_code, start_str, end_str)
 
         # Step 2: OTP로 데이터 요청
-        data = {
-            'code': otp,
-            'isuCd': stock_code,
-            'strtDd': start_str,
-            'endDd': end_str,
-            'share': '1',
-            'money': '1',
-            'csvxls_isNo': 'false'
-        }
-
-        session = create_session()
-        headers = {
-            'Referer': 'http://data.krx.co.kr/contents/MDC/MDI/mdiLoader',
-            'User-Agent': 'Mozilla/5.0'
-        }
-
         response = post_request(
             KRX_STOCK_URL,
-            data=data,
-            headers=headers,
-            session=session
+            data=_krx_data_form(otp, stock_code, start_str, end_str),
+            headers=KRX_HEADERS
         )
 
-        # JSON 파싱
-        result = json.loads(response.text)
-
-        # DataFrame 변환
-        if 'output' in result:
-            df = pd.DataFrame(result['output'])
-        elif 'OutBlock_1' in result:
-            df = pd.DataFrame(result['OutBlock_1'])
-        else:
-            # 응답에서 리스트 찾기
-            for key, value in result.items():
-                if isinstance(value, list) and len(value) > 0:
-                    df = pd.DataFrame(value)
-                    break
-            else:
-                raise ValueError(f"No data found in response for {stock_code}")
-
-        if df.empty:
-            return pd.DataFrame()
-
-        # 컬럼명 정규화
-        column_map = {
-            'TRD_DD': 'Date',
-            'TDD_CLSPRC': 'Close',
-            'TDD_OPNPRC': 'Open',
-            'TDD_HGPRC': 'High',
-            'TDD_LWPRC': 'Low',
-            'ACC_TRDVOL': 'Volume',
-            'ACC_TRDVAL': 'Amount',
-            'FLUC_RT': 'Change',
-            'CMPPREVDD_PRC': 'ChgAmount',
-        }
-
-        df = df.rename(columns=column_map)
-
-        # Date 컬럼 처리
-        if 'Date' in df.columns:
-            df['Date'] = pd.to_datetime(df['Date'], format='%Y/%m/%d', errors='coerce')
-            df = df.set_index('Date')
-
-        # 숫자형 컬럼 변환
-        numeric_columns = ['Open', 'High', 'Low', 'Close', 'Volume', 'Amount', 'Change']
-        for col in numeric_columns:
-            if col in df.columns:
-                # 쉼표 제거 후 숫자 변환
-                df[col] = df[col].astype(str).str.replace(',', '').astype(float)
-
-        # OHLCV 순서로 정렬
-        ohlcv_cols = ['Open', 'High', 'Low', 'Close', 'Volume']
-        available_cols = [col for col in ohlcv_cols if col in df.columns]
-        other_cols = [col for col in df.columns if col not in ohlcv_cols]
-
-        df = df[available_cols + other_cols]
-
-        # 날짜순 정렬
-        df = df.sort_index()
-
-        return df
+        return _parse_krx_data(response.text, stock_code)
 
     except Exception as e:
-        print(f"Warning: KRX API failed for {stock_code} ({e})")
+        report_warning(f"Warning: KRX API failed for {stock_code} ({e})")
         return pd.DataFrame()
 
 
-def get_krx_data(
+async def fetch_krx_stock_data_async(
     stock_code: str,
     start: datetime,
     end: datetime
 ) -> pd.DataFrame:
     """
-    KRX 데이터 조회 (청크 단위로 분할하여 조회)
-
-    KRX는 한 번에 2년치 데이터만 조회 가능하므로 청크로 분할
+    KRX에서 주가 데이터 조회 (asyncio 버전, 결과는 fetch_krx_stock_data와 동일)
 
     Args:
-        stock_code: 종목 코드
+        stock_code: 종목 코드 (6자리, 예: '005930')
         start: 시작일
         end: 종료일
 
     Returns:
-        전체 기간 주가 데이터 DataFrame
+        주가 데이터 DataFrame
     """
-    # 2년 단위로 청크 분할
-    chunks = get_date_chunks(start, end, chunk_years=2)
+    stock_code = stock_code.zfill(6)
+
+    start_str = date_to_str_krx(start)
+    end_str = date_to_str_krx(end)
 
-    all_data = []
+    try:
+        otp_response = await get_request_async(
+            KRX_OTP_URL,
+            params=_krx_otp_params(stock_code, start_str, end_str)
+        )
+
+        response = await post_request_async(
+            KRX_STOCK_URL,
+            data=_krx_data_form(otp_response.text, stock_code, start_str, end_str),
+            headers=KRX_HEADERS
+        )
+
+        return _parse_krx_data(response.text, stock_code)
+
+    except Exception as e:
+        report_warning(f"Warning: KRX API failed for {stock_code} ({e})")
+        return pd.DataFrame()
 
-    for chunk_start, chunk_end in chunks:
-        df_chunk = fetch_krx_stock_data(stock_code, chunk_start, chunk_end)
 
-        if not df_chunk.empty:
-            all_data.append(df_chunk)
+def _merge_krx_chunks(results) -> pd.DataFrame:
+    """청크별 결과 병합 (입력 순서 = 날짜 순서)"""
+    all_data = [df_chunk for df_chunk in results if not df_chunk.empty]
 
     if not all_data:
         return pd.DataFrame()
@@ -204,3 +230,73 @@ def get_krx_data(
     df = df.sort_index()
 
     return df
+
+
+def get_krx_data(
+    stock_code: str,
+    start: datetime,
+    end: datetime,
+    max_workers: int = 4
+) -> pd.DataFrame:
+    """
+    KRX 데이터 조회 (청크 단위로 분할하여 조회)
+
+    KRX는 한 번에 2년치 데이터만 조회 가능하므로 청크로 분할하고,
+    청크마다 필요한 OTP 발급 + 데이터 요청을 여러 청크에 대해 동시에 수행
+
+    Args:
+        stock_code: 종목 코드
+        start: 시작일
+        end: 종료일
+        max_workers: 동시 조회 청크 수
+
+    Returns:
+        전체 기간 주가 데이터 DataFrame
+    """
+    # 2년 단위로 청크 분할
+    chunks = get_date_chunks(start, end, chunk_years=2)
+
+    def fetch(chunk):
+        return fetch_krx_stock_data(stock_code, chunk[0], chunk[1])
+
+    if len(chunks) <= 1 or max_workers <= 1:
+        results = [fetch(chunk) for chunk in chunks]
+    else:
+        # map은 입력 순서대로 결과를 돌려주므로 청크 순서 유지
+        # 작업 스레드에도 호출자의 context(경고 수집 등)를 전달
+        contexts = [contextvars.copy_context() for _ in chunks]
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(chunks))) as executor:
+            results = list(executor.map(lambda ctx, chunk: ctx.run(fetch, chunk), contexts, chunks))
+
+    return _merge_krx_chunks(results)
+
+
+async def get_krx_data_async(
+    stock_code: str,
+    start: datetime,
+    end: datetime,
+    max_concurrency: int = 4
+) -> pd.DataFrame:
+    """
+    KRX 데이터 조회 (asyncio 버전, 청크를 이벤트 루프에서 동시에 조회)
+
+    Args:
+        stock_code: 종목 코드
+        start: 시작일
+        end: 종료일
+        max_concurrency: 동시 조회 청크 수
+
+    Returns:
+        전체 기간 주가 데이터 DataFrame
+    """
+    chunks = get_date_chunks(start, end, chunk_years=2)
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+    async def fetch(chunk):
+        async with semaphore:
+            return await fetch_krx_stock_data_async(stock_code, chunk[0], chunk[1])
+
+    # gather는 입력 순서대로 결과를 돌려주므로 청크 순서 유지
+    results = await asyncio.gather(*(fetch(chunk) for chunk in chunks))
+
+    return _merge_krx_chunks(results)
@@ -0,0 +1,109 @@
+"""KRX JSON 응답 디코딩
+
+KRX 정보데이터시스템은 모든 값을 문자열로 보내고 숫자에는 천 단위 쉼표가 붙습니다
+(예: "1,234,500"). 레코드 dict 리스트로 DataFrame을 만든 뒤 컬럼마다
+astype(str).str.replace(',', '').astype(float)를 하는 대신, 필요한 필드만
+컬럼 리스트로 모아 쉼표를 한 번에 제거하고 바로 float64/int64 배열로 변환합니다.
+"""
+
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+# 필드 형식
+FLOAT = 'float'   # float64 (가격, 등락률)
+INT = 'int'       # int64 (거래량, 거래대금, 주식수, 시가총액 - 빈 값이 있으면 float64)
+DATE = 'date'     # datetime64 (YYYY/MM/DD)
+STR = 'str'       # 문자열 그대로
+
+_FIELD_SEP = '\t'
+
+
+def find_records(result: Dict[str, Any]) -> Optional[List[Dict[str, Any]]]:
+    """
+    응답 JSON에서 레코드 리스트 찾기
+
+    Returns:
+        레코드 리스트 (output → OutBlock_1 → 첫 번째 비어있지 않은 리스트 순, 없으면 None)
+    """
+    if 'output' in result:
+        return result['output']
+    if 'OutBlock_1' in result:
+        return result['OutBlock_1']
+
+    for value in result.values():
+        if isinstance(value, list) and len(value) > 0:
+            return value
+    return None
+
+
+def decode_numbers(values: List[Any], kind: str = FLOAT) -> np.ndarray:
+    """
+    쉼표 포함 숫자 문자열 리스트 → float64 / int64 배열
+
+    Args:
+        values: 값 리스트 (예: ['1,234', '-', '56.7'])
+        kind: FLOAT 또는 INT (INT인데 빈 값/소수가 있으면 float64 반환)
+
+    Returns:
+        숫자 배열 (빈 값 '-', '' 등 변환할 수 없는 값은 NaN)
+    """
+    dtype = np.int64 if kind == INT else np.float64
+
+    try:
+        # 구분자로 이어 붙인 뒤 쉼표를 한 번에 제거 (값마다 replace 호출하지 않음)
+        cleaned = _FIELD_SEP.join(values).replace(',', '').split(_FIELD_SEP)
+        return np.array(cleaned, dtype=dtype)
+    except (TypeError, ValueError, OverflowError):
+        pass
+
+    # 빈 값('-', '', None)이나 잘못된 값이 섞인 경우
+    numbers = pd.to_numeric(
+        pd.Series(values, dtype=object).astype(str).str.replace(',', '', regex=False),
+        errors='coerce'
+    ).to_numpy(dtype=np.float64)
+
+    if kind == INT and not np.isnan(numbers).any() and (numbers == np.floor(numbers)).all():
+        return numbers.astype(np.int64)
+    return numbers
+
+
+def decode_records(
+    records: List[Dict[str, Any]],
+    fields: Dict[str, Tuple[str, str]],
+    keep_other: bool = True
+) -> pd.DataFrame:
+    """
+    KRX 레코드 리스트 → 컬럼 형식이 지정된 DataFrame
+
+    Args:
+        records: 응답 레코드 리스트
+        fields: {KRX 필드명: (컬럼명, 형식)} - 형식은 FLOAT, INT, DATE, STR
+        keep_other: fields에 없는 필드도 문자열 컬럼으로 유지할지 여부
+
+    Returns:
+        DataFrame (컬럼 순서는 첫 레코드의 필드 순서)
+    """
+    if not records:
+        return pd.DataFrame()
+
+    columns = {}
+    for key in records[0]:
+        if key not in fields:
+            if keep_other:
+                columns[key] = [record.get(key) for record in records]
+            continue
+
+        name, kind = fields[key]
+        values = [record.get(key) for record in records]
+
+        if kind in (FLOAT, INT):
+            columns[name] = decode_numbers(values, kind)
+        elif kind == DATE:
+            columns[name] = pd.to_datetime(pd.Series(values, dtype=object), format='%Y/%m/%d', errors='coerce')
+        else:
+            columns[name] = values
+
+    return pd.DataFrame(columns)
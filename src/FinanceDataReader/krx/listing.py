@@ -3,13 +3,28 @@
 import pandas as pd
 import json
 from typing import Optional
-from ..utils import get_request, post_request, create_session
+from ..utils import get_request, post_request
+from .decode import FLOAT, INT, STR, decode_records
 
 
 # KRX 정보데이터시스템 API
 KRX_STOCK_LISTING_URL = "http://data.krx.co.kr/comm/bldAttendant/getJsonData.cmd"
 KRX_OTP_URL = "http://data.krx.co.kr/comm/fileDn/GenerateOTP/generate.cmd"
 
+# KRX 필드 → (컬럼명, 형식)
+KRX_LISTING_FIELDS = {
+    'ISU_SRT_CD': ('Code', STR),
+    'ISU_ABBRV': ('Name', STR),
+    'ISU_CD': ('FullCode', STR),
+    'MKT_NM': ('Market', STR),
+    'SECT_TP_NM': ('Sector', STR),
+    'KIND_STKCERT_TP_NM': ('Type', STR),
+    'LIST_DD': ('ListingDate', STR),
+    'TDD_CLSPRC': ('Close', FLOAT),
+    'LIST_SHRS': ('Shares', INT),
+    'MKTCAP': ('MarketCap', INT),
+}
+
 
 def get_krx_otp(
     mkt_id: str = 'ALL',
@@ -36,8 +51,7 @@ def get_krx_otp(
         'url': 'dbms/MDC/STAT/standard/MDCSTAT01901'
     }
 
-    session = create_session()
-    response = get_request(KRX_OTP_URL, params=params, session=session)
+    response = get_request(KRX_OTP_URL, params=params)
 
     return response.text
 
@@ -79,7 +93,6 @@ def get_krx_stock_listing(market: str = 'ALL') -> pd.DataFrame:
             'csvxls_isNo': 'false'
         }
 
-        session = create_session()
         headers = {
             'Referer': 'http://data.krx.co.kr/contents/MDC/MDI/mdiLoader',
             'User-Agent': 'Mozilla/5.0'
@@ -88,41 +101,23 @@ def get_krx_stock_listing(market: str = 'ALL') -> pd.DataFrame:
         response = post_request(
             KRX_STOCK_LISTING_URL,
             data=data,
-            headers=headers,
-            session=session
+            headers=headers
         )
 
         # JSON 파싱
         result = json.loads(response.text)
+        records = result['OutBlock_1'] if 'OutBlock_1' in result else result.get('output', [])
 
-        # DataFrame 변환
-        if 'OutBlock_1' in result:
-            df = pd.DataFrame(result['OutBlock_1'])
-        else:
-            # 대체 키 확인
-            df = pd.DataFrame(result.get('output', []))
+        # 필요한 필드만 컬럼으로 변환 (숫자 필드는 float64/int64, 알려진 필드가 없으면 전체 유지)
+        keep_other = bool(records) and not any(key in KRX_LISTING_FIELDS for key in records[0])
+        df = decode_records(records, KRX_LISTING_FIELDS, keep_other=keep_other)
 
         if df.empty:
             raise ValueError(f"No data found for market: {market}")
 
-        # 컬럼명 정규화
-        column_map = {
-            'ISU_SRT_CD': 'Code',
-            'ISU_ABBRV': 'Name',
-            'ISU_CD': 'FullCode',
-            'MKT_NM': 'Market',
-            'SECT_TP_NM': 'Sector',
-            'KIND_STKCERT_TP_NM': 'Type',
-            'LIST_DD': 'ListingDate',
-            'TDD_CLSPRC': 'Close',
-            'LIST_SHRS': 'Shares',
-            'MKTCAP': 'MarketCap',
-        }
-
-        df = df.rename(columns=column_map)
-
         # 필요한 컬럼만 선택 (존재하는 컬럼만)
-        available_columns = [col for col in column_map.values() if col in df.columns]
+        column_order = [name for name, _ in KRX_LISTING_FIELDS.values()]
+        available_columns = [col for col in column_order if col in df.columns]
         if available_columns:
             df = df[available_columns]
 
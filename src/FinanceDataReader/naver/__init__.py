@@ -1,11 +1,18 @@
 """네이버 금융 데이터 소스"""
 
 from .listing import get_naver_stock_listing, get_naver_etf_listing
-from .data import get_naver_data, get_naver_index_data
+from .data import (
+    get_naver_data,
+    get_naver_index_data,
+    get_naver_data_async,
+    get_naver_index_data_async,
+)
 
 __all__ = [
     'get_naver_stock_listing',
     'get_naver_etf_listing',
     'get_naver_data',
     'get_naver_index_data',
+    'get_naver_data_async',
+    'get_naver_index_data_async',
 ]
@@ -1,16 +1,133 @@
 """네이버 금융 주가 데이터 조회"""
 
+import io
+import re
+import numpy as np
 import pandas as pd
 from datetime import datetime
-from bs4 import BeautifulSoup
-from typing import Optional
-from ..utils import get_request, create_session, date_to_str_yahoo
+from typing import List, Optional, Tuple
+from ..utils import get_request, get_request_async, date_to_str_yahoo, report_warning, DATETIME_UNIT
 
 
 # 네이버 금융 API
 NAVER_FINANCE_API_URL = "https://fchart.stock.naver.com/sise.nhn"
 
 
+def _naver_params(stock_code: str, start: datetime, end: datetime) -> dict:
+    """네이버 금융 차트 API 요청 파라미터"""
+    return {
+        'symbol': stock_code,
+        'requestType': 1,  # 일봉
+        'startTime': start.strftime('%Y%m%d'),
+        'endTime': end.strftime('%Y%m%d'),
+        'timeframe': 'day'
+    }
+
+
+# <item data="날짜|시가|고가|저가|종가|거래량" /> 의 data 속성
+_ITEM_DATA_RE = re.compile(r'<item\s+data="([^"]*)"')
+_ITEM_RE = re.compile(r'<item[\s/>]')
+
+NAVER_FIELDS = ['Date', 'Open', 'High', 'Low', 'Close', 'Volume']
+
+
+def _yyyymmdd_to_datetime(values: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    YYYYMMDD 정수 배열 → (datetime64 배열, 유효 여부)
+
+    월/일이 범위를 벗어나거나 존재하지 않는 날짜(2월 30일 등)는 무효로 표시합니다.
+    """
+    year, month, day = values // 10000, values // 100 % 100, values % 100
+    valid = (month >= 1) & (month <= 12) & (day >= 1) & (day <= 31)
+
+    months = np.where(valid, (year - 1970) * 12 + month - 1, 0).astype('datetime64[M]')
+    dates = months.astype('datetime64[D]') + np.where(valid, day - 1, 0).astype('timedelta64[D]')
+
+    # 말일을 넘긴 날짜는 다음 달로 넘어가므로 월이 바뀌었는지로 확인
+    valid &= dates.astype('datetime64[M]') == months
+    return dates.astype(f'datetime64[{DATETIME_UNIT}]'), valid
+
+
+def _split_naver_items(rows: List[str]) -> np.ndarray:
+    """data 문자열 → N × 6 float 배열 (필드 부족/숫자 아님은 NaN)"""
+    table = np.full((len(rows), len(NAVER_FIELDS)), np.nan)
+    for i, row in enumerate(rows):
+        fields = row.split('|')
+        if len(fields) < len(NAVER_FIELDS):
+            continue
+        for j, field in enumerate(fields[:len(NAVER_FIELDS)]):
+            try:
+                table[i, j] = float(field)
+            except ValueError:
+                pass
+    return table
+
+
+def _decode_naver_items(rows: List[str]) -> pd.DataFrame:
+    """
+    data 속성 문자열 목록 → 주가 DataFrame
+
+    한 번에 CSV 파서('|' 구분)로 숫자 배열을 만들고 날짜는 정수 연산으로 변환합니다.
+    형식이 어긋난 행이 있으면 행 단위로 나눠 해당 행만 제외합니다
+    (기존 파서와 동일하게 파싱 실패 행은 스킵).
+    """
+    try:
+        table = pd.read_csv(
+            io.StringIO('\n'.join(rows)), sep='|', header=None, dtype=np.float64
+        ).to_numpy()
+        if table.shape != (len(rows), len(NAVER_FIELDS)):
+            raise ValueError('unexpected field count')
+    except ValueError:
+        table = _split_naver_items(rows)
+
+    dates, valid = _yyyymmdd_to_datetime(np.nan_to_num(table[:, 0]).astype(np.int64))
+    volumes = table[:, 5]
+    valid &= (
+        ~np.isnan(table).any(axis=1)
+        & (table[:, 0] == np.floor(table[:, 0]))
+        & (volumes == np.floor(volumes))
+    )
+
+    if not valid.all():
+        dates, table = dates[valid], table[valid]
+
+    df = pd.DataFrame(table[:, 1:5], index=pd.DatetimeIndex(dates, name='Date'), columns=NAVER_FIELDS[1:5])
+    df['Volume'] = table[:, 5].astype(np.int64)
+    return df
+
+
+def _parse_naver_data(
+    text: str,
+    stock_code: str,
+    start: datetime,
+    end: datetime
+) -> pd.DataFrame:
+    """
+    네이버 금융 차트 API 응답(XML) → 주가 DataFrame (동기/비동기 공용)
+
+    응답은 <item data="..."/> 태그의 나열이므로 XML 트리를 만들지 않고
+    정규식으로 data 속성만 추출한 뒤 열 단위로 한 번에 변환합니다.
+    """
+    rows = _ITEM_DATA_RE.findall(text)
+
+    if not rows:
+        if _ITEM_RE.search(text) is None:
+            report_warning(f"No data found for {stock_code}")
+        return pd.DataFrame()
+
+    df = _decode_naver_items(rows)
+
+    if df.empty:
+        return pd.DataFrame()
+
+    df = df.sort_index()
+
+    # 날짜 범위 필터링
+    df = df[(df.index >= start) & (df.index <= end)]
+
+    return df
+
+
 def get_naver_data(
     stock_code: str,
     start: datetime,
@@ -33,75 +150,44 @@ def get_naver_data(
 
     try:
         # 네이버 금융 차트 API 사용
-        params = {
-            'symbol': stock_code,
-            'requestType': 1,  # 일봉
-            'startTime': start.strftime('%Y%m%d'),
-            'endTime': end.strftime('%Y%m%d'),
-            'timeframe': 'day'
-        }
-
-        session = create_session()
         response = get_request(
             NAVER_FINANCE_API_URL,
-            params=params,
-            session=session
+            params=_naver_params(stock_code, start, end)
         )
+        return _parse_naver_data(response.text, stock_code, start, end)
 
-        # XML 파싱
-        soup = BeautifulSoup(response.text, 'lxml')
+    except Exception as e:
+        report_warning(f"Warning: Naver API failed for {stock_code} ({e})")
+        return pd.DataFrame()
 
-        # 데이터 추출
-        items = soup.find_all('item')
 
-        if not items:
-            print(f"No data found for {stock_code}")
-            return pd.DataFrame()
+async def get_naver_data_async(
+    stock_code: str,
+    start: datetime,
+    end: datetime
+) -> pd.DataFrame:
+    """
+    네이버 금융에서 주가 데이터 조회 (asyncio 버전, 결과는 get_naver_data와 동일)
 
-        data_list = []
-        for item in items:
-            try:
-                # item의 data 속성: 날짜|시가|고가|저가|종가|거래량
-                data = item.get('data', '').split('|')
-
-                if len(data) >= 6:
-                    date_str = data[0]
-                    open_price = float(data[1])
-                    high_price = float(data[2])
-                    low_price = float(data[3])
-                    close_price = float(data[4])
-                    volume = int(data[5])
-
-                    # 날짜 파싱 (YYYYMMDD)
-                    date = datetime.strptime(date_str, '%Y%m%d')
-
-                    data_list.append({
-                        'Date': date,
-                        'Open': open_price,
-                        'High': high_price,
-                        'Low': low_price,
-                        'Close': close_price,
-                        'Volume': volume
-                    })
-            except (ValueError, IndexError) as e:
-                # 파싱 실패한 항목은 스킵
-                continue
-
-        if not data_list:
-            return pd.DataFrame()
-
-        # DataFrame 생성
-        df = pd.DataFrame(data_list)
-        df = df.set_index('Date')
-        df = df.sort_index()
-
-        # 날짜 범위 필터링
-        df = df[(df.index >= start) & (df.index <= end)]
-
-        return df
+    Args:
+        stock_code: 종목 코드 (6자리, 예: '005930')
+        start: 시작일
+        end: 종료일
+
+    Returns:
+        주가 데이터 DataFrame
+    """
+    stock_code = stock_code.zfill(6)
+
+    try:
+        response = await get_request_async(
+            NAVER_FINANCE_API_URL,
+            params=_naver_params(stock_code, start, end)
+        )
+        return _parse_naver_data(response.text, stock_code, start, end)
 
     except Exception as e:
-        print(f"Warning: Naver API failed for {stock_code} ({e})")
+        report_warning(f"Warning: Naver API failed for {stock_code} ({e})")
         return pd.DataFrame()
 
 
@@ -131,3 +217,12 @@ def get_naver_index_data(
 
     # 지수는 일반 종목과 동일한 API 사용
     return get_naver_data(index_code, start, end)
+
+
+async def get_naver_index_data_async(
+    index_code: str,
+    start: datetime,
+    end: datetime
+) -> pd.DataFrame:
+    """네이버 금융에서 지수 데이터 조회 (asyncio 버전)"""
+    return await get_naver_data_async(index_code, start, end)
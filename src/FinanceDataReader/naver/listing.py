@@ -3,7 +3,7 @@
 import pandas as pd
 from bs4 import BeautifulSoup
 from typing import Optional
-from ..utils import get_request, create_session
+from ..utils import get_request
 
 
 # 네이버 금융 URL
@@ -8,13 +8,32 @@ from .date_utils import (
     date_to_str_krx,
     date_to_str_yahoo,
     get_date_chunks,
+    epoch_to_datetime,
+    DATETIME_UNIT,
 )
 from .http import (
     create_session,
+    get_session,
+    configure_session_pool,
+    close_sessions,
     get_request,
     post_request,
     rate_limited_request,
 )
+from .async_http import (
+    async_session,
+    get_request_async,
+    post_request_async,
+)
+from .report import (
+    report_warning,
+    collect_warnings,
+)
+from .rate_limit import (
+    AdaptiveRateLimiter,
+    get_rate_limiter,
+    set_host_defaults,
+)
 
 __all__ = [
     'parse_date',
@@ -24,8 +43,21 @@ __all__ = [
     'date_to_str_krx',
     'date_to_str_yahoo',
     'get_date_chunks',
+    'epoch_to_datetime',
+    'DATETIME_UNIT',
     'create_session',
+    'get_session',
+    'configure_session_pool',
+    'close_sessions',
     'get_request',
     'post_request',
     'rate_limited_request',
+    'async_session',
+    'get_request_async',
+    'post_request_async',
+    'report_warning',
+    'collect_warnings',
+    'AdaptiveRateLimiter',
+    'get_rate_limiter',
+    'set_host_defaults',
 ]
@@ -0,0 +1,184 @@
+"""비동기 HTTP 요청 유틸리티 모듈
+
+- aiohttp가 설치되어 있으면 이벤트 루프 하나에서 요청을 다중화
+- 없으면 동기 get_request / post_request를 스레드에서 실행 (결과는 동일)
+- 호스트별 속도 제한기는 동기 경로와 공유 (대기는 asyncio.sleep)
+
+Examples:
+    >>> async with async_session(limit=50):
+    ...     response = await get_request_async(url, params=params)
+    ...     text = response.text
+"""
+
+import asyncio
+import contextvars
+import functools
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Optional
+
+import requests
+
+from .http import DEFAULT_HEADERS, _POOL_CONFIG, get_request, post_request
+from .rate_limit import get_rate_limiter, get_retry_after
+
+try:
+    import aiohttp
+    _has_aiohttp = True
+except ImportError:
+    aiohttp = None
+    _has_aiohttp = False
+
+
+# 5xx 응답 재시도 대상 (동기 세션의 urllib3 Retry 설정과 동일)
+_RETRY_STATUS = (500, 502, 503, 504)
+
+# 현재 작업이 사용할 aiohttp 세션 (async_session 블록 안에서만 설정)
+_ASYNC_SESSION = contextvars.ContextVar('fdr_async_session', default=None)
+
+
+class AsyncResponse:
+    """비동기 요청 응답 (리더가 사용하는 requests.Response 속성만 제공)"""
+
+    def __init__(self, url: str, status_code: int, headers: Dict[str, str], text: str):
+        self.url = url
+        self.status_code = status_code
+        self.headers = headers
+        self.text = text
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code} Error for url: {self.url}", response=self)
+
+
+@asynccontextmanager
+async def async_session(limit: int = 100, limit_per_host: int = 0) -> AsyncIterator[Any]:
+    """
+    블록 안의 비동기 요청이 공유할 aiohttp 세션 (aiohttp가 없으면 None)
+
+    Args:
+        limit: 전체 동시 연결 수
+        limit_per_host: 호스트당 동시 연결 수 (0이면 제한 없음)
+    """
+    if not _has_aiohttp:
+        yield None
+        return
+
+    connector = aiohttp.TCPConnector(limit=limit, limit_per_host=limit_per_host)
+    async with aiohttp.ClientSession(connector=connector, headers=DEFAULT_HEADERS) as session:
+        token = _ASYNC_SESSION.set(session)
+        try:
+            yield session
+        finally:
+            _ASYNC_SESSION.reset(token)
+
+
+def _clean_params(params: Optional[Dict[str, Any]]) -> Optional[Dict[str, str]]:
+    """aiohttp 쿼리/폼 값은 문자열만 허용하므로 requests와 같은 방식으로 변환"""
+    if params is None:
+        return None
+    return {key: str(value) for key, value in params.items() if value is not None}
+
+
+async def _send_async(session, method: str, url: str, timeout: int, **kwargs) -> AsyncResponse:
+    """호스트별 속도 제한 + 429/5xx 재시도를 적용해 aiohttp 요청"""
+    limiter = get_rate_limiter(url)
+    max_retries = max(limiter.max_retries, _POOL_CONFIG['max_retries'])
+    client_timeout = aiohttp.ClientTimeout(total=timeout)
+
+    for attempt in range(max_retries + 1):
+        wait = limiter.reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+        async with session.request(method, url, timeout=client_timeout, **kwargs) as resp:
+            response = AsyncResponse(str(resp.url), resp.status, dict(resp.headers), await resp.text())
+
+        if response.status_code == 429:
+            limiter.on_rate_limited(get_retry_after(response))
+            continue
+
+        limiter.on_success()
+        if response.status_code in _RETRY_STATUS and attempt < max_retries:
+            await asyncio.sleep(_POOL_CONFIG['backoff_factor'] * (2 ** attempt))
+            continue
+        return response
+
+    return response
+
+
+async def _request_async(method: str, url: str, timeout: int, **kwargs) -> AsyncResponse:
+    session = _ASYNC_SESSION.get()
+    if session is not None:
+        return await _send_async(session, method, url, timeout, **kwargs)
+
+    # async_session 밖에서 호출되면 요청 1회용 세션 사용
+    async with aiohttp.ClientSession(headers=DEFAULT_HEADERS) as session:
+        return await _send_async(session, method, url, timeout, **kwargs)
+
+
+async def _run_sync(func, *args, **kwargs):
+    """동기 요청 함수를 스레드에서 실행 (context 유지)"""
+    loop = asyncio.get_running_loop()
+    ctx = contextvars.copy_context()
+    return await loop.run_in_executor(None, functools.partial(ctx.run, func, *args, **kwargs))
+
+
+async def get_request_async(
+    url: str,
+    params: Optional[Dict[str, Any]] = None,
+    headers: Optional[Dict[str, str]] = None,
+    timeout: int = 30
+):
+    """
+    비동기 HTTP GET 요청 (get_request와 동일한 인자/예외)
+
+    Returns:
+        AsyncResponse (aiohttp가 없으면 requests.Response)
+
+    Raises:
+        requests.RequestException: 요청 실패 시
+    """
+    if not _has_aiohttp:
+        return await _run_sync(get_request, url, params=params, headers=headers, timeout=timeout)
+
+    request_headers = {**DEFAULT_HEADERS, **headers} if headers else DEFAULT_HEADERS
+
+    try:
+        response = await _request_async(
+            'GET', url, timeout, params=_clean_params(params), headers=request_headers
+        )
+        response.raise_for_status()
+        return response
+    except (aiohttp.ClientError, asyncio.TimeoutError, requests.RequestException) as e:
+        raise requests.RequestException(f"Failed to GET {url}: {e}")
+
+
+async def post_request_async(
+    url: str,
+    data: Optional[Dict[str, Any]] = None,
+    json: Optional[Dict[str, Any]] = None,
+    headers: Optional[Dict[str, str]] = None,
+    timeout: int = 30
+):
+    """
+    비동기 HTTP POST 요청 (post_request와 동일한 인자/예외)
+
+    Returns:
+        AsyncResponse (aiohttp가 없으면 requests.Response)
+
+    Raises:
+        requests.RequestException: 요청 실패 시
+    """
+    if not _has_aiohttp:
+        return await _run_sync(post_request, url, data=data, json=json, headers=headers, timeout=timeout)
+
+    request_headers = {**DEFAULT_HEADERS, **headers} if headers else DEFAULT_HEADERS
+
+    try:
+        response = await _request_async(
+            'POST', url, timeout, data=_clean_params(data), json=json, headers=request_headers
+        )
+        response.raise_for_status()
+        return response
+    except (aiohttp.ClientError, asyncio.TimeoutError, requests.RequestException) as e:
+        raise requests.RequestException(f"Failed to POST {url}: {e}")
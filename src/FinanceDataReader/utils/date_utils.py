@@ -1,7 +1,15 @@
 """날짜 처리 유틸리티 모듈"""
 
 from datetime import datetime, timedelta
-from typing import Optional, Tuple
+from typing import Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+from dateutil import tz
+
+
+# datetime 객체로 만든 DatetimeIndex의 해상도 (pandas 2: ns, pandas 3: us)
+DATETIME_UNIT = np.datetime_data(pd.DatetimeIndex([datetime(2000, 1, 1)]).dtype)[0]
 
 
 def parse_date(date_str: Optional[str], default: Optional[datetime] = None) -> datetime:
@@ -152,3 +160,36 @@ def get_date_chunks(start: datetime, end: datetime, chunk_years: int = 2) -> lis
         current_start = chunk_end + timedelta(days=1)
 
     return chunks
+
+
+def epoch_to_datetime(timestamps: Sequence[float], unit: str = 's') -> pd.DatetimeIndex:
+    """
+    Unix epoch 배열 → 로컬 시각 DatetimeIndex (시간대 없음)
+
+    [datetime.fromtimestamp(ts) for ts in timestamps]와 같은 값을 배열 연산 한 번으로
+    만듭니다. 시스템 시간대(TZ 환경변수 / /etc/localtime)의 서머타임 전환도 반영합니다.
+
+    Args:
+        timestamps: epoch 값 리스트 또는 배열
+        unit: epoch 단위 ('s': 초, 'ms': 밀리초)
+
+    Returns:
+        DatetimeIndex (datetime 객체로 만든 인덱스와 같은 해상도)
+    """
+    values = np.asarray(timestamps)
+    local_tz = tz.gettz()
+
+    if local_tz is None or isinstance(local_tz, tz.tzlocal):
+        # 시간대 파일을 찾을 수 없는 환경 - 기존 방식
+        scale = 1000 if unit == 'ms' else 1
+        return pd.DatetimeIndex([datetime.fromtimestamp(ts / scale) for ts in values.tolist()])
+
+    if values.dtype.kind == 'f':
+        # 실수 epoch는 fromtimestamp와 같이 마이크로초로 반올림 (ns 변환 시 정밀도 손실 방지)
+        values = np.round(values * (1000 if unit == 'ms' else 1_000_000)).astype(np.int64)
+        unit = 'us'
+
+    index = pd.to_datetime(values, unit=unit, utc=True).tz_convert(local_tz).tz_localize(None)
+    if hasattr(index, 'as_unit'):
+        index = index.as_unit(DATETIME_UNIT)
+    return index
@@ -1,11 +1,13 @@
 """HTTP 요청 유틸리티 모듈"""
 
-import time
+import threading
 from typing import Optional, Dict, Any
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
+from .rate_limit import get_host, get_rate_limiter, get_retry_after
+
 
 DEFAULT_HEADERS = {
     'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 '
@@ -15,13 +17,33 @@ DEFAULT_HEADERS = {
 }
 
 
-def create_session(max_retries: int = 3, backoff_factor: float = 0.3) -> requests.Session:
+# 공유 세션 연결 풀 설정 (configure_session_pool로 변경)
+_POOL_CONFIG = {
+    'max_retries': 3,
+    'backoff_factor': 0.3,
+    'pool_connections': 10,
+    'pool_maxsize': 10,
+}
+
+# 호스트별 공유 세션 (keep-alive 연결 재사용)
+_SESSIONS: Dict[str, requests.Session] = {}
+_SESSIONS_LOCK = threading.Lock()
+
+
+def create_session(
+    max_retries: int = 3,
+    backoff_factor: float = 0.3,
+    pool_connections: int = 10,
+    pool_maxsize: int = 10
+) -> requests.Session:
     """
     재시도 로직이 포함된 requests Session 생성
 
     Args:
         max_retries: 최대 재시도 횟수
         backoff_factor: 재시도 간격 계산 인자
+        pool_connections: 연결 풀을 유지할 호스트 수
+        pool_maxsize: 호스트당 최대 연결 수 (동시 요청 스레드 수 이상 권장)
 
     Returns:
         설정된 requests.Session 객체
@@ -31,11 +53,16 @@ def create_session(max_retries: int = 3, backoff_factor: float = 0.3) -> request
     retry_strategy = Retry(
         total=max_retries,
         backoff_factor=backoff_factor,
-        status_forcelist=[429, 500, 502, 503, 504],
+        # 429는 호스트별 속도 제한기가 처리 (속도 조절 + 재시도)
+        status_forcelist=[500, 502, 503, 504],
         allowed_methods=["HEAD", "GET", "POST", "OPTIONS"]
     )
 
-    adapter = HTTPAdapter(max_retries=retry_strategy)
+    adapter = HTTPAdapter(
+        max_retries=retry_strategy,
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize
+    )
     session.mount("http://", adapter)
     session.mount("https://", adapter)
 
@@ -44,6 +71,79 @@ def create_session(max_retries: int = 3, backoff_factor: float = 0.3) -> request
     return session
 
 
+def get_session(url: str) -> requests.Session:
+    """
+    호스트별 공유 Session 반환 (없으면 생성)
+
+    같은 호스트에 대한 요청은 프로세스 전체에서 하나의 연결 풀을 공유하므로
+    TCP/TLS 연결을 매번 새로 맺지 않습니다. urllib3 연결 풀은 스레드 안전합니다.
+
+    Args:
+        url: 요청 URL 또는 호스트 이름
+
+    Returns:
+        공유 requests.Session 객체
+    """
+    host = get_host(url)
+    with _SESSIONS_LOCK:
+        session = _SESSIONS.get(host)
+        if session is None:
+            session = create_session(**_POOL_CONFIG)
+            _SESSIONS[host] = session
+        return session
+
+
+def configure_session_pool(
+    pool_maxsize: Optional[int] = None,
+    pool_connections: Optional[int] = None,
+    max_retries: Optional[int] = None,
+    backoff_factor: Optional[float] = None
+):
+    """
+    공유 세션 연결 풀 설정 변경 (기존 공유 세션은 닫고 다음 요청부터 새 설정 적용)
+
+    Args:
+        pool_maxsize: 호스트당 최대 연결 수
+        pool_connections: 연결 풀을 유지할 호스트 수
+        max_retries: 최대 재시도 횟수
+        backoff_factor: 재시도 간격 계산 인자
+    """
+    updates = {
+        'pool_maxsize': pool_maxsize,
+        'pool_connections': pool_connections,
+        'max_retries': max_retries,
+        'backoff_factor': backoff_factor,
+    }
+    with _SESSIONS_LOCK:
+        _POOL_CONFIG.update({k: v for k, v in updates.items() if v is not None})
+    close_sessions()
+
+
+def close_sessions():
+    """공유 세션 모두 닫기"""
+    with _SESSIONS_LOCK:
+        sessions = list(_SESSIONS.values())
+        _SESSIONS.clear()
+
+    for session in sessions:
+        session.close()
+
+
+def _send(session: requests.Session, method: str, url: str, **kwargs) -> requests.Response:
+    """호스트별 속도 제한을 적용해 요청 (429 응답이면 속도를 낮춰 재시도)"""
+    limiter = get_rate_limiter(url)
+
+    for _ in range(limiter.max_retries + 1):
+        limiter.acquire()
+        response = session.request(method, url, **kwargs)
+        if response.status_code != 429:
+            limiter.on_success()
+            return response
+        limiter.on_rate_limited(get_retry_after(response))
+
+    return response
+
+
 def get_request(
     url: str,
     params: Optional[Dict[str, Any]] = None,
@@ -59,7 +159,7 @@ def get_request(
         params: 쿼리 파라미터
         headers: 추가 헤더
         timeout: 타임아웃 (초)
-        session: 재사용할 Session 객체 (None이면 새로 생성)
+        session: 사용할 Session 객체 (None이면 호스트별 공유 세션)
 
     Returns:
         requests.Response 객체
@@ -68,7 +168,7 @@ def get_request(
         requests.RequestException: 요청 실패 시
     """
     if session is None:
-        session = create_session()
+        session = get_session(url)
 
     if headers:
         request_headers = {**DEFAULT_HEADERS, **headers}
@@ -76,7 +176,9 @@ def get_request(
         request_headers = DEFAULT_HEADERS
 
     try:
-        response = session.get(
+        response = _send(
+            session,
+            'GET',
             url,
             params=params,
             headers=request_headers,
@@ -105,7 +207,7 @@ def post_request(
         json: JSON 데이터
         headers: 추가 헤더
         timeout: 타임아웃 (초)
-        session: 재사용할 Session 객체
+        session: 사용할 Session 객체 (None이면 호스트별 공유 세션)
 
     Returns:
         requests.Response 객체
@@ -114,7 +216,7 @@ def post_request(
         requests.RequestException: 요청 실패 시
     """
     if session is None:
-        session = create_session()
+        session = get_session(url)
 
     if headers:
         request_headers = {**DEFAULT_HEADERS, **headers}
@@ -122,7 +224,9 @@ def post_request(
         request_headers = DEFAULT_HEADERS
 
     try:
-        response = session.post(
+        response = _send(
+            session,
+            'POST',
             url,
             data=data,
             json=json,
@@ -135,18 +239,23 @@ def post_request(
         raise requests.RequestException(f"Failed to POST {url}: {e}")
 
 
-def rate_limited_request(func, *args, delay: float = 0.1, **kwargs):
+def rate_limited_request(func, *args, delay: Optional[float] = None, **kwargs):
     """
     요청 속도 제한을 위한 래퍼
 
+    get_request / post_request는 이미 호스트별 속도 제한기를 거치므로 그대로 호출하고,
+    그 외 함수는 첫 번째 인자(URL)의 호스트 제한기를 적용합니다.
+
     Args:
-        func: 요청 함수 (get_request 또는 post_request)
-        delay: 요청 후 대기 시간 (초)
+        func: 요청 함수 (get_request, post_request 또는 URL을 첫 인자로 받는 함수)
+        delay: 하위 호환용 (고정 대기 대신 적응형 제한기를 사용하므로 무시)
         *args, **kwargs: func에 전달할 인자
 
     Returns:
         func의 반환값
     """
-    result = func(*args, **kwargs)
-    time.sleep(delay)
-    return result
+    if func in (get_request, post_request):
+        return func(*args, **kwargs)
+
+    url = args[0] if args else kwargs.get('url', '')
+    return get_rate_limiter(url).call(func, *args, **kwargs)
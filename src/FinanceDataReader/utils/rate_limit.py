@@ -0,0 +1,209 @@
+"""적응형 요청 속도 제한 모듈
+
+- 호스트별 토큰 버킷 (스레드 안전, 프로세스 전체 공유)
+- 429 (Too Many Requests) 응답 시 속도를 줄이고 Retry-After 동안 대기
+- 연속 성공 시 속도를 조금씩 올려 실제 한도 근처에서 동작 (AIMD)
+"""
+
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+from urllib.parse import urlparse
+
+
+def is_rate_limit_error(exc: BaseException) -> bool:
+    """예외가 요청 한도 초과(429)를 의미하는지 확인"""
+    response = getattr(exc, 'response', None)
+    if getattr(response, 'status_code', None) == 429:
+        return True
+    if 'RateLimit' in type(exc).__name__:
+        return True
+    return 'Too Many Requests' in str(exc)
+
+
+def get_retry_after(response: Any) -> Optional[float]:
+    """응답의 Retry-After 헤더(초) 추출 (없거나 날짜 형식이면 None)"""
+    headers = getattr(response, 'headers', None) or {}
+    try:
+        return max(float(headers.get('Retry-After')), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+class AdaptiveRateLimiter:
+    """
+    적응형 토큰 버킷
+
+    acquire()는 토큰이 생길 때까지 대기합니다. 요청 결과를 on_success() /
+    on_rate_limited()로 알려주면 초당 요청 수(rate)를 자동으로 조절합니다.
+    """
+
+    def __init__(
+        self,
+        rate: float = 2.0,
+        burst: float = 5.0,
+        min_rate: float = 0.2,
+        max_rate: float = 20.0,
+        increase: float = 0.05,
+        decrease: float = 0.5,
+        max_retries: int = 3,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        """
+        초기화
+
+        Args:
+            rate: 시작 속도 (초당 요청 수)
+            burst: 버킷 크기 (연속으로 바로 보낼 수 있는 요청 수)
+            min_rate: 최소 속도
+            max_rate: 최대 속도
+            increase: 성공 1회당 속도 증가량 (초당 요청 수)
+            decrease: 429 발생 시 속도 감소 배율
+            max_retries: call()에서 429 발생 시 재시도 횟수
+            clock: 시간 함수 (테스트용)
+            sleep: 대기 함수 (테스트용)
+        """
+        self.rate = rate
+        self.burst = burst
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.increase = increase
+        self.decrease = decrease
+        self.max_retries = max_retries
+        self.success_count = 0
+        self.throttled_count = 0
+
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._tokens = float(burst)
+        self._updated = clock()  # 토큰 충전 기준 시각 (429 후에는 미래 시각)
+
+    def _refill(self, now: float):
+        elapsed = now - self._updated
+        if elapsed > 0:
+            self._tokens = min(self.burst, self._tokens + elapsed * self.rate)
+            self._updated = now
+
+    def reserve(self) -> float:
+        """
+        토큰 1개 예약 (대기하지 않음)
+
+        asyncio 코드는 반환된 시간만큼 asyncio.sleep()으로 기다린 뒤 요청합니다.
+
+        Returns:
+            요청 전에 기다려야 할 시간 (초)
+        """
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+            # 토큰을 먼저 예약하고 부족분만큼 기다림 (대기 순서 = 예약 순서)
+            self._tokens -= 1
+            wait = max(self._updated - now, 0.0)
+            if self._tokens < 0:
+                wait += -self._tokens / self.rate
+        return wait
+
+    def acquire(self) -> float:
+        """
+        토큰 1개 획득 (필요하면 대기)
+
+        Returns:
+            대기한 시간 (초)
+        """
+        wait = self.reserve()
+        if wait > 0:
+            self._sleep(wait)
+        return wait
+
+    def on_success(self):
+        """요청 성공 - 속도를 조금 올림"""
+        with self._lock:
+            self.success_count += 1
+            self.rate = min(self.max_rate, self.rate + self.increase)
+
+    def on_rate_limited(self, retry_after: Optional[float] = None):
+        """
+        요청 한도 초과 - 속도를 줄이고 잠시 모든 요청을 멈춤
+
+        Args:
+            retry_after: 서버가 알려준 대기 시간 (초, 없으면 새 속도 기준 1개 간격)
+        """
+        with self._lock:
+            self.throttled_count += 1
+            self.rate = max(self.min_rate, self.rate * self.decrease)
+            pause = retry_after if retry_after is not None else 1.0 / self.rate
+
+            now = self._clock()
+            self._refill(now)
+            self._tokens = min(self._tokens, 0.0)
+            self._updated = max(self._updated, now + pause)
+
+    def call(self, func: Callable, *args, **kwargs):
+        """
+        속도 제한을 적용해 func 호출 (429 예외면 재시도)
+
+        Returns:
+            func의 반환값
+
+        Raises:
+            func가 발생시킨 예외 (429는 max_retries회 재시도 후)
+        """
+        for attempt in range(self.max_retries + 1):
+            self.acquire()
+            try:
+                result = func(*args, **kwargs)
+            except Exception as e:
+                if not is_rate_limit_error(e):
+                    raise
+                self.on_rate_limited(get_retry_after(getattr(e, 'response', None)))
+                if attempt == self.max_retries:
+                    raise
+                continue
+
+            self.on_success()
+            return result
+
+
+_LIMITERS: Dict[str, AdaptiveRateLimiter] = {}
+_HOST_DEFAULTS: Dict[str, Dict[str, Any]] = {}
+_LIMITERS_LOCK = threading.Lock()
+
+
+def get_host(url: str) -> str:
+    """URL에서 호스트 이름 추출"""
+    return urlparse(url).netloc.lower() or url.lower()
+
+
+def set_host_defaults(host: str, **kwargs):
+    """
+    호스트별 제한기 기본 설정 등록 (데이터 소스 모듈에서 호스트 한도에 맞게 지정)
+
+    Args:
+        host: 호스트 이름 또는 URL
+        **kwargs: 이 호스트의 제한기를 처음 생성할 때 쓸 AdaptiveRateLimiter 설정
+    """
+    with _LIMITERS_LOCK:
+        _HOST_DEFAULTS[get_host(host)] = kwargs
+
+
+def get_rate_limiter(host: str, **kwargs) -> AdaptiveRateLimiter:
+    """
+    호스트별 공유 속도 제한기 반환 (없으면 생성)
+
+    Args:
+        host: 호스트 이름 또는 URL
+        **kwargs: 처음 생성할 때 AdaptiveRateLimiter에 전달할 설정
+                  (set_host_defaults로 등록한 호스트 기본값보다 우선)
+
+    Returns:
+        AdaptiveRateLimiter
+    """
+    host = get_host(host)
+    with _LIMITERS_LOCK:
+        limiter = _LIMITERS.get(host)
+        if limiter is None:
+            limiter = AdaptiveRateLimiter(**{**_HOST_DEFAULTS.get(host, {}), **kwargs})
+            _LIMITERS[host] = limiter
+        return limiter
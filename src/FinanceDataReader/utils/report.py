@@ -0,0 +1,51 @@
+"""조회 경고 수집 모듈
+
+리더는 조회 실패 시 경고를 출력하고 빈 DataFrame을 반환합니다.
+collect_warnings() 안에서 실행하면 출력과 함께 경고 메시지를 모아서
+종목별 실패 사유로 돌려줄 수 있습니다 (스레드/asyncio 작업별로 분리).
+"""
+
+import contextvars
+from contextlib import contextmanager
+from typing import Iterator, List
+
+
+# 현재 작업의 경고 수집 리스트 (수집 중이 아니면 None)
+_COLLECTOR = contextvars.ContextVar('fdr_warning_collector', default=None)
+
+
+def report_warning(message: str) -> None:
+    """
+    조회 경고 출력 (수집 중이면 함께 기록)
+
+    Args:
+        message: 경고 메시지
+    """
+    print(message)
+
+    collected = _COLLECTOR.get()
+    if collected is not None:
+        collected.append(message)
+
+
+@contextmanager
+def collect_warnings() -> Iterator[List[str]]:
+    """
+    블록 안에서 발생한 조회 경고 수집
+
+    Examples:
+        >>> with collect_warnings() as messages:
+        ...     df = get_naver_data('005930', start, end)
+        >>> if df.empty:
+        ...     print(messages)
+    """
+    parent = _COLLECTOR.get()
+    messages: List[str] = []
+    token = _COLLECTOR.set(messages)
+    try:
+        yield messages
+    finally:
+        _COLLECTOR.reset(token)
+        # 중첩 수집이면 바깥 수집에도 전달 (예: 캐시 구간 조회 안의 경고 → DataReaderMany 실패 사유)
+        if parent is not None:
+            parent.extend(messages)
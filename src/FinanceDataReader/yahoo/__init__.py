@@ -1,8 +1,9 @@
 """Yahoo Finance 데이터 소스"""
 
-from .data import get_yahoo_data, normalize_yahoo_symbol
+from .data import get_yahoo_data, get_yahoo_data_async, normalize_yahoo_symbol
 
 __all__ = [
     'get_yahoo_data',
+    'get_yahoo_data_async',
     'normalize_yahoo_symbol',
 ]
@@ -1,10 +1,11 @@
 """Yahoo Finance 데이터 조회"""
 
+import numpy as np
 import pandas as pd
 from datetime import datetime
 import json
 from typing import Optional
-from ..utils import get_request, create_session
+from ..utils import get_request, get_request_async, report_warning, epoch_to_datetime
 
 
 # Yahoo Finance API
@@ -12,6 +13,100 @@ YAHOO_FINANCE_API_URL = "https://query1.finance.yahoo.com/v8/finance/chart/{symb
 YAHOO_FINANCE_V7_URL = "https://query1.finance.yahoo.com/v7/finance/download/{symbol}"
 
 
+def _yahoo_download_params(start: datetime, end: datetime) -> dict:
+    """Yahoo Finance v7 다운로드 API 요청 파라미터"""
+    # Unix timestamp 변환
+    return {
+        'period1': int(start.timestamp()),
+        'period2': int(end.timestamp()),
+        'interval': '1d',
+        'events': 'history',
+        'includeAdjustedClose': 'true'
+    }
+
+
+def _yahoo_chart_params(start: datetime, end: datetime) -> dict:
+    """Yahoo Finance Chart API 요청 파라미터"""
+    return {
+        'period1': int(start.timestamp()),
+        'period2': int(end.timestamp()),
+        'interval': '1d',
+        'includePrePost': 'false',
+    }
+
+
+def _parse_yahoo_csv(text: str) -> pd.DataFrame:
+    """Yahoo Finance v7 다운로드 응답(CSV) → 주가 DataFrame (동기/비동기 공용)"""
+    # CSV 파싱
+    from io import StringIO
+    df = pd.read_csv(StringIO(text))
+
+    if df.empty:
+        return pd.DataFrame()
+
+    # Date 컬럼을 인덱스로
+    if 'Date' in df.columns:
+        df['Date'] = pd.to_datetime(df['Date'])
+        df = df.set_index('Date')
+
+    # 컬럼명 정규화
+    column_map = {
+        'Open': 'Open',
+        'High': 'High',
+        'Low': 'Low',
+        'Close': 'Close',
+        'Adj Close': 'Adj Close',
+        'Volume': 'Volume'
+    }
+
+    df = df.rename(columns=column_map)
+
+    # NaN 제거
+    df = df.dropna()
+
+    # 날짜순 정렬
+    df = df.sort_index()
+
+    return df
+
+
+def _parse_yahoo_chart(text: str) -> pd.DataFrame:
+    """Yahoo Finance Chart API 응답(JSON) → 주가 DataFrame (동기/비동기 공용)"""
+    data = json.loads(text)
+
+    # 데이터 추출
+    chart = data['chart']['result'][0]
+
+    timestamps = chart['timestamp']
+    quote = chart['indicators']['quote'][0]
+
+    # Adjusted Close (있는 경우)
+    adj_close = None
+    if 'adjclose' in chart['indicators']:
+        adj_close = chart['indicators']['adjclose'][0]['adjclose']
+
+    # DataFrame 생성 (epoch/가격 리스트를 배열로 한 번에 변환, 결측(None)은 NaN)
+    df_data = {
+        'Open': np.array(quote['open'], dtype=np.float64),
+        'High': np.array(quote['high'], dtype=np.float64),
+        'Low': np.array(quote['low'], dtype=np.float64),
+        'Close': np.array(quote['close'], dtype=np.float64),
+        'Volume': np.array(quote['volume'], dtype=np.float64),
+    }
+
+    if adj_close:
+        df_data['Adj Close'] = np.array(adj_close, dtype=np.float64)
+
+    df = pd.DataFrame(df_data, index=epoch_to_datetime(timestamps).rename('Date'))
+    df = df.dropna()
+
+    # 결측 봉을 제거한 뒤 거래량은 정수형
+    df['Volume'] = df['Volume'].astype(np.int64)
+    df = df.sort_index()
+
+    return df
+
+
 def get_yahoo_data(
     symbol: str,
     start: datetime,
@@ -30,64 +125,21 @@ def get_yahoo_data(
         Columns: Date, Open, High, Low, Close, Volume, Adj Close
     """
     try:
-        # Unix timestamp 변환
-        period1 = int(start.timestamp())
-        period2 = int(end.timestamp())
-
         # Yahoo Finance API 호출
-        params = {
-            'period1': period1,
-            'period2': period2,
-            'interval': '1d',
-            'events': 'history',
-            'includeAdjustedClose': 'true'
-        }
-
-        session = create_session()
         url = YAHOO_FINANCE_V7_URL.format(symbol=symbol)
 
-        response = get_request(url, params=params, session=session)
+        response = get_request(url, params=_yahoo_download_params(start, end))
 
-        # CSV 파싱
-        from io import StringIO
-        df = pd.read_csv(StringIO(response.text))
-
-        if df.empty:
-            return pd.DataFrame()
-
-        # Date 컬럼을 인덱스로
-        if 'Date' in df.columns:
-            df['Date'] = pd.to_datetime(df['Date'])
-            df = df.set_index('Date')
-
-        # 컬럼명 정규화
-        column_map = {
-            'Open': 'Open',
-            'High': 'High',
-            'Low': 'Low',
-            'Close': 'Close',
-            'Adj Close': 'Adj Close',
-            'Volume': 'Volume'
-        }
-
-        df = df.rename(columns=column_map)
-
-        # NaN 제거
-        df = df.dropna()
-
-        # 날짜순 정렬
-        df = df.sort_index()
-
-        return df
+        return _parse_yahoo_csv(response.text)
 
     except Exception as e:
-        print(f"Warning: Yahoo Finance API failed for {symbol} ({e})")
+        report_warning(f"Warning: Yahoo Finance API failed for {symbol} ({e})")
 
         # 대체 방법: Chart API 사용
         try:
             return _get_yahoo_data_chart_api(symbol, start, end)
         except Exception as e2:
-            print(f"Warning: Yahoo Chart API also failed ({e2})")
+            report_warning(f"Warning: Yahoo Chart API also failed ({e2})")
             return pd.DataFrame()
 
 
@@ -107,53 +159,47 @@ def _get_yahoo_data_chart_api(
     Returns:
         주가 데이터 DataFrame
     """
-    period1 = int(start.timestamp())
-    period2 = int(end.timestamp())
-
-    params = {
-        'period1': period1,
-        'period2': period2,
-        'interval': '1d',
-        'includePrePost': 'false',
-    }
-
-    session = create_session()
     url = YAHOO_FINANCE_API_URL.format(symbol=symbol)
 
-    response = get_request(url, params=params, session=session)
+    response = get_request(url, params=_yahoo_chart_params(start, end))
 
-    data = json.loads(response.text)
+    return _parse_yahoo_chart(response.text)
 
-    # 데이터 추출
-    chart = data['chart']['result'][0]
 
-    timestamps = chart['timestamp']
-    quote = chart['indicators']['quote'][0]
+async def get_yahoo_data_async(
+    symbol: str,
+    start: datetime,
+    end: datetime
+) -> pd.DataFrame:
+    """
+    Yahoo Finance에서 주가 데이터 조회 (asyncio 버전, 결과는 get_yahoo_data와 동일)
 
-    # Adjusted Close (있는 경우)
-    adj_close = None
-    if 'adjclose' in chart['indicators']:
-        adj_close = chart['indicators']['adjclose'][0]['adjclose']
+    Args:
+        symbol: 티커 심볼 (예: 'AAPL', '005930.KS')
+        start: 시작일
+        end: 종료일
 
-    # DataFrame 생성
-    df_data = {
-        'Date': [datetime.fromtimestamp(ts) for ts in timestamps],
-        'Open': quote['open'],
-        'High': quote['high'],
-        'Low': quote['low'],
-        'Close': quote['close'],
-        'Volume': quote['volume'],
-    }
+    Returns:
+        주가 데이터 DataFrame
+    """
+    try:
+        url = YAHOO_FINANCE_V7_URL.format(symbol=symbol)
 
-    if adj_close:
-        df_data['Adj Close'] = adj_close
+        response = await get_request_async(url, params=_yahoo_download_params(start, end))
 
-    df = pd.DataFrame(df_data)
-    df = df.set_index('Date')
-    df = df.dropna()
-    df = df.sort_index()
+        return _parse_yahoo_csv(response.text)
 
-    return df
+    except Exception as e:
+        report_warning(f"Warning: Yahoo Finance API failed for {symbol} ({e})")
+
+        # 대체 방법: Chart API 사용
+        try:
+            url = YAHOO_FINANCE_API_URL.format(symbol=symbol)
+            response = await get_request_async(url, params=_yahoo_chart_params(start, end))
+            return _parse_yahoo_chart(response.text)
+        except Exception as e2:
+            report_warning(f"Warning: Yahoo Chart API also failed ({e2})")
+            return pd.DataFrame()
 
 
 def normalize_yahoo_symbol(symbol: str, market: Optional[str] = None) -> str:
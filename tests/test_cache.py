@@ -0,0 +1,146 @@
+"""로컬 OHLCV 캐시 테스트 (네트워크 불필요)"""
+
+import sys
+from datetime import datetime
+
+import pandas as pd
+
+sys.path.insert(0, 'src')
+
+
+def _make_fetcher(calls):
+    """영업일마다 봉이 있는 가짜 원본"""
+    def fetcher(start, end):
+        calls.append((start.date().isoformat(), end.date().isoformat()))
+        index = pd.bdate_range(start, end, name='Date')
+        return pd.DataFrame({'Close': [float(d.day) for d in index]}, index=index)
+    return fetcher
+
+
+def test_cache_fetches_only_missing_ranges(tmp_path):
+    """캐시 범위 밖 구간만 조회, 최근 구간은 TTL 후 재조회"""
+    from FinanceDataReader.cache import OHLCVCache
+
+    calls = []
+    fetcher = _make_fetcher(calls)
+    today = datetime(2024, 6, 14, 15, 0)
+    cache = OHLCVCache(str(tmp_path), fmt='pickle', now=lambda: today)
+
+    df = cache.read('NAVER', '005930', datetime(2024, 3, 1), today, fetcher)
+    assert calls == [('2024-03-01', '2024-06-14')]
+    assert df.index[0] == pd.Timestamp('2024-03-01') and df.index[-1] == pd.Timestamp('2024-06-14')
+
+    # 같은 요청 / 안쪽 구간: 디스크에서 바로
+    fresh = OHLCVCache(str(tmp_path), fmt='pickle', now=lambda: today)
+    pd.testing.assert_frame_equal(fresh.read('naver', '005930', datetime(2024, 3, 1), today, fetcher), df)
+    inner = fresh.read('NAVER', '005930', datetime(2024, 4, 1), datetime(2024, 4, 30), fetcher)
+    assert len(calls) == 1
+    assert inner.index.min() >= pd.Timestamp('2024-04-01') and inner.index.max() <= pd.Timestamp('2024-04-30')
+
+    # 앞쪽 확장: 모자란 구간만
+    wider = fresh.read('NAVER', '005930', datetime(2024, 1, 1), today, fetcher)
+    assert calls[1:] == [('2024-01-01', '2024-02-29')]
+    assert wider.index.is_monotonic_increasing and not wider.index.duplicated().any()
+
+    # 다음 날: 미확정이던 오늘 봉부터 다시 조회
+    tomorrow = datetime(2024, 6, 17, 10, 0)
+    later = OHLCVCache(str(tmp_path), fmt='pickle', now=lambda: tomorrow)
+    later.read('NAVER', '005930', datetime(2024, 1, 1), tomorrow, fetcher)
+    assert calls[2:] == [('2024-06-14', '2024-06-17')]
+
+    # 다른 심볼은 별도 키
+    cache.read('NAVER', '000660', datetime(2024, 6, 1), today, fetcher)
+    assert calls[-1] == ('2024-06-01', '2024-06-14')
+
+
+def test_cache_covers_each_fetched_range(tmp_path):
+    """빈 결과도 확인 완료로 기록, 일부 구간 조회 실패 시 성공한 구간은 유지"""
+    import pytest
+    from FinanceDataReader.cache import OHLCVCache
+
+    calls = []
+    today = datetime(2024, 6, 14, 15, 0)
+    cache = OHLCVCache(str(tmp_path), fmt='pickle', refresh_ttl=0, now=lambda: today)
+
+    def empty(start, end):
+        calls.append(start)
+        return pd.DataFrame()
+
+    # 데이터가 없는 구간 (예: 상장 전)은 다시 조회하지 않음
+    assert cache.read('YAHOO', 'AAPL', datetime(2024, 1, 1), datetime(2024, 2, 1), empty).empty
+    assert cache.read('YAHOO', 'AAPL', datetime(2024, 1, 1), datetime(2024, 2, 1), _make_fetcher(calls)).empty
+    assert len(calls) == 1
+
+    fetcher = _make_fetcher(calls)
+
+    def flaky(start, end):
+        if end >= datetime(2024, 6, 1):
+            raise ConnectionError('timeout')
+        return fetcher(start, end)
+
+    cache.read('NAVER', '005930', datetime(2024, 3, 1), datetime(2024, 5, 31), fetcher)
+    with pytest.raises(ConnectionError):
+        cache.read('NAVER', '005930', datetime(2024, 1, 1), today, flaky)
+
+    # 앞쪽 구간은 저장됨, 실패한 뒤쪽 구간만 다시 조회
+    del calls[:]
+    df = cache.read('NAVER', '005930', datetime(2024, 1, 1), today, fetcher)
+    assert calls == [('2024-06-01', '2024-06-14')]
+    assert df.index[0] == pd.Timestamp('2024-01-01') and df.index[-1] == pd.Timestamp('2024-06-14')
+
+
+def test_cache_reader_failure_is_not_covered(tmp_path, monkeypatch):
+    """리더가 오류를 경고 후 빈/일부 결과로 돌려주면 커버하지 않고, 복구 후 다시 조회"""
+    from types import SimpleNamespace
+    import FinanceDataReader as fdr
+    from FinanceDataReader.cache import OHLCVCache
+    from FinanceDataReader.krx import data as krx_data
+    from FinanceDataReader.naver import data as naver_data
+
+    online = [False]
+    requests = []
+
+    def naver_request(url, params=None, **kwargs):
+        requests.append(params['startTime'])
+        if not online[0]:
+            raise ConnectionError('network down')
+        index = pd.bdate_range(params['startTime'], params['endTime'])
+        items = ''.join(f'<item data="{d:%Y%m%d}|100|110|90|105|1000" />' for d in index)
+        return SimpleNamespace(text=f'<chartdata>{items}</chartdata>')
+
+    monkeypatch.setattr(naver_data, 'get_request', naver_request)
+    cache_dir = str(tmp_path / 'naver')
+    assert fdr.DataReader('NAVER:005930', '2020-01-01', '2020-03-01', cache=cache_dir).shape == (0, 0)
+
+    online[0] = True
+    assert not fdr.DataReader('NAVER:005930', '2020-01-01', '2020-03-01', cache=cache_dir).empty
+    fdr.DataReader('NAVER:005930', '2020-01-01', '2020-03-01', cache=cache_dir)
+    assert len(requests) == 2   # 실패 후 다시 조회, 정상 조회한 구간은 디스크에서
+
+    # KRX: 2년 청크 중 일부만 실패하면 받은 청크는 반환하되 구간은 커버하지 않음
+    failing_before = ['20100101']
+
+    def krx_otp(stock_code, start_date, end_date):
+        if start_date < failing_before[0]:
+            raise ConnectionError('timeout')
+        return 'otp'
+
+    monkeypatch.setattr(krx_data, 'get_krx_price_otp', krx_otp)
+    monkeypatch.setattr(krx_data, 'post_request',
+                        lambda url, data=None, **kwargs: SimpleNamespace(text=f"{data['strtDd']}|{data['endDd']}"))
+    monkeypatch.setattr(krx_data, '_parse_krx_data', lambda text, stock_code: pd.DataFrame(
+        {'Close': 1.0}, index=pd.bdate_range(*text.split('|'), name='Date')))
+
+    cache = OHLCVCache(str(tmp_path / 'krx'), fmt='pickle')
+
+    def fetcher(start, end):
+        return krx_data.get_krx_data('005930', start, end)
+
+    partial = cache.read('KRX', '005930', datetime(2006, 1, 1), datetime(2013, 12, 31), fetcher)
+    assert partial.index[0] >= pd.Timestamp('2010-01-01')
+
+    failing_before[0] = '00000000'
+    full = cache.read('KRX', '005930', datetime(2006, 1, 1), datetime(2013, 12, 31), fetcher)
+    assert full.index[0] == pd.Timestamp('2006-01-02') and cache.fetch_count == 2
+    cache.read('KRX', '005930', datetime(2006, 1, 1), datetime(2013, 12, 31), fetcher)
+    assert cache.fetch_count == 2
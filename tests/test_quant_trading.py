@@ -0,0 +1,701 @@
+"""quant_trading 모듈 테스트 (네트워크 불필요)"""
+
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, '.')
+
+
+def test_ticker_info_cache_single_request():
+    """여러 분석기가 캐시를 공유하면 종목당 1회만 요청"""
+    from quant_trading.ticker_info_cache import TickerInfoCache
+    from quant_trading.valuation_analyzer import ValuationAnalyzer
+    from quant_trading.automation_analyzer import AutomationAnalyzer
+    from quant_trading.policy_analyzer import PolicyAnalyzer
+
+    calls = []
+
+    def fetcher(ticker):
+        calls.append(ticker)
+        return {'sector': 'Technology', 'industry': 'Semiconductors', 'returnOnEquity': 0.25}
+
+    cache = TickerInfoCache(fetcher=fetcher)
+
+    def analyze(ticker):
+        ValuationAnalyzer(ticker, info_cache=cache).calculate_total_score()
+        AutomationAnalyzer(ticker, info_cache=cache).calculate_total_score()
+        PolicyAnalyzer(ticker, info_cache=cache).calculate_total_score()
+        return cache.get(ticker)['sector']
+
+    tickers = ['NVDA', 'AMD', 'INTC'] * 4
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        sectors = list(executor.map(analyze, tickers))
+
+    assert sectors == ['Technology'] * len(tickers)
+    assert sorted(calls) == ['AMD', 'INTC', 'NVDA']
+    assert cache.request_count == 3
+
+
+def test_ticker_info_cache_disk_ttl(tmp_path):
+    """디스크 캐시는 TTL 이내에서만 재사용"""
+    from quant_trading.ticker_info_cache import TickerInfoCache
+
+    calls = []
+
+    def fetcher(ticker):
+        calls.append(ticker)
+        return {'longName': f'{ticker} Inc.'}
+
+    TickerInfoCache(cache_dir=str(tmp_path), fetcher=fetcher).get('aapl')
+    warm = TickerInfoCache(cache_dir=str(tmp_path), fetcher=fetcher)
+    assert warm.get('AAPL') == {'longName': 'AAPL Inc.'}
+    assert calls == ['AAPL']
+
+    expired = TickerInfoCache(cache_dir=str(tmp_path), ttl=-1, fetcher=fetcher)
+    expired.get('AAPL')
+    assert calls == ['AAPL', 'AAPL']
+
+
+def _make_ohlcv(n=300, seed=0, start='2024-01-01'):
+    """테스트용 OHLCV 데이터 생성"""
+    import numpy as np
+    import pandas as pd
+
+    rng = np.random.default_rng(seed)
+    index = pd.bdate_range(start, periods=n, tz='America/New_York')
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.02, n)))
+    return pd.DataFrame({
+        'Open': close * (1 + rng.normal(0, 0.005, n)),
+        'High': close * (1 + np.abs(rng.normal(0, 0.01, n))),
+        'Low': close * (1 - np.abs(rng.normal(0, 0.01, n))),
+        'Close': close,
+        'Volume': rng.integers(1_000_000, 5_000_000, n),
+    }, index=index)
+
+
+def test_price_store_point_in_time():
+    """as_of는 기준일 이전 데이터만, 한 번의 로드로 제공"""
+    from datetime import datetime
+    from quant_trading.price_store import PriceStore
+
+    df = _make_ohlcv()
+    calls = []
+
+    def loader(ticker, start, end):
+        calls.append(ticker)
+        return df
+
+    store = PriceStore.load(['AAA', 'BBB', 'AAA'], datetime(2024, 6, 1), datetime(2024, 12, 1),
+                            loader=loader)
+    assert sorted(calls) == ['AAA', 'BBB']
+
+    date = datetime(2024, 7, 15, 14, 30)
+    sliced = store.as_of('AAA', date)
+    assert sliced.index.max() < datetime(2024, 7, 15)
+    assert len(sliced) == (df.index.tz_localize(None) < datetime(2024, 7, 15)).sum()
+    assert store.as_of('AAA', date, lookback_days=30).index.min() >= datetime(2024, 6, 15)
+
+    # 기준일 당일 종가는 as_of에는 없고 price_on에는 포함
+    assert store.price_on('AAA', datetime(2024, 7, 15)) == df['Close'].iloc[len(sliced)]
+    assert store.price_on('AAA', datetime(2024, 7, 14)) == sliced['Close'].iloc[-1]
+    assert store.price_on('AAA', datetime(2023, 1, 1)) is None
+    assert store.as_of('ZZZ', date).empty
+
+
+def test_technical_panel_matches_per_ticker():
+    """패널 채점 결과가 종목별 TechnicalAnalyzerV3와 동일"""
+    import numpy as np
+    from quant_trading.technical_analyzer_v3 import TechnicalAnalyzerV3, TechnicalAnalyzerV3Panel
+
+    frames = {}
+    lengths = [15, 20, 59, 60, 126, 200, 253, 300]
+    for i in range(24):
+        df = _make_ohlcv(n=300, seed=i).iloc[-lengths[i % len(lengths)]:].copy()
+        if i % 3 == 0:
+            # 급락 구간 (RSI 과매도 / BB 하단 시그널 유도)
+            df.iloc[-5:, df.columns.get_loc('Close')] *= np.linspace(1, 0.8, 5)
+        frames[f'T{i}'] = df
+
+    panel = TechnicalAnalyzerV3Panel.from_frames(frames)
+    scores = panel.calculate_total_scores()
+
+    for ticker, df in frames.items():
+        expected = TechnicalAnalyzerV3(df).calculate_total_score()
+        assert panel.get_result(ticker, scores) == expected, ticker
+
+
+def test_obv_vectorized_and_append():
+    """배열 OBV = 행 단위 정의, 이어붙이기 = 전체 재계산"""
+    import numpy as np
+    import pandas as pd
+    from quant_trading.indicators import calculate_obv, append_obv
+
+    df = pd.DataFrame({
+        'Close': [10.0, 11.0, 11.0, 9.0, np.nan, 12.0, 12.5],
+        'Volume': [100, 200, 300, 400, 500, 600, 700],
+    })
+    # 상승 +, 하락 -, 보합/NaN 비교는 유지
+    expected = [0, 200, 200, -200, -200, -200, 500]
+    assert calculate_obv(df.copy())['OBV'].tolist() == expected
+
+    merged = append_obv(calculate_obv(df.iloc[:4].copy()), df.iloc[4:])
+    assert merged['OBV'].tolist() == expected
+
+
+def test_selective_indicators_match_full():
+    """선택 계산 결과 = 전체 계산 결과, 불필요한 지표는 계산하지 않음"""
+    import pandas as pd
+    import pytest
+    from quant_trading.indicators import calculate_all_indicators, calculate_indicators
+
+    df = _make_ohlcv(n=200)
+    full = calculate_all_indicators(df)
+    partial = calculate_indicators(df, ['SMA_20', 'BB_Lower', 'MACD_Hist', 'STOCH_D_5_3_3'])
+
+    for column in ['SMA_20', 'BB_Middle', 'BB_Std', 'BB_Lower', 'MACD', 'MACD_Signal',
+                   'MACD_Hist', 'STOCH_K_5_3_3', 'STOCH_D_5_3_3']:
+        pd.testing.assert_series_equal(partial[column], full[column])
+
+    assert 'OBV' not in partial.columns
+    assert 'Ichimoku_SpanA' not in partial.columns
+    assert 'OBV' not in df.columns  # 원본은 수정하지 않음
+
+    with pytest.raises(ValueError):
+        calculate_indicators(df, ['UNKNOWN'])
+
+
+def test_indicator_state_incremental_matches_full(tmp_path):
+    """증분 갱신 결과 = 전체 재계산 결과 (저장/복원 후에도 동일)"""
+    import numpy as np
+    from quant_trading.indicators import calculate_indicators
+    from quant_trading.indicator_state import (
+        IndicatorState, IndicatorStateStore, STATE_COLUMNS
+    )
+
+    df = _make_ohlcv(n=320)
+    full = calculate_indicators(df)
+
+    store = IndicatorStateStore(str(tmp_path))
+    store.save('AAA', IndicatorState.from_history(df.iloc[:250]))
+    state = store.load('aaa')
+    assert store.load('ZZZ') is None
+
+    for i in range(250, 300):
+        values = state.update(df.iloc[i])
+        for column in STATE_COLUMNS:
+            assert np.isclose(values[column], full[column].iloc[i], rtol=1e-9, equal_nan=True), column
+
+    # 진행 중인 마지막 봉은 미리보기만 하고 상태에 반영하지 않음
+    preview = state.advance(df.iloc[:320])
+    assert state.last_date == df.index[318]
+    for column in STATE_COLUMNS:
+        assert np.isclose(preview[column], full[column].iloc[319], rtol=1e-9, equal_nan=True), column
+
+
+def test_refresh_indicator_states_from_price_store(tmp_path, monkeypatch):
+    """시간별 갱신: 저장된 상태 + 새 봉 = 전체 재계산, 가격 이력이 바뀌면 다시 생성"""
+    import numpy as np
+    from quant_trading.indicators import calculate_indicators
+    from quant_trading.indicator_state import (
+        IndicatorState, IndicatorStateStore, STATE_COLUMNS, refresh_indicator_states
+    )
+    from quant_trading.price_store import PriceStore
+
+    rebuilt = []
+    from_history = IndicatorState.from_history.__func__
+    monkeypatch.setattr(IndicatorState, 'from_history',
+                        classmethod(lambda cls, df: rebuilt.append(len(df)) or from_history(cls, df)))
+
+    df = _make_ohlcv(n=310)
+    store = IndicatorStateStore(str(tmp_path))
+
+    def assert_latest(latest, frame):
+        full = calculate_indicators(frame)
+        for column in STATE_COLUMNS:
+            assert np.isclose(latest[column], full[column].iloc[-1], rtol=1e-9, equal_nan=True), column
+
+    first = refresh_indicator_states(PriceStore({'AAA': df.iloc[:300]}), ['AAA', 'BAD'], store)
+    assert list(first) == ['AAA']
+    assert_latest(first['AAA'], df.iloc[:300])
+
+    # 다음 실행: 새로 추가된 봉만 확정 반영
+    prices = PriceStore({'AAA': df})
+    latest = refresh_indicator_states(prices, ['AAA'], store)
+    assert_latest(latest['AAA'], df)
+    assert store.load('AAA').last_date == prices.history('AAA').index[-2]
+    assert rebuilt == [299]   # 전체 재계산은 첫 실행 한 번뿐
+
+    # 수정 주가 등으로 과거 종가가 바뀌면 상태를 다시 생성
+    adjusted = df.copy()
+    adjusted[['Open', 'High', 'Low', 'Close']] *= 0.5
+    latest = refresh_indicator_states(PriceStore({'AAA': adjusted}), ['AAA'], store)
+    assert_latest(latest['AAA'], adjusted)
+    assert rebuilt == [299, 309]
+
+
+def test_price_store_bulk_download():
+    """묶음 다운로드 결과를 종목별로 분리, 거래 없는 날 행은 제거"""
+    import numpy as np
+    import pandas as pd
+    from quant_trading.price_store import PriceStore
+
+    requests = []
+
+    def downloader(tickers, period, **kwargs):
+        requests.append(list(tickers))
+        frames = {}
+        for i, ticker in enumerate(tickers):
+            if ticker == 'BAD':
+                continue  # 다운로드 실패 종목은 결과에 없음
+            df = _make_ohlcv(n=30, seed=i).drop(columns='Open')
+            df['Open'] = df['Close']
+            if ticker == 'NEW':
+                df.iloc[:10] = np.nan  # 상장 전 구간
+            frames[ticker] = df
+        return pd.concat(frames, axis=1)
+
+    tickers = ['AAA', 'BBB', 'NEW', 'BAD', 'CCC']
+    store = PriceStore.download(tickers, chunk_size=2, downloader=downloader)
+
+    assert requests == [['AAA', 'BBB'], ['NEW', 'BAD'], ['CCC']]
+    assert sorted(store.tickers) == ['AAA', 'BBB', 'CCC', 'NEW']
+    assert 'BAD' not in store
+    assert len(store.history('NEW')) == 20
+    assert list(store.history('AAA').columns) == ['Open', 'High', 'Low', 'Close', 'Volume']
+
+
+def test_adaptive_rate_limiter():
+    """토큰 버킷 간격 유지, 429 시 감속 후 재시도, 성공 시 가속"""
+    import pytest
+    from quant_trading.rate_limiter import AdaptiveRateLimiter
+
+    now = [0.0]
+
+    def sleep(seconds):
+        now[0] += seconds
+
+    limiter = AdaptiveRateLimiter(rate=2.0, burst=2, increase=0.5, max_rate=3.0,
+                                  clock=lambda: now[0], sleep=sleep)
+
+    # 버킷 2개는 즉시, 이후는 1/rate 간격
+    assert [limiter.acquire() for _ in range(3)] == [0.0, 0.0, 0.5]
+
+    class TooManyRequests(Exception):
+        pass
+
+    attempts = []
+
+    def flaky():
+        attempts.append(now[0])
+        if len(attempts) < 3:
+            raise TooManyRequests('429 Too Many Requests')
+        return 'ok'
+
+    assert limiter.call(flaky) == 'ok'
+    assert limiter.throttled_count == 2
+    assert attempts[1] - attempts[0] >= 1.0  # 감속 후 재시도
+    assert limiter.rate == 2.0 * 0.5 * 0.5 + 0.5
+
+    for _ in range(10):
+        limiter.call(lambda: None)
+    assert limiter.rate == 3.0  # 성공이 이어지면 최대 속도까지 회복
+
+    # FinanceDataReader 구현 공유, Yahoo 호스트만 별도 기본 속도
+    from FinanceDataReader.utils import rate_limit
+    from quant_trading.rate_limiter import YAHOO_HOST, YAHOO_LIMITS, get_rate_limiter
+    assert AdaptiveRateLimiter is rate_limit.AdaptiveRateLimiter
+    yahoo = get_rate_limiter(YAHOO_HOST)
+    assert rate_limit.get_rate_limiter(YAHOO_HOST) is yahoo
+    assert (yahoo.burst, yahoo.max_rate) == (YAHOO_LIMITS['burst'], YAHOO_LIMITS['max_rate'])
+
+    with pytest.raises(ValueError):
+        limiter.call(lambda: int('x'))  # 429가 아닌 예외는 재시도하지 않음
+
+
+def test_market_archive_roundtrip_and_reuse(tmp_path):
+    """아카이브 패널은 memmap (복사 없음), 같은 요청은 다운로드 없이 재사용"""
+    import os
+    import numpy as np
+    import pandas as pd
+    from quant_trading.market_archive import MarketArchive
+    from quant_trading.price_store import PriceStore
+
+    frames = {'AAA': _make_ohlcv(n=40, seed=1), 'NEW': _make_ohlcv(n=20, seed=2, start='2024-01-22')}
+    calls = []
+
+    def downloader(tickers, period, **kwargs):
+        calls.append(list(tickers))
+        return pd.concat({ticker: frames[ticker] for ticker in tickers if ticker in frames}, axis=1)
+
+    path = str(tmp_path / 'archive')
+    store = PriceStore.download(['AAA', 'NEW', 'BAD'], downloader=downloader, archive=path)
+    cached = PriceStore.download(['NEW', 'BAD'], downloader=downloader, archive=path, max_age_hours=1.0)
+    assert calls == [['AAA', 'NEW', 'BAD']]
+    assert sorted(cached.tickers) == ['AAA', 'NEW']
+
+    for ticker in ['AAA', 'NEW']:
+        np.testing.assert_array_equal(cached.history(ticker).values, store.history(ticker).values)
+        assert cached.history(ticker).index.equals(store.history(ticker).index)
+
+    archive = MarketArchive.open(path)
+    close = archive.panel('Close')
+    assert isinstance(archive.field('Close'), np.memmap)
+    assert np.shares_memory(close.values, archive.field('Close'))
+    assert close.shape == (40, 2) and close['NEW'].isna().sum() == 20
+
+    # 기간이 다르거나 오래된 아카이브는 다시 다운로드, 기본값(max_age_hours=0)은 항상 다운로드
+    PriceStore.download(['AAA'], period='1y', downloader=downloader, archive=path, max_age_hours=1.0)
+    PriceStore.download(['AAA'], period='1y', downloader=downloader, archive=path, max_age_hours=-1)
+    PriceStore.download(['AAA'], period='1y', downloader=downloader, archive=path)
+    assert len(calls) == 4
+    assert len([name for name in os.listdir(path) if os.path.isdir(os.path.join(path, name))]) == 1
+    assert MarketArchive.open(str(tmp_path / 'missing')) is None
+
+
+def _technical_total(df, offset):
+    """프로세스 풀 테스트용 계산 함수 (모듈 최상위 - 피클 가능)"""
+    from quant_trading.technical_analyzer_v3 import TechnicalAnalyzerV3
+    return TechnicalAnalyzerV3(df).calculate_total_score()['total_score'] + offset
+
+
+def test_compute_stage_processes_match_inline(tmp_path):
+    """프로세스 풀 계산 결과 = 현재 프로세스 계산 결과 (아카이브 공유 + 누락 종목 직접 전달)"""
+    from quant_trading.compute_pool import run_compute_stage
+    from quant_trading.price_store import PriceStore
+
+    store = PriceStore({f'T{i}': _make_ohlcv(n=250, seed=i) for i in range(6)})
+    tasks = {ticker: (i,) for i, ticker in enumerate(store.tickers + ['MISSING'])}
+    expected = dict(run_compute_stage(_technical_total, store, tasks, processes=False))
+    assert sorted(expected) == sorted(store.tickers)
+
+    # 아카이브 없는 저장소 (임시 아카이브로 공유)
+    assert dict(run_compute_stage(_technical_total, store, tasks, max_workers=2)) == expected
+
+    # 아카이브 + 나중에 추가된 종목 (DataFrame 직접 전달)
+    shared = PriceStore.from_archive(store.save_archive(str(tmp_path / 'archive')))
+    shared.add('LATE', _make_ohlcv(n=250, seed=99))
+    tasks['LATE'] = (0,)
+    expected['LATE'] = _technical_total(shared.history('LATE'), 0)
+    assert dict(run_compute_stage(_technical_total, shared, tasks, max_workers=2, chunk_size=2)) == expected
+
+
+def test_pipeline_streams_and_retries():
+    """느린 종목이 다른 종목을 막지 않고, 실패한 요청은 백오프 후 재시도"""
+    import threading
+    import time
+    from quant_trading.compute_pool import run_pipeline
+    from quant_trading.price_store import PriceStore
+
+    for processes in (False, True):
+        store = PriceStore({ticker: _make_ohlcv(n=250, seed=i) for i, ticker in enumerate(['A', 'B', 'SLOW', 'FLAKY'])})
+        attempts = {}
+        lock = threading.Lock()
+
+        def fetch(ticker):
+            with lock:
+                attempts[ticker] = attempts.get(ticker, 0) + 1
+            if ticker == 'SLOW':
+                time.sleep(0.5)
+            if ticker == 'FLAKY' and attempts[ticker] < 3:
+                raise ConnectionError('temporary')
+            if ticker == 'DEAD':
+                raise ConnectionError('permanent')
+            if ticker == 'LATE':
+                store.add('LATE', _make_ohlcv(n=250, seed=9))  # 개별 다운로드로 보충
+            return (1,)
+
+        order = [ticker for ticker, _ in run_pipeline(
+            ['SLOW', 'A', 'FLAKY', 'DEAD', 'B', 'LATE'], fetch, _technical_total, store,
+            fetch_workers=4, max_workers=2, retries=2, backoff=0.01, processes=processes)]
+        results = dict(run_pipeline(['A', 'DEAD'], fetch, _technical_total, store, retries=0,
+                                    processes=processes))
+
+        assert sorted(order) == ['A', 'B', 'DEAD', 'FLAKY', 'LATE', 'SLOW']
+        assert order.index('A') < order.index('SLOW') and order.index('B') < order.index('SLOW')
+        assert attempts['FLAKY'] == 3 and attempts['DEAD'] == 3 + 1
+        assert results == {'A': _technical_total(store.history('A'), 1), 'DEAD': None}
+
+
+def _render_card(data, suffix):
+    return f"<div>{data['ticker']} {data['score']}{suffix}</div>"
+
+
+def test_fragment_cache_and_static_assets(tmp_path):
+    """바뀐 데이터만 다시 렌더링, 디스크 캐시 재사용/정리, 해시 파일명 정적 자원"""
+    import os
+    from quant_trading.report_cache import FragmentCache, write_static_asset
+
+    cache_path = str(tmp_path / 'cards.json')
+    cache = FragmentCache(cache_path)
+    first = [cache.render({'ticker': t, 'score': 70}, _render_card, '!') for t in ['A', 'B', 'C']]
+    assert first[0] == '<div>A 70!</div>' and (cache.hits, cache.misses) == (0, 3)
+    cache.save()
+
+    # 다음 실행: B만 점수 변경, C는 빠짐 → B만 다시 렌더링, C 조각은 정리
+    cache = FragmentCache(cache_path)
+    assert cache.render({'score': 70, 'ticker': 'A'}, _render_card, '!') == first[0]
+    assert cache.render({'ticker': 'B', 'score': 65}, _render_card, '!') == '<div>B 65!</div>'
+    assert cache.render({'ticker': 'A', 'score': 70}, _render_card, '?') == '<div>A 70?</div>'
+    assert (cache.hits, cache.misses) == (1, 2)
+    cache.save()
+    assert len(FragmentCache(cache_path)._fragments) == 3
+
+    # 정적 자원: 내용이 같으면 같은 파일, 바뀌면 새 파일명
+    asset_dir = str(tmp_path / 'assets')
+    css = write_static_asset(asset_dir, 'report', 'body { color: red; }', 'css')
+    assert css == write_static_asset(asset_dir, 'report', 'body { color: red; }', 'css')
+    assert css != write_static_asset(asset_dir, 'report', 'body { color: blue; }', 'css')
+    assert css.endswith('.css') and len(os.listdir(asset_dir)) == 2
+
+
+def test_backtest_engine_matches_legacy_loop():
+    """엔진 결과 = 기존 스크립트 루프 (as_of 채점 + price_on 수익률), 패널 채점도 동일"""
+    import pytest
+    from datetime import datetime, timedelta
+    from quant_trading.backtest import (
+        Backtest, calculate_metrics, technical_panel_scorer, technical_scorer
+    )
+    from quant_trading.price_store import PriceStore
+    from quant_trading.technical_analyzer_v3 import TechnicalAnalyzerV3
+
+    store = PriceStore({f'T{i}': _make_ohlcv(n=400 - i * 20, seed=i) for i in range(8)})
+    tickers = store.tickers + ['MISSING']
+    start, end = datetime(2025, 1, 6), datetime(2025, 4, 30)
+
+    # 기존 스크립트 루프
+    dates = []
+    current = start
+    while current <= end:
+        dates.append(current)
+        current += timedelta(days=7)
+
+    expected = []
+    for date, next_date in zip(dates[:-1], dates[1:]):
+        results = []
+        for ticker in tickers:
+            df = store.as_of(ticker, date)
+            if len(df) >= 180:
+                score = TechnicalAnalyzerV3(df).calculate_total_score()['total_score']
+                results.append((ticker, score, df['Close'].iloc[-1]))
+        results.sort(key=lambda x: x[1], reverse=True)
+        top = results[:3]
+        period_return = sum((store.price_on(t, next_date) - buy) / buy / len(top) for t, _, buy in top)
+        expected.append(([t for t, _, _ in top], period_return))
+
+    for panel_scorer in (None, technical_panel_scorer):
+        backtest = Backtest(store, technical_scorer, tickers, top_n=3, rebalance_days=7,
+                            panel_scorer=panel_scorer)
+        metrics = backtest.run(start, end, on_rebalance=None)
+
+        assert len(backtest.portfolio_history) == len(expected)
+        for record, (top, period_return) in zip(backtest.portfolio_history, expected):
+            assert record['top_stocks'] == top
+            assert abs(record['return'] - period_return) < 1e-12
+        assert metrics == pytest.approx(calculate_metrics([r for _, r in expected], days=(end - start).days))
+
+    # 지표 정의 (기존 스크립트와 동일)
+    metrics = calculate_metrics([0.1, -0.2, 0.05], initial_capital=100)
+    assert abs(metrics['final_capital'] - 100 * 1.1 * 0.8 * 1.05) < 1e-9
+    assert abs(metrics['max_drawdown'] - (-0.2)) < 1e-12
+    assert metrics['win_rate'] == 2 / 3 and calculate_metrics([]) is None
+
+
+def test_param_sweep_matches_backtest():
+    """스윕 결과 = 조합별 Backtest 단독 실행, 프로세스 실행도 동일. 임계값은 패널/종목별 채점 모두 반영"""
+    from datetime import datetime
+    from functools import partial
+    import pandas as pd
+    from quant_trading.backtest import Backtest, technical_panel_scorer
+    from quant_trading.param_sweep import parameter_grid, run_sweep
+    from quant_trading.price_store import PriceStore
+    from quant_trading.technical_analyzer_v3 import TechnicalAnalyzerV3, TechnicalAnalyzerV3Panel
+
+    # 임계값 파라미터: 패널 = 종목별, 기본값 외 값은 점수를 바꿈
+    frames = {f'T{i}': _make_ohlcv(n=300, seed=i) for i in range(4)}
+    close = pd.DataFrame({t: df['Close'] for t, df in frames.items()})
+    thresholds = {'momentum_6m_strong': 0.05, 'momentum_6m_medium': 0.0, 'rsi_oversold': 45}
+    panel = TechnicalAnalyzerV3Panel(close, thresholds)
+    scores = panel.calculate_total_scores()
+    for ticker, df in frames.items():
+        assert panel.get_result(ticker, scores) == TechnicalAnalyzerV3(df, thresholds).calculate_total_score()
+    assert TechnicalAnalyzerV3(frames['T0']).thresholds == TechnicalAnalyzerV3.THRESHOLDS
+
+    store = PriceStore({f'T{i}': _make_ohlcv(n=400, seed=i) for i in range(6)})
+    start, end = datetime(2025, 1, 6), datetime(2025, 3, 31)
+    grid = {'top_n': [2, 4], 'rebalance_days': [7, 14], 'momentum_6m_strong': [0.1, 0.3]}
+    assert len(parameter_grid(grid)) == 8 and len(parameter_grid(grid, n_random=3)) == 3
+
+    inline = run_sweep(store, start, end, grid, processes=False, sort_by=None)
+    pooled = run_sweep(store, start, end, grid, max_workers=2, sort_by=None)
+    pd.testing.assert_frame_equal(pooled, inline)
+
+    for row, params in zip(inline.to_dict('records'), parameter_grid(grid)):
+        scorer = partial(technical_panel_scorer, momentum_6m_strong=params['momentum_6m_strong'])
+        backtest = Backtest(store, tickers=store.tickers, top_n=params['top_n'],
+                            rebalance_days=params['rebalance_days'], panel_scorer=scorer)
+        metrics = backtest.run(start, end, on_rebalance=None)
+        assert row['sharpe_ratio'] == metrics['sharpe_ratio']
+        assert row['total_return'] == metrics['total_return']
+
+    ranked = run_sweep(store, start, end, grid, processes=False)
+    assert ranked['sharpe_ratio'].is_monotonic_decreasing
+
+
+def _sector_scorer(ticker, df):
+    from quant_trading.backtest import technical_scorer
+    return {**technical_scorer(ticker, df), 'sector': 'A' if ticker in ('T0', 'T1') else 'B'}
+
+
+def test_score_cache_reuses_and_invalidates(tmp_path):
+    """디스크 점수 캐시: 재실행은 채점 없이 같은 결과, 가격이 바뀐 종목만 다시 채점"""
+    from datetime import datetime
+    from quant_trading.backtest import Backtest
+    from quant_trading.price_store import PriceStore
+    from quant_trading.score_cache import scorer_key
+
+    frames = {f'T{i}': _make_ohlcv(n=400 - i * 30, seed=i) for i in range(6)}
+    tickers = list(frames) + ['MISSING']
+    start, end = datetime(2025, 1, 6), datetime(2025, 3, 31)
+    cache_dir = str(tmp_path / 'scores')
+
+    expected = Backtest(PriceStore(frames), _sector_scorer, tickers, top_n=2)
+    expected_metrics = expected.run(start, end, on_rebalance=None)
+
+    first = Backtest(PriceStore(frames), _sector_scorer, tickers, top_n=2, score_cache_dir=cache_dir)
+    assert first.run(start, end, on_rebalance=None) == expected_metrics
+    assert first.score_store.hits == 0 and first.score_store.misses == 12 * len(tickers)
+
+    # 포트폴리오 규칙만 바꾼 재실행: 전부 캐시에서 (문자열 점수 키 포함)
+    rerun = Backtest(PriceStore(frames), _sector_scorer, tickers, top_n=4, score_cache_dir=cache_dir)
+    rerun.run(start, end, on_rebalance=None)
+    assert rerun.score_store.misses == 0
+    assert rerun.score_date(start) == expected.score_date(start)
+
+    # 한 종목 가격이 바뀌면 그 종목만 다시 채점
+    frames['T2'] = _make_ohlcv(n=370, seed=99)
+    changed = Backtest(PriceStore(frames), _sector_scorer, tickers, top_n=2, score_cache_dir=cache_dir)
+    metrics = changed.run(start, end, on_rebalance=None)
+    assert changed.score_store.misses == 12
+    assert metrics == Backtest(PriceStore(frames), _sector_scorer, tickers, top_n=2).run(start, end, on_rebalance=None)
+
+    # 채점 코드/파라미터가 다르면 다른 캐시
+    assert scorer_key(_sector_scorer) != scorer_key(_sector_scorer, lookback_days=365)
+    assert scorer_key(_sector_scorer) != scorer_key(_make_ohlcv)
+
+
+def test_portfolio_returns_with_costs():
+    """비중 × 수익률 행렬 연산: 회전율/거래 비용, 한 행씩 이어 계산해도 동일"""
+    from datetime import datetime
+    import numpy as np
+    from quant_trading.backtest import (
+        Backtest, close_panel, holding_period_returns, portfolio_returns, rebalance_schedule,
+        technical_panel_scorer
+    )
+    from quant_trading.price_store import PriceStore
+
+    weights = np.array([[0.5, 0.5], [1.0, 0.0]])
+    returns = np.array([[0.1, -0.1], [0.2, np.nan]])
+    result = portfolio_returns(weights, returns, commission=0.001, slippage=0.001)
+    # 1구간: 현금 -> 50/50 (회전율 1), 종료 비중 55/45 / 2구간: 55/45 -> 100/0 (회전율 0.9)
+    assert np.allclose(result['gross'], [0.0, 0.2])
+    assert np.allclose(result['turnover'], [1.0, 0.9])
+    assert np.allclose(result['net'], [-0.002, 0.2 - 0.0018 * 1.2])
+    assert np.allclose(result['drift'], [1.0, 0.0])
+
+    store = PriceStore({f'T{i}': _make_ohlcv(n=400, seed=i) for i in range(8)})
+    start, end = datetime(2025, 1, 6), datetime(2025, 4, 30)
+    plain = Backtest(store, panel_scorer=technical_panel_scorer, top_n=3)
+    plain_metrics = plain.run(start, end, on_rebalance=None)
+    costly = Backtest(store, panel_scorer=technical_panel_scorer, top_n=3, commission=0.0005, slippage=0.001)
+    metrics = costly.run(start, end, on_rebalance=None)
+
+    assert 'turnover' not in plain.portfolio_history[0] and 'avg_turnover' not in plain_metrics
+    assert metrics['total_return'] < plain_metrics['total_return']
+    assert costly.portfolio_history[0]['turnover'] == 1.0
+
+    # 리밸런싱마다 계산한 결과 = 전체 비중 행렬 한 번에 계산한 결과
+    history = costly.portfolio_history
+    held = costly.weights.loc[[record['date'] for record in history]]
+    period_returns = holding_period_returns(close_panel(store, store.tickers), rebalance_schedule(start, end, 7))
+    batch = portfolio_returns(held.values, period_returns.loc[held.index].values, 0.0005, 0.001)
+    assert np.allclose(batch['net'], [record['return'] for record in history], rtol=0, atol=1e-15)
+    assert np.allclose(batch['gross'], [record['gross_return'] for record in history], rtol=0, atol=1e-15)
+    assert abs(metrics['avg_turnover'] - batch['turnover'].mean()) < 1e-12
+
+
+def test_backtest_liquidation_cost_when_going_to_cash():
+    """투자 -> 현금 -> 투자: 현금 전환 시 전량 매도 비용 차감, 재매수는 현금에서 시작"""
+    from datetime import datetime
+    import pytest
+    from quant_trading.backtest import Backtest
+    from quant_trading.price_store import PriceStore
+
+    store = PriceStore({f'T{i}': _make_ohlcv(n=300, seed=i) for i in range(4)})
+    start, end = datetime(2025, 1, 6), datetime(2025, 1, 27)   # 1/6 투자, 1/13 현금, 1/20 투자
+
+    def scorer(ticker, df):
+        # 1/13 리밸런싱 (1/10까지 데이터)만 편입 기준 미달
+        in_cash = df.index[-1].strftime('%Y-%m-%d') == '2025-01-10'
+        return {'total_score': 0.0 if in_cash else 1.0 + int(ticker[1:])}
+
+    plain = Backtest(store, scorer, top_n=2, min_score=0.5)
+    plain.run(start, end, on_rebalance=None)
+    costly = Backtest(store, scorer, top_n=2, min_score=0.5, commission=0.001, slippage=0.002)
+    metrics = costly.run(start, end, on_rebalance=None)
+
+    first, second = costly.portfolio_history
+    gross1, gross2 = [record['return'] for record in plain.portfolio_history]
+    assert [first['date'], second['date']] == [datetime(2025, 1, 6), datetime(2025, 1, 20)]
+
+    # 1구간: 매수(회전율 1) + 현금 전환 매도(회전율 1), 비용은 각각 구간 시작/종료 자본 기준
+    assert first['turnover'] == pytest.approx(2.0)
+    assert first['return'] == pytest.approx((1 + gross1) * 0.997 ** 2 - 1, abs=1e-15)
+    assert first['cost'] == pytest.approx(0.003 + 0.003 * (1 + gross1) * 0.997)
+    # 2구간: 보유 종목이 없으므로 다시 현금에서 매수
+    assert second['turnover'] == pytest.approx(1.0)
+    assert second['return'] == pytest.approx((1 + gross2) * 0.997 - 1, abs=1e-15)
+
+    assert costly.capital == pytest.approx(100000 * (1 + first['return']) * (1 + second['return']))
+    assert metrics['final_capital'] == pytest.approx(costly.capital)
+
+
+def test_sector_capped_selection():
+    """벡터화 섹터 한도 선정 = 점수순 순회 규칙, 여러 날짜 한 번에 선정 = 날짜별 선정"""
+    import numpy as np
+    import pandas as pd
+    from quant_trading.portfolio import (
+        SectorCappedSelector, encode_sectors, grouped_rank, sector_caps, sector_rankings
+    )
+
+    codes, names = encode_sectors(['Technology', 'Energy', None, 'Technology', 'Energy'])
+    assert codes.tolist() == [0, 1, 2, 0, 1] and names == ['Technology', 'Energy', 'Unknown']
+    assert sector_caps(names, 10).tolist() == [3, 2, 2] and sector_caps(names, 2).tolist() == [1, 1, 1]
+    assert grouped_rank([5, 7, 1, 5, np.nan], codes).tolist() == [[0, 0, 0, 1, 1]]
+
+    rng = np.random.default_rng(0)
+    tickers = [f'T{i}' for i in range(40)]
+    sectors = dict(zip(tickers, rng.choice(['Technology', 'Energy', 'Financials', 'Utilities'], 40)))
+    scores = pd.DataFrame(np.round(rng.normal(50, 10, (30, 40))), columns=tickers)
+    scores[scores < 35] = np.nan
+    selector = SectorCappedSelector(sectors)
+
+    for top_n in (3, 10):
+        selected = selector.select_many(scores, top_n)
+        caps = dict(zip(selector.names, selector.caps(top_n)))
+        for date, row in scores.iterrows():
+            candidates = [{'ticker': t, 'total_score': s} for t, s in row.items() if not np.isnan(s)]
+            candidates.sort(key=lambda x: x['total_score'], reverse=True)
+
+            # 기준: 점수순으로 보면서 한도가 찬 섹터는 건너뜀
+            expected, counts = [], {}
+            for stock in candidates:
+                sector = sectors[stock['ticker']]
+                if len(expected) < top_n and counts.get(sector, 0) < caps[sector]:
+                    expected.append(stock['ticker'])
+                    counts[sector] = counts.get(sector, 0) + 1
+
+            assert [stock['ticker'] for stock in selector(candidates, top_n)] == expected
+            assert set(selected.columns[selected.loc[date].values]) == set(expected)
+
+    # 리포트 섹터 탭: 섹터 이름순, 섹터 내 점수순 (동점은 입력 순서)
+    assert sector_rankings(['B', 'A', 'B', 'A'], [1, 2, 3, 2]) == {'A': [1, 3], 'B': [2, 0]}
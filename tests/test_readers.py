@@ -0,0 +1,230 @@
+"""FinanceDataReader 리더 테스트 (네트워크 불필요)"""
+
+import sys
+import threading
+import time
+from datetime import datetime
+
+import pandas as pd
+
+sys.path.insert(0, 'src')
+
+
+def test_krx_chunks_fetched_concurrently_in_order(monkeypatch):
+    """청크는 동시에 조회하고 결과는 날짜순으로 병합"""
+    from FinanceDataReader.krx import data as krx_data
+
+    active = [0]
+    peak = [0]
+    lock = threading.Lock()
+
+    def fake_fetch(stock_code, start, end):
+        with lock:
+            active[0] += 1
+            peak[0] = max(peak[0], active[0])
+        time.sleep(0.05)
+        with lock:
+            active[0] -= 1
+        # 청크 경계 하루 겹침 (dedupe 확인용)
+        index = pd.date_range(start, end, freq='MS').append(pd.DatetimeIndex([end]))
+        return pd.DataFrame({'Close': range(len(index))}, index=index)
+
+    monkeypatch.setattr(krx_data, 'fetch_krx_stock_data', fake_fetch)
+
+    df = krx_data.get_krx_data('005930', datetime(2004, 1, 1), datetime(2024, 1, 1), max_workers=4)
+
+    assert peak[0] == 4
+    assert df.index.is_monotonic_increasing
+    assert not df.index.duplicated().any()
+    assert df.index[0] == pd.Timestamp('2004-01-01') and df.index[-1] == pd.Timestamp('2024-01-01')
+
+
+def test_datareader_many_panel_and_errors(monkeypatch):
+    """여러 종목 동시 조회: 패널/dict 반환, 종목별 실패 사유 보고"""
+    import pytest
+    import FinanceDataReader as fdr
+    from FinanceDataReader import data as fdr_data
+    from FinanceDataReader.utils import report_warning
+
+    def fake_fetch(data_source, symbol, start, end):
+        if symbol == 'EMPTY':
+            report_warning(f"No data found for {symbol}")
+            return pd.DataFrame()
+        if symbol == 'BOOM':
+            raise ValueError('bad symbol')
+        index = pd.bdate_range('2024-01-01', periods=5 if symbol == 'AAA' else 3)
+        return pd.DataFrame({'Close': 1.0, 'Volume': 10}, index=index)
+
+    monkeypatch.setattr(fdr_data, '_fetch_data', fake_fetch)
+
+    panel = fdr.DataReader(['AAA', 'BBB', 'EMPTY', 'BOOM'], '2024-01-01', '2024-01-31',
+                           data_source='YAHOO', cache=False)
+    assert list(panel.columns.get_level_values(0).unique()) == ['AAA', 'BBB']
+    assert list(panel['AAA'].columns) == ['Close', 'Volume']
+    assert len(panel) == 5 and panel['BBB']['Close'].isna().sum() == 2
+    assert panel.attrs['errors'] == {'EMPTY': 'No data found for EMPTY', 'BOOM': 'bad symbol'}
+
+    frames = fdr.DataReaderMany(['AAA', 'EMPTY'], '2024-01-01', data_source='YAHOO',
+                                cache=False, output='dict', errors='ignore')
+    assert list(frames) == ['AAA'] and list(frames.errors) == ['EMPTY']
+
+    with pytest.raises(fdr.DataReaderError) as exc_info:
+        fdr.DataReaderMany(['AAA', 'BOOM'], '2024-01-01', data_source='YAHOO',
+                           cache=False, errors='raise')
+    assert list(exc_info.value.results) == ['AAA']
+    assert exc_info.value.errors == {'BOOM': 'bad symbol'}
+
+
+def _start_stub_server():
+    """리더 응답을 흉내 내는 로컬 HTTP 서버 (naver XML, yahoo CSV, krx OTP/JSON, coingecko/fred JSON)"""
+    import json
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    bodies = {
+        '/naver': (
+            '<?xml version="1.0" encoding="EUC-KR" ?><protocol><chartdata symbol="005930">'
+            '<item data="20240103|100|110|90|105|1000" />'
+            '<item data="20240102|99|101|98|100|2000" />'
+            '<item data="20240104|105|106|104|106|1500" />'
+            '</chartdata></protocol>'
+        ),
+        '/yahoo/AAPL': 'Date,Open,High,Low,Close,Adj Close,Volume\n'
+                       '2024-01-02,1,2,0.5,1.5,1.4,100\n2024-01-03,1.5,2.5,1,2,1.9,200\n',
+        '/otp': 'OTP123',
+        '/krx': json.dumps({'OutBlock_1': [
+            {'TRD_DD': '2024/01/03', 'TDD_OPNPRC': '1,000', 'TDD_HGPRC': '1,100', 'TDD_LWPRC': '900',
+             'TDD_CLSPRC': '1,050', 'ACC_TRDVOL': '12,345', 'FLUC_RT': '1.5'},
+            {'TRD_DD': '2024/01/02', 'TDD_OPNPRC': '990', 'TDD_HGPRC': '1,010', 'TDD_LWPRC': '980',
+             'TDD_CLSPRC': '1,000', 'ACC_TRDVOL': '2,000', 'FLUC_RT': '-0.5'},
+        ]}),
+        '/coins/bitcoin': json.dumps({
+            'prices': [[1704153600000, 42000.5], [1704240000000, 43000.0]],
+            'total_volumes': [[1704153600000, 1e9], [1704240000000, 2e9]],
+        }),
+        '/fred': json.dumps({'observations': [
+            {'date': '2024-01-01', 'value': '3.7'}, {'date': '2024-02-01', 'value': '.'},
+        ]}),
+    }
+
+    class Handler(BaseHTTPRequestHandler):
+        def _reply(self):
+            body = bodies.get(self.path.split('?')[0])
+            if self.command == 'POST':
+                length = int(self.headers.get('Content-Length', 0))
+                form = self.rfile.read(length).decode()
+                # OTP가 form으로 전달되지 않으면 실패
+                if 'code=OTP123' not in form:
+                    body = None
+            if body is None:
+                self.send_response(404)
+                self.end_headers()
+                return
+            data = body.encode()
+            self.send_response(200)
+            self.send_header('Content-Length', str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        do_GET = _reply
+        do_POST = _reply
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def test_async_readers_match_sync(monkeypatch):
+    """asyncio 리더는 로컬 스텁 서버에서 동기 리더와 같은 DataFrame을 반환"""
+    import asyncio
+    import FinanceDataReader as fdr
+    from FinanceDataReader.krx import data as krx_data
+    from FinanceDataReader.naver import data as naver_data
+    from FinanceDataReader.yahoo import data as yahoo_data
+    from FinanceDataReader.crypto import data as crypto_data
+    from FinanceDataReader.fred import data as fred_data
+    from FinanceDataReader.utils import async_http
+
+    server = _start_stub_server()
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+    monkeypatch.setattr(naver_data, 'NAVER_FINANCE_API_URL', base + '/naver')
+    monkeypatch.setattr(yahoo_data, 'YAHOO_FINANCE_V7_URL', base + '/yahoo/{symbol}')
+    monkeypatch.setattr(yahoo_data, 'YAHOO_FINANCE_API_URL', base + '/chart/{symbol}')
+    monkeypatch.setattr(krx_data, 'KRX_OTP_URL', base + '/otp')
+    monkeypatch.setattr(krx_data, 'KRX_STOCK_URL', base + '/krx')
+    monkeypatch.setattr(crypto_data, 'COINGECKO_API_URL', base + '/coins/{coin_id}')
+    monkeypatch.setattr(fred_data, 'FRED_API_URL', base + '/fred')
+
+    start, end = datetime(2024, 1, 1), datetime(2024, 1, 31)
+    cases = [
+        (krx_data.get_krx_data, krx_data.get_krx_data_async, ('005930', start, end)),
+        (naver_data.get_naver_data, naver_data.get_naver_data_async, ('005930', start, end)),
+        (yahoo_data.get_yahoo_data, yahoo_data.get_yahoo_data_async, ('AAPL', start, end)),
+        (crypto_data.get_crypto_data, crypto_data.get_crypto_data_async, ('BTC', start, end)),
+        (fred_data.get_fred_data, fred_data.get_fred_data_async, ('UNRATE', start, end, 'KEY')),
+    ]
+
+    try:
+        # aiohttp 경로와 (미설치 시) 스레드 대체 경로 모두 확인
+        for has_aiohttp in sorted({False, async_http._has_aiohttp}):
+            monkeypatch.setattr(async_http, '_has_aiohttp', has_aiohttp)
+            for sync_reader, async_reader, args in cases:
+                expected = sync_reader(*args)
+                assert not expected.empty
+                pd.testing.assert_frame_equal(asyncio.run(async_reader(*args)), expected)
+
+            symbols = ['NAVER:005930', 'YAHOO:AAPL', 'YAHOO:MISSING']
+            expected = fdr.DataReaderMany(symbols, start, end, cache=False, errors='ignore')
+            panel = asyncio.run(fdr.DataReaderAsync(symbols, start, end, cache=False,
+                                                    max_concurrency=2, errors='ignore'))
+            pd.testing.assert_frame_equal(panel, expected)
+            assert list(panel.attrs['errors']) == ['YAHOO:MISSING']
+    finally:
+        server.shutdown()
+
+
+def test_naver_parse_skips_malformed_rows():
+    """네이버 응답: 필드 부족/숫자 아님/없는 날짜 행은 제외하고 정렬·기간 필터 적용"""
+    from FinanceDataReader.naver.data import _parse_naver_data
+
+    text = (
+        '<chartdata>'
+        '<item data="20240104|105|106|104|106|1500" />'
+        '<item data="20240102|99|101|98|100|2000" />'
+        '<item data="20240103|1|2|3" />'
+        '<item data="20240105|1|x|3|4|5" />'
+        '<item data="20240230|1|2|3|4|5" />'
+        '<item data="20240108|1|2|3|4|1.5" />'
+        '<item data="20231229|1|2|3|4|5" />'
+        '</chartdata>'
+    )
+    df = _parse_naver_data(text, '005930', datetime(2024, 1, 1), datetime(2024, 1, 31))
+
+    assert list(df.index) == [pd.Timestamp('2024-01-02'), pd.Timestamp('2024-01-04')]
+    assert list(df.columns) == ['Open', 'High', 'Low', 'Close', 'Volume']
+    assert df['Close'].tolist() == [100.0, 106.0] and df['Volume'].dtype == 'int64'
+    assert _parse_naver_data('<chartdata></chartdata>', '005930', datetime(2024, 1, 1), datetime(2024, 1, 31)).empty
+
+
+def test_krx_decode_comma_numbers():
+    """KRX 응답: 쉼표 숫자는 float64/int64로, 빈 값('-')은 NaN으로 변환"""
+    import json
+    from FinanceDataReader.krx.data import _parse_krx_data
+    from FinanceDataReader.krx.decode import INT, decode_numbers
+
+    text = json.dumps({'OutBlock_1': [
+        {'TRD_DD': '2024/01/03', 'TDD_CLSPRC': '71,000', 'FLUC_TP_CD': '1', 'FLUC_RT': '-',
+         'TDD_OPNPRC': '70,500', 'TDD_HGPRC': '71,200', 'TDD_LWPRC': '70,100', 'ACC_TRDVOL': '12,345,678'},
+        {'TRD_DD': '2024/01/02', 'TDD_CLSPRC': '70,000', 'FLUC_TP_CD': '2', 'FLUC_RT': '-1.25',
+         'TDD_OPNPRC': '69,500', 'TDD_HGPRC': '70,200', 'TDD_LWPRC': '69,100', 'ACC_TRDVOL': '9,876'},
+    ]})
+    df = _parse_krx_data(text, '005930')
+
+    assert list(df.columns) == ['Open', 'High', 'Low', 'Close', 'Volume', 'FLUC_TP_CD', 'Change']
+    assert df.index.is_monotonic_increasing and df['Close'].tolist() == [70000.0, 71000.0]
+    assert df['Volume'].dtype == 'int64' and df['Volume'].tolist() == [9876, 12345678]
+    assert df['Change'].iloc[0] == -1.25 and pd.isna(df['Change'].iloc[1])
+
+    assert decode_numbers(['1,000', '', '2'], INT).dtype == 'float64'
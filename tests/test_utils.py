@@ -0,0 +1,105 @@
+"""FinanceDataReader 유틸리티 테스트 (네트워크 불필요)"""
+
+import sys
+
+sys.path.insert(0, 'src')
+
+
+class _FakeResponse:
+    def __init__(self, status_code, headers=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            import requests
+            raise requests.HTTPError(f"{self.status_code} Error", response=self)
+
+
+class _FakeSession:
+    def __init__(self, statuses):
+        self.statuses = list(statuses)
+        self.calls = []
+
+    def request(self, method, url, **kwargs):
+        self.calls.append((method, url))
+        status, headers = self.statuses.pop(0)
+        return _FakeResponse(status, headers)
+
+
+def test_get_request_backs_off_on_429():
+    """429 응답은 호스트 제한기가 감속 후 재시도"""
+    from FinanceDataReader.utils import get_request, get_rate_limiter
+
+    limiter = get_rate_limiter('http://throttled.test', clock=lambda: 0.0, sleep=lambda s: None)
+    session = _FakeSession([(429, {'Retry-After': '0'}), (429, {}), (200, {})])
+
+    response = get_request('http://throttled.test/data', session=session)
+
+    assert response.status_code == 200
+    assert len(session.calls) == 3
+    assert limiter.throttled_count == 2
+    assert limiter.success_count == 1
+    assert get_rate_limiter('throttled.test') is limiter  # 호스트 단위 공유
+
+
+def test_host_rate_defaults():
+    """KRX 호스트만 높은 시작 속도, 나머지 호스트는 라이브러리 기본값"""
+    from FinanceDataReader.krx.data import KRX_OTP_URL, KRX_RATE_LIMITS
+    from FinanceDataReader.utils import AdaptiveRateLimiter, get_rate_limiter
+
+    krx = get_rate_limiter(KRX_OTP_URL)
+    assert (krx.rate, krx.burst, krx.max_rate) == (KRX_RATE_LIMITS['rate'], KRX_RATE_LIMITS['burst'],
+                                                   KRX_RATE_LIMITS['max_rate'])
+
+    other = get_rate_limiter('http://other-host.test')
+    default = AdaptiveRateLimiter()
+    assert (other.rate, other.burst, other.max_rate) == (default.rate, default.burst, default.max_rate)
+    assert default.rate < krx.rate
+
+
+def test_shared_session_per_host():
+    """호스트별 공유 세션 재사용, 풀 설정 변경 시 새 세션"""
+    from FinanceDataReader.utils import get_session, configure_session_pool, get_request
+
+    session = get_session('https://pool.test/a')
+    assert get_session('https://pool.test/b?x=1') is session
+    assert get_session('https://other.test/') is not session
+
+    calls = []
+    session.request = lambda method, url, **kwargs: calls.append(url) or _FakeResponse(200)
+    get_request('https://pool.test/data')
+    get_request('https://pool.test/data')
+    assert calls == ['https://pool.test/data'] * 2
+
+    configure_session_pool(pool_maxsize=32)
+    resized = get_session('https://pool.test/')
+    assert resized is not session
+    assert resized.get_adapter('https://pool.test/')._pool_maxsize == 32
+    configure_session_pool(pool_maxsize=10)
+
+
+def test_epoch_to_datetime_matches_fromtimestamp(monkeypatch):
+    """epoch 배열 변환은 datetime.fromtimestamp와 동일 (서머타임 전환 포함)"""
+    import time
+    from datetime import datetime
+    import numpy as np
+    import pandas as pd
+    from FinanceDataReader.utils import epoch_to_datetime
+
+    # 2024-03-10 미국 서머타임 시작 전후 시간봉 + 실수 밀리초
+    seconds = list(range(1710000000, 1710000000 + 72 * 3600, 3600))
+    millis = [ts * 1000.0 + 250 for ts in seconds]
+
+    for zone in ('America/New_York', 'Asia/Seoul'):
+        monkeypatch.setenv('TZ', zone)
+        time.tzset()
+        try:
+            expected = pd.DatetimeIndex([datetime.fromtimestamp(ts) for ts in seconds])
+            assert epoch_to_datetime(seconds).equals(expected)
+            assert epoch_to_datetime(np.array(millis), unit='ms').equals(
+                pd.DatetimeIndex([datetime.fromtimestamp(ms / 1000) for ms in millis])
+            )
+        finally:
+            monkeypatch.delenv('TZ')
+            time.tzset()
@@ -11,7 +11,7 @@ REM Python 실행
 python generate_daily_report_v2.py
 
 REM Git 자동 커밋 및 푸시 (선택사항)
-REM git add daily_stock_report_*.html index.html
+REM git add daily_stock_report_*.html index.html assets/
 REM git commit -m "Auto update - %date% %time%"
 REM git push
 